@@ -1,6 +1,13 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from enum import Enum
 
-from app.domain.models import AIAssistant, ContentType, Role
+from app.domain.models import AIAssistant, BatchJobStatus, ContentType, Role
+
+
+class CachePolicy(str, Enum):
+    DEFAULT = "default"
+    REFRESH = "refresh"
+    BYPASS = "bypass"
 
 
 @dataclass
@@ -17,8 +24,9 @@ class TextContentItemDTO:
 
 @dataclass
 class ImageContentItemDTO:
-    image_base64: str
+    image_base64: str | None = None
     type: ContentType = ContentType.IMAGE_URL
+    image_id: str | None = None
 
 
 @dataclass
@@ -31,11 +39,14 @@ class AIMessageDTO:
 class GenerateAIRequestDTO:
     messages: list[MessageDTO]
     assistant: AIAssistant
+    cache_policy: CachePolicy = CachePolicy.DEFAULT
+    truncate_history: bool = False
 
 
 @dataclass
 class GenerateVisionAIRequestDTO:
     messages: list[AIMessageDTO]
+    cache_policy: CachePolicy = CachePolicy.DEFAULT
 
 
 @dataclass
@@ -49,3 +60,96 @@ class UsageDTO:
 class AIResponseDTO:
     assistant_message: str
     usage: UsageDTO
+    cached: bool = False
+    served_by: str | None = None
+
+
+@dataclass
+class AIResponseChunkDTO:
+    delta: str
+    usage: UsageDTO | None = None
+    served_by: str | None = None
+
+
+@dataclass
+class GenerateAIBatchRequestDTO:
+    items: list[GenerateAIRequestDTO]
+    max_concurrency: int | None = None
+
+
+@dataclass
+class BatchItemResultDTO:
+    index: int
+    response: AIResponseDTO | None = None
+    error: Exception | None = None
+
+
+@dataclass
+class BatchJobRequestDTO:
+    custom_id: str | None
+    messages: list[MessageDTO]
+
+
+@dataclass
+class CreateBatchJobDTO:
+    assistant: AIAssistant
+    requests: list[BatchJobRequestDTO]
+
+
+@dataclass
+class BatchJobDTO:
+    id: str
+    assistant: AIAssistant
+    provider: str
+    status: BatchJobStatus
+    request_count: int
+    completed_count: int
+    failed_count: int
+    created_at: float
+    updated_at: float
+    error: str | None = None
+
+
+@dataclass
+class BatchJobResultDTO:
+    custom_id: str
+    response: AIResponseDTO | None = None
+    error: str | None = None
+
+
+@dataclass
+class StoredImageDTO:
+    image_id: str
+    size: int
+    mime_type: str
+
+
+@dataclass
+class TokenCountDTO:
+    assistant: AIAssistant
+    prompt_tokens: int
+    method: str
+    budget_tokens: int | None
+    fits: bool
+
+
+@dataclass
+class CreateSessionDTO:
+    assistant: AIAssistant
+    messages: list[MessageDTO] = field(default_factory=list)
+
+
+@dataclass
+class SessionTurnDTO:
+    messages: list[MessageDTO]
+    cache_policy: CachePolicy = CachePolicy.DEFAULT
+    truncate_history: bool = False
+
+
+@dataclass
+class SessionDTO:
+    id: str
+    assistant: AIAssistant
+    messages: list[MessageDTO]
+    created_at: float
+    updated_at: float
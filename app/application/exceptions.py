@@ -16,3 +16,11 @@ class ServiceUnavailableException(ApplicationException):
 
 class ConfigurationException(ApplicationException):
     """Startup/configuration error (fail fast on invalid config)."""
+
+
+class NotFoundException(ApplicationException):
+    """Requested resource does not exist (404)."""
+
+
+class ConflictException(ApplicationException):
+    """The resource was changed by a concurrent request (409)."""
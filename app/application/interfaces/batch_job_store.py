@@ -0,0 +1,16 @@
+from typing import Protocol
+
+from app.domain.models import BatchJob
+
+
+class BatchJobStore(Protocol):
+    """Persists batch jobs and the provider batch each one is mapped to."""
+
+    async def save(self, job: BatchJob) -> None:
+        ...
+
+    async def get(self, job_id: str) -> BatchJob | None:
+        ...
+
+    async def aclose(self) -> None:
+        ...
@@ -0,0 +1,24 @@
+from dataclasses import dataclass
+from typing import Protocol
+
+
+@dataclass
+class PreprocessedImage:
+    image_base64: str
+    original_bytes: int
+    bytes: int
+    original_tokens: int
+    tokens: int
+
+
+class ImagePreprocessor(Protocol):
+    """Shrinks vision images before they are sent upstream."""
+
+    async def preprocess(self, image_base64: str) -> PreprocessedImage:
+        ...
+
+    def stats(self) -> dict:
+        ...
+
+    async def aclose(self) -> None:
+        ...
@@ -0,0 +1,25 @@
+from dataclasses import dataclass
+from typing import BinaryIO, Protocol
+
+
+@dataclass
+class StoredImage:
+    image_id: str
+    size: int
+    mime_type: str
+
+
+class ImageStore(Protocol):
+    """Content-addressed store of uploaded images; an image id is the SHA-256 of its bytes."""
+
+    async def put(self, file: BinaryIO) -> StoredImage:
+        ...
+
+    async def get_data_url(self, image_id: str) -> str | None:
+        ...
+
+    def stats(self) -> dict:
+        ...
+
+    async def aclose(self) -> None:
+        ...
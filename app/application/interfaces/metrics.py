@@ -0,0 +1,24 @@
+from typing import Protocol
+
+from app.domain.models import AIAssistant, Usage
+
+
+class UpstreamMetrics(Protocol):
+    """Records upstream model calls per assistant; called on every request, so it must stay cheap."""
+
+    def call_started(self, assistant: AIAssistant) -> float:
+        """Marks a call as in flight and returns the start time to pass back when it ends."""
+        ...
+
+    def call_finished(self, assistant: AIAssistant, started: float, error: Exception | None = None) -> None:
+        ...
+
+    def call_cancelled(self, assistant: AIAssistant, started: float) -> None:
+        """Ends a call abandoned by our side (client disconnect, stream closed early); not a provider failure."""
+        ...
+
+    def first_token(self, assistant: AIAssistant, started: float) -> None:
+        ...
+
+    def tokens(self, assistant: AIAssistant, usage: Usage) -> None:
+        ...
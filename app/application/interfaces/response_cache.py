@@ -0,0 +1,17 @@
+from typing import Protocol
+
+
+class ResponseCache(Protocol):
+    """Byte-oriented store for serialized AI responses, keyed by request fingerprint."""
+
+    async def get(self, key: str) -> bytes | None:
+        ...
+
+    async def set(self, key: str, value: bytes) -> None:
+        ...
+
+    def stats(self) -> dict:
+        ...
+
+    async def aclose(self) -> None:
+        ...
@@ -0,0 +1,32 @@
+from typing import Protocol
+
+from app.domain.models import Message, Session
+
+
+class SessionStore(Protocol):
+    """Keeps conversation sessions; turns are appended without rewriting the history."""
+
+    async def create(self, session: Session) -> None:
+        ...
+
+    async def get(self, session_id: str) -> Session | None:
+        ...
+
+    async def append(
+        self, session_id: str, messages: list[Message], updated_at: float, expected_length: int | None = None
+    ) -> bool:
+        """Adds messages to the end of the history; False if the session no longer exists.
+
+        With ``expected_length`` the append is a compare-and-set: it raises
+        ``ConflictException`` if the history no longer has that many messages.
+        """
+        ...
+
+    async def delete(self, session_id: str) -> bool:
+        ...
+
+    def stats(self) -> dict:
+        ...
+
+    async def aclose(self) -> None:
+        ...
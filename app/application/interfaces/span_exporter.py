@@ -0,0 +1,15 @@
+from typing import TYPE_CHECKING, Protocol
+
+if TYPE_CHECKING:
+    from app.application.services.tracing import Trace
+
+
+class SpanExporter(Protocol):
+    """Destination for finished request traces."""
+
+    def export(self, trace: "Trace") -> None:
+        """Hand over a finished trace; must not block the event loop."""
+        ...
+
+    async def aclose(self) -> None:
+        ...
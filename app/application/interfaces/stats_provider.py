@@ -0,0 +1,8 @@
+from typing import Protocol
+
+
+class StatsProvider(Protocol):
+    """Source of point-in-time operational statistics (pools, limiters, caches)."""
+
+    def stats(self) -> dict:
+        ...
@@ -0,0 +1,24 @@
+from dataclasses import dataclass, field
+from typing import Protocol
+
+from app.domain.models import AIAssistant, Message
+
+
+@dataclass
+class TokenEstimate:
+    tokens: int
+    method: str
+    # False for heuristic counts, which may be well off the model's real tokenizer.
+    exact: bool = True
+    # Cost of each message including its framing, when known; ``tokens`` minus their sum is the fixed overhead.
+    message_tokens: list[int] | None = field(default=None, repr=False)
+
+
+class TokenEstimator(Protocol):
+    """Estimates prompt size locally, before a request is dispatched."""
+
+    async def count_messages(self, assistant: AIAssistant, messages: list[Message]) -> TokenEstimate:
+        ...
+
+    def context_window(self, assistant: AIAssistant) -> int | None:
+        ...
@@ -1,5 +1,5 @@
-from app.application.dto import AIResponseDTO, UsageDTO
-from app.domain.models import AIResponse, Usage
+from app.application.dto import AIResponseChunkDTO, AIResponseDTO, BatchJobDTO, MessageDTO, SessionDTO, UsageDTO
+from app.domain.models import AIResponse, AIResponseChunk, BatchJob, Session, Usage
 
 
 def to_usage_dto(usage: Usage) -> UsageDTO:
@@ -10,9 +10,43 @@ def to_usage_dto(usage: Usage) -> UsageDTO:
     )
 
 
-def to_ai_response_dto(response: AIResponse) -> AIResponseDTO:
+def to_ai_response_dto(response: AIResponse, cached: bool = False) -> AIResponseDTO:
     return AIResponseDTO(
         assistant_message=response.assistant_message,
         usage=to_usage_dto(response.usage),
+        cached=cached,
+        served_by=response.served_by,
     )
 
+
+def to_ai_response_chunk_dto(chunk: AIResponseChunk, served_by: str | None = None) -> AIResponseChunkDTO:
+    return AIResponseChunkDTO(
+        delta=chunk.delta,
+        usage=to_usage_dto(chunk.usage) if chunk.usage is not None else None,
+        served_by=served_by,
+    )
+
+
+def to_batch_job_dto(job: BatchJob) -> BatchJobDTO:
+    return BatchJobDTO(
+        id=job.id,
+        assistant=job.assistant,
+        provider=job.provider,
+        status=job.status,
+        request_count=job.request_count,
+        completed_count=job.completed_count,
+        failed_count=job.failed_count,
+        created_at=job.created_at,
+        updated_at=job.updated_at,
+        error=job.error,
+    )
+
+
+def to_session_dto(session: Session) -> SessionDTO:
+    return SessionDTO(
+        id=session.id,
+        assistant=session.assistant,
+        messages=[MessageDTO(role=message.role, content=message.content) for message in session.messages],
+        created_at=session.created_at,
+        updated_at=session.updated_at,
+    )
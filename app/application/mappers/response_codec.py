@@ -0,0 +1,28 @@
+import json
+
+from app.domain.models import AIResponse, Usage
+
+
+def encode_response(response: AIResponse) -> bytes:
+    return json.dumps(
+        {
+            "assistant_message": response.assistant_message,
+            "usage": {
+                "prompt_tokens": response.usage.prompt_tokens,
+                "completion_tokens": response.usage.completion_tokens,
+                "total_tokens": response.usage.total_tokens,
+            },
+            "served_by": response.served_by,
+        },
+        ensure_ascii=False,
+        separators=(",", ":"),
+    ).encode()
+
+
+def decode_response(data: bytes) -> AIResponse:
+    payload = json.loads(data)
+    return AIResponse(
+        assistant_message=payload["assistant_message"],
+        usage=Usage(**payload["usage"]),
+        served_by=payload.get("served_by"),
+    )
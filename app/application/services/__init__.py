@@ -1,5 +1,8 @@
 from app.application.services.ai_service import AIService
+from app.application.services.batch_job_service import BatchJobService
 from app.application.services.config_validator import AppConfigValidator
+from app.application.services.image_service import ImageService
+from app.application.services.session_service import SessionService
+from app.application.services.stats_service import StatsService
 
-__all__ = ["AIService", "AppConfigValidator"]
-
+__all__ = ["AIService", "AppConfigValidator", "BatchJobService", "ImageService", "SessionService", "StatsService"]
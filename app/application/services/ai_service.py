@@ -1,6 +1,23 @@
-from app.application.dto import AIResponseDTO, GenerateAIRequestDTO, GenerateVisionAIRequestDTO
-from app.application.use_cases.generate_text_ai_use_case import GenerateTextAIUseCase
-from app.application.use_cases.generate_vision_ai_use_case import GenerateVisionAIUseCase
+from collections.abc import AsyncIterator
+from typing import TYPE_CHECKING
+
+from app.application.dto import (
+    AIResponseChunkDTO,
+    AIResponseDTO,
+    BatchItemResultDTO,
+    GenerateAIBatchRequestDTO,
+    GenerateAIRequestDTO,
+    GenerateVisionAIRequestDTO,
+    TokenCountDTO,
+)
+from app.application.exceptions import ValidationException
+
+if TYPE_CHECKING:
+    # Use cases import helpers from this package, so importing them eagerly here would be circular.
+    from app.application.use_cases.count_tokens_use_case import CountTokensUseCase
+    from app.application.use_cases.generate_text_ai_use_case import GenerateTextAIUseCase
+    from app.application.use_cases.generate_text_batch_use_case import GenerateTextBatchUseCase
+    from app.application.use_cases.generate_vision_ai_use_case import GenerateVisionAIUseCase
 
 
 class AIService:
@@ -8,11 +25,20 @@ class AIService:
 
     def __init__(
         self,
-        generate_text_use_case: GenerateTextAIUseCase,
-        generate_vision_use_case: GenerateVisionAIUseCase,
+        generate_text_use_case: "GenerateTextAIUseCase",
+        generate_vision_use_case: "GenerateVisionAIUseCase",
+        generate_batch_use_case: "GenerateTextBatchUseCase",
+        count_tokens_use_case: "CountTokensUseCase | None" = None,
     ):
         self._generate_text_use_case = generate_text_use_case
         self._generate_vision_use_case = generate_vision_use_case
+        self._generate_batch_use_case = generate_batch_use_case
+        self._count_tokens_use_case = count_tokens_use_case
+
+    @property
+    def text_use_case(self) -> "GenerateTextAIUseCase":
+        """The text use case, shared with features that build on top of it such as sessions."""
+        return self._generate_text_use_case
 
     async def generate_ai_response(self, dto: GenerateAIRequestDTO) -> AIResponseDTO:
         return await self._generate_text_use_case.execute(dto)
@@ -20,3 +46,19 @@ class AIService:
     async def generate_ai_response_vision(self, dto: GenerateVisionAIRequestDTO) -> AIResponseDTO:
         return await self._generate_vision_use_case.execute(dto)
 
+    def generate_ai_response_stream(self, dto: GenerateAIRequestDTO) -> AsyncIterator[AIResponseChunkDTO]:
+        return self._generate_text_use_case.execute_stream(dto)
+
+    def generate_ai_response_vision_stream(self, dto: GenerateVisionAIRequestDTO) -> AsyncIterator[AIResponseChunkDTO]:
+        return self._generate_vision_use_case.execute_stream(dto)
+
+    async def generate_ai_response_batch(self, dto: GenerateAIBatchRequestDTO) -> list[BatchItemResultDTO]:
+        return await self._generate_batch_use_case.execute(dto)
+
+    def generate_ai_response_batch_stream(self, dto: GenerateAIBatchRequestDTO) -> AsyncIterator[BatchItemResultDTO]:
+        return self._generate_batch_use_case.execute_stream(dto)
+
+    async def count_tokens(self, dto: GenerateAIRequestDTO) -> TokenCountDTO:
+        if self._count_tokens_use_case is None:
+            raise ValidationException("Token counting is disabled")
+        return await self._count_tokens_use_case.execute(dto)
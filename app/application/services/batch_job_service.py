@@ -0,0 +1,26 @@
+from collections.abc import AsyncIterator
+from typing import TYPE_CHECKING
+
+from app.application.dto import BatchJobDTO, BatchJobResultDTO, CreateBatchJobDTO
+
+if TYPE_CHECKING:
+    from app.application.use_cases.batch_jobs_use_case import BatchJobsUseCase
+
+
+class BatchJobService:
+    """Facade over provider batch jobs."""
+
+    def __init__(self, batch_jobs_use_case: "BatchJobsUseCase"):
+        self._batch_jobs_use_case = batch_jobs_use_case
+
+    async def create_job(self, dto: CreateBatchJobDTO) -> BatchJobDTO:
+        return await self._batch_jobs_use_case.create(dto)
+
+    async def get_job(self, job_id: str) -> BatchJobDTO:
+        return await self._batch_jobs_use_case.get(job_id)
+
+    async def cancel_job(self, job_id: str) -> BatchJobDTO:
+        return await self._batch_jobs_use_case.cancel(job_id)
+
+    async def get_job_results(self, job_id: str) -> AsyncIterator[BatchJobResultDTO]:
+        return await self._batch_jobs_use_case.results(job_id)
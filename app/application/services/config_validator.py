@@ -1,5 +1,6 @@
 from app.application.exceptions import ConfigurationException
 from app.application.interfaces.config_validator import ConfigValidator
+from app.domain.models import AIAssistant, Priority
 from core.config import Config
 
 
@@ -46,3 +47,101 @@ class AppConfigValidator(ConfigValidator):
             missing_list = ", ".join(sorted(missing))
             raise ConfigurationException(f"Missing required configuration keys: {missing_list}")
 
+        if config.response_cache.backend not in ("memory", "sqlite"):
+            raise ConfigurationException(
+                f"Unsupported RESPONSE_CACHE_BACKEND: {config.response_cache.backend} (expected memory or sqlite)"
+            )
+
+        concurrency = config.concurrency
+        if not 1 <= concurrency.min_limit <= concurrency.initial_limit <= concurrency.max_limit:
+            raise ConfigurationException(
+                "Concurrency limits must satisfy 1 <= CONCURRENCY_MIN_LIMIT <= CONCURRENCY_INITIAL_LIMIT <= CONCURRENCY_MAX_LIMIT"
+            )
+        if not 0 < concurrency.backoff < 1:
+            raise ConfigurationException("CONCURRENCY_BACKOFF must be in (0, 1)")
+
+        hedging = config.hedging
+        assistants = {assistant.value for assistant in AIAssistant if assistant != AIAssistant.AUTO}
+        unknown = (set(hedging.assistants) | set(hedging.alternates) | set(hedging.alternates.values())) - assistants
+        if unknown:
+            raise ConfigurationException(f"Unknown assistants in hedging configuration: {', '.join(sorted(unknown))}")
+        unknown = (set(config.fallbacks) | {name for chain in config.fallbacks.values() for name in chain}) - assistants
+        if unknown:
+            raise ConfigurationException(f"Unknown assistants in fallback chains: {', '.join(sorted(unknown))}")
+        unknown = set(config.auto_routing.pool) - assistants
+        if unknown:
+            raise ConfigurationException(f"Unknown assistants in AUTO_POOL: {', '.join(sorted(unknown))}")
+        if not 0 <= config.auto_routing.exploration <= 1:
+            raise ConfigurationException("AUTO_EXPLORATION must be in [0, 1]")
+        if config.batch.max_items < 1 or config.batch.max_concurrency < 1:
+            raise ConfigurationException("BATCH_MAX_ITEMS and BATCH_MAX_CONCURRENCY must be at least 1")
+        if config.batch_jobs.provider not in ("openai", "local"):
+            raise ConfigurationException(
+                f"Unsupported BATCH_JOBS_PROVIDER: {config.batch_jobs.provider} (expected openai or local)"
+            )
+        if config.batch_jobs.max_requests < 1 or config.batch_jobs.local_concurrency < 1:
+            raise ConfigurationException("BATCH_JOBS_MAX_REQUESTS and BATCH_JOBS_LOCAL_CONCURRENCY must be at least 1")
+        if config.batch_jobs.local_result_ttl < 0:
+            raise ConfigurationException("BATCH_JOBS_LOCAL_RESULT_TTL must be non-negative")
+        images = config.image_preprocessing
+        if images.format not in ("jpeg", "webp", "png"):
+            raise ConfigurationException(f"Unsupported IMAGE_FORMAT: {images.format} (expected jpeg, webp or png)")
+        if images.max_side < 1 or images.max_short_side < 1 or images.workers < 1 or images.cache_entries < 0:
+            raise ConfigurationException(
+                "IMAGE_MAX_SIDE, IMAGE_MAX_SHORT_SIDE and IMAGE_WORKERS must be at least 1, IMAGE_CACHE_ENTRIES non-negative"
+            )
+        if not 1 <= images.quality <= 100:
+            raise ConfigurationException("IMAGE_QUALITY must be in [1, 100]")
+        if config.image_store.max_bytes < 1 or config.image_store.max_image_bytes < 1:
+            raise ConfigurationException("IMAGE_STORE_MAX_BYTES and IMAGE_STORE_MAX_IMAGE_BYTES must be positive")
+        limits = config.request_limits
+        if min(limits.max_body_bytes, limits.max_vision_body_bytes, limits.max_batch_body_bytes) < 1:
+            raise ConfigurationException(
+                "REQUEST_MAX_BODY_BYTES, REQUEST_MAX_VISION_BODY_BYTES and REQUEST_MAX_BATCH_BODY_BYTES must be positive"
+            )
+        priorities = {priority.value for priority in Priority}
+        if unknown := set(config.concurrency.queue_timeouts) - priorities:
+            raise ConfigurationException(f"CONCURRENCY_QUEUE_TIMEOUTS has unknown priority classes: {sorted(unknown)}")
+        if any(timeout <= 0 for timeout in config.concurrency.queue_timeouts.values()):
+            raise ConfigurationException("CONCURRENCY_QUEUE_TIMEOUTS must be positive")
+        if any(weight <= 0 for weight in config.concurrency.tenant_weights.values()):
+            raise ConfigurationException("TENANT_WEIGHTS must be positive")
+        known = {assistant.value for assistant in AIAssistant} - {AIAssistant.AUTO.value}
+        if unknown := set(config.token_budget.context_windows) - known:
+            raise ConfigurationException(f"CONTEXT_WINDOWS has unknown assistants: {sorted(unknown)}")
+        windows = config.token_budget.context_windows.values()
+        if config.token_budget.reserve_tokens < 0 or any(window <= config.token_budget.reserve_tokens for window in windows):
+            raise ConfigurationException("CONTEXT_WINDOWS must be larger than TOKEN_BUDGET_RESERVE, which must be non-negative")
+        sessions = config.sessions
+        if sessions.backend not in ("memory", "sqlite"):
+            raise ConfigurationException(f"Unsupported SESSIONS_BACKEND: {sessions.backend} (expected memory or sqlite)")
+        if sessions.max_sessions < 1 or sessions.max_messages < 1 or sessions.ttl_seconds <= 0:
+            raise ConfigurationException("SESSIONS_MAX, SESSIONS_MAX_MESSAGES and SESSIONS_TTL must be positive")
+        buckets = config.metrics.latency_buckets
+        if not buckets or buckets[0] <= 0 or any(lower >= upper for lower, upper in zip(buckets, buckets[1:])):
+            raise ConfigurationException("METRICS_LATENCY_BUCKETS must be positive and strictly increasing")
+        if config.tracing.exporter not in ("none", "file"):
+            raise ConfigurationException(f"Unsupported TRACING_EXPORTER: {config.tracing.exporter} (expected none or file)")
+        if not 0 < config.tracing.sample_rate <= 1:
+            raise ConfigurationException("TRACING_SAMPLE_RATE must be in (0, 1]")
+        if not 0 <= config.logging.info_sample_rate <= 1:
+            raise ConfigurationException("LOG_INFO_SAMPLE_RATE must be in [0, 1]")
+        if config.logging.max_message_chars < 0:
+            raise ConfigurationException("LOG_MAX_MESSAGE_CHARS must be non-negative")
+        admission = config.admission
+        if min(admission.max_in_flight, admission.endpoint_max_in_flight, *admission.endpoint_limits.values()) < 1:
+            raise ConfigurationException(
+                "ADMISSION_MAX_IN_FLIGHT, ADMISSION_ENDPOINT_MAX_IN_FLIGHT and ADMISSION_ENDPOINT_LIMITS must be positive"
+            )
+        if admission.max_loop_lag <= 0 or admission.lag_interval <= 0 or admission.retry_after < 0:
+            raise ConfigurationException(
+                "ADMISSION_MAX_LOOP_LAG and ADMISSION_LAG_INTERVAL must be positive, ADMISSION_RETRY_AFTER non-negative"
+            )
+        if config.circuit_breaker.failure_threshold < 1 or config.circuit_breaker.half_open_max_calls < 1:
+            raise ConfigurationException(
+                "CIRCUIT_BREAKER_FAILURE_THRESHOLD and CIRCUIT_BREAKER_HALF_OPEN_CALLS must be at least 1"
+            )
+        if not 0 < hedging.percentile < 100:
+            raise ConfigurationException("HEDGING_PERCENTILE must be in (0, 100)")
+        if not 0 <= hedging.budget_ratio <= 1:
+            raise ConfigurationException("HEDGING_BUDGET must be in [0, 1]")
@@ -0,0 +1,86 @@
+import logging
+
+from app.application.exceptions import ValidationException
+from app.application.interfaces.token_estimator import TokenEstimate, TokenEstimator
+from app.domain.models import AIAssistant, Message, Role
+
+logger = logging.getLogger(__name__)
+
+
+class ContextBudget:
+    """Checks prompts against the model's context window before they are sent.
+
+    ``reserve_tokens`` is kept free for the reply. An oversized prompt is
+    rejected up front rather than after a network round trip and queue time;
+    with ``truncate`` the oldest non-system messages are dropped until it fits,
+    always keeping the last message. Only exact estimates are enforced, which
+    with the tiktoken estimator means OpenAI and gpt-oss models: a heuristic
+    one over the budget is logged and the prompt is sent as is, leaving the
+    decision to the provider.
+    """
+
+    def __init__(self, estimator: TokenEstimator, reserve_tokens: int):
+        self._estimator = estimator
+        self._reserve_tokens = reserve_tokens
+        self.rejected = 0
+        self.truncated = 0
+        self.unverified = 0
+
+    def budget(self, assistant: AIAssistant) -> int | None:
+        window = self._estimator.context_window(assistant)
+        return window - self._reserve_tokens if window is not None else None
+
+    async def estimate(self, assistant: AIAssistant, messages: list[Message]) -> TokenEstimate:
+        return await self._estimator.count_messages(assistant, messages)
+
+    async def fit(self, assistant: AIAssistant, messages: list[Message], truncate: bool = False) -> list[Message]:
+        budget = self.budget(assistant)
+        if budget is None:
+            return messages
+        estimate = await self.estimate(assistant, messages)
+        if estimate.tokens <= budget:
+            return messages
+        if not estimate.exact:
+            self.unverified += 1
+            logger.warning(
+                "Prompt for assistant=%s is estimated at %s tokens (%s), over the %s budget; sending it unchecked",
+                assistant.value, estimate.tokens, estimate.method, budget,
+            )
+            return messages
+        if truncate:
+            fitted = await self._truncate(assistant, messages, estimate, budget)
+            if fitted is not None:
+                self.truncated += 1
+                logger.info(
+                    "Dropped %s oldest messages for assistant=%s to fit %s tokens",
+                    len(messages) - len(fitted), assistant.value, budget,
+                )
+                return fitted
+        self.rejected += 1
+        raise ValidationException(
+            f"Prompt is about {estimate.tokens} tokens, more than the {budget} available for {assistant.value} "
+            f"(context window {self._estimator.context_window(assistant)}, {self._reserve_tokens} reserved for the reply)"
+        )
+
+    async def _truncate(
+        self, assistant: AIAssistant, messages: list[Message], estimate: TokenEstimate, budget: int
+    ) -> list[Message] | None:
+        # Estimates are additive: a fixed reply overhead plus a cost per message, so dropping one subtracts its cost.
+        costs = estimate.message_tokens
+        if costs is None:
+            overhead = (await self.estimate(assistant, [])).tokens
+            costs = [(await self.estimate(assistant, [message])).tokens - overhead for message in messages]
+        total = estimate.tokens
+        removed = set()
+        for index, message in enumerate(messages[:-1]):
+            if total <= budget:
+                break
+            if message.role != Role.SYSTEM:
+                removed.add(index)
+                total -= costs[index]
+        if total > budget:
+            return None
+        return [message for index, message in enumerate(messages) if index not in removed]
+
+    def stats(self) -> dict:
+        return {"rejected": self.rejected, "truncated": self.truncated, "unverified": self.unverified}
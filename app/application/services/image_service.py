@@ -0,0 +1,20 @@
+from typing import BinaryIO
+
+from app.application.dto import StoredImageDTO
+from app.application.exceptions import ValidationException
+from app.application.interfaces.image_store import ImageStore
+from app.domain.exceptions import InvalidImageException
+
+
+class ImageService:
+    """Facade over the uploaded image store."""
+
+    def __init__(self, image_store: ImageStore):
+        self._image_store = image_store
+
+    async def upload_image(self, file: BinaryIO) -> StoredImageDTO:
+        try:
+            image = await self._image_store.put(file)
+        except InvalidImageException as exc:
+            raise ValidationException(str(exc))
+        return StoredImageDTO(image_id=image.image_id, size=image.size, mime_type=image.mime_type)
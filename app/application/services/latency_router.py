@@ -0,0 +1,120 @@
+import logging
+import random
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+
+from app.domain.models import AIAssistant
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class _BackendStats:
+    latency: float | None = None
+    error_rate: float = 0.0
+    in_flight: int = 0
+    requests: int = 0
+    errors: int = 0
+    last_observed: float = 0.0
+
+
+class LatencyRouter:
+    """Ranks the backends of the ``auto`` assistant by live latency, error rate and load.
+
+    Each backend's score is its latency EWMA scaled up by its current in-flight
+    count and error-rate EWMA; lower is better. Backends without samples, or
+    whose estimate is older than ``stale_after`` seconds, go first so they are
+    measured again. With probability ``exploration`` a random backend is tried
+    first, which keeps estimates of the slower backends from going stale under load.
+    """
+
+    _ALPHA = 0.2
+
+    def __init__(self, pool: list[AIAssistant], exploration: float = 0.05, stale_after: float = 60.0, rng: random.Random | None = None):
+        if not pool:
+            raise ValueError("Routing pool must not be empty")
+        self._backends = {assistant: _BackendStats() for assistant in pool}
+        self._exploration = exploration
+        self._stale_after = stale_after
+        self._random = rng or random.Random()
+        self.explorations = 0
+
+    @property
+    def pool(self) -> list[AIAssistant]:
+        return list(self._backends)
+
+    def rank(self) -> list[AIAssistant]:
+        now = time.monotonic()
+        stale = [
+            assistant
+            for assistant, stats in self._backends.items()
+            if stats.requests == 0 or now - stats.last_observed > self._stale_after
+        ]
+        # Probe the stalest idle backend, one call at a time, so a cold start does not route everything blind.
+        stale = sorted(
+            (assistant for assistant in stale if self._backends[assistant].in_flight == 0),
+            key=lambda assistant: (self._backends[assistant].requests > 0, self._backends[assistant].last_observed),
+        )
+        ranked = sorted(
+            (assistant for assistant in self._backends if self._backends[assistant].latency is not None),
+            key=self._score,
+        )
+        ranked += [assistant for assistant in self._backends if assistant not in ranked]
+        if stale:
+            first = stale[0]
+        elif len(ranked) > 1 and self._random.random() < self._exploration:
+            first = self._random.choice(ranked[1:])
+            self.explorations += 1
+        else:
+            return ranked
+        return [first, *(assistant for assistant in ranked if assistant != first)]
+
+    def _score(self, assistant: AIAssistant) -> float:
+        stats = self._backends[assistant]
+        return stats.latency * (1 + stats.in_flight) / max(1.0 - stats.error_rate, 0.05)
+
+    @contextmanager
+    def track(self, assistant: AIAssistant) -> Iterator[None]:
+        """Count the call as in flight and feed its latency and outcome into the estimates."""
+        stats = self._backends.get(assistant)
+        if stats is None:
+            yield
+            return
+        stats.in_flight += 1
+        started = time.monotonic()
+        try:
+            yield
+        except Exception:
+            self._observe(stats, None)
+            raise
+        else:
+            self._observe(stats, time.monotonic() - started)
+        finally:
+            stats.in_flight -= 1
+
+    def _observe(self, stats: _BackendStats, latency: float | None) -> None:
+        stats.requests += 1
+        stats.last_observed = time.monotonic()
+        failed = latency is None
+        if failed:
+            stats.errors += 1
+        stats.error_rate += self._ALPHA * (float(failed) - stats.error_rate)
+        if latency is not None:
+            stats.latency = latency if stats.latency is None else stats.latency + self._ALPHA * (latency - stats.latency)
+
+    def stats(self) -> dict:
+        return {
+            "explorations": self.explorations,
+            "backends": {
+                assistant.value: {
+                    "latency": stats.latency,
+                    "error_rate": round(stats.error_rate, 4),
+                    "in_flight": stats.in_flight,
+                    "requests": stats.requests,
+                    "errors": stats.errors,
+                }
+                for assistant, stats in self._backends.items()
+            },
+        }
@@ -0,0 +1,38 @@
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from app.domain.models import RequestIdentity
+
+_identity: ContextVar[RequestIdentity] = ContextVar("request_identity", default=RequestIdentity())
+
+
+def current_identity() -> RequestIdentity:
+    """Identity of the request being handled; tasks started from it inherit the value."""
+    return _identity.get()
+
+
+@contextmanager
+def request_identity(identity: RequestIdentity) -> Iterator[None]:
+    token = _identity.set(identity)
+    try:
+        yield
+    finally:
+        _identity.reset(token)
+
+
+_request_id: ContextVar[str | None] = ContextVar("request_id", default=None)
+
+
+def current_request_id() -> str | None:
+    """ID of the request being handled, for log records; ``None`` outside a request."""
+    return _request_id.get()
+
+
+@contextmanager
+def request_id_context(request_id: str) -> Iterator[None]:
+    token = _request_id.set(request_id)
+    try:
+        yield
+    finally:
+        _request_id.reset(token)
@@ -0,0 +1,48 @@
+import hashlib
+import json
+
+from app.domain.models import AIAssistant, AIMessage, ImageContentItem, Message, TextContentItem
+
+_FINGERPRINT_VERSION = b"llmbox-request-v1"
+_CHUNK_CHARS = 1 << 20
+
+
+def _update_str(digest: hashlib.blake2b, value: str) -> None:
+    # Length-prefix every field so that concatenations cannot collide, and
+    # encode large strings (base64 images) in slices to avoid a full copy.
+    digest.update(f"{len(value)}:".encode())
+    for start in range(0, len(value), _CHUNK_CHARS):
+        digest.update(value[start:start + _CHUNK_CHARS].encode())
+
+
+def _new_digest(kind: str, params: dict | None) -> hashlib.blake2b:
+    digest = hashlib.blake2b(_FINGERPRINT_VERSION, digest_size=32)
+    _update_str(digest, kind)
+    _update_str(digest, json.dumps(params or {}, sort_keys=True, separators=(",", ":")))
+    return digest
+
+
+def text_request_key(assistant: AIAssistant, messages: list[Message], params: dict | None = None) -> str:
+    """Canonical hash of a text generation request: assistant, messages and generation parameters."""
+    digest = _new_digest("text", params)
+    _update_str(digest, assistant.value)
+    for message in messages:
+        _update_str(digest, message.role.value)
+        _update_str(digest, message.content)
+    return digest.hexdigest()
+
+
+def vision_request_key(messages: list[AIMessage], params: dict | None = None) -> str:
+    """Canonical hash of a vision request; image payloads are hashed incrementally."""
+    digest = _new_digest("vision", params)
+    for message in messages:
+        _update_str(digest, message.role.value)
+        digest.update(f"{len(message.content)}:".encode())
+        for item in message.content:
+            if isinstance(item, TextContentItem):
+                _update_str(digest, "text")
+                _update_str(digest, item.text)
+            elif isinstance(item, ImageContentItem):
+                _update_str(digest, "image")
+                _update_str(digest, item.image_base64)
+    return digest.hexdigest()
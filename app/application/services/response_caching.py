@@ -0,0 +1,24 @@
+import logging
+
+from app.application.interfaces.response_cache import ResponseCache
+from app.application.mappers.response_codec import decode_response, encode_response
+from app.domain.models import AIResponse
+
+logger = logging.getLogger(__name__)
+
+
+async def get_cached_response(cache: ResponseCache, key: str) -> AIResponse | None:
+    """Look up a cached response; cache failures are logged and treated as a miss."""
+    try:
+        data = await cache.get(key)
+        return decode_response(data) if data is not None else None
+    except Exception as exc:
+        logger.warning("Response cache lookup failed: %s", exc, exc_info=True)
+        return None
+
+
+async def store_response(cache: ResponseCache, key: str, response: AIResponse) -> None:
+    try:
+        await cache.set(key, encode_response(response))
+    except Exception as exc:
+        logger.warning("Response cache store failed: %s", exc, exc_info=True)
@@ -0,0 +1,29 @@
+from collections.abc import AsyncIterator
+from typing import TYPE_CHECKING
+
+from app.application.dto import AIResponseChunkDTO, AIResponseDTO, CreateSessionDTO, SessionDTO, SessionTurnDTO
+
+if TYPE_CHECKING:
+    from app.application.use_cases.sessions_use_case import SessionsUseCase
+
+
+class SessionService:
+    """Facade over server-side conversation sessions."""
+
+    def __init__(self, sessions_use_case: "SessionsUseCase"):
+        self._sessions_use_case = sessions_use_case
+
+    async def create_session(self, dto: CreateSessionDTO) -> SessionDTO:
+        return await self._sessions_use_case.create(dto)
+
+    async def get_session(self, session_id: str) -> SessionDTO:
+        return await self._sessions_use_case.get(session_id)
+
+    async def delete_session(self, session_id: str) -> None:
+        await self._sessions_use_case.delete(session_id)
+
+    async def send_message(self, session_id: str, dto: SessionTurnDTO) -> AIResponseDTO:
+        return await self._sessions_use_case.send(session_id, dto)
+
+    def send_message_stream(self, session_id: str, dto: SessionTurnDTO) -> AsyncIterator[AIResponseChunkDTO]:
+        return self._sessions_use_case.send_stream(session_id, dto)
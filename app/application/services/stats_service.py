@@ -0,0 +1,14 @@
+from app.application.interfaces.stats_provider import StatsProvider
+
+
+class StatsService:
+    """Collects named statistics providers into a single snapshot for monitoring."""
+
+    def __init__(self):
+        self._providers: dict[str, StatsProvider] = {}
+
+    def register(self, name: str, provider: StatsProvider) -> None:
+        self._providers[name] = provider
+
+    def snapshot(self) -> dict:
+        return {name: provider.stats() for name, provider in self._providers.items()}
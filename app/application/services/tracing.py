@@ -0,0 +1,157 @@
+import os
+import random
+import time
+from contextvars import ContextVar, Token
+
+from app.application.interfaces.span_exporter import SpanExporter
+
+
+class Span:
+    """One timed step of a request; times are ``time.perf_counter()`` readings."""
+
+    __slots__ = ("trace", "name", "span_id", "parent_id", "start", "end", "attributes")
+
+    def __init__(self, trace: "Trace", name: str, parent_id: str | None, start: float, attributes: dict | None = None):
+        self.trace = trace
+        self.name = name
+        self.span_id = os.urandom(8).hex()
+        self.parent_id = parent_id
+        self.start = start
+        self.end: float | None = None
+        self.attributes = attributes
+
+    @property
+    def duration(self) -> float:
+        return (self.end if self.end is not None else time.perf_counter()) - self.start
+
+
+class Trace:
+    """Spans recorded while handling one request, rooted at a span covering the whole request."""
+
+    def __init__(self, name: str, attributes: dict | None = None):
+        self.trace_id = os.urandom(16).hex()
+        # Wall-clock anchor, so exporters can turn perf_counter readings into timestamps.
+        self.started_ns = time.time_ns()
+        self.root = Span(self, name, None, time.perf_counter(), attributes)
+        self.spans: list[Span] = [self.root]
+
+    @property
+    def finished(self) -> bool:
+        return self.root.end is not None
+
+    def timestamp_ns(self, perf_time: float) -> int:
+        return self.started_ns + int((perf_time - self.root.start) * 1e9)
+
+    def add(self, name: str, start: float, end: float, parent: Span | None = None, attributes: dict | None = None) -> None:
+        """Record a step that has already ended; ignored once the request is finished."""
+        if self.finished:
+            return
+        span = Span(self, name, (parent or self.root).span_id, start, attributes)
+        span.end = end
+        self.spans.append(span)
+
+    def server_timing(self) -> str:
+        """``Server-Timing`` header value: time per span name, summed over repeats, plus the total so far."""
+        durations: dict[str, float] = {}
+        for span in self.spans[1:]:
+            if span.end is not None:
+                durations[span.name] = durations.get(span.name, 0.0) + span.end - span.start
+        durations["total"] = self.root.duration
+        return ", ".join(f"{name};dur={duration * 1000:.1f}" for name, duration in durations.items())
+
+
+_current_span: ContextVar[Span | None] = ContextVar("current_span", default=None)
+
+
+class _SpanScope:
+    __slots__ = ("_name", "_attributes", "_span", "_token")
+
+    def __init__(self, name: str, attributes: dict | None):
+        self._name = name
+        self._attributes = attributes
+
+    def __enter__(self) -> Span | None:
+        parent = _current_span.get()
+        if parent is None or parent.trace.finished:
+            self._span = None
+            return None
+        self._span = Span(parent.trace, self._name, parent.span_id, time.perf_counter(), self._attributes)
+        parent.trace.spans.append(self._span)
+        self._token = _current_span.set(self._span)
+        return self._span
+
+    def __exit__(self, *exc_info) -> None:
+        if self._span is not None:
+            self._span.end = time.perf_counter()
+            _current_span.reset(self._token)
+
+
+class _NoopScope:
+    __slots__ = ()
+
+    def __enter__(self) -> None:
+        return None
+
+    def __exit__(self, *exc_info) -> None:
+        return None
+
+
+_NOOP = _NoopScope()
+
+
+def span(name: str, **attributes):
+    """Time the block as a child of the current span; a shared no-op when the request is not traced.
+
+    The block must not span a ``yield`` of an async generator: the span would
+    stay current for the consumer between chunks. Use :func:`record_span` there.
+    """
+    if _current_span.get() is None:
+        return _NOOP
+    return _SpanScope(name, attributes or None)
+
+
+def tracing_active() -> bool:
+    return _current_span.get() is not None
+
+
+def record_span(name: str, start: float, end: float | None = None, **attributes) -> None:
+    """Record a step that started at ``start`` (a ``time.perf_counter()`` reading) as a child of the current span."""
+    parent = _current_span.get()
+    if parent is not None:
+        parent.trace.add(name, start, end if end is not None else time.perf_counter(), parent, attributes or None)
+
+
+class Tracer:
+    """Starts and finishes request traces and hands finished ones to the exporter.
+
+    Only ``sample_rate`` of requests are traced; for the rest :func:`span`
+    costs a single context variable lookup.
+    """
+
+    def __init__(self, exporter: SpanExporter | None = None, sample_rate: float = 1.0, server_timing: bool = True):
+        self._exporter = exporter
+        self._sample_rate = sample_rate
+        self.server_timing = server_timing
+        self.traced = 0
+        self.exported = 0
+
+    def start(self, name: str, attributes: dict | None = None) -> tuple[Trace, Token] | None:
+        if self._sample_rate < 1.0 and random.random() >= self._sample_rate:
+            return None
+        trace = Trace(name, attributes)
+        self.traced += 1
+        return trace, _current_span.set(trace.root)
+
+    def finish(self, trace: Trace, token: Token) -> None:
+        trace.root.end = time.perf_counter()
+        _current_span.reset(token)
+        if self._exporter is not None:
+            self._exporter.export(trace)
+            self.exported += 1
+
+    def stats(self) -> dict:
+        return {"sample_rate": self._sample_rate, "traced": self.traced, "exported": self.exported}
+
+    async def aclose(self) -> None:
+        if self._exporter is not None:
+            await self._exporter.aclose()
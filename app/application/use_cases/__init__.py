@@ -1,8 +1,12 @@
+from app.application.use_cases.batch_jobs_use_case import BatchJobsUseCase
 from app.application.use_cases.generate_text_ai_use_case import GenerateTextAIUseCase
+from app.application.use_cases.generate_text_batch_use_case import GenerateTextBatchUseCase
 from app.application.use_cases.generate_vision_ai_use_case import GenerateVisionAIUseCase
 
 __all__ = [
+    "BatchJobsUseCase",
     "GenerateTextAIUseCase",
+    "GenerateTextBatchUseCase",
     "GenerateVisionAIUseCase",
 ]
 
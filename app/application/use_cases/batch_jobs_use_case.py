@@ -0,0 +1,136 @@
+import logging
+import time
+import uuid
+from collections.abc import AsyncIterator
+from dataclasses import replace
+
+from app.application.dto import BatchJobDTO, BatchJobResultDTO, CreateBatchJobDTO
+from app.application.exceptions import NotFoundException, ServiceUnavailableException, ValidationException
+from app.application.interfaces.batch_job_store import BatchJobStore
+from app.application.mappers.domain_to_dto import to_ai_response_dto, to_batch_job_dto
+from app.application.mappers.dto_to_domain import to_domain_message
+from app.domain.interfaces import BatchProvider
+from app.domain.models import AIAssistant, BatchJob, BatchJobStatus, BatchRequest
+
+logger = logging.getLogger(__name__)
+
+
+class BatchJobsUseCase:
+    """Submits bulk requests to a provider's batch API and tracks them as local jobs.
+
+    Each job gets our own id, which the store maps to the provider batch id;
+    job status is refreshed from the provider until it reaches a terminal state.
+    """
+
+    def __init__(self, providers: dict[AIAssistant, BatchProvider], store: BatchJobStore, max_requests: int = 50000):
+        self._providers = providers
+        self._store = store
+        self._max_requests = max_requests
+
+    async def create(self, dto: CreateBatchJobDTO) -> BatchJobDTO:
+        provider = self._providers.get(dto.assistant)
+        if provider is None:
+            raise ValidationException(f"Batch jobs are not supported for assistant {dto.assistant.value}")
+        if not dto.requests:
+            raise ValidationException("Batch job must contain at least one request")
+        if len(dto.requests) > self._max_requests:
+            raise ValidationException(f"Batch job exceeds the limit of {self._max_requests} requests")
+
+        requests = [
+            BatchRequest(
+                custom_id=request.custom_id or str(index),
+                messages=[to_domain_message(message) for message in request.messages],
+            )
+            for index, request in enumerate(dto.requests)
+        ]
+        if len({request.custom_id for request in requests}) != len(requests):
+            raise ValidationException("custom_id values must be unique within a batch job")
+
+        try:
+            provider_batch_id = await provider.submit(requests)
+        except Exception as exc:
+            logger.error("Batch submission to %s failed: %s", provider.name, exc, exc_info=True)
+            raise ServiceUnavailableException(f"Failed to submit batch to {provider.name}", original_error=exc)
+
+        now = time.time()
+        job = BatchJob(
+            id=f"job_{uuid.uuid4().hex}",
+            assistant=dto.assistant,
+            provider=provider.name,
+            provider_batch_id=provider_batch_id,
+            status=BatchJobStatus.PENDING,
+            request_count=len(requests),
+            created_at=now,
+            updated_at=now,
+        )
+        await self._store.save(job)
+        logger.info("Batch job %s submitted to %s as %s", job.id, provider.name, provider_batch_id)
+        return to_batch_job_dto(job)
+
+    async def get(self, job_id: str) -> BatchJobDTO:
+        return to_batch_job_dto(await self._refresh(await self._load(job_id)))
+
+    async def cancel(self, job_id: str) -> BatchJobDTO:
+        job = await self._load(job_id)
+        if not job.status.is_terminal:
+            try:
+                await self._provider_for(job).cancel(job.provider_batch_id)
+            except Exception as exc:
+                raise ServiceUnavailableException(f"Failed to cancel batch job {job_id}", original_error=exc)
+        return to_batch_job_dto(await self._refresh(job))
+
+    async def results(self, job_id: str) -> AsyncIterator[BatchJobResultDTO]:
+        """Check that the job has finished, then return an iterator over its results.
+
+        The check runs before the first result is read, so an unfinished job is
+        reported as a regular error rather than in the middle of a download.
+        """
+        job = await self._refresh(await self._load(job_id))
+        if not job.status.is_terminal:
+            raise ValidationException(f"Batch job {job_id} is still {job.status.value}")
+        return self._iter_results(job, self._provider_for(job))
+
+    @staticmethod
+    async def _iter_results(job: BatchJob, provider: BatchProvider) -> AsyncIterator[BatchJobResultDTO]:
+        try:
+            async for result in provider.get_results(job.provider_batch_id):
+                yield BatchJobResultDTO(
+                    custom_id=result.custom_id,
+                    response=to_ai_response_dto(result.response) if result.response is not None else None,
+                    error=result.error,
+                )
+        except Exception as exc:
+            raise ServiceUnavailableException(f"Failed to download results of batch job {job.id}", original_error=exc)
+
+    async def _load(self, job_id: str) -> BatchJob:
+        job = await self._store.get(job_id)
+        if job is None:
+            raise NotFoundException(f"Batch job not found: {job_id}")
+        return job
+
+    def _provider_for(self, job: BatchJob) -> BatchProvider:
+        provider = self._providers.get(job.assistant)
+        if provider is None or provider.name != job.provider:
+            raise ServiceUnavailableException(f"Batch provider {job.provider} is no longer configured")
+        return provider
+
+    async def _refresh(self, job: BatchJob) -> BatchJob:
+        if job.status.is_terminal:
+            return job
+        try:
+            state = await self._provider_for(job).get_state(job.provider_batch_id)
+        except ServiceUnavailableException:
+            raise
+        except Exception as exc:
+            raise ServiceUnavailableException(f"Failed to fetch status of batch job {job.id}", original_error=exc)
+        refreshed = replace(
+            job,
+            status=state.status,
+            completed_count=state.completed,
+            failed_count=state.failed,
+            error=state.error,
+            updated_at=time.time(),
+        )
+        if refreshed != replace(job, updated_at=refreshed.updated_at):
+            await self._store.save(refreshed)
+        return refreshed
@@ -0,0 +1,27 @@
+import logging
+
+from app.application.dto import GenerateAIRequestDTO, TokenCountDTO
+from app.application.mappers.dto_to_domain import to_domain_messages_from_dto
+from app.application.services.context_budget import ContextBudget
+
+logger = logging.getLogger(__name__)
+
+
+class CountTokensUseCase:
+    """Estimates a request's prompt size locally, without calling the provider."""
+
+    def __init__(self, context_budget: ContextBudget):
+        self._context_budget = context_budget
+
+    async def execute(self, request: GenerateAIRequestDTO) -> TokenCountDTO:
+        messages, assistant = to_domain_messages_from_dto(request)
+        estimate = await self._context_budget.estimate(assistant, messages)
+        budget = self._context_budget.budget(assistant)
+        logger.debug("Estimated %s prompt tokens for assistant=%s (%s)", estimate.tokens, assistant.value, estimate.method)
+        return TokenCountDTO(
+            assistant=assistant,
+            prompt_tokens=estimate.tokens,
+            method=estimate.method,
+            budget_tokens=budget,
+            fits=budget is None or estimate.tokens <= budget,
+        )
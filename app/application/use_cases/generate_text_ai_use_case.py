@@ -1,46 +1,273 @@
 import logging
+from collections.abc import AsyncIterator
+from contextlib import nullcontext
+from dataclasses import replace
 
-from app.application.dto import AIResponseDTO, GenerateAIRequestDTO
-from app.application.exceptions import ServiceUnavailableException, ValidationException
-from app.application.mappers.domain_to_dto import to_ai_response_dto
+from app.application.dto import AIResponseChunkDTO, AIResponseDTO, CachePolicy, GenerateAIRequestDTO
+from app.application.exceptions import ApplicationException, ServiceUnavailableException, ValidationException
+from app.application.interfaces.metrics import UpstreamMetrics
+from app.application.interfaces.response_cache import ResponseCache
+from app.application.mappers.domain_to_dto import to_ai_response_chunk_dto, to_ai_response_dto
 from app.application.mappers.dto_to_domain import to_domain_messages_from_dto
+from app.application.services.context_budget import ContextBudget
+from app.application.services.latency_router import LatencyRouter
+from app.application.services.request_fingerprint import text_request_key
+from app.application.services.response_caching import get_cached_response, store_response
+from app.application.services.single_flight import SingleFlight
+from app.application.services.tracing import span
 from app.domain.exceptions import (
     AIServiceException,
     DomainException,
     UnknownAIAssistantException,
+    is_client_error,
 )
 from app.domain.interfaces import TextModelClient
-from app.domain.models import AIAssistant, AIResponse
+from app.domain.models import AIAssistant, AIResponse, Message, Usage
 
 logger = logging.getLogger(__name__)
 
 
 class GenerateTextAIUseCase:
 
-    def __init__(self, text_clients: dict[AIAssistant, TextModelClient]):
+    def __init__(
+        self,
+        text_clients: dict[AIAssistant, TextModelClient],
+        response_cache: ResponseCache | None = None,
+        single_flight: SingleFlight | None = None,
+        fallbacks: dict[AIAssistant, list[AIAssistant]] | None = None,
+        router: LatencyRouter | None = None,
+        context_budget: ContextBudget | None = None,
+        metrics: UpstreamMetrics | None = None,
+    ):
         self._text_clients = text_clients
+        self._response_cache = response_cache
+        self._single_flight = single_flight
+        self._fallbacks = fallbacks or {}
+        self._router = router
+        self._context_budget = context_budget
+        self._metrics = metrics
+
+    @property
+    def text_clients(self) -> dict[AIAssistant, TextModelClient]:
+        """The configured backends, wrapped in their limiters and breakers, for callers that bypass the use case."""
+        return dict(self._text_clients)
 
     async def execute(self, request: GenerateAIRequestDTO) -> AIResponseDTO:
         logger.info("Executing GenerateTextAIUseCase with assistant=%s", request.assistant)
 
         messages, assistant = to_domain_messages_from_dto(request)
+        return await self.generate(assistant, messages, request.cache_policy, request.truncate_history)
+
+    async def generate(
+        self,
+        assistant: AIAssistant,
+        messages: list[Message],
+        cache_policy: CachePolicy = CachePolicy.DEFAULT,
+        truncate_history: bool = False,
+    ) -> AIResponseDTO:
+        """Same as ``execute`` for messages that are already domain objects, such as a stored session history."""
+        with span("use_case", assistant=assistant.value):
+            return await self._generate(assistant, messages, cache_policy, truncate_history)
+
+    async def _generate(
+        self,
+        assistant: AIAssistant,
+        messages: list[Message],
+        cache_policy: CachePolicy,
+        truncate_history: bool,
+    ) -> AIResponseDTO:
+        self._ensure_available(assistant)
+        messages = await self._fit_context(assistant, messages, truncate_history)
+
+        use_cache = self._response_cache is not None and cache_policy != CachePolicy.BYPASS
+        request_key = None
+        if use_cache or self._single_flight is not None:
+            request_key = text_request_key(assistant, messages)
+
+        if use_cache and cache_policy == CachePolicy.DEFAULT:
+            with span("cache"):
+                cached_response = await get_cached_response(self._response_cache, request_key)
+            if cached_response is not None:
+                logger.info("Response cache hit for assistant=%s", assistant.value)
+                return to_ai_response_dto(cached_response, cached=True)
+
+        async def generate() -> AIResponse:
+            response = await self._generate_with_fallback(assistant, messages)
+            if use_cache:
+                await store_response(self._response_cache, request_key, response)
+            return response
+
+        try:
+            if self._single_flight is not None:
+                domain_response: AIResponse = await self._single_flight.do(request_key, generate)
+            else:
+                domain_response = await generate()
+        except Exception as exc:
+            raise self._to_application_exception(exc, assistant)
+
+        return to_ai_response_dto(domain_response)
+
+    async def execute_stream(self, request: GenerateAIRequestDTO) -> AsyncIterator[AIResponseChunkDTO]:
+        logger.info("Executing streaming GenerateTextAIUseCase with assistant=%s", request.assistant)
+
+        messages, assistant = to_domain_messages_from_dto(request)
+        async for chunk in self.generate_stream(assistant, messages, request.truncate_history):
+            yield chunk
+
+    async def generate_stream(
+        self,
+        assistant: AIAssistant,
+        messages: list[Message],
+        truncate_history: bool = False,
+    ) -> AsyncIterator[AIResponseChunkDTO]:
+        self._ensure_available(assistant)
+        messages = await self._fit_context(assistant, messages, truncate_history)
+        try:
+            async for chunk in self._stream_with_fallback(assistant, messages):
+                yield chunk
+        except Exception as exc:
+            raise self._to_application_exception(exc, assistant)
 
+    def _candidates(self, assistant: AIAssistant) -> list[tuple[AIAssistant, TextModelClient]]:
+        if assistant == AIAssistant.AUTO:
+            # The auto assistant fails over through its whole pool, best estimate first.
+            chain = self._router.rank()
+        else:
+            chain = [assistant, *self._fallbacks.get(assistant, [])]
+        candidates = [(candidate, self._text_clients[candidate]) for candidate in chain if candidate in self._text_clients]
+        if not candidates:
+            raise ServiceUnavailableException(f"No configured backend can serve assistant {assistant.value}")
+        return candidates
+
+    async def _generate_with_fallback(self, assistant: AIAssistant, messages: list[Message]) -> AIResponse:
+        candidates = self._candidates(assistant)
+        for index, (candidate, client) in enumerate(candidates):
+            try:
+                with self._track(candidate):
+                    response = await self._call(candidate, client, messages)
+            except Exception as exc:
+                if index == len(candidates) - 1 or not self._should_fail_over(exc):
+                    raise
+                logger.warning("Assistant %s failed (%s), falling back to %s", candidate.value, exc, candidates[index + 1][0].value)
+                continue
+            if response.served_by is None:
+                response = replace(response, served_by=candidate.value)
+            return response
+
+    async def _stream_with_fallback(self, assistant: AIAssistant, messages: list[Message]) -> AsyncIterator[AIResponseChunkDTO]:
+        """Fail over while the stream has produced nothing yet; after the first chunk errors propagate."""
+        candidates = self._candidates(assistant)
+        for index, (candidate, client) in enumerate(candidates):
+            stream = client.generate_stream(messages)
+            started = self._metrics.call_started(candidate) if self._metrics is not None else 0.0
+            try:
+                with self._track(candidate):
+                    first_chunk = await anext(stream, None)
+            except Exception as exc:
+                self._call_finished(candidate, started, exc)
+                if index == len(candidates) - 1 or not self._should_fail_over(exc):
+                    raise
+                logger.warning("Assistant %s failed (%s), falling back to %s", candidate.value, exc, candidates[index + 1][0].value)
+                continue
+            except BaseException:
+                self._call_cancelled(candidate, started)
+                raise
+            usage = None
+            try:
+                if first_chunk is not None:
+                    if self._metrics is not None:
+                        self._metrics.first_token(candidate, started)
+                    usage = first_chunk.usage
+                    yield to_ai_response_chunk_dto(first_chunk, served_by=candidate.value)
+                    async for chunk in stream:
+                        usage = chunk.usage or usage
+                        yield to_ai_response_chunk_dto(chunk)
+            except Exception as exc:
+                self._call_finished(candidate, started, exc)
+                raise
+            except BaseException:
+                self._call_cancelled(candidate, started)
+                raise
+            self._call_finished(candidate, started, usage=usage)
+            return
+
+    async def _call(self, assistant: AIAssistant, client: TextModelClient, messages: list[Message]) -> AIResponse:
+        if self._metrics is None:
+            return await client.generate(messages)
+        started = self._metrics.call_started(assistant)
+        try:
+            response = await client.generate(messages)
+        except Exception as exc:
+            self._call_finished(assistant, started, exc)
+            raise
+        except BaseException:
+            self._call_cancelled(assistant, started)
+            raise
+        self._call_finished(assistant, started, usage=response.usage)
+        return response
+
+    def _call_finished(
+        self,
+        assistant: AIAssistant,
+        started: float,
+        error: Exception | None = None,
+        usage: Usage | None = None,
+    ) -> None:
+        if self._metrics is None:
+            return
+        self._metrics.call_finished(assistant, started, error)
+        if usage is not None:
+            self._metrics.tokens(assistant, usage)
+
+    def _call_cancelled(self, assistant: AIAssistant, started: float) -> None:
+        if self._metrics is not None:
+            self._metrics.call_cancelled(assistant, started)
+
+    async def _fit_context(self, assistant: AIAssistant, messages: list[Message], truncate: bool) -> list[Message]:
+        """Reject or trim prompts that cannot fit the requested model before paying for the round trip.
+
+        Fallbacks and ``auto`` can land on models with other windows, so only
+        the explicitly requested model is checked.
+        """
+        if self._context_budget is None:
+            return messages
+        with span("context_budget"):
+            return await self._context_budget.fit(assistant, messages, truncate)
+
+    def _track(self, assistant: AIAssistant):
+        return self._router.track(assistant) if self._router is not None else nullcontext()
+
+    @staticmethod
+    def _should_fail_over(exc: Exception) -> bool:
+        if isinstance(exc, DomainException) and not isinstance(exc, AIServiceException):
+            return False
+        return not is_client_error(exc)
+
+    def _ensure_available(self, assistant: AIAssistant) -> None:
+        if assistant == AIAssistant.AUTO:
+            if self._router is None:
+                raise ValidationException("The auto assistant is not configured")
+            return
+        self._get_client(assistant)
+
+    def _get_client(self, assistant: AIAssistant) -> TextModelClient:
         client = self._text_clients.get(assistant)
         if client is None:
             raise ValidationException(f"Unknown AI assistant: {assistant.value}")
-        try:
-            domain_response: AIResponse = await client.generate(messages)
-            return to_ai_response_dto(domain_response)
-        except UnknownAIAssistantException as exc:
-            raise ValidationException(str(exc))
-        except AIServiceException as exc:
-            raise ServiceUnavailableException(str(exc), original_error=exc)
-        except DomainException as exc:
-            raise ValidationException(str(exc))
-        except Exception as exc:
-            logger.error("Error in GenerateTextAIUseCase with assistant=%s: %s",assistant.value, exc, exc_info=True)
-            raise ServiceUnavailableException(
-                f"Failed to generate AI response with assistant {assistant.value}",
-                original_error=exc,
-            )
+        return client
 
+    @staticmethod
+    def _to_application_exception(exc: Exception, assistant: AIAssistant) -> ApplicationException:
+        if isinstance(exc, ApplicationException):
+            return exc
+        if isinstance(exc, UnknownAIAssistantException):
+            return ValidationException(str(exc))
+        if isinstance(exc, AIServiceException):
+            return ServiceUnavailableException(str(exc), original_error=exc)
+        if isinstance(exc, DomainException):
+            return ValidationException(str(exc))
+        logger.error("Error in GenerateTextAIUseCase with assistant=%s: %s", assistant.value, exc, exc_info=exc)
+        return ServiceUnavailableException(
+            f"Failed to generate AI response with assistant {assistant.value}",
+            original_error=exc,
+        )
@@ -0,0 +1,67 @@
+import asyncio
+import logging
+from collections.abc import AsyncIterator
+
+from app.application.dto import BatchItemResultDTO, GenerateAIBatchRequestDTO, GenerateAIRequestDTO
+from app.application.exceptions import ApplicationException, ValidationException
+from app.application.use_cases.generate_text_ai_use_case import GenerateTextAIUseCase
+
+logger = logging.getLogger(__name__)
+
+
+class GenerateTextBatchUseCase:
+    """Runs many independent text requests with a bounded number in flight.
+
+    A fixed pool of workers pulls items in order, so a batch of thousands never
+    creates thousands of tasks; per-provider limits still apply inside the
+    clients. A failing item is reported in its own result and does not affect
+    the rest of the batch.
+    """
+
+    def __init__(self, text_use_case: GenerateTextAIUseCase, max_items: int = 1000, max_concurrency: int = 16):
+        self._text_use_case = text_use_case
+        self._max_items = max_items
+        self._max_concurrency = max_concurrency
+
+    async def execute(self, batch: GenerateAIBatchRequestDTO) -> list[BatchItemResultDTO]:
+        results = [result async for result in self.execute_stream(batch)]
+        return sorted(results, key=lambda result: result.index)
+
+    async def execute_stream(self, batch: GenerateAIBatchRequestDTO) -> AsyncIterator[BatchItemResultDTO]:
+        """Yield item results in completion order."""
+        self._validate(batch)
+        logger.info("Executing GenerateTextBatchUseCase with %s items", len(batch.items))
+
+        concurrency = min(batch.max_concurrency or self._max_concurrency, self._max_concurrency, len(batch.items))
+        pending = iter(enumerate(batch.items))
+        results: asyncio.Queue[BatchItemResultDTO] = asyncio.Queue()
+
+        async def worker() -> None:
+            for index, item in pending:
+                results.put_nowait(await self._run_item(index, item))
+
+        workers = [asyncio.create_task(worker()) for _ in range(concurrency)]
+        try:
+            for _ in range(len(batch.items)):
+                yield await results.get()
+        finally:
+            for task in workers:
+                task.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+
+    async def _run_item(self, index: int, item: GenerateAIRequestDTO) -> BatchItemResultDTO:
+        try:
+            return BatchItemResultDTO(index=index, response=await self._text_use_case.execute(item))
+        except ApplicationException as exc:
+            return BatchItemResultDTO(index=index, error=exc)
+        except Exception as exc:
+            logger.error("Unexpected error in batch item %s: %s", index, exc, exc_info=True)
+            return BatchItemResultDTO(index=index, error=exc)
+
+    def _validate(self, batch: GenerateAIBatchRequestDTO) -> None:
+        if not batch.items:
+            raise ValidationException("Batch must contain at least one item")
+        if len(batch.items) > self._max_items:
+            raise ValidationException(f"Batch exceeds the limit of {self._max_items} items")
+        if batch.max_concurrency is not None and batch.max_concurrency < 1:
+            raise ValidationException("max_concurrency must be at least 1")
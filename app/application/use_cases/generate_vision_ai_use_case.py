@@ -1,33 +1,186 @@
+import asyncio
 import logging
+from collections.abc import AsyncIterator
 
-from app.application.dto import AIResponseDTO, GenerateVisionAIRequestDTO
-from app.application.exceptions import ServiceUnavailableException, ValidationException
-from app.application.mappers.domain_to_dto import to_ai_response_dto
+from app.application.dto import (
+    AIResponseChunkDTO,
+    AIResponseDTO,
+    CachePolicy,
+    GenerateVisionAIRequestDTO,
+    ImageContentItemDTO,
+)
+from app.application.exceptions import (
+    ApplicationException,
+    NotFoundException,
+    ServiceUnavailableException,
+    ValidationException,
+)
+from app.application.interfaces.image_preprocessor import ImagePreprocessor
+from app.application.interfaces.image_store import ImageStore
+from app.application.interfaces.metrics import UpstreamMetrics
+from app.application.interfaces.response_cache import ResponseCache
+from app.application.mappers.domain_to_dto import to_ai_response_chunk_dto, to_ai_response_dto
 from app.application.mappers.dto_to_domain import to_domain_ai_messages_from_dto
+from app.application.services.request_fingerprint import vision_request_key
+from app.application.services.response_caching import get_cached_response, store_response
+from app.application.services.tracing import span
 from app.domain.exceptions import AIServiceException, DomainException
 from app.domain.interfaces import VisionModelClient
-from app.domain.models import AIResponse
+from app.domain.models import AIAssistant, AIMessage, AIResponse, AIResponseChunk, ImageContentItem
 
 logger = logging.getLogger(__name__)
 
+# Vision requests are served by the OpenAI client, so they are accounted to chat_gpt.
+_VISION_ASSISTANT = AIAssistant.CHAT_GPT
+
 
 class GenerateVisionAIUseCase:
 
-    def __init__(self, vision_client: VisionModelClient):
+    def __init__(
+        self,
+        vision_client: VisionModelClient,
+        response_cache: ResponseCache | None = None,
+        image_preprocessor: ImagePreprocessor | None = None,
+        image_store: ImageStore | None = None,
+        metrics: UpstreamMetrics | None = None,
+    ):
         self._vision_client = vision_client
+        self._response_cache = response_cache
+        self._image_preprocessor = image_preprocessor
+        self._image_store = image_store
+        self._metrics = metrics
 
     async def execute(self, request: GenerateVisionAIRequestDTO) -> AIResponseDTO:
         logger.info("Executing GenerateVisionAIUseCase")
 
+        with span("use_case", assistant=_VISION_ASSISTANT.value):
+            return await self._execute(request)
+
+    async def _execute(self, request: GenerateVisionAIRequestDTO) -> AIResponseDTO:
+        with span("images"):
+            await self._resolve_image_ids(request)
+        messages = to_domain_ai_messages_from_dto(request)
+
+        cache_key = None
+        if self._response_cache is not None and request.cache_policy != CachePolicy.BYPASS:
+            cache_key = vision_request_key(messages)
+            if request.cache_policy == CachePolicy.DEFAULT:
+                with span("cache"):
+                    cached_response = await get_cached_response(self._response_cache, cache_key)
+                if cached_response is not None:
+                    logger.info("Response cache hit for vision request")
+                    return to_ai_response_dto(cached_response, cached=True)
+
+        try:
+            with span("images"):
+                await self._preprocess_images(messages)
+            domain_response = await self._generate(messages)
+        except Exception as exc:
+            raise self._to_application_exception(exc)
+
+        if cache_key is not None:
+            await store_response(self._response_cache, cache_key, domain_response)
+        return to_ai_response_dto(domain_response)
+
+    async def execute_stream(self, request: GenerateVisionAIRequestDTO) -> AsyncIterator[AIResponseChunkDTO]:
+        logger.info("Executing streaming GenerateVisionAIUseCase")
+
+        await self._resolve_image_ids(request)
         messages = to_domain_ai_messages_from_dto(request)
 
         try:
-            domain_response: AIResponse = await self._vision_client.generate_vision(messages)
-            return to_ai_response_dto(domain_response)
-        except AIServiceException as exc:
-            raise ServiceUnavailableException(str(exc), original_error=exc)
-        except DomainException as exc:
-            raise ValidationException(str(exc))
+            await self._preprocess_images(messages)
+            async for chunk in self._stream(messages):
+                yield to_ai_response_chunk_dto(chunk)
         except Exception as exc:
-            logger.error("Error in GenerateVisionAIUseCase: %s", exc, exc_info=True)
-            raise ServiceUnavailableException("Failed to generate vision AI response", original_error=exc)
+            raise self._to_application_exception(exc)
+
+    async def _generate(self, messages: list[AIMessage]) -> AIResponse:
+        if self._metrics is None:
+            return await self._vision_client.generate_vision(messages)
+        started = self._metrics.call_started(_VISION_ASSISTANT)
+        try:
+            response = await self._vision_client.generate_vision(messages)
+        except Exception as exc:
+            self._metrics.call_finished(_VISION_ASSISTANT, started, exc)
+            raise
+        except BaseException:
+            self._metrics.call_cancelled(_VISION_ASSISTANT, started)
+            raise
+        self._metrics.call_finished(_VISION_ASSISTANT, started)
+        self._metrics.tokens(_VISION_ASSISTANT, response.usage)
+        return response
+
+    async def _stream(self, messages: list[AIMessage]) -> AsyncIterator[AIResponseChunk]:
+        if self._metrics is None:
+            async for chunk in self._vision_client.generate_vision_stream(messages):
+                yield chunk
+            return
+        started = self._metrics.call_started(_VISION_ASSISTANT)
+        first = True
+        usage = None
+        try:
+            async for chunk in self._vision_client.generate_vision_stream(messages):
+                if first:
+                    self._metrics.first_token(_VISION_ASSISTANT, started)
+                    first = False
+                usage = chunk.usage or usage
+                yield chunk
+        except Exception as exc:
+            self._metrics.call_finished(_VISION_ASSISTANT, started, exc)
+            raise
+        except BaseException:
+            self._metrics.call_cancelled(_VISION_ASSISTANT, started)
+            raise
+        self._metrics.call_finished(_VISION_ASSISTANT, started)
+        if usage is not None:
+            self._metrics.tokens(_VISION_ASSISTANT, usage)
+
+    async def _resolve_image_ids(self, request: GenerateVisionAIRequestDTO) -> None:
+        """Replace references to uploaded images with their data URLs; an unknown id is a 404."""
+        items = [
+            item
+            for message in request.messages
+            for item in message.content
+            if isinstance(item, ImageContentItemDTO) and item.image_id is not None
+        ]
+        if not items:
+            return
+        if self._image_store is None:
+            raise ValidationException("Image uploads are not enabled")
+        try:
+            data_urls = await asyncio.gather(*(self._image_store.get_data_url(item.image_id) for item in items))
+        except OSError as exc:
+            logger.error("Failed to read uploaded images: %s", exc, exc_info=exc)
+            raise ServiceUnavailableException("Failed to read uploaded image", original_error=exc)
+        for item, data_url in zip(items, data_urls):
+            if data_url is None:
+                raise NotFoundException(f"Unknown image_id: {item.image_id}")
+            item.image_base64 = data_url
+
+    async def _preprocess_images(self, messages: list[AIMessage]) -> None:
+        """Shrink images in place; the cache key is taken from the original request beforehand."""
+        if self._image_preprocessor is None:
+            return
+        images = [item for message in messages for item in message.content if isinstance(item, ImageContentItem)]
+        if not images:
+            return
+        results = await asyncio.gather(*(self._image_preprocessor.preprocess(item.image_base64) for item in images))
+        for item, result in zip(images, results):
+            item.image_base64 = result.image_base64
+        logger.info(
+            "Preprocessed %s images: %s -> %s bytes, ~%s vision tokens saved",
+            len(results),
+            sum(result.original_bytes for result in results),
+            sum(result.bytes for result in results),
+            sum(result.original_tokens - result.tokens for result in results),
+        )
+
+    @staticmethod
+    def _to_application_exception(exc: Exception) -> ApplicationException:
+        if isinstance(exc, AIServiceException):
+            return ServiceUnavailableException(str(exc), original_error=exc)
+        if isinstance(exc, DomainException):
+            return ValidationException(str(exc))
+        logger.error("Error in GenerateVisionAIUseCase: %s", exc, exc_info=exc)
+        return ServiceUnavailableException("Failed to generate vision AI response", original_error=exc)
@@ -0,0 +1,107 @@
+import asyncio
+import logging
+import time
+import uuid
+import weakref
+from collections.abc import AsyncIterator
+
+from app.application.dto import AIResponseChunkDTO, AIResponseDTO, CreateSessionDTO, SessionDTO, SessionTurnDTO
+from app.application.exceptions import NotFoundException, ValidationException
+from app.application.interfaces.session_store import SessionStore
+from app.application.mappers.domain_to_dto import to_session_dto
+from app.application.mappers.dto_to_domain import to_domain_message
+from app.application.use_cases.generate_text_ai_use_case import GenerateTextAIUseCase
+from app.domain.models import Message, Role, Session
+
+logger = logging.getLogger(__name__)
+
+
+class SessionsUseCase:
+    """Conversations whose history lives on the server.
+
+    A client sends only the new turn; it is appended to the stored history
+    together with the assistant's reply once the reply has been generated.
+    A failed turn leaves the history unchanged. The append is a compare-and-set
+    against the history the turn was generated from, so a turn that raced with
+    another one (in another worker, or a concurrent stream) is rejected with
+    ``ConflictException`` instead of being interleaved. Within one process,
+    regular turns of a session additionally wait for each other; streamed turns
+    do not take that lock, since the client sets their pace.
+    """
+
+    def __init__(self, store: SessionStore, text_use_case: GenerateTextAIUseCase, max_messages: int = 1000):
+        self._store = store
+        self._text_use_case = text_use_case
+        self._max_messages = max_messages
+        self._locks: weakref.WeakValueDictionary[str, asyncio.Lock] = weakref.WeakValueDictionary()
+
+    async def create(self, dto: CreateSessionDTO) -> SessionDTO:
+        if len(dto.messages) > self._max_messages:
+            raise ValidationException(f"Session exceeds the limit of {self._max_messages} messages")
+        now = time.time()
+        session = Session(
+            id=f"sess_{uuid.uuid4().hex}",
+            assistant=dto.assistant,
+            messages=[to_domain_message(message) for message in dto.messages],
+            created_at=now,
+            updated_at=now,
+        )
+        await self._store.create(session)
+        logger.info("Session %s created for assistant=%s", session.id, session.assistant.value)
+        return to_session_dto(session)
+
+    async def get(self, session_id: str) -> SessionDTO:
+        return to_session_dto(await self._load(session_id))
+
+    async def delete(self, session_id: str) -> None:
+        if not await self._store.delete(session_id):
+            raise NotFoundException(f"Session {session_id} not found")
+
+    async def send(self, session_id: str, dto: SessionTurnDTO) -> AIResponseDTO:
+        async with self._lock(session_id):
+            session, turn = await self._prepare_turn(session_id, dto)
+            saved_length = len(session.messages)
+            response = await self._text_use_case.generate(
+                session.assistant, [*session.messages, *turn], dto.cache_policy, dto.truncate_history
+            )
+            await self._append(session_id, saved_length, [*turn, Message(role=Role.ASSISTANT, content=response.assistant_message)])
+            return response
+
+    async def send_stream(self, session_id: str, dto: SessionTurnDTO) -> AsyncIterator[AIResponseChunkDTO]:
+        session, turn = await self._prepare_turn(session_id, dto)
+        saved_length = len(session.messages)
+        parts = []
+        stream = self._text_use_case.generate_stream(session.assistant, [*session.messages, *turn], dto.truncate_history)
+        async for chunk in stream:
+            parts.append(chunk.delta)
+            yield chunk
+        # Only a stream that ran to the end is recorded; a broken one leaves the history as it was.
+        async with self._lock(session_id):
+            await self._append(session_id, saved_length, [*turn, Message(role=Role.ASSISTANT, content="".join(parts))])
+
+    def _lock(self, session_id: str) -> asyncio.Lock:
+        lock = self._locks.get(session_id)
+        if lock is None:
+            lock = asyncio.Lock()
+            self._locks[session_id] = lock
+        return lock
+
+    async def _load(self, session_id: str) -> Session:
+        session = await self._store.get(session_id)
+        if session is None:
+            raise NotFoundException(f"Session {session_id} not found")
+        return session
+
+    async def _prepare_turn(self, session_id: str, dto: SessionTurnDTO) -> tuple[Session, list[Message]]:
+        if not dto.messages:
+            raise ValidationException("A turn must contain at least one message")
+        session = await self._load(session_id)
+        if len(session.messages) + len(dto.messages) + 1 > self._max_messages:
+            raise ValidationException(f"Session {session_id} has reached the limit of {self._max_messages} messages")
+        return session, [to_domain_message(message) for message in dto.messages]
+
+    async def _append(self, session_id: str, saved_length: int, messages: list[Message]) -> None:
+        """Save the turn unless the stored history no longer has ``saved_length`` messages."""
+        if not await self._store.append(session_id, messages, time.time(), expected_length=saved_length):
+            # Deleted or evicted while the reply was being generated; the reply is still returned.
+            logger.warning("Session %s disappeared before its turn could be saved", session_id)
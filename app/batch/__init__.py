@@ -0,0 +1 @@
+"""Offline JSONL batch runner: ``python -m app.batch run in.jsonl out.jsonl``."""
@@ -0,0 +1,78 @@
+import argparse
+import asyncio
+import sys
+
+from dotenv import load_dotenv
+
+from app.application.services.request_context import request_identity
+from app.batch.runner import BatchRunner
+from app.composition.config_bootstrap import load_config
+from app.composition.logging_bootstrap import setup_logging
+from app.domain.models import Priority, RequestIdentity
+from app.presentation.dependencies import close_resources, get_ai_service
+
+
+def parse_assistant_limits(values: list[str]) -> dict[str, int]:
+    limits = {}
+    for value in values:
+        name, _, limit = value.partition("=")
+        if not limit:
+            raise argparse.ArgumentTypeError(f"Expected ASSISTANT=LIMIT, got {value!r}")
+        limits[name] = int(limit)
+    return limits
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="python -m app.batch", description="Run JSONL generation requests through LLMBox.")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run = commands.add_parser("run", help="process an input JSONL file, resuming from its checkpoint if present")
+    run.add_argument("input", help="JSONL file, one /generate-ai-response request body per line")
+    run.add_argument("output", help="JSONL file for results; <output>.checkpoint tracks progress")
+    run.add_argument("--concurrency", type=int, default=16, help="lines in flight at once (default: 16)")
+    run.add_argument(
+        "--assistant-concurrency",
+        action="append",
+        default=[],
+        metavar="ASSISTANT=LIMIT",
+        help="per-assistant cap, may be repeated (e.g. qwen3_235b=4)",
+    )
+    run.add_argument("--window", type=int, default=10000, help="max lines started past the oldest unfinished one")
+    run.add_argument("--checkpoint-interval", type=float, default=5.0, help="seconds between checkpoints")
+    run.add_argument("--progress-interval", type=float, default=10.0, help="seconds between progress reports")
+    run.add_argument("--restart", action="store_true", help="ignore an existing checkpoint and start over")
+    run.add_argument("--tenant", default="batch", help="tenant to schedule the calls as, at bulk priority (default: batch)")
+    return parser
+
+
+async def run(args: argparse.Namespace) -> None:
+    runner = BatchRunner(
+        get_ai_service(),
+        concurrency=args.concurrency,
+        assistant_limits=parse_assistant_limits(args.assistant_concurrency),
+        window=args.window,
+        checkpoint_interval=args.checkpoint_interval,
+        progress_interval=args.progress_interval,
+        report=lambda message: print(message, file=sys.stderr, flush=True),
+    )
+    try:
+        with request_identity(RequestIdentity(tenant=args.tenant, priority=Priority.BULK)):
+            await runner.run(args.input, args.output, restart=args.restart)
+    finally:
+        await close_resources()
+
+
+def main() -> None:
+    args = build_parser().parse_args()
+    load_dotenv()
+    config = load_config()
+    setup_logging(config.logging)
+    try:
+        asyncio.run(run(args))
+    except KeyboardInterrupt:
+        print("Interrupted; rerun the same command to resume.", file=sys.stderr)
+        sys.exit(130)
+
+
+if __name__ == "__main__":
+    main()
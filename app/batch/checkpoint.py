@@ -0,0 +1,44 @@
+import json
+import os
+from dataclasses import dataclass, field
+
+
+@dataclass
+class Checkpoint:
+    """Resumable progress of a batch run.
+
+    Every input line up to and including ``watermark`` has a result in the
+    output file, which is valid up to ``output_size`` bytes; ``input_offset``
+    is where the line after the watermark starts. Lines above the watermark
+    that already finished are listed in ``completed``. Their number is bounded
+    by the runner's window, so the checkpoint stays small for any input size.
+    """
+
+    watermark: int = -1
+    input_offset: int = 0
+    output_size: int = 0
+    completed: list[int] = field(default_factory=list)
+
+    @classmethod
+    def load(cls, path: str) -> "Checkpoint | None":
+        try:
+            with open(path, encoding="utf-8") as file:
+                return cls(**json.load(file))
+        except FileNotFoundError:
+            return None
+
+    def save(self, path: str) -> None:
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as file:
+            json.dump(
+                {
+                    "watermark": self.watermark,
+                    "input_offset": self.input_offset,
+                    "output_size": self.output_size,
+                    "completed": self.completed,
+                },
+                file,
+            )
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(tmp_path, path)
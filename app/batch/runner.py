@@ -0,0 +1,219 @@
+import asyncio
+import json
+import logging
+import os
+import time
+from collections.abc import Callable
+from contextlib import nullcontext
+from dataclasses import dataclass
+
+from pydantic import ValidationError
+
+from app.application.exceptions import ValidationException
+from app.application.services import AIService
+from app.batch.checkpoint import Checkpoint
+from app.presentation.api.schemas import GenerateAIRequestSchema
+from app.presentation.mappers.mappers import to_batch_item_error_schema, to_generate_ai_request_dto, to_response_schema
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class BatchProgress:
+    total: int
+    done: int = 0
+    failed: int = 0
+    tokens: int = 0
+    started_at: float = 0.0
+    resumed_from: int = 0
+
+    def summary(self) -> str:
+        elapsed = max(time.monotonic() - self.started_at, 1e-9)
+        processed = self.done - self.resumed_from
+        rate = processed / elapsed
+        remaining = self.total - self.done
+        eta = f"{remaining / rate:.0f}s" if rate > 0 else "?"
+        return (
+            f"{self.done}/{self.total} lines ({self.failed} failed), "
+            f"{rate:.1f} lines/s, {self.tokens / elapsed:.0f} tokens/s, ETA {eta}"
+        )
+
+
+def count_lines(path: str) -> int:
+    count = 0
+    last = b"\n"
+    with open(path, "rb") as file:
+        while chunk := file.read(1 << 20):
+            count += chunk.count(b"\n")
+            last = chunk[-1:]
+    # A final line without a trailing newline is still a line.
+    return count + (last != b"\n")
+
+
+def _save_checkpoint(output, checkpoint: Checkpoint, path: str) -> None:
+    output.flush()
+    os.fsync(output.fileno())
+    checkpoint.save(path)
+
+
+class BatchRunner:
+    """Runs a JSONL file of ``GenerateAIRequestSchema`` lines through ``AIService``.
+
+    The input is read lazily and at most ``concurrency`` lines are in flight,
+    each assistant additionally capped by ``assistant_limits``. Results are
+    appended to the output as they complete, tagged with their input ``line``
+    (and ``id`` if the input had one). A line is never started more than
+    ``window`` lines past the oldest unfinished one, which bounds memory no
+    matter how large the file is.
+
+    Progress is checkpointed next to the output every ``checkpoint_interval``
+    seconds; a rerun with the same paths truncates the output to the last
+    checkpoint and continues from there.
+    """
+
+    def __init__(
+        self,
+        ai_service: AIService,
+        concurrency: int = 16,
+        assistant_limits: dict[str, int] | None = None,
+        window: int = 10000,
+        checkpoint_interval: float = 5.0,
+        progress_interval: float = 10.0,
+        report: Callable[[str], None] | None = None,
+    ):
+        if concurrency < 1 or window < concurrency:
+            raise ValueError("concurrency must be at least 1 and window at least concurrency")
+        self._ai_service = ai_service
+        self._concurrency = concurrency
+        self._assistant_limits = {name: asyncio.Semaphore(limit) for name, limit in (assistant_limits or {}).items()}
+        self._window = window
+        self._checkpoint_interval = checkpoint_interval
+        self._progress_interval = progress_interval
+        self._report = report or logger.info
+
+    async def run(self, input_path: str, output_path: str, restart: bool = False) -> BatchProgress:
+        checkpoint_path = f"{output_path}.checkpoint"
+        checkpoint = None if restart else Checkpoint.load(checkpoint_path)
+        if checkpoint is None:
+            checkpoint = Checkpoint()
+            with open(output_path, "wb"):
+                pass
+        else:
+            with open(output_path, "r+b") as output:
+                output.truncate(checkpoint.output_size)
+            self._report(f"Resuming after line {checkpoint.watermark}")
+
+        progress = BatchProgress(total=count_lines(input_path), started_at=time.monotonic())
+        progress.done = progress.resumed_from = checkpoint.watermark + 1 + len(checkpoint.completed)
+
+        with open(input_path, "rb") as source, open(output_path, "ab") as output:
+            source.seek(checkpoint.input_offset)
+            await self._process(source, output, checkpoint, checkpoint_path, progress)
+
+        os.remove(checkpoint_path)
+        self._report(f"Finished: {progress.summary()}")
+        return progress
+
+    async def _process(self, source, output, checkpoint: Checkpoint, checkpoint_path: str, progress: BatchProgress) -> None:
+        completed = set(checkpoint.completed)
+        offsets: dict[int, int] = {}  # input offset of every started, unfinished line
+        slots = asyncio.Semaphore(self._concurrency)
+        window_moved = asyncio.Event()
+        tasks: set[asyncio.Task] = set()
+        finishing: set[asyncio.Task] = set()
+        # Output writes and checkpoints run in threads, one at a time, so the loop keeps dispatching lines meanwhile.
+        io_lock = asyncio.Lock()
+        last_checkpoint = last_report = time.monotonic()
+
+        async def write_checkpoint() -> None:
+            next_offset = offsets[checkpoint.watermark + 1] if checkpoint.watermark + 1 in offsets else source.tell()
+            checkpoint.input_offset = next_offset
+            checkpoint.output_size = output.tell()
+            checkpoint.completed = sorted(completed)
+            await asyncio.to_thread(_save_checkpoint, output, checkpoint, checkpoint_path)
+
+        async def finish(index: int, result: dict | None, tokens: int, failed: bool) -> None:
+            nonlocal last_checkpoint, last_report
+            async with io_lock:
+                if result is not None:
+                    await asyncio.to_thread(output.write, json.dumps(result, ensure_ascii=False).encode() + b"\n")
+                completed.add(index)
+                progress.done += 1
+                progress.failed += failed
+                progress.tokens += tokens
+                while checkpoint.watermark + 1 in completed:
+                    checkpoint.watermark += 1
+                    completed.discard(checkpoint.watermark)
+                    offsets.pop(checkpoint.watermark, None)
+                window_moved.set()
+
+                now = time.monotonic()
+                if now - last_checkpoint >= self._checkpoint_interval:
+                    await write_checkpoint()
+                    last_checkpoint = now
+            if now - last_report >= self._progress_interval:
+                self._report(progress.summary())
+                last_report = now
+
+        async def run_line(index: int, raw: bytes) -> None:
+            try:
+                result, tokens, failed = await self._run_line(index, raw)
+                # Shielded, so a cancelled run never leaves a result written to the output but missing from the checkpoint.
+                task = asyncio.create_task(finish(index, result, tokens, failed))
+                finishing.add(task)
+                task.add_done_callback(finishing.discard)
+                await asyncio.shield(task)
+            finally:
+                slots.release()
+
+        index = checkpoint.watermark + 1
+        try:
+            while True:
+                offset = source.tell()
+                raw = source.readline()
+                if not raw:
+                    break
+                if index in completed:
+                    index += 1
+                    continue
+                while index - checkpoint.watermark > self._window:
+                    window_moved.clear()
+                    await window_moved.wait()
+                await slots.acquire()
+                offsets[index] = offset
+                task = asyncio.create_task(run_line(index, raw))
+                tasks.add(task)
+                task.add_done_callback(tasks.discard)
+                index += 1
+            if tasks:
+                await asyncio.gather(*tasks)
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            await asyncio.gather(*finishing, return_exceptions=True)
+            async with io_lock:
+                await write_checkpoint()
+
+    async def _run_line(self, index: int, raw: bytes) -> tuple[dict | None, int, bool]:
+        if not raw.strip():
+            return None, 0, False
+        result: dict = {"line": index}
+        try:
+            payload = json.loads(raw)
+            if isinstance(payload, dict) and "id" in payload:
+                result["id"] = payload["id"]
+            request = to_generate_ai_request_dto(GenerateAIRequestSchema.model_validate(payload))
+        except (ValueError, ValidationError) as exc:
+            result["error"] = to_batch_item_error_schema(ValidationException(f"Invalid input line: {exc}")).model_dump()
+            return result, 0, True
+
+        limit = self._assistant_limits.get(request.assistant.value)
+        async with limit if limit is not None else nullcontext():
+            try:
+                response = await self._ai_service.generate_ai_response(request)
+            except Exception as exc:
+                result["error"] = to_batch_item_error_schema(exc).model_dump()
+                return result, 0, True
+        result["response"] = to_response_schema(response).model_dump()
+        return result, response.usage.total_tokens, False
@@ -1,21 +1,153 @@
-from app.application.services import AIService
+from app.application.interfaces.image_preprocessor import ImagePreprocessor
+from app.application.interfaces.image_store import ImageStore
+from app.application.interfaces.response_cache import ResponseCache
+from app.application.interfaces.session_store import SessionStore
+from app.application.services import AIService, BatchJobService, ImageService, SessionService
+from app.application.services.context_budget import ContextBudget
+from app.application.services.latency_router import LatencyRouter
+from app.application.services.single_flight import SingleFlight
+from app.application.services.tracing import Tracer
+from app.application.use_cases.batch_jobs_use_case import BatchJobsUseCase
+from app.application.use_cases.count_tokens_use_case import CountTokensUseCase
 from app.application.use_cases.generate_text_ai_use_case import GenerateTextAIUseCase
+from app.application.use_cases.generate_text_batch_use_case import GenerateTextBatchUseCase
 from app.application.use_cases.generate_vision_ai_use_case import GenerateVisionAIUseCase
-from app.domain.interfaces import TextModelClient, VisionModelClient
+from app.application.use_cases.sessions_use_case import SessionsUseCase
+from app.domain.interfaces import BatchProvider, TextModelClient, VisionModelClient
 from app.domain.models import AIAssistant
+from app.infrastructure.batch.local_batch_provider import LocalBatchProvider
+from app.infrastructure.batch.openai_batch_provider import OpenAIBatchProvider
+from app.infrastructure.batch.sqlite_job_store import SqliteBatchJobStore
+from app.infrastructure.cache.memory_cache import InMemoryResponseCache
+from app.infrastructure.cache.sqlite_cache import SqliteResponseCache
 from app.infrastructure.clients.openai_client import OpenAIClient
-from app.infrastructure.clients.yandex_auth import YandexAuth
+from app.infrastructure.clients.yandex_auth import IAM_TOKEN_URL, YandexAuth
 from app.infrastructure.clients.yandex_gpt_client import YandexGPTClient
 from app.infrastructure.clients.yandex_gpt_oss_client import YandexGPTOssClient
-from core.config import Config
+from app.infrastructure.http.upstream_registry import UpstreamRegistry
+from app.infrastructure.images.disk_image_store import DiskImageStore
+from app.infrastructure.images.pillow_preprocessor import PillowImagePreprocessor
+from app.infrastructure.metrics.prometheus import PrometheusMetrics
+from app.infrastructure.resilience.adaptive_limiter import AdaptiveLimiter, LimiterRegistry
+from app.infrastructure.resilience.admission import AdmissionController
+from app.infrastructure.resilience.circuit_breaker import CircuitBreakerRegistry
+from app.infrastructure.resilience.hedging import HedgingRegistry
+from app.infrastructure.sessions.memory_store import InMemorySessionStore
+from app.infrastructure.sessions.sqlite_store import SqliteSessionStore
+from app.infrastructure.tokens.tiktoken_estimator import TiktokenTokenEstimator
+from app.infrastructure.tracing.otlp_file_exporter import OtlpJsonFileExporter
+from core.config import (
+    AdmissionConfig,
+    Config,
+    ImagePreprocessingConfig,
+    ImageStoreConfig,
+    MetricsConfig,
+    ResponseCacheConfig,
+    SessionsConfig,
+    TracingConfig,
+)
 
 
-def build_ai_service(config: Config) -> AIService:
+def build_upstream_registry(config: Config) -> UpstreamRegistry:
+    return UpstreamRegistry(default_config=config.http, upstream_configs=config.upstream_http)
+
+
+def build_response_cache(config: ResponseCacheConfig) -> ResponseCache | None:
+    if not config.enabled:
+        return None
+    if config.backend == "sqlite":
+        return SqliteResponseCache(
+            path=config.path,
+            max_bytes=config.max_bytes,
+            ttl_seconds=config.ttl_seconds,
+            compact_interval=config.compact_interval,
+        )
+    return InMemoryResponseCache(max_bytes=config.max_bytes, ttl_seconds=config.ttl_seconds)
+
+
+def build_single_flight(config: Config) -> SingleFlight | None:
+    return SingleFlight() if config.request_coalescing else None
+
+
+def build_limiter_registry(config: Config) -> LimiterRegistry | None:
+    return LimiterRegistry(config.concurrency) if config.concurrency.enabled else None
+
+
+def build_hedging_registry(config: Config) -> HedgingRegistry | None:
+    return HedgingRegistry(config.hedging) if config.hedging.assistants else None
+
+
+def build_breaker_registry(config: Config) -> CircuitBreakerRegistry | None:
+    return CircuitBreakerRegistry(config.circuit_breaker) if config.circuit_breaker.enabled else None
+
+
+def build_admission_controller(config: AdmissionConfig) -> AdmissionController | None:
+    return AdmissionController(config) if config.enabled else None
+
+
+def build_metrics(config: MetricsConfig) -> PrometheusMetrics | None:
+    return PrometheusMetrics(latency_buckets=config.latency_buckets) if config.enabled else None
+
+
+def build_tracer(config: TracingConfig) -> Tracer | None:
+    if not config.enabled:
+        return None
+    exporter = OtlpJsonFileExporter(config.path) if config.exporter == "file" else None
+    return Tracer(exporter=exporter, sample_rate=config.sample_rate, server_timing=config.server_timing)
+
+
+def build_latency_router(config: Config) -> LatencyRouter:
+    names = config.auto_routing.pool or [assistant.value for assistant in AIAssistant if assistant != AIAssistant.AUTO]
+    return LatencyRouter(
+        [AIAssistant(name) for name in names],
+        exploration=config.auto_routing.exploration,
+        stale_after=config.auto_routing.stale_after,
+    )
+
+
+def build_image_preprocessor(config: ImagePreprocessingConfig) -> ImagePreprocessor | None:
+    return PillowImagePreprocessor(config) if config.enabled else None
+
+
+def build_image_store(config: ImageStoreConfig) -> ImageStore:
+    return DiskImageStore(path=config.path, max_bytes=config.max_bytes, max_image_bytes=config.max_image_bytes)
+
+
+def build_image_service(image_store: ImageStore) -> ImageService:
+    return ImageService(image_store=image_store)
+
+
+def build_context_budget(config: Config) -> ContextBudget | None:
+    if not config.token_budget.enabled:
+        return None
+    estimator = TiktokenTokenEstimator(config.token_budget, openai_model=config.open_ai.model)
+    return ContextBudget(estimator, reserve_tokens=config.token_budget.reserve_tokens)
+
+
+def build_ai_service(
+    config: Config,
+    upstreams: UpstreamRegistry,
+    response_cache: ResponseCache | None = None,
+    single_flight: SingleFlight | None = None,
+    limiters: LimiterRegistry | None = None,
+    hedging: HedgingRegistry | None = None,
+    breakers: CircuitBreakerRegistry | None = None,
+    router: LatencyRouter | None = None,
+    image_preprocessor: ImagePreprocessor | None = None,
+    image_store: ImageStore | None = None,
+    context_budget: ContextBudget | None = None,
+    metrics: PrometheusMetrics | None = None,
+) -> AIService:
+    def limiter_for(assistant: AIAssistant) -> AdaptiveLimiter | None:
+        return limiters.get(assistant.value) if limiters is not None else None
+
     if not config.open_ai.model or not config.open_ai.api_key:
         raise ValueError("OpenAI model and api_key must be configured")
     openai_client = OpenAIClient(
         model=config.open_ai.model,
-        api_key=config.open_ai.api_key
+        api_key=config.open_ai.api_key,
+        client=upstreams.openai_client("openai", api_key=config.open_ai.api_key),
+        limiter=limiter_for(AIAssistant.CHAT_GPT),
     )
 
     if not config.yandex.key_id or not config.yandex.service_account_id or not config.yandex.private_key:
@@ -23,7 +155,10 @@ def build_ai_service(config: Config) -> AIService:
     yandex_auth = YandexAuth(
         key_id=config.yandex.key_id,
         service_account_id=config.yandex.service_account_id,
-        private_key=config.yandex.private_key
+        private_key=config.yandex.private_key,
+        http_transport=upstreams.http_transport("yandex_iam", IAM_TOKEN_URL),
+        refresh_fraction=config.yandex.iam_refresh_fraction,
+        token_cache_path=config.yandex.iam_token_cache_path,
     )
 
     if not config.yandex.yandex_gpt_api_url or not config.yandex.yandex_gpt_model_path or not config.yandex.yandex_gpt_model_name:
@@ -32,11 +167,18 @@ def build_ai_service(config: Config) -> AIService:
         api_url=config.yandex.yandex_gpt_api_url,
         model_path=config.yandex.yandex_gpt_model_path,
         model_name=config.yandex.yandex_gpt_model_name,
-        auth=yandex_auth
+        auth=yandex_auth,
+        http_transport=upstreams.http_transport("yandex_gpt", config.yandex.yandex_gpt_api_url),
+        limiter=limiter_for(AIAssistant.YANDEX_GPT),
     )
 
     if not config.yandex.yandex_gpt_model_path or not config.yandex.open_ai_api_key or not config.yandex.open_ai_base_url:
         raise ValueError("Yandex GPT OSS configuration must be complete")
+    yandex_open_ai = upstreams.openai_client(
+        "yandex_open_ai",
+        api_key=config.yandex.open_ai_api_key,
+        base_url=config.yandex.open_ai_base_url,
+    )
 
     if not config.yandex.gpt_oss_20b_model_name:
         raise ValueError("Yandex GPT OSS 20B model name must be configured")
@@ -44,7 +186,9 @@ def build_ai_service(config: Config) -> AIService:
         model_name=config.yandex.gpt_oss_20b_model_name,
         model_path=config.yandex.yandex_gpt_model_path,
         api_key=config.yandex.open_ai_api_key,
-        base_url=config.yandex.open_ai_base_url
+        base_url=config.yandex.open_ai_base_url,
+        client=yandex_open_ai,
+        limiter=limiter_for(AIAssistant.GPT_OSS_20B),
     )
 
     if not config.yandex.gpt_oss_120b_model_name:
@@ -53,7 +197,9 @@ def build_ai_service(config: Config) -> AIService:
         model_name=config.yandex.gpt_oss_120b_model_name,
         model_path=config.yandex.yandex_gpt_model_path,
         api_key=config.yandex.open_ai_api_key,
-        base_url=config.yandex.open_ai_base_url
+        base_url=config.yandex.open_ai_base_url,
+        client=yandex_open_ai,
+        limiter=limiter_for(AIAssistant.GPT_OSS_120B),
     )
 
     if not config.yandex.qwen_235b_model_name:
@@ -62,7 +208,9 @@ def build_ai_service(config: Config) -> AIService:
         model_name=config.yandex.qwen_235b_model_name,
         model_path=config.yandex.yandex_gpt_model_path,
         api_key=config.yandex.open_ai_api_key,
-        base_url=config.yandex.open_ai_base_url
+        base_url=config.yandex.open_ai_base_url,
+        client=yandex_open_ai,
+        limiter=limiter_for(AIAssistant.QWEN3_235B),
     )
 
     text_clients: dict[AIAssistant, TextModelClient] = {
@@ -75,11 +223,89 @@ def build_ai_service(config: Config) -> AIService:
 
     vision_client: VisionModelClient = openai_client
 
-    generate_text_use_case = GenerateTextAIUseCase(text_clients=text_clients)
-    generate_vision_use_case = GenerateVisionAIUseCase(vision_client=vision_client)
+    if breakers is not None:
+        text_clients = {assistant: breakers.wrap(assistant.value, client) for assistant, client in text_clients.items()}
+        # Text and vision calls share the chat_gpt breaker since they hit the same provider.
+        vision_client = text_clients[AIAssistant.CHAT_GPT]
+
+    if hedging is not None:
+        text_clients = hedging.wrap(text_clients)
+
+    fallbacks = {
+        AIAssistant(name): [AIAssistant(fallback) for fallback in chain] for name, chain in config.fallbacks.items()
+    }
+
+    generate_text_use_case = GenerateTextAIUseCase(
+        text_clients=text_clients,
+        response_cache=response_cache,
+        single_flight=single_flight,
+        fallbacks=fallbacks,
+        router=router,
+        context_budget=context_budget,
+        metrics=metrics,
+    )
+    generate_vision_use_case = GenerateVisionAIUseCase(
+        vision_client=vision_client,
+        response_cache=response_cache,
+        image_preprocessor=image_preprocessor,
+        image_store=image_store,
+        metrics=metrics,
+    )
+
+    generate_batch_use_case = GenerateTextBatchUseCase(
+        text_use_case=generate_text_use_case,
+        max_items=config.batch.max_items,
+        max_concurrency=config.batch.max_concurrency,
+    )
 
     return AIService(
         generate_text_use_case=generate_text_use_case,
         generate_vision_use_case=generate_vision_use_case,
+        generate_batch_use_case=generate_batch_use_case,
+        count_tokens_use_case=CountTokensUseCase(context_budget) if context_budget is not None else None,
     )
 
+
+def build_batch_providers(
+    config: Config,
+    upstreams: UpstreamRegistry,
+    text_clients: dict[AIAssistant, TextModelClient],
+) -> dict[AIAssistant, BatchProvider]:
+    if config.batch_jobs.provider == "local":
+        # The stand-in replays each batch through the assistant's regular client, with its limiter and breaker.
+        return {
+            assistant: LocalBatchProvider(
+                client,
+                concurrency=config.batch_jobs.local_concurrency,
+                result_ttl=config.batch_jobs.local_result_ttl,
+            )
+            for assistant, client in text_clients.items()
+        }
+    if not config.open_ai.model or not config.open_ai.api_key:
+        raise ValueError("OpenAI model and api_key must be configured")
+    openai = upstreams.openai_client("openai", api_key=config.open_ai.api_key)
+    return {AIAssistant.CHAT_GPT: OpenAIBatchProvider(openai, model=config.open_ai.model)}
+
+
+def build_batch_job_store(config: Config) -> SqliteBatchJobStore:
+    return SqliteBatchJobStore(config.batch_jobs.store_path)
+
+
+def build_batch_job_service(
+    config: Config,
+    providers: dict[AIAssistant, BatchProvider],
+    store: SqliteBatchJobStore,
+) -> BatchJobService:
+    batch_jobs_use_case = BatchJobsUseCase(providers=providers, store=store, max_requests=config.batch_jobs.max_requests)
+    return BatchJobService(batch_jobs_use_case=batch_jobs_use_case)
+
+
+def build_session_store(config: SessionsConfig) -> SessionStore:
+    if config.backend == "sqlite":
+        return SqliteSessionStore(path=config.path, max_sessions=config.max_sessions, ttl_seconds=config.ttl_seconds)
+    return InMemorySessionStore(max_sessions=config.max_sessions, ttl_seconds=config.ttl_seconds)
+
+
+def build_session_service(config: SessionsConfig, ai_service: AIService, store: SessionStore) -> SessionService:
+    sessions_use_case = SessionsUseCase(store=store, text_use_case=ai_service.text_use_case, max_messages=config.max_messages)
+    return SessionService(sessions_use_case=sessions_use_case)
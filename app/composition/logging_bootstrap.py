@@ -1,10 +1,29 @@
+import atexit
 import logging
-from logging.handlers import TimedRotatingFileHandler
+import queue
+from logging.handlers import QueueListener, TimedRotatingFileHandler
 
+from app.infrastructure.logging.filters import RequestContextFilter
+from app.infrastructure.logging.json_formatter import JsonFormatter
+from app.infrastructure.logging.queue_handler import TruncatingQueueHandler
 from core.config import LoggingConfig
 
+_listener: QueueListener | None = None
+
 
 def setup_logging(config: LoggingConfig) -> None:
+    """Routes the root logger through a queue; a background thread writes to the file and console.
+
+    Logging calls on the event loop only enqueue the record, so slow disks or
+    terminals never stall request handling. The listener is stopped, flushing
+    the queue, at interpreter exit.
+    """
+    global _listener
+    if _listener is None:
+        atexit.register(shutdown_logging)
+    else:
+        shutdown_logging()
+
     root_logger = logging.getLogger()
     root_logger.setLevel(config.level)
     root_logger.handlers.clear()
@@ -18,14 +37,29 @@ def setup_logging(config: LoggingConfig) -> None:
         encoding="utf-8",
     )
     file_handler.setLevel(config.level)
-    file_formatter = logging.Formatter(config.format)
+    file_formatter = JsonFormatter() if config.json_format else logging.Formatter(config.format)
     file_handler.setFormatter(file_formatter)
 
     console_handler = logging.StreamHandler()
     console_handler.setLevel(config.level)
-    console_formatter = logging.Formatter(config.format)
+    console_formatter = JsonFormatter() if config.json_format else logging.Formatter(config.format)
     console_handler.setFormatter(console_formatter)
 
-    root_logger.addHandler(file_handler)
-    root_logger.addHandler(console_handler)
+    records = queue.SimpleQueue()
+    queue_handler = TruncatingQueueHandler(records, max_message_chars=config.max_message_chars)
+    queue_handler.addFilter(RequestContextFilter(config.info_sample_rate))
+    root_logger.addHandler(queue_handler)
+
+    _listener = QueueListener(records, file_handler, console_handler, respect_handler_level=True)
+    _listener.start()
+
 
+def shutdown_logging() -> None:
+    """Writes out queued records and closes the handlers; safe to call more than once."""
+    global _listener
+    if _listener is None:
+        return
+    listener, _listener = _listener, None
+    listener.stop()
+    for handler in listener.handlers:
+        handler.close()
@@ -12,3 +12,27 @@ class AIServiceException(DomainException):
     def __init__(self, message: str, original_error: Exception = None):
         self.original_error = original_error
         super().__init__(message)
+
+
+class ProviderStatusException(AIServiceException):
+    def __init__(self, status_code: int, message: str):
+        self.status_code = status_code
+        super().__init__(message)
+
+
+class ProviderOverloadedException(AIServiceException):
+    """The provider's concurrency limit is exhausted and the request could not be queued in time."""
+
+
+class CircuitOpenException(AIServiceException):
+    """The provider's circuit breaker is open, so the call was rejected without reaching it."""
+
+
+def is_client_error(exc: BaseException) -> bool:
+    """Whether a provider rejected the request itself (4xx other than 408/429), so retrying elsewhere will not help."""
+    status_code = getattr(exc, "status_code", None)
+    return isinstance(status_code, int) and 400 <= status_code < 500 and status_code not in (408, 429)
+
+
+class InvalidImageException(DomainException):
+    """Image payload cannot be decoded."""
@@ -1,13 +1,46 @@
+from collections.abc import AsyncIterator
 from typing import Protocol
 
-from app.domain.models import AIMessage, AIResponse, Message
+from app.domain.models import (
+    AIMessage,
+    AIResponse,
+    AIResponseChunk,
+    BatchRequest,
+    BatchResult,
+    Message,
+    ProviderBatchState,
+)
 
 
 class TextModelClient(Protocol):
     async def generate(self, messages: list[Message]) -> AIResponse:
         ...
 
+    def generate_stream(self, messages: list[Message]) -> AsyncIterator[AIResponseChunk]:
+        ...
+
 
 class VisionModelClient(Protocol):
     async def generate_vision(self, messages: list[AIMessage]) -> AIResponse:
         ...
+
+    def generate_vision_stream(self, messages: list[AIMessage]) -> AsyncIterator[AIResponseChunk]:
+        ...
+
+
+class BatchProvider(Protocol):
+    """Asynchronous bulk-generation API of a provider: submit now, collect results later."""
+
+    name: str
+
+    async def submit(self, requests: list[BatchRequest]) -> str:
+        ...
+
+    async def get_state(self, batch_id: str) -> ProviderBatchState:
+        ...
+
+    def get_results(self, batch_id: str) -> AsyncIterator[BatchResult]:
+        ...
+
+    async def cancel(self, batch_id: str) -> None:
+        ...
@@ -8,6 +8,23 @@ class AIAssistant(Enum):
     GPT_OSS_120B = "gpt_oss_120b"
     GPT_OSS_20B = "gpt_oss_20b"
     QWEN3_235B = "qwen3_235b"
+    AUTO = "auto"
+
+
+class Priority(str, Enum):
+    """Scheduling class of a request; classes are served strictly in declaration order."""
+
+    INTERACTIVE = "interactive"
+    DEFAULT = "default"
+    BULK = "bulk"
+
+
+@dataclass(frozen=True)
+class RequestIdentity:
+    """Who a request is made for and how urgently, used to schedule upstream calls."""
+
+    tenant: str = "anonymous"
+    priority: Priority = Priority.DEFAULT
 
 
 class Role(str, Enum):
@@ -57,3 +74,70 @@ class Usage:
 class AIResponse:
     assistant_message: str
     usage: Usage
+    served_by: str | None = None
+
+
+@dataclass
+class AIResponseChunk:
+    delta: str
+    usage: Usage | None = None
+
+
+class BatchJobStatus(str, Enum):
+    PENDING = "pending"
+    IN_PROGRESS = "in_progress"
+    COMPLETED = "completed"
+    FAILED = "failed"
+    CANCELLED = "cancelled"
+    EXPIRED = "expired"
+
+    @property
+    def is_terminal(self) -> bool:
+        return self not in (BatchJobStatus.PENDING, BatchJobStatus.IN_PROGRESS)
+
+
+@dataclass
+class BatchRequest:
+    custom_id: str
+    messages: list[Message]
+
+
+@dataclass
+class BatchResult:
+    custom_id: str
+    response: AIResponse | None = None
+    error: str | None = None
+
+
+@dataclass
+class ProviderBatchState:
+    status: BatchJobStatus
+    completed: int = 0
+    failed: int = 0
+    error: str | None = None
+
+
+@dataclass
+class BatchJob:
+    id: str
+    assistant: AIAssistant
+    provider: str
+    provider_batch_id: str
+    status: BatchJobStatus
+    request_count: int
+    created_at: float
+    updated_at: float
+    completed_count: int = 0
+    failed_count: int = 0
+    error: str | None = None
+
+
+@dataclass
+class Session:
+    """A conversation whose history is kept on the server."""
+
+    id: str
+    assistant: AIAssistant
+    messages: list[Message]
+    created_at: float
+    updated_at: float
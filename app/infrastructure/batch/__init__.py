@@ -0,0 +1 @@
+"""Provider batch APIs and the store of local batch jobs."""
@@ -0,0 +1,124 @@
+import asyncio
+import logging
+import time
+import uuid
+from collections.abc import AsyncIterator
+from dataclasses import dataclass, field
+
+from app.domain.interfaces import BatchProvider, TextModelClient
+from app.domain.models import BatchJobStatus, BatchRequest, BatchResult, ProviderBatchState
+
+logger = logging.getLogger(__name__)
+
+_LOST_BATCH_ERROR = "Local batch is unknown: the service restarted or its results expired"
+
+
+@dataclass
+class _LocalBatch:
+    requests: list[BatchRequest]
+    status: BatchJobStatus = BatchJobStatus.PENDING
+    results: dict[int, BatchResult] = field(default_factory=dict)
+    completed: int = 0
+    failed: int = 0
+    task: asyncio.Task | None = None
+    finished_at: float | None = None
+
+
+class LocalBatchProvider(BatchProvider):
+    """In-process stand-in for a provider batch API, backed by an ordinary text client.
+
+    Each batch runs as a background task in which a fixed pool of workers
+    pulls requests in order. Results are kept in memory for ``result_ttl``
+    seconds after the batch finishes and are lost on restart: a batch this
+    process does not know is reported as expired with no results. Meant for
+    development and offline tests of the batch job flow, not for production
+    bulk work.
+    """
+
+    name = "local"
+
+    def __init__(self, client: TextModelClient, concurrency: int = 4, result_ttl: float = 3600.0):
+        if concurrency < 1:
+            raise ValueError("concurrency must be at least 1")
+        self._client = client
+        self._concurrency = concurrency
+        self._result_ttl = result_ttl
+        self._batches: dict[str, _LocalBatch] = {}
+
+    def _evict_expired(self) -> None:
+        now = time.monotonic()
+        expired = [
+            batch_id
+            for batch_id, batch in self._batches.items()
+            if batch.finished_at is not None and now - batch.finished_at >= self._result_ttl
+        ]
+        for batch_id in expired:
+            del self._batches[batch_id]
+
+    def _find(self, batch_id: str) -> _LocalBatch | None:
+        self._evict_expired()
+        return self._batches.get(batch_id)
+
+    async def submit(self, requests: list[BatchRequest]) -> str:
+        self._evict_expired()
+        batch_id = f"local_batch_{uuid.uuid4().hex}"
+        batch = _LocalBatch(requests=list(requests))
+        batch.task = asyncio.create_task(self._process(batch))
+        self._batches[batch_id] = batch
+        return batch_id
+
+    async def _process(self, batch: _LocalBatch) -> None:
+        batch.status = BatchJobStatus.IN_PROGRESS
+        pending = iter(enumerate(batch.requests))
+
+        async def worker() -> None:
+            for index, request in pending:
+                try:
+                    response = await self._client.generate(request.messages)
+                except Exception as exc:
+                    logger.warning("Local batch request %s failed: %s", request.custom_id, exc)
+                    batch.results[index] = BatchResult(custom_id=request.custom_id, error=str(exc))
+                    batch.failed += 1
+                else:
+                    batch.results[index] = BatchResult(custom_id=request.custom_id, response=response)
+                    batch.completed += 1
+
+        workers = [asyncio.create_task(worker()) for _ in range(min(self._concurrency, len(batch.requests)))]
+        try:
+            await asyncio.gather(*workers)
+        except asyncio.CancelledError:
+            batch.status = BatchJobStatus.CANCELLED
+            raise
+        else:
+            batch.status = BatchJobStatus.COMPLETED
+        finally:
+            for task in workers:
+                task.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+            batch.requests = []
+            batch.finished_at = time.monotonic()
+
+    async def get_state(self, batch_id: str) -> ProviderBatchState:
+        batch = self._find(batch_id)
+        if batch is None:
+            return ProviderBatchState(status=BatchJobStatus.EXPIRED, error=_LOST_BATCH_ERROR)
+        return ProviderBatchState(status=batch.status, completed=batch.completed, failed=batch.failed)
+
+    async def get_results(self, batch_id: str) -> AsyncIterator[BatchResult]:
+        batch = self._find(batch_id)
+        if batch is None:
+            return
+        for index in sorted(batch.results):
+            yield batch.results[index]
+
+    async def cancel(self, batch_id: str) -> None:
+        batch = self._batches.get(batch_id)
+        if batch is not None and batch.task is not None and not batch.task.done():
+            batch.task.cancel()
+            await asyncio.gather(batch.task, return_exceptions=True)
+
+    async def aclose(self) -> None:
+        for batch in self._batches.values():
+            if batch.task is not None and not batch.task.done():
+                batch.task.cancel()
+        await asyncio.gather(*(b.task for b in self._batches.values() if b.task is not None), return_exceptions=True)
@@ -0,0 +1,114 @@
+import json
+import logging
+from collections.abc import AsyncIterator
+
+from openai import AsyncOpenAI
+
+from app.domain.interfaces import BatchProvider
+from app.domain.models import AIResponse, BatchJobStatus, BatchRequest, BatchResult, ProviderBatchState, Usage
+from app.infrastructure.clients.openai_client import OpenAIClient
+
+logger = logging.getLogger(__name__)
+
+_STATUSES = {
+    "validating": BatchJobStatus.PENDING,
+    "in_progress": BatchJobStatus.IN_PROGRESS,
+    "finalizing": BatchJobStatus.IN_PROGRESS,
+    "cancelling": BatchJobStatus.IN_PROGRESS,
+    "completed": BatchJobStatus.COMPLETED,
+    "failed": BatchJobStatus.FAILED,
+    "cancelled": BatchJobStatus.CANCELLED,
+    "expired": BatchJobStatus.EXPIRED,
+}
+
+
+class OpenAIBatchProvider(BatchProvider):
+    """OpenAI Batch API: requests are uploaded as a JSONL file and processed within the completion window.
+
+    Batched requests are billed at a discount and do not count against the
+    synchronous rate limits, which suits bulk jobs that can wait for hours.
+    """
+
+    name = "openai"
+
+    def __init__(self, client: AsyncOpenAI, model: str, completion_window: str = "24h"):
+        if not model:
+            raise ValueError("OpenAI batch model is required")
+        self._client = client
+        self._model = model
+        self._completion_window = completion_window
+
+    def _build_input(self, requests: list[BatchRequest]) -> bytes:
+        lines = []
+        for request in requests:
+            lines.append(json.dumps({
+                "custom_id": request.custom_id,
+                "method": "POST",
+                "url": "/v1/chat/completions",
+                "body": {"model": self._model, "messages": OpenAIClient._build_messages(request.messages)},
+            }, ensure_ascii=False))
+        return ("\n".join(lines) + "\n").encode()
+
+    async def submit(self, requests: list[BatchRequest]) -> str:
+        input_file = await self._client.files.create(
+            file=("batch.jsonl", self._build_input(requests), "application/jsonl"),
+            purpose="batch",
+        )
+        batch = await self._client.batches.create(
+            input_file_id=input_file.id,
+            endpoint="/v1/chat/completions",
+            completion_window=self._completion_window,
+        )
+        logger.info("OpenAI batch %s created from file %s with %s requests", batch.id, input_file.id, len(requests))
+        return batch.id
+
+    async def get_state(self, batch_id: str) -> ProviderBatchState:
+        batch = await self._client.batches.retrieve(batch_id)
+        counts = batch.request_counts
+        error = None
+        if batch.errors and batch.errors.data:
+            error = "; ".join(item.message or item.code or "unknown error" for item in batch.errors.data)
+        return ProviderBatchState(
+            status=_STATUSES.get(batch.status, BatchJobStatus.IN_PROGRESS),
+            completed=counts.completed if counts else 0,
+            failed=counts.failed if counts else 0,
+            error=error,
+        )
+
+    async def get_results(self, batch_id: str) -> AsyncIterator[BatchResult]:
+        batch = await self._client.batches.retrieve(batch_id)
+        for file_id in (batch.output_file_id, batch.error_file_id):
+            if not file_id:
+                continue
+            # Result files can be large; stream them line by line instead of loading them whole.
+            async with self._client.with_streaming_response.files.content(file_id) as response:
+                async for line in response.iter_lines():
+                    if line.strip():
+                        yield self._parse_result(json.loads(line))
+
+    @staticmethod
+    def _parse_result(record: dict) -> BatchResult:
+        custom_id = record["custom_id"]
+        if record.get("error"):
+            error = record["error"]
+            return BatchResult(custom_id=custom_id, error=error.get("message") or error.get("code") or str(error))
+        response = record.get("response") or {}
+        body = response.get("body") or {}
+        if response.get("status_code") != 200:
+            message = (body.get("error") or {}).get("message") or f"status {response.get('status_code')}"
+            return BatchResult(custom_id=custom_id, error=message)
+        usage = body["usage"]
+        return BatchResult(
+            custom_id=custom_id,
+            response=AIResponse(
+                assistant_message=body["choices"][0]["message"]["content"],
+                usage=Usage(
+                    prompt_tokens=usage["prompt_tokens"],
+                    completion_tokens=usage["completion_tokens"],
+                    total_tokens=usage["total_tokens"],
+                ),
+            ),
+        )
+
+    async def cancel(self, batch_id: str) -> None:
+        await self._client.batches.cancel(batch_id)
@@ -0,0 +1,103 @@
+import asyncio
+import sqlite3
+from concurrent.futures import ThreadPoolExecutor
+
+from app.application.interfaces.batch_job_store import BatchJobStore
+from app.domain.models import AIAssistant, BatchJob, BatchJobStatus
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS batch_jobs (
+    id TEXT PRIMARY KEY,
+    assistant TEXT NOT NULL,
+    provider TEXT NOT NULL,
+    provider_batch_id TEXT NOT NULL,
+    status TEXT NOT NULL,
+    request_count INTEGER NOT NULL,
+    completed_count INTEGER NOT NULL,
+    failed_count INTEGER NOT NULL,
+    error TEXT,
+    created_at REAL NOT NULL,
+    updated_at REAL NOT NULL
+) WITHOUT ROWID;
+"""
+
+_COLUMNS = (
+    "id, assistant, provider, provider_batch_id, status, request_count,"
+    " completed_count, failed_count, error, created_at, updated_at"
+)
+
+
+class SqliteBatchJobStore(BatchJobStore):
+    """Keeps batch jobs in a SQLite file so they can be polled and collected after a restart.
+
+    All SQLite calls run on a dedicated thread to keep them off the event loop.
+    """
+
+    def __init__(self, path: str):
+        self._path = path
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="batch-jobs")
+        self._connection: sqlite3.Connection | None = None
+
+    async def _run(self, func, *args):
+        return await asyncio.get_running_loop().run_in_executor(self._executor, func, *args)
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._connection is None:
+            connection = sqlite3.connect(self._path, timeout=5.0, isolation_level=None)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.executescript(_SCHEMA)
+            self._connection = connection
+        return self._connection
+
+    async def save(self, job: BatchJob) -> None:
+        await self._run(self._save, job)
+
+    def _save(self, job: BatchJob) -> None:
+        self._connect().execute(
+            f"INSERT OR REPLACE INTO batch_jobs ({_COLUMNS}) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            (
+                job.id,
+                job.assistant.value,
+                job.provider,
+                job.provider_batch_id,
+                job.status.value,
+                job.request_count,
+                job.completed_count,
+                job.failed_count,
+                job.error,
+                job.created_at,
+                job.updated_at,
+            ),
+        )
+
+    async def get(self, job_id: str) -> BatchJob | None:
+        return await self._run(self._get, job_id)
+
+    def _get(self, job_id: str) -> BatchJob | None:
+        row = self._connect().execute(f"SELECT {_COLUMNS} FROM batch_jobs WHERE id = ?", (job_id,)).fetchone()
+        if row is None:
+            return None
+        (id_, assistant, provider, provider_batch_id, status, request_count,
+         completed_count, failed_count, error, created_at, updated_at) = row
+        return BatchJob(
+            id=id_,
+            assistant=AIAssistant(assistant),
+            provider=provider,
+            provider_batch_id=provider_batch_id,
+            status=BatchJobStatus(status),
+            request_count=request_count,
+            created_at=created_at,
+            updated_at=updated_at,
+            completed_count=completed_count,
+            failed_count=failed_count,
+            error=error,
+        )
+
+    async def aclose(self) -> None:
+        await self._run(self._close)
+        self._executor.shutdown(wait=True)
+
+    def _close(self) -> None:
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
@@ -0,0 +1 @@
+"""Response cache backends."""
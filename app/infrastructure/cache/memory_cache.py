@@ -0,0 +1,65 @@
+import time
+from collections import OrderedDict
+
+from app.application.interfaces.response_cache import ResponseCache
+
+
+class InMemoryResponseCache(ResponseCache):
+    """Process-local LRU cache bounded by total payload size, with a per-entry TTL."""
+
+    def __init__(self, max_bytes: int, ttl_seconds: float):
+        if max_bytes <= 0 or ttl_seconds <= 0:
+            raise ValueError("max_bytes and ttl_seconds must be positive")
+        self._max_bytes = max_bytes
+        self._ttl = ttl_seconds
+        self._entries: OrderedDict[str, tuple[float, bytes]] = OrderedDict()
+        self._size = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    async def get(self, key: str) -> bytes | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            self._remove(key)
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return value
+
+    async def set(self, key: str, value: bytes) -> None:
+        entry_size = len(key) + len(value)
+        if entry_size > self._max_bytes:
+            return
+        if key in self._entries:
+            self._remove(key)
+        self._entries[key] = (time.monotonic() + self._ttl, value)
+        self._size += entry_size
+        while self._size > self._max_bytes:
+            oldest = next(iter(self._entries))
+            self._remove(oldest)
+            self.evictions += 1
+
+    def _remove(self, key: str) -> None:
+        _, value = self._entries.pop(key)
+        self._size -= len(key) + len(value)
+
+    def stats(self) -> dict:
+        return {
+            "backend": "memory",
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "entries": len(self._entries),
+            "bytes": self._size,
+            "max_bytes": self._max_bytes,
+        }
+
+    async def aclose(self) -> None:
+        self._entries.clear()
+        self._size = 0
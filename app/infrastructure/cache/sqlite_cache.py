@@ -0,0 +1,165 @@
+import asyncio
+import logging
+import sqlite3
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from app.application.interfaces.response_cache import ResponseCache
+
+logger = logging.getLogger(__name__)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    key TEXT PRIMARY KEY,
+    value BLOB NOT NULL,
+    size INTEGER NOT NULL,
+    expires_at REAL NOT NULL,
+    accessed_at REAL NOT NULL
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS responses_accessed_at ON responses (accessed_at);
+"""
+
+
+class SqliteResponseCache(ResponseCache):
+    """Persistent response cache in a SQLite database running in WAL mode.
+
+    Several worker processes on one host can share the same file: WAL lets
+    readers proceed while one process writes, and ``busy_timeout`` absorbs
+    short write contention. Entries survive restarts, so a redeployed service
+    starts warm. All SQLite calls run on a dedicated thread to keep them off
+    the event loop.
+
+    Expired entries are removed and the total payload size is trimmed back to
+    ``max_bytes`` (least recently accessed first) every ``compact_interval``
+    seconds, after which freed pages are returned with ``incremental_vacuum``.
+    """
+
+    # Access times are only rewritten when older than this, so hot keys do not turn every read into a write.
+    _TOUCH_INTERVAL = 60.0
+
+    def __init__(self, path: str, max_bytes: int, ttl_seconds: float, compact_interval: float = 60.0):
+        if max_bytes <= 0 or ttl_seconds <= 0:
+            raise ValueError("max_bytes and ttl_seconds must be positive")
+        self._path = path
+        self._max_bytes = max_bytes
+        self._ttl = ttl_seconds
+        self._compact_interval = compact_interval
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="response-cache")
+        self._connection: sqlite3.Connection | None = None
+        self._next_compaction = 0.0
+        self._entries = 0
+        self._bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    async def _run(self, func, *args):
+        return await asyncio.get_running_loop().run_in_executor(self._executor, func, *args)
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._connection is None:
+            connection = sqlite3.connect(self._path, timeout=5.0, isolation_level=None)
+            connection.execute("PRAGMA auto_vacuum=INCREMENTAL")
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            connection.executescript(_SCHEMA)
+            self._connection = connection
+            self._compact()
+            logger.info("Response cache opened at %s: %s entries, %s bytes", self._path, self._entries, self._bytes)
+        return self._connection
+
+    async def get(self, key: str) -> bytes | None:
+        value = await self._run(self._get, key)
+        if value is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return value
+
+    def _get(self, key: str) -> bytes | None:
+        connection = self._connect()
+        now = time.time()
+        row = connection.execute(
+            "SELECT value, expires_at, accessed_at FROM responses WHERE key = ?", (key,)
+        ).fetchone()
+        if row is None:
+            return None
+        value, expires_at, accessed_at = row
+        if expires_at <= now:
+            return None
+        if accessed_at < now - self._TOUCH_INTERVAL:
+            connection.execute("UPDATE responses SET accessed_at = ? WHERE key = ?", (now, key))
+        return value
+
+    async def set(self, key: str, value: bytes) -> None:
+        await self._run(self._set, key, value)
+
+    def _set(self, key: str, value: bytes) -> None:
+        size = len(key) + len(value)
+        if size > self._max_bytes:
+            return
+        connection = self._connect()
+        now = time.time()
+        connection.execute(
+            "INSERT OR REPLACE INTO responses (key, value, size, expires_at, accessed_at) VALUES (?, ?, ?, ?, ?)",
+            (key, value, size, now + self._ttl, now),
+        )
+        self._entries += 1
+        self._bytes += size
+        if now >= self._next_compaction or self._bytes > self._max_bytes:
+            self._compact()
+
+    async def compact(self) -> None:
+        await self._run(self._compact_now)
+
+    def _compact_now(self) -> None:
+        self._connect()
+        self._compact()
+
+    def _compact(self) -> None:
+        connection = self._connection
+        now = time.time()
+        connection.execute("BEGIN IMMEDIATE")
+        try:
+            connection.execute("DELETE FROM responses WHERE expires_at <= ?", (now,))
+            entries, total = connection.execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM responses").fetchone()
+            if total > self._max_bytes:
+                # Walk entries from least recently accessed and drop them until the rest fits.
+                excess = total - self._max_bytes
+                victims = []
+                for key, size in connection.execute("SELECT key, size FROM responses ORDER BY accessed_at"):
+                    victims.append((key,))
+                    excess -= size
+                    if excess <= 0:
+                        break
+                connection.executemany("DELETE FROM responses WHERE key = ?", victims)
+                self.evictions += len(victims)
+                entries, total = connection.execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM responses").fetchone()
+            connection.execute("COMMIT")
+        except BaseException:
+            connection.execute("ROLLBACK")
+            raise
+        connection.execute("PRAGMA incremental_vacuum")
+        self._entries, self._bytes = entries, total
+        self._next_compaction = now + self._compact_interval
+
+    def stats(self) -> dict:
+        return {
+            "backend": "sqlite",
+            "path": self._path,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "entries": self._entries,
+            "bytes": self._bytes,
+            "max_bytes": self._max_bytes,
+        }
+
+    async def aclose(self) -> None:
+        await self._run(self._close)
+        self._executor.shutdown(wait=True)
+
+    def _close(self) -> None:
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
@@ -1,24 +1,36 @@
 import logging
+from collections.abc import AsyncIterator
+from contextlib import nullcontext
 
 from openai import AsyncOpenAI
 from openai.types.chat import ChatCompletionAssistantMessageParam, ChatCompletionSystemMessageParam, ChatCompletionUserMessageParam
 
+from app.application.services.tracing import span
 from app.domain.interfaces import TextModelClient, VisionModelClient
-from app.domain.models import AIMessage, AIResponse, ImageContentItem, Message, Role, TextContentItem, Usage
+from app.domain.models import AIMessage, AIResponse, AIResponseChunk, ImageContentItem, Message, Role, TextContentItem, Usage
+from app.infrastructure.resilience.adaptive_limiter import AdaptiveLimiter
 
 logger = logging.getLogger(__name__)
 
 
 class OpenAIClient(TextModelClient, VisionModelClient):
-    def __init__(self, model: str, api_key: str):
+    def __init__(self, model: str, api_key: str, client: AsyncOpenAI | None = None, limiter: AdaptiveLimiter | None = None):
         if not model or not api_key:
             raise ValueError("OpenAI model and api_key are required")
         self._model = model
-        self._client = AsyncOpenAI(api_key=api_key)
+        self._client = client or AsyncOpenAI(api_key=api_key)
+        self._limiter = limiter
+
+    def _slot(self, record_latency: bool = True):
+        return self._limiter.slot(record_latency) if self._limiter is not None else nullcontext()
 
     async def generate(self, user_messages: list[Message]) -> AIResponse:
         return await self._generate_text(user_messages)
 
+    async def generate_stream(self, user_messages: list[Message]) -> AsyncIterator[AIResponseChunk]:
+        async for chunk in self._stream(self._build_messages(user_messages)):
+            yield chunk
+
     @staticmethod
     def _serialize_message(msg: AIMessage) -> dict:
         content_items = []
@@ -38,7 +50,8 @@ class OpenAIClient(TextModelClient, VisionModelClient):
             "content": content_items
         }
 
-    async def _generate_text(self, user_messages: list[Message]) -> AIResponse:
+    @staticmethod
+    def _build_messages(user_messages: list[Message]) -> list:
         messages = []
 
         for message in user_messages:
@@ -49,7 +62,14 @@ class OpenAIClient(TextModelClient, VisionModelClient):
             elif message.role == Role.ASSISTANT:
                 messages.append(ChatCompletionAssistantMessageParam(role=message.role.value, content=message.content))
 
-        completion = await self._client.chat.completions.create(model=self._model, messages=messages)
+        return messages
+
+    async def _generate_text(self, user_messages: list[Message]) -> AIResponse:
+        messages = self._build_messages(user_messages)
+
+        async with self._slot():
+            with span("upstream", provider="openai", model=self._model):
+                completion = await self._client.chat.completions.create(model=self._model, messages=messages)
 
         assistant_message = completion.choices[0].message.content
         prompt_tokens = completion.usage.prompt_tokens
@@ -59,10 +79,34 @@ class OpenAIClient(TextModelClient, VisionModelClient):
         usage_model = Usage(prompt_tokens=prompt_tokens, completion_tokens=completion_tokens, total_tokens=total_tokens)
         return AIResponse(assistant_message=assistant_message, usage=usage_model)
 
+    async def _stream(self, messages: list) -> AsyncIterator[AIResponseChunk]:
+        # A stream holds its slot until it ends; its duration says nothing about provider latency.
+        async with self._slot(record_latency=False):
+            # Only the wait for the response headers is a span; the block must not cover a yield.
+            with span("upstream", provider="openai", model=self._model):
+                stream = await self._client.chat.completions.create(
+                    model=self._model,
+                    messages=messages,
+                    stream=True,
+                    stream_options={"include_usage": True},
+                )
+            async for chunk in stream:
+                if chunk.choices and chunk.choices[0].delta.content:
+                    yield AIResponseChunk(delta=chunk.choices[0].delta.content)
+                if chunk.usage:
+                    usage = Usage(
+                        prompt_tokens=chunk.usage.prompt_tokens,
+                        completion_tokens=chunk.usage.completion_tokens,
+                        total_tokens=chunk.usage.total_tokens,
+                    )
+                    yield AIResponseChunk(delta="", usage=usage)
+
     async def generate_vision(self, user_messages: list[AIMessage]) -> AIResponse:
         messages = [self._serialize_message(msg) for msg in user_messages]
 
-        response = await self._client.chat.completions.create(model=self._model, messages=messages)
+        async with self._slot():
+            with span("upstream", provider="openai", model=self._model):
+                response = await self._client.chat.completions.create(model=self._model, messages=messages)
 
         usage = Usage(
             prompt_tokens=response.usage.prompt_tokens,
@@ -75,3 +119,8 @@ class OpenAIClient(TextModelClient, VisionModelClient):
         logger.info("OpenAI Vision API response received")
 
         return AIResponse(assistant_message=content, usage=usage)
+
+    async def generate_vision_stream(self, user_messages: list[AIMessage]) -> AsyncIterator[AIResponseChunk]:
+        messages = [self._serialize_message(msg) for msg in user_messages]
+        async for chunk in self._stream(messages):
+            yield chunk
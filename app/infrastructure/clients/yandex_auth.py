@@ -1,15 +1,38 @@
 import asyncio
+import contextvars
+import fcntl
+import json
 import logging
+import os
 import time
+from datetime import datetime
 
-import httpx
 import jwt
+from cryptography.hazmat.primitives import serialization
+
+from app.application.services.tracing import span
+from app.infrastructure.http.transport import HttpTransport
 
 logger = logging.getLogger(__name__)
 
+IAM_TOKEN_URL = "https://iam.api.cloud.yandex.net/iam/v1/tokens"
+
 
 class YandexAuth:
-    def __init__(self, key_id: str, service_account_id: str, private_key: str):
+    _DEFAULT_IAM_TTL = 3600
+    _EXPIRY_MARGIN = 60
+    _RETRY_DELAY = 30
+
+    def __init__(
+        self,
+        key_id: str,
+        service_account_id: str,
+        private_key: str,
+        http_transport: HttpTransport,
+        refresh_fraction: float = 0.5,
+        token_cache_path: str | None = None,
+        iam_url: str = IAM_TOKEN_URL,
+    ):
         if not key_id or not service_account_id or not private_key:
             missing = []
             if not key_id:
@@ -20,15 +43,25 @@ class YandexAuth:
                 missing.append("private_key")
             logger.error("Missing required parameters: %s", missing)
             raise ValueError(f"Missing required parameters: {missing}")
+        if not 0 < refresh_fraction <= 1:
+            raise ValueError("refresh_fraction must be in (0, 1]")
 
         self._KEY_ID = key_id
         self._SERVICE_ACCOUNT_ID = service_account_id
         self._PRIVATE_KEY = self._normalize_private_key(private_key)
+        self._signing_key = None
+        self._http = http_transport
+        self._refresh_fraction = refresh_fraction
+        self._token_cache_path = token_cache_path
+        self._iam_url = iam_url
         self.jwt_token = None
         self.jwt_expires_at = 0
         self.iam_key = None
         self.iam_expires_at = 0
-        self._iam_token_task = None
+        self._iam_issued_at = 0.0
+        self._refresh_at = 0.0
+        self._refresh_task: asyncio.Task | None = None
+        self._iam_token_task: asyncio.Task | None = None
         logger.info("Yandex Auth initialized")
 
     @staticmethod
@@ -39,53 +72,90 @@ class YandexAuth:
         return key.replace("\\n", "\n")
 
     def _is_jwt_valid(self) -> bool:
-        return self.jwt_token is not None and time.time() < self.jwt_expires_at - 60
+        return self.jwt_token is not None and time.time() < self.jwt_expires_at - self._EXPIRY_MARGIN
 
     def _is_iam_valid(self) -> bool:
-        return self.iam_key is not None and time.time() < self.iam_expires_at - 60
+        return self.iam_key is not None and time.time() < self.iam_expires_at - self._EXPIRY_MARGIN
 
     async def get_iam_key(self) -> str:
-        try:
-            if not self._is_jwt_valid():
-                logger.info("JWT token expired or missing, creating new one...")
-                self.jwt_token = self.create_jwt_token()
-                self.iam_key = None
-                self.iam_expires_at = 0
-
-            if not self._is_iam_valid():
-                logger.info("IAM token expired or missing, creating new one...")
-                self.iam_key = await self.create_iam_token(self.jwt_token)
-                self.iam_expires_at = time.time() + 3600
-
-                if self._iam_token_task is None:
-                    logger.info("Starting IAM token refresh task...")
-                    self._iam_token_task = asyncio.create_task(self.update_iam_token())
-
+        if self._is_iam_valid():
             logger.debug("IAM key provided")
             return self.iam_key
 
+        logger.info("IAM token expired or missing, refreshing...")
+        try:
+            with span("auth", provider="yandex"):
+                return await self._refresh()
         except Exception as exc:
             logger.error("Error getting IAM key: %s", exc, exc_info=True)
+            raise
+
+    async def _refresh(self) -> str:
+        """Refresh the IAM token, sharing one in-flight refresh between all callers."""
+        if self._refresh_task is None:
+            self._refresh_task = asyncio.create_task(self._do_refresh())
+            self._refresh_task.add_done_callback(self._on_refresh_done)
+        return await asyncio.shield(self._refresh_task)
+
+    def _on_refresh_done(self, task: asyncio.Task) -> None:
+        self._refresh_task = None
+        if not task.cancelled() and task.exception() is not None:
             self.jwt_token = None
             self.jwt_expires_at = 0
-            self.iam_key = None
-            self.iam_expires_at = 0
-            raise
+
+    async def _do_refresh(self) -> str:
+        if self._token_cache_path:
+            lock_fd = await asyncio.to_thread(self._lock_token_cache)
+            try:
+                if await asyncio.to_thread(self._load_cached_token):
+                    logger.info("IAM token loaded from %s", self._token_cache_path)
+                else:
+                    await self._issue_iam_token()
+                    await asyncio.to_thread(self._store_cached_token)
+            finally:
+                await asyncio.to_thread(self._unlock_token_cache, lock_fd)
+        else:
+            await self._issue_iam_token()
+
+        if self._iam_token_task is None:
+            logger.info("Starting IAM token refresh task...")
+            # A fresh context, so the long-lived task does not keep the first caller's request trace alive.
+            self._iam_token_task = asyncio.create_task(self.update_iam_token(), context=contextvars.Context())
+        return self.iam_key
+
+    async def _issue_iam_token(self) -> None:
+        if not self._is_jwt_valid():
+            logger.info("JWT token expired or missing, creating new one...")
+            self.jwt_token = await asyncio.to_thread(self.create_jwt_token)
+
+        issued_at = time.time()
+        iam_key, expires_at = await self.create_iam_token(self.jwt_token)
+        self._set_iam_token(iam_key, issued_at, expires_at)
+        logger.info("IAM token issued, expires at %s", expires_at)
+
+    def _set_iam_token(self, iam_key: str, issued_at: float, expires_at: float) -> None:
+        self.iam_key = iam_key
+        self.iam_expires_at = expires_at
+        self._iam_issued_at = issued_at
+        self._refresh_at = issued_at + (expires_at - issued_at) * self._refresh_fraction
 
     def create_jwt_token(self) -> str:
         try:
             logger.debug("Creating JWT token...")
+            if self._signing_key is None:
+                # Parsing validates the RSA key, which costs far more than signing; do it once.
+                self._signing_key = serialization.load_pem_private_key(self._PRIVATE_KEY.encode(), password=None)
             now = int(time.time())
             expires_at = now + 3600
             payload = {
-                "aud": "https://iam.api.cloud.yandex.net/iam/v1/tokens",
+                "aud": IAM_TOKEN_URL,
                 "iss": self._SERVICE_ACCOUNT_ID,
                 "iat": now,
                 "exp": expires_at,
             }
             encoded_token = jwt.encode(
                 payload,
-                self._PRIVATE_KEY,
+                self._signing_key,
                 algorithm="PS256",
                 headers={"kid": self._KEY_ID},
             )
@@ -99,10 +169,9 @@ class YandexAuth:
             logger.error("Error creating JWT token: %s", exc, exc_info=True)
             raise
 
-    async def create_iam_token(self, jwt_token: str) -> str:
+    async def create_iam_token(self, jwt_token: str) -> tuple[str, float]:
+        """Exchange a JWT for an IAM token; returns the token and its expiry as a Unix timestamp."""
         try:
-            iam_token_url = "https://iam.api.cloud.yandex.net/iam/v1/tokens"
-
             headers = {
                 "Content-Type": "application/json"
             }
@@ -111,12 +180,15 @@ class YandexAuth:
                 "jwt": jwt_token
             }
 
-            async with httpx.AsyncClient() as client:
-                response = await client.post(iam_token_url, json=data, headers=headers)
+            requested_at = time.time()
+            response = await self._http.client.post(self._iam_url, json=data, headers=headers)
 
             if response.status_code == 200:
-                result = response.json()["iamToken"]
-                return result
+                result = response.json()
+                expires_at = requested_at + self._DEFAULT_IAM_TTL
+                if result.get("expiresAt"):
+                    expires_at = datetime.fromisoformat(result["expiresAt"]).timestamp()
+                return result["iamToken"], expires_at
             error_text = response.text
             logger.error("IAM token creation failed: status=%s, response=%s", response.status_code, error_text)
             raise Exception(f"Ошибка при получении IAM-токена: {response.status_code} - {error_text}")
@@ -126,22 +198,64 @@ class YandexAuth:
             raise
 
     async def update_iam_token(self):
+        """Refresh the token ahead of expiry, at ``refresh_fraction`` of its lifetime."""
         try:
-            await asyncio.sleep(3000)
             while True:
+                await asyncio.sleep(max(self._refresh_at - time.time(), 0))
                 try:
-                    self.jwt_token = self.create_jwt_token()
-                    self.iam_key = await self.create_iam_token(self.jwt_token)
-                    self.iam_expires_at = time.time() + 3600
+                    await self._refresh()
                     logger.info("Tokens refreshed successfully")
                 except Exception as exc:
                     logger.error("Error refreshing tokens: %s", exc, exc_info=True)
-                    self.jwt_token = None
-                    self.jwt_expires_at = 0
-                    self.iam_key = None
-                    self.iam_expires_at = 0
-                await asyncio.sleep(3000)
+                    self._refresh_at = time.time() + self._RETRY_DELAY
 
         except Exception as exc:
             logger.error("Token refresh task crashed: %s", exc, exc_info=True)
             self._iam_token_task = None
+
+    def _lock_token_cache(self) -> int:
+        fd = os.open(f"{self._token_cache_path}.lock", os.O_RDWR | os.O_CREAT, 0o600)
+        fcntl.flock(fd, fcntl.LOCK_EX)
+        return fd
+
+    @staticmethod
+    def _unlock_token_cache(fd: int) -> None:
+        fcntl.flock(fd, fcntl.LOCK_UN)
+        os.close(fd)
+
+    def _load_cached_token(self) -> bool:
+        """Adopt a token another process (or a previous run) has already cached, if still fresh."""
+        try:
+            with open(self._token_cache_path, encoding="utf-8") as file:
+                cached = json.load(file)
+        except FileNotFoundError:
+            return False
+        except (OSError, ValueError) as exc:
+            logger.warning("Ignoring unreadable IAM token cache %s: %s", self._token_cache_path, exc)
+            return False
+
+        if cached.get("key_id") != self._KEY_ID or cached.get("service_account_id") != self._SERVICE_ACCOUNT_ID:
+            return False
+        now = time.time()
+        issued_at = float(cached.get("issued_at", 0))
+        expires_at = float(cached.get("expires_at", 0))
+        refresh_at = issued_at + (expires_at - issued_at) * self._refresh_fraction
+        if now >= refresh_at or now >= expires_at - self._EXPIRY_MARGIN:
+            return False
+
+        self._set_iam_token(cached["iam_token"], issued_at, expires_at)
+        return True
+
+    def _store_cached_token(self) -> None:
+        payload = {
+            "key_id": self._KEY_ID,
+            "service_account_id": self._SERVICE_ACCOUNT_ID,
+            "iam_token": self.iam_key,
+            "issued_at": self._iam_issued_at,
+            "expires_at": self.iam_expires_at,
+        }
+        tmp_path = f"{self._token_cache_path}.{os.getpid()}.tmp"
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, "w", encoding="utf-8") as file:
+            json.dump(payload, file)
+        os.replace(tmp_path, self._token_cache_path)
@@ -1,10 +1,16 @@
+import json
 import logging
+import time
+from collections.abc import AsyncIterator
+from contextlib import nullcontext
 
-import httpx
-
+from app.application.services.tracing import record_span, span
+from app.domain.exceptions import ProviderStatusException
 from app.domain.interfaces import TextModelClient
-from app.domain.models import AIResponse, Message, Usage
+from app.domain.models import AIResponse, AIResponseChunk, Message, Usage
 from app.infrastructure.clients.yandex_auth import YandexAuth
+from app.infrastructure.http.transport import HttpTransport
+from app.infrastructure.resilience.adaptive_limiter import AdaptiveLimiter
 
 logger = logging.getLogger(__name__)
 
@@ -16,6 +22,8 @@ class YandexGPTClient(TextModelClient):
         model_path: str,
         model_name: str,
         auth: YandexAuth,
+        http_transport: HttpTransport,
+        limiter: AdaptiveLimiter | None = None,
     ):
         if not api_url or not model_path or not model_name:
             raise ValueError("Yandex GPT api_url, model_path and model_name are required")
@@ -23,13 +31,18 @@ class YandexGPTClient(TextModelClient):
         self._model_path = model_path
         self.model_name = model_name
         self.auth = auth
+        self._http = http_transport
+        self._limiter = limiter
 
-    async def generate(self, user_messages: list[Message]) -> AIResponse:
+    def _slot(self, record_latency: bool = True):
+        return self._limiter.slot(record_latency) if self._limiter is not None else nullcontext()
+
+    def _build_request(self, user_messages: list[Message], stream: bool) -> dict:
         model_uri = f"{self._model_path}{self.model_name}"
-        data = {
+        return {
             "modelUri": model_uri,
             "completionOptions": {
-                "stream": False,
+                "stream": stream,
                 "temperature": 0.2,
                 "maxTokens": 2000,
             },
@@ -38,30 +51,75 @@ class YandexGPTClient(TextModelClient):
             ],
         }
 
+    async def _build_headers(self) -> dict:
         iam_key = await self.auth.get_iam_key()
 
-        headers = {
+        return {
             "Authorization": f"Bearer {iam_key}",
             "Content-Type": "application/json",
         }
 
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            response = await client.post(f"{self._api_url}/completion", json=data, headers=headers)
+    @staticmethod
+    def _parse_usage(usage_raw: dict) -> Usage:
+        return Usage(
+            prompt_tokens=int(usage_raw["inputTextTokens"]),
+            completion_tokens=int(usage_raw["completionTokens"]),
+            total_tokens=int(usage_raw["totalTokens"]),
+        )
+
+    async def generate(self, user_messages: list[Message]) -> AIResponse:
+        data = self._build_request(user_messages, stream=False)
+        headers = await self._build_headers()
+
+        async with self._slot():
+            with span("upstream", provider="yandex_gpt", model=self.model_name):
+                response = await self._http.client.post(f"{self._api_url}/completion", json=data, headers=headers)
 
-        if response.status_code != 200:
-            error_text = response.text
-            logger.error("Yandex GPT API error: status=%s, response=%s", response.status_code, error_text)
-            raise Exception(f"Yandex GPT API error: {response.status_code} - {error_text}")
+            if response.status_code != 200:
+                error_text = response.text
+                logger.error("Yandex GPT API error: status=%s, response=%s", response.status_code, error_text)
+                raise ProviderStatusException(
+                    response.status_code, f"Yandex GPT API error: {response.status_code} - {error_text}"
+                )
 
         response_json = response.json()
         logger.debug("Yandex GPT response JSON: %s", response_json)
 
         assistant_message = response_json["result"]["alternatives"][0]["message"]["text"]
-        usage_raw = response_json["result"]["usage"]
-
-        usage = Usage(
-            prompt_tokens=int(usage_raw["inputTextTokens"]),
-            completion_tokens=int(usage_raw["completionTokens"]),
-            total_tokens=int(usage_raw["totalTokens"]),
-        )
+        usage = self._parse_usage(response_json["result"]["usage"])
         return AIResponse(assistant_message=assistant_message, usage=usage)
+
+    async def generate_stream(self, user_messages: list[Message]) -> AsyncIterator[AIResponseChunk]:
+        data = self._build_request(user_messages, stream=True)
+        headers = await self._build_headers()
+
+        async with self._slot(record_latency=False):
+            started = time.perf_counter()
+            async with self._http.client.stream(
+                "POST", f"{self._api_url}/completion", json=data, headers=headers
+            ) as response:
+                # Recorded after the fact: a span block must not stay open across the yields below.
+                record_span("upstream", started, provider="yandex_gpt", model=self.model_name)
+                if response.status_code != 200:
+                    error_text = (await response.aread()).decode(errors="replace")
+                    logger.error("Yandex GPT API error: status=%s, response=%s", response.status_code, error_text)
+                    raise ProviderStatusException(
+                        response.status_code, f"Yandex GPT API error: {response.status_code} - {error_text}"
+                    )
+
+                # Each line is a JSON object whose alternative carries the full text generated so far.
+                emitted = ""
+                usage = None
+                async for line in response.aiter_lines():
+                    if not line.strip():
+                        continue
+                    result = json.loads(line)["result"]
+                    text = result["alternatives"][0]["message"]["text"]
+                    if len(text) > len(emitted):
+                        yield AIResponseChunk(delta=text[len(emitted):])
+                        emitted = text
+                    if result.get("usage"):
+                        usage = self._parse_usage(result["usage"])
+
+        if usage is not None:
+            yield AIResponseChunk(delta="", usage=usage)
@@ -1,4 +1,6 @@
 import logging
+from collections.abc import AsyncIterator
+from contextlib import nullcontext
 
 from openai import AsyncOpenAI
 from openai.types.chat import (
@@ -7,21 +9,36 @@ from openai.types.chat import (
     ChatCompletionUserMessageParam,
 )
 
+from app.application.services.tracing import span
 from app.domain.interfaces import TextModelClient
-from app.domain.models import AIResponse, Message, Role, Usage
+from app.domain.models import AIResponse, AIResponseChunk, Message, Role, Usage
+from app.infrastructure.resilience.adaptive_limiter import AdaptiveLimiter
 
 logger = logging.getLogger(__name__)
 
 
 class YandexGPTOssClient(TextModelClient):
-    def __init__(self, model_name: str, model_path: str, api_key: str, base_url: str):
+    def __init__(
+        self,
+        model_name: str,
+        model_path: str,
+        api_key: str,
+        base_url: str,
+        client: AsyncOpenAI | None = None,
+        limiter: AdaptiveLimiter | None = None,
+    ):
         if not model_name or not model_path or not api_key or not base_url:
             raise ValueError("Yandex GPT OSS model_name, model_path, api_key and base_url are required")
         self.model_name = model_name
         self._model_path = model_path
-        self.open_ai = AsyncOpenAI(api_key=api_key, base_url=base_url)
+        self.open_ai = client or AsyncOpenAI(api_key=api_key, base_url=base_url)
+        self._limiter = limiter
 
-    async def generate(self, user_messages: list[Message]) -> AIResponse:
+    def _slot(self, record_latency: bool = True):
+        return self._limiter.slot(record_latency) if self._limiter is not None else nullcontext()
+
+    @staticmethod
+    def _build_messages(user_messages: list[Message]) -> list:
         messages = []
 
         for message in user_messages:
@@ -32,9 +49,16 @@ class YandexGPTOssClient(TextModelClient):
             elif message.role == Role.ASSISTANT:
                 messages.append(ChatCompletionAssistantMessageParam(role=message.role.value, content=message.content))
 
+        return messages
+
+    async def generate(self, user_messages: list[Message]) -> AIResponse:
+        messages = self._build_messages(user_messages)
+
         logger.info("Sending request to OpenAI-compatible API")
         model = f"{self._model_path}{self.model_name}"
-        completion = await self.open_ai.chat.completions.create(model=model, messages=messages, temperature=0.2, max_tokens=2000,)
+        async with self._slot():
+            with span("upstream", provider="yandex_openai", model=self.model_name):
+                completion = await self.open_ai.chat.completions.create(model=model, messages=messages, temperature=0.2, max_tokens=2000,)
 
         assistant_message = completion.choices[0].message.content
         prompt_tokens = completion.usage.prompt_tokens
@@ -46,4 +70,28 @@ class YandexGPTOssClient(TextModelClient):
         usage_model = Usage(prompt_tokens=prompt_tokens, completion_tokens=completion_tokens, total_tokens=total_tokens)
         return AIResponse(assistant_message=assistant_message, usage=usage_model)
 
+    async def generate_stream(self, user_messages: list[Message]) -> AsyncIterator[AIResponseChunk]:
+        messages = self._build_messages(user_messages)
 
+        logger.info("Sending streaming request to OpenAI-compatible API")
+        model = f"{self._model_path}{self.model_name}"
+        async with self._slot(record_latency=False):
+            with span("upstream", provider="yandex_openai", model=self.model_name):
+                stream = await self.open_ai.chat.completions.create(
+                    model=model,
+                    messages=messages,
+                    temperature=0.2,
+                    max_tokens=2000,
+                    stream=True,
+                    stream_options={"include_usage": True},
+                )
+            async for chunk in stream:
+                if chunk.choices and chunk.choices[0].delta.content:
+                    yield AIResponseChunk(delta=chunk.choices[0].delta.content)
+                if chunk.usage:
+                    usage = Usage(
+                        prompt_tokens=chunk.usage.prompt_tokens,
+                        completion_tokens=chunk.usage.completion_tokens,
+                        total_tokens=chunk.usage.total_tokens,
+                    )
+                    yield AIResponseChunk(delta="", usage=usage)
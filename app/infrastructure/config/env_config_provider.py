@@ -1,11 +1,32 @@
+from app.application.exceptions import ConfigurationException
 from app.application.interfaces.config_provider import ConfigProvider
 from app.application.interfaces.config_source import ConfigSource
 from app.application.interfaces.config_validator import ConfigValidator
+from app.domain.models import AIAssistant
 from core.config import (
+    UPSTREAM_NAMES,
+    AdmissionConfig,
     ApplicationConfig,
+    AutoRoutingConfig,
+    BatchConfig,
+    BatchJobsConfig,
+    CircuitBreakerConfig,
+    ConcurrencyConfig,
     Config,
+    HedgingConfig,
+    HttpConfig,
+    ImagePreprocessingConfig,
+    ImageStoreConfig,
     LoggingConfig,
+    MetricsConfig,
     OpenAIConfig,
+    RequestLimitsConfig,
+    ResponseCacheConfig,
+    SessionsConfig,
+    StatsConfig,
+    TenancyConfig,
+    TokenBudgetConfig,
+    TracingConfig,
     YandexConfig,
 )
 
@@ -23,6 +44,7 @@ class EnvConfigProvider(ConfigProvider):
 
     def _load_config_from_env(self) -> Config:
         env = self._source
+        http = self._load_http_config("HTTP_", HttpConfig())
         return Config(
             application=ApplicationConfig(
                 host=env.get("HOST", "0.0.0.0"),
@@ -44,10 +66,187 @@ class EnvConfigProvider(ConfigProvider):
                 qwen_235b_model_name=env.get("YANDEX_QWEN_235B_MODEL_NAME"),
                 open_ai_api_key=env.get("YANDEX_OPEN_AI_API_KEY"),
                 open_ai_base_url=env.get("YANDEX_OPEN_AI_BASE_URL"),
+                iam_refresh_fraction=float(env.get("YANDEX_IAM_REFRESH_FRACTION", "0.5")),
+                iam_token_cache_path=env.get("YANDEX_IAM_TOKEN_CACHE"),
             ),
             logging=LoggingConfig(
                 level=env.get("LOG_LEVEL", "INFO"),
                 file=env.get("LOG_FILE", "llmbox.log"),
                 format=env.get("LOG_FORMAT", "%(asctime)s - %(name)s - %(levelname)s - %(message)s"),
+                json_format=self._get_bool("LOG_JSON", False),
+                info_sample_rate=float(env.get("LOG_INFO_SAMPLE_RATE", "1.0")),
+                max_message_chars=int(env.get("LOG_MAX_MESSAGE_CHARS", "8192")),
             ),
+            http=http,
+            upstream_http={name: self._load_http_config(f"{name.upper()}_HTTP_", http) for name in UPSTREAM_NAMES},
+            response_cache=ResponseCacheConfig(
+                enabled=self._get_bool("RESPONSE_CACHE_ENABLED", False),
+                backend=env.get("RESPONSE_CACHE_BACKEND", "memory"),
+                path=env.get("RESPONSE_CACHE_PATH", "llmbox_cache.sqlite3"),
+                max_bytes=int(env.get("RESPONSE_CACHE_MAX_BYTES", str(64 * 1024 * 1024))),
+                ttl_seconds=float(env.get("RESPONSE_CACHE_TTL", "3600")),
+                compact_interval=float(env.get("RESPONSE_CACHE_COMPACT_INTERVAL", "60")),
+            ),
+            request_coalescing=self._get_bool("REQUEST_COALESCING_ENABLED", True),
+            concurrency=ConcurrencyConfig(
+                enabled=self._get_bool("CONCURRENCY_LIMIT_ENABLED", True),
+                initial_limit=int(env.get("CONCURRENCY_INITIAL_LIMIT", "16")),
+                min_limit=int(env.get("CONCURRENCY_MIN_LIMIT", "1")),
+                max_limit=int(env.get("CONCURRENCY_MAX_LIMIT", "128")),
+                max_queue=int(env.get("CONCURRENCY_MAX_QUEUE", "256")),
+                queue_timeout=float(env.get("CONCURRENCY_QUEUE_TIMEOUT", "10")),
+                latency_tolerance=float(env.get("CONCURRENCY_LATENCY_TOLERANCE", "2")),
+                backoff=float(env.get("CONCURRENCY_BACKOFF", "0.5")),
+                queue_timeouts=self._get_number_pairs("CONCURRENCY_QUEUE_TIMEOUTS", float),
+                tenant_weights=self._get_number_pairs("TENANT_WEIGHTS", float),
+            ),
+            hedging=HedgingConfig(
+                assistants=self._get_list("HEDGING_ASSISTANTS"),
+                alternates=self._get_assistant_pairs("HEDGING_ALTERNATES"),
+                percentile=float(env.get("HEDGING_PERCENTILE", "95")),
+                budget_ratio=float(env.get("HEDGING_BUDGET", "0.05")),
+                min_samples=int(env.get("HEDGING_MIN_SAMPLES", "20")),
+            ),
+            circuit_breaker=CircuitBreakerConfig(
+                enabled=self._get_bool("CIRCUIT_BREAKER_ENABLED", True),
+                failure_threshold=int(env.get("CIRCUIT_BREAKER_FAILURE_THRESHOLD", "5")),
+                reset_timeout=float(env.get("CIRCUIT_BREAKER_RESET_TIMEOUT", "30")),
+                half_open_max_calls=int(env.get("CIRCUIT_BREAKER_HALF_OPEN_CALLS", "1")),
+            ),
+            fallbacks={
+                assistant.value: chain
+                for assistant in AIAssistant
+                if (chain := self._get_list(f"FALLBACK_{assistant.value.upper()}"))
+            },
+            auto_routing=AutoRoutingConfig(
+                pool=self._get_list("AUTO_POOL"),
+                exploration=float(env.get("AUTO_EXPLORATION", "0.05")),
+                stale_after=float(env.get("AUTO_STALE_AFTER", "60")),
+            ),
+            batch=BatchConfig(
+                max_items=int(env.get("BATCH_MAX_ITEMS", "1000")),
+                max_concurrency=int(env.get("BATCH_MAX_CONCURRENCY", "16")),
+            ),
+            batch_jobs=BatchJobsConfig(
+                provider=env.get("BATCH_JOBS_PROVIDER", "openai"),
+                store_path=env.get("BATCH_JOBS_STORE_PATH", "llmbox_batch_jobs.sqlite3"),
+                max_requests=int(env.get("BATCH_JOBS_MAX_REQUESTS", "50000")),
+                local_concurrency=int(env.get("BATCH_JOBS_LOCAL_CONCURRENCY", "4")),
+                local_result_ttl=float(env.get("BATCH_JOBS_LOCAL_RESULT_TTL", "3600")),
+            ),
+            image_preprocessing=ImagePreprocessingConfig(
+                enabled=self._get_bool("IMAGE_PREPROCESSING_ENABLED", False),
+                max_side=int(env.get("IMAGE_MAX_SIDE", "2048")),
+                max_short_side=int(env.get("IMAGE_MAX_SHORT_SIDE", "768")),
+                format=env.get("IMAGE_FORMAT", "jpeg").lower(),
+                quality=int(env.get("IMAGE_QUALITY", "85")),
+                workers=int(env.get("IMAGE_WORKERS", "2")),
+                cache_entries=int(env.get("IMAGE_CACHE_ENTRIES", "256")),
+            ),
+            image_store=ImageStoreConfig(
+                path=env.get("IMAGE_STORE_PATH", "llmbox_images"),
+                max_bytes=int(env.get("IMAGE_STORE_MAX_BYTES", str(1024 * 1024 * 1024))),
+                max_image_bytes=int(env.get("IMAGE_STORE_MAX_IMAGE_BYTES", str(20 * 1024 * 1024))),
+            ),
+            request_limits=RequestLimitsConfig(
+                max_body_bytes=int(env.get("REQUEST_MAX_BODY_BYTES", str(1024 * 1024))),
+                max_vision_body_bytes=int(env.get("REQUEST_MAX_VISION_BODY_BYTES", str(64 * 1024 * 1024))),
+                max_batch_body_bytes=int(env.get("REQUEST_MAX_BATCH_BODY_BYTES", str(32 * 1024 * 1024))),
+            ),
+            admission=AdmissionConfig(
+                enabled=self._get_bool("ADMISSION_CONTROL_ENABLED", True),
+                max_in_flight=int(env.get("ADMISSION_MAX_IN_FLIGHT", "512")),
+                endpoint_max_in_flight=int(env.get("ADMISSION_ENDPOINT_MAX_IN_FLIGHT", "256")),
+                endpoint_limits=self._get_number_pairs("ADMISSION_ENDPOINT_LIMITS", int),
+                max_loop_lag=float(env.get("ADMISSION_MAX_LOOP_LAG", "0.25")),
+                lag_interval=float(env.get("ADMISSION_LAG_INTERVAL", "0.05")),
+                retry_after=int(env.get("ADMISSION_RETRY_AFTER", "1")),
+                exempt_paths=self._get_list("ADMISSION_EXEMPT_PATHS")
+                or ["/health", "/stats", "/metrics", "/docs", "/redoc", "/openapi.json"],
+            ),
+            tenancy=TenancyConfig(
+                tenant_header=env.get("TENANT_HEADER", "X-Tenant-Id"),
+                priority_header=env.get("PRIORITY_HEADER", "X-Priority"),
+                api_key_tenants=self._get_pairs("TENANT_API_KEYS"),
+                bulk_paths=self._get_list("BULK_PATHS") or ["/generate-ai-response/batch", "/batch-jobs"],
+            ),
+            token_budget=TokenBudgetConfig(
+                enabled=self._get_bool("TOKEN_BUDGET_ENABLED", True),
+                context_windows=self._get_number_pairs("CONTEXT_WINDOWS", int),
+                reserve_tokens=int(env.get("TOKEN_BUDGET_RESERVE", "2000")),
+            ),
+            sessions=SessionsConfig(
+                backend=env.get("SESSIONS_BACKEND", "memory").lower(),
+                path=env.get("SESSIONS_PATH", "llmbox_sessions.sqlite3"),
+                max_sessions=int(env.get("SESSIONS_MAX", "10000")),
+                max_messages=int(env.get("SESSIONS_MAX_MESSAGES", "1000")),
+                ttl_seconds=float(env.get("SESSIONS_TTL", str(24 * 3600))),
+            ),
+            metrics=MetricsConfig(
+                enabled=self._get_bool("METRICS_ENABLED", False),
+                latency_buckets=[float(bound) for bound in self._get_list("METRICS_LATENCY_BUCKETS")]
+                or MetricsConfig().latency_buckets,
+            ),
+            stats=StatsConfig(enabled=self._get_bool("STATS_ENABLED", False)),
+            tracing=TracingConfig(
+                enabled=self._get_bool("TRACING_ENABLED", False),
+                exporter=env.get("TRACING_EXPORTER", "none").lower(),
+                path=env.get("TRACING_PATH", "llmbox_traces.jsonl"),
+                sample_rate=float(env.get("TRACING_SAMPLE_RATE", "1.0")),
+                server_timing=self._get_bool("TRACING_SERVER_TIMING", True),
+            ),
+        )
+
+    def _load_http_config(self, prefix: str, defaults: HttpConfig) -> HttpConfig:
+        env = self._source
+        return HttpConfig(
+            max_connections=int(env.get(f"{prefix}MAX_CONNECTIONS", str(defaults.max_connections))),
+            max_keepalive_connections=int(env.get(f"{prefix}MAX_KEEPALIVE_CONNECTIONS", str(defaults.max_keepalive_connections))),
+            keepalive_expiry=float(env.get(f"{prefix}KEEPALIVE_EXPIRY", str(defaults.keepalive_expiry))),
+            http2=self._get_bool(f"{prefix}HTTP2", defaults.http2),
+            timeout=float(env.get(f"{prefix}TIMEOUT", str(defaults.timeout))),
+            connect_timeout=float(env.get(f"{prefix}CONNECT_TIMEOUT", str(defaults.connect_timeout))),
+            dns_cache_ttl=float(env.get(f"{prefix}DNS_CACHE_TTL", str(defaults.dns_cache_ttl))),
         )
+
+    def _get_list(self, key: str) -> list[str]:
+        value = self._source.get(key) or ""
+        return [item.strip() for item in value.split(",") if item.strip()]
+
+    def _get_assistant_pairs(self, key: str) -> dict[str, str]:
+        """``assistant=assistant`` items of a comma-separated list; both sides must name a known assistant."""
+        known = {assistant.value for assistant in AIAssistant} - {AIAssistant.AUTO.value}
+        pairs = {}
+        for item in self._get_list(key):
+            name, separator, other = item.partition("=")
+            name, other = name.strip(), other.strip()
+            if not separator or name not in known or other not in known:
+                raise ConfigurationException(f"{key}: invalid item {item!r}, expected <assistant>=<assistant> with known assistant names")
+            pairs[name] = other
+        return pairs
+
+    def _get_pairs(self, key: str) -> dict[str, str]:
+        """``name=value`` items of a comma-separated list; the value follows the last ``=``."""
+        pairs = {}
+        for item in self._get_list(key):
+            name, separator, value = item.rpartition("=")
+            name, value = name.strip(), value.strip()
+            if not separator or not name or not value:
+                raise ConfigurationException(f"{key}: invalid item {item!r}, expected <name>=<value>")
+            pairs[name] = value
+        return pairs
+
+    def _get_number_pairs(self, key: str, number: type[int] | type[float]) -> dict[str, int | float]:
+        pairs = {}
+        for name, value in self._get_pairs(key).items():
+            try:
+                pairs[name] = number(value)
+            except ValueError:
+                raise ConfigurationException(f"{key}: invalid value {value!r} for {name!r}, expected {number.__name__}") from None
+        return pairs
+
+    def _get_bool(self, key: str, default: bool) -> bool:
+        value = self._source.get(key)
+        if value is None:
+            return default
+        return value.strip().lower() in ("1", "true", "yes", "on")
@@ -0,0 +1 @@
+"""Shared HTTP transport used by upstream clients."""
@@ -0,0 +1,43 @@
+import time
+
+import httpx
+
+from app.application.services.tracing import record_span, tracing_active
+
+# httpcore trace events (without the http11/http2 prefix) and the span each pair of them becomes.
+_TRACED_STEPS = {
+    "connect_tcp": "upstream.connect",
+    "start_tls": "upstream.tls",
+    "send_request_headers": "upstream.send",
+    "send_request_body": "upstream.send",
+    "receive_response_headers": "upstream.ttfb",
+}
+
+
+def _make_trace_callback(host: str):
+    started: dict[str, float] = {}
+
+    async def on_event(event: str, info: dict) -> None:
+        parts = event.rsplit(".", 2)
+        if len(parts) != 3:
+            return
+        _, step, phase = parts
+        name = _TRACED_STEPS.get(step)
+        if name is None:
+            return
+        if phase == "started":
+            started[step] = time.perf_counter()
+        elif step in started:
+            record_span(name, started.pop(step), host=host)
+
+    return on_event
+
+
+async def add_trace_extension(request: httpx.Request) -> None:
+    """httpx request hook that records connect, TLS and time-to-first-byte spans for traced requests.
+
+    ``upstream.ttfb`` runs from the request being sent to the response headers
+    arriving, i.e. the provider's own processing time plus one round trip.
+    """
+    if tracing_active():
+        request.extensions["trace"] = _make_trace_callback(request.url.host)
@@ -0,0 +1,176 @@
+import asyncio
+import ipaddress
+import logging
+import socket
+import time
+import typing
+
+import httpcore
+import httpx
+
+from app.infrastructure.http.tracing_hooks import add_trace_extension
+from core.config import HttpConfig
+
+logger = logging.getLogger(__name__)
+
+
+class CachingDNSBackend(httpcore.AsyncNetworkBackend):
+    """Network backend that caches resolved addresses for ``ttl`` seconds.
+
+    TLS still uses the original hostname for SNI and certificate checks, because
+    httpcore passes ``server_hostname`` to ``start_tls`` separately.
+    """
+
+    def __init__(self, ttl: float, backend: httpcore.AsyncNetworkBackend | None = None):
+        self._ttl = ttl
+        self._backend = backend or httpcore.AnyIOBackend()
+        self._cache: dict[tuple[str, int], tuple[float, list[str]]] = {}
+
+    async def _resolve(self, host: str, port: int) -> list[str]:
+        try:
+            ipaddress.ip_address(host)
+            return [host]
+        except ValueError:
+            pass
+
+        now = time.monotonic()
+        cached = self._cache.get((host, port))
+        if cached is not None and cached[0] > now:
+            return cached[1]
+
+        loop = asyncio.get_running_loop()
+        infos = await loop.getaddrinfo(host, port, type=socket.SOCK_STREAM)
+        addresses = list(dict.fromkeys(info[4][0] for info in infos))
+        self._cache[(host, port)] = (now + self._ttl, addresses)
+        logger.debug("Resolved %s to %s", host, addresses)
+        return addresses
+
+    async def connect_tcp(
+        self,
+        host: str,
+        port: int,
+        timeout: float | None = None,
+        local_address: str | None = None,
+        socket_options: typing.Iterable[httpcore.SOCKET_OPTION] | None = None,
+    ) -> httpcore.AsyncNetworkStream:
+        addresses = await self._resolve(host, port)
+        last_error: Exception | None = None
+        for address in addresses:
+            try:
+                return await self._backend.connect_tcp(
+                    address,
+                    port,
+                    timeout=timeout,
+                    local_address=local_address,
+                    socket_options=socket_options,
+                )
+            except (httpcore.ConnectError, httpcore.ConnectTimeout) as exc:
+                last_error = exc
+        self._cache.pop((host, port), None)
+        raise last_error or httpcore.ConnectError(f"No addresses resolved for {host}")
+
+    async def connect_unix_socket(
+        self,
+        path: str,
+        timeout: float | None = None,
+        socket_options: typing.Iterable[httpcore.SOCKET_OPTION] | None = None,
+    ) -> httpcore.AsyncNetworkStream:
+        return await self._backend.connect_unix_socket(path, timeout=timeout, socket_options=socket_options)
+
+    async def sleep(self, seconds: float) -> None:
+        await self._backend.sleep(seconds)
+
+
+class PooledHTTPTransport(httpx.AsyncHTTPTransport):
+    """``httpx.AsyncHTTPTransport`` whose connection pool resolves hosts through a DNS cache."""
+
+    def __init__(self, limits: httpx.Limits, http2: bool, dns_cache_ttl: float):
+        super().__init__(limits=limits, http2=http2)
+        if dns_cache_ttl > 0:
+            # The default pool has not opened a connection yet, so replacing it leaks nothing.
+            self._pool = httpcore.AsyncConnectionPool(
+                ssl_context=httpx.create_ssl_context(),
+                max_connections=limits.max_connections,
+                max_keepalive_connections=limits.max_keepalive_connections,
+                keepalive_expiry=limits.keepalive_expiry,
+                http1=True,
+                http2=http2,
+                network_backend=CachingDNSBackend(ttl=dns_cache_ttl),
+            )
+
+    def pool_stats(self) -> dict[str, int]:
+        connections = self._pool.connections
+        idle = sum(1 for connection in connections if connection.is_idle())
+        return {
+            "connections": len(connections),
+            "active": len(connections) - idle,
+            "idle": idle,
+        }
+
+
+class HttpTransport:
+    """Application-lifetime HTTP client with keep-alive connection pooling.
+
+    The underlying ``httpx.AsyncClient`` is created by :meth:`open` (or on first
+    use) and must be released with :meth:`aclose` when the application shuts down.
+    """
+
+    def __init__(self, config: HttpConfig):
+        self._config = config
+        self._client: httpx.AsyncClient | None = None
+        self._transport: PooledHTTPTransport | None = None
+
+    @property
+    def config(self) -> HttpConfig:
+        return self._config
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        if self._client is None:
+            self.open()
+        return self._client
+
+    def open(self) -> None:
+        if self._client is None:
+            self._client = self._create_client()
+
+    def _create_client(self) -> httpx.AsyncClient:
+        config = self._config
+        limits = httpx.Limits(
+            max_connections=config.max_connections,
+            max_keepalive_connections=config.max_keepalive_connections,
+            keepalive_expiry=config.keepalive_expiry,
+        )
+        timeout = httpx.Timeout(config.timeout, connect=config.connect_timeout)
+        self._transport = PooledHTTPTransport(limits=limits, http2=config.http2, dns_cache_ttl=config.dns_cache_ttl)
+        logger.info(
+            "Opening HTTP transport: max_connections=%s, keepalive=%s, http2=%s",
+            config.max_connections,
+            config.max_keepalive_connections,
+            config.http2,
+        )
+        return httpx.AsyncClient(
+            transport=self._transport,
+            timeout=timeout,
+            event_hooks={"request": [add_trace_extension]},
+        )
+
+    def stats(self) -> dict:
+        stats = {
+            "max_connections": self._config.max_connections,
+            "max_keepalive_connections": self._config.max_keepalive_connections,
+            "http2": self._config.http2,
+            "connections": 0,
+            "active": 0,
+            "idle": 0,
+        }
+        if self._transport is not None and self._client is not None:
+            stats.update(self._transport.pool_stats())
+        return stats
+
+    async def aclose(self) -> None:
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+            self._transport = None
+            logger.info("HTTP transport closed")
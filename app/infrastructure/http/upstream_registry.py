@@ -0,0 +1,78 @@
+import logging
+from dataclasses import dataclass
+
+from openai import AsyncOpenAI
+
+from app.infrastructure.http.transport import HttpTransport
+from core.config import HttpConfig
+
+logger = logging.getLogger(__name__)
+
+OPENAI_BASE_URL = "https://api.openai.com/v1"
+
+
+@dataclass
+class _Upstream:
+    name: str
+    base_url: str
+    transport: HttpTransport
+    openai: AsyncOpenAI | None = None
+
+
+class UpstreamRegistry:
+    """Hands out one pooled HTTP transport per upstream, keyed by (base_url, api_key).
+
+    Clients that talk to the same upstream with the same credentials share a
+    single connection pool (and, for OpenAI-compatible APIs, a single
+    ``AsyncOpenAI``), so connections warmed by one model are reused by the others.
+    Pool settings come from ``upstream_configs[name]`` or fall back to ``default_config``.
+    """
+
+    def __init__(self, default_config: HttpConfig, upstream_configs: dict[str, HttpConfig] | None = None):
+        self._default_config = default_config
+        self._upstream_configs = upstream_configs or {}
+        self._upstreams: dict[tuple[str, str | None], _Upstream] = {}
+
+    def http_transport(self, name: str, base_url: str, api_key: str | None = None) -> HttpTransport:
+        return self._get_or_create(name, base_url, api_key).transport
+
+    def openai_client(self, name: str, api_key: str, base_url: str | None = None) -> AsyncOpenAI:
+        upstream = self._get_or_create(name, base_url or OPENAI_BASE_URL, api_key)
+        if upstream.openai is None:
+            upstream.openai = AsyncOpenAI(
+                api_key=api_key,
+                base_url=upstream.base_url,
+                http_client=upstream.transport.client,
+                timeout=upstream.transport.config.timeout,
+            )
+        return upstream.openai
+
+    def _get_or_create(self, name: str, base_url: str, api_key: str | None) -> _Upstream:
+        key = (base_url.rstrip("/"), api_key)
+        upstream = self._upstreams.get(key)
+        if upstream is None:
+            config = self._upstream_configs.get(name, self._default_config)
+            transport = HttpTransport(config)
+            transport.open()
+            upstream = _Upstream(name=name, base_url=key[0], transport=transport)
+            self._upstreams[key] = upstream
+            logger.info("Registered upstream %s (%s)", name, key[0])
+        return upstream
+
+    def stats(self) -> dict:
+        stats = {}
+        for upstream in self._upstreams.values():
+            label = upstream.name
+            suffix = 2
+            while label in stats:
+                label = f"{upstream.name}#{suffix}"
+                suffix += 1
+            stats[label] = {"base_url": upstream.base_url, **upstream.transport.stats()}
+        return stats
+
+    async def aclose(self) -> None:
+        for upstream in self._upstreams.values():
+            if upstream.openai is not None:
+                await upstream.openai.close()
+            await upstream.transport.aclose()
+        self._upstreams.clear()
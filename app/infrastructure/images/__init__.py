@@ -0,0 +1 @@
+"""Vision image preprocessing."""
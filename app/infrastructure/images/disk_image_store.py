@@ -0,0 +1,169 @@
+import asyncio
+import base64
+import hashlib
+import logging
+import os
+import re
+import tempfile
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import BinaryIO
+
+from app.application.interfaces.image_store import ImageStore, StoredImage
+from app.domain.exceptions import InvalidImageException
+
+logger = logging.getLogger(__name__)
+
+_CHUNK_SIZE = 1 << 20
+# A multiple of 3, so base64 of consecutive slices concatenates into base64 of the whole.
+_ENCODE_CHUNK = 3 << 18
+_IMAGE_ID = re.compile(r"[0-9a-f]{64}")
+_SIGNATURES = (
+    (b"\xff\xd8\xff", "image/jpeg", "jpg"),
+    (b"\x89PNG\r\n\x1a\n", "image/png", "png"),
+    (b"GIF87a", "image/gif", "gif"),
+    (b"GIF89a", "image/gif", "gif"),
+)
+_EXTENSIONS = {"jpg": "image/jpeg", "png": "image/png", "gif": "image/gif", "webp": "image/webp"}
+
+
+def _sniff(header: bytes) -> tuple[str, str]:
+    for signature, mime_type, extension in _SIGNATURES:
+        if header.startswith(signature):
+            return mime_type, extension
+    if header[:4] == b"RIFF" and header[8:12] == b"WEBP":
+        return "image/webp", "webp"
+    raise InvalidImageException("Unsupported image format (expected JPEG, PNG, GIF or WebP)")
+
+
+class DiskImageStore(ImageStore):
+    """Stores uploaded images on local disk under the SHA-256 of their bytes.
+
+    Uploads are streamed to a temporary file while being hashed, so a large
+    image is never held in memory whole; the same image uploaded twice is kept
+    once. When the total size exceeds ``max_bytes`` the least recently used
+    images are deleted. Reads base64-encode the file slice by slice into one
+    buffer. File I/O runs on a dedicated thread pool.
+    """
+
+    def __init__(self, path: str, max_bytes: int, max_image_bytes: int):
+        if max_bytes <= 0 or max_image_bytes <= 0:
+            raise ValueError("max_bytes and max_image_bytes must be positive")
+        self._path = path
+        self._max_bytes = max_bytes
+        self._max_image_bytes = max_image_bytes
+        self._executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="image-store")
+        self._lock = threading.Lock()
+        self._index: OrderedDict[str, tuple[str, int]] | None = None
+        self._bytes = 0
+        self.uploads = 0
+        self.duplicates = 0
+        self.evictions = 0
+
+    async def _run(self, func, *args):
+        return await asyncio.get_running_loop().run_in_executor(self._executor, func, *args)
+
+    def _load_index(self) -> OrderedDict[str, tuple[str, int]]:
+        """Rebuild the LRU order from file access times; called with the lock held."""
+        if self._index is None:
+            os.makedirs(self._path, exist_ok=True)
+            entries = []
+            for name in os.listdir(self._path):
+                image_id, _, extension = name.partition(".")
+                if not _IMAGE_ID.fullmatch(image_id) or extension not in _EXTENSIONS:
+                    continue
+                stat = os.stat(os.path.join(self._path, name))
+                entries.append((stat.st_atime, image_id, name, stat.st_size))
+            self._index = OrderedDict((image_id, (name, size)) for _, image_id, name, size in sorted(entries))
+            self._bytes = sum(size for _, size in self._index.values())
+            logger.info("Image store opened at %s: %s images, %s bytes", self._path, len(self._index), self._bytes)
+        return self._index
+
+    async def put(self, file: BinaryIO) -> StoredImage:
+        return await self._run(self._put, file)
+
+    def _put(self, file: BinaryIO) -> StoredImage:
+        with self._lock:
+            self._load_index()
+        digest = hashlib.sha256()
+        size = 0
+        header = b""
+        fd, tmp_path = tempfile.mkstemp(dir=self._path, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as output:
+                while chunk := file.read(_CHUNK_SIZE):
+                    size += len(chunk)
+                    if size > self._max_image_bytes:
+                        raise InvalidImageException(f"Image exceeds the limit of {self._max_image_bytes} bytes")
+                    if len(header) < 16:
+                        header += chunk[:16]
+                    digest.update(chunk)
+                    output.write(chunk)
+            mime_type, extension = _sniff(header)
+            image_id = digest.hexdigest()
+            name = f"{image_id}.{extension}"
+            with self._lock:
+                self.uploads += 1
+                if image_id in self._index:
+                    self.duplicates += 1
+                    self._index.move_to_end(image_id)
+                    os.unlink(tmp_path)
+                else:
+                    os.replace(tmp_path, os.path.join(self._path, name))
+                    self._index[image_id] = (name, size)
+                    self._bytes += size
+                    self._evict()
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+            raise
+        return StoredImage(image_id=image_id, size=size, mime_type=mime_type)
+
+    def _evict(self) -> None:
+        while self._bytes > self._max_bytes and len(self._index) > 1:
+            image_id, (name, size) = self._index.popitem(last=False)
+            try:
+                os.unlink(os.path.join(self._path, name))
+            except FileNotFoundError:
+                pass
+            self._bytes -= size
+            self.evictions += 1
+
+    async def get_data_url(self, image_id: str) -> str | None:
+        if not _IMAGE_ID.fullmatch(image_id):
+            return None
+        return await self._run(self._get_data_url, image_id)
+
+    def _get_data_url(self, image_id: str) -> str | None:
+        with self._lock:
+            entry = self._load_index().get(image_id)
+            if entry is None:
+                return None
+            self._index.move_to_end(image_id)
+        name, _ = entry
+        path = os.path.join(self._path, name)
+        try:
+            data_url = bytearray(f"data:{_EXTENSIONS[name.partition('.')[2]]};base64,".encode())
+            with open(path, "rb") as file:
+                # The raw bytes are never held whole; the buffer and the final str are the only full-size copies.
+                while chunk := file.read(_ENCODE_CHUNK):
+                    data_url += base64.b64encode(chunk)
+            os.utime(path)
+        except FileNotFoundError:
+            return None
+        return data_url.decode("ascii")
+
+    def stats(self) -> dict:
+        return {
+            "path": self._path,
+            "images": len(self._index) if self._index is not None else 0,
+            "bytes": self._bytes,
+            "max_bytes": self._max_bytes,
+            "uploads": self.uploads,
+            "duplicates": self.duplicates,
+            "evictions": self.evictions,
+        }
+
+    async def aclose(self) -> None:
+        self._executor.shutdown(wait=True)
@@ -0,0 +1,182 @@
+import asyncio
+import base64
+import binascii
+import hashlib
+import io
+import logging
+import math
+import multiprocessing
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+
+from app.application.interfaces.image_preprocessor import ImagePreprocessor, PreprocessedImage
+from app.application.services.single_flight import SingleFlight
+from app.domain.exceptions import InvalidImageException
+from core.config import ImagePreprocessingConfig
+
+logger = logging.getLogger(__name__)
+
+_EXIF_ORIENTATION = 0x0112
+# ``Image.info`` entries that carry camera, location or colour-profile data rather than pixels.
+_METADATA_KEYS = ("exif", "icc_profile", "xmp", "XML:com.adobe.xmp", "comment", "photoshop")
+_MIME_TYPES = {"jpeg": "image/jpeg", "webp": "image/webp", "png": "image/png"}
+
+
+def estimate_image_tokens(width: int, height: int) -> int:
+    """Vision tokens OpenAI bills for an image at ``detail=high``.
+
+    The provider fits the image into 2048x2048, scales its short side down to
+    768 and charges 170 tokens per 512px tile plus a fixed 85.
+    """
+    scale = min(1.0, 2048 / max(width, height))
+    width, height = width * scale, height * scale
+    scale = min(1.0, 768 / min(width, height))
+    width, height = width * scale, height * scale
+    return 85 + 170 * math.ceil(width / 512) * math.ceil(height / 512)
+
+
+def _split_data_url(image_base64: str) -> tuple[str, str]:
+    header, separator, payload = image_base64.partition(",")
+    if not separator or not header.startswith("data:") or not header.endswith(";base64"):
+        raise InvalidImageException("Image must be a base64 data URL")
+    return header, payload
+
+
+def _target_size(width: int, height: int, max_side: int, max_short_side: int) -> tuple[int, int]:
+    scale = min(1.0, max_side / max(width, height), max_short_side / min(width, height))
+    return max(1, round(width * scale)), max(1, round(height * scale))
+
+
+def _preprocess(image_base64: str, max_side: int, max_short_side: int, image_format: str, quality: int):
+    """Runs in a worker process: decode, cap the resolution, re-encode without metadata."""
+    from PIL import Image, ImageOps
+
+    _, payload = _split_data_url(image_base64)
+    try:
+        data = base64.b64decode(payload, validate=True)
+        image = Image.open(io.BytesIO(data))
+        original_size = image.size
+        # JPEG can decode straight to a reduced scale, which skips most of the work for big photos.
+        image.draft("RGB", _target_size(*original_size, max_side, max_short_side))
+        exif = image.getexif()
+        has_metadata = bool(exif) or any(key in image.info for key in _METADATA_KEYS) or bool(getattr(image, "text", None))
+        if exif.get(_EXIF_ORIENTATION) in (5, 6, 7, 8):
+            original_size = original_size[::-1]
+        image = ImageOps.exif_transpose(image)
+    except (binascii.Error, OSError, Image.DecompressionBombError) as exc:
+        raise InvalidImageException(f"Cannot decode image: {exc}") from None
+
+    target = _target_size(*original_size, max_side, max_short_side)
+    if image.size != target:
+        image = image.resize(target, Image.Resampling.LANCZOS)
+    if image_format == "jpeg" and image.mode not in ("RGB", "L"):
+        image = image.convert("RGBA")
+        background = Image.new("RGB", image.size, (255, 255, 255))
+        background.paste(image, mask=image.getchannel("A"))
+        image = background
+
+    for key in _METADATA_KEYS:
+        # Some encoders (PNG) write these back from ``info`` unless they are removed.
+        image.info.pop(key, None)
+    output = io.BytesIO()
+    image.save(output, format=image_format.upper(), quality=quality, optimize=True)
+    encoded = output.getvalue()
+    if len(encoded) >= len(data) and image.size == original_size and not has_metadata:
+        # Already small enough; re-encoding would only make it bigger. With metadata the stripped copy
+        # is sent even if it is slightly larger.
+        return image_base64, len(data), len(data), original_size, original_size
+    processed = f"data:{_MIME_TYPES[image_format]};base64,{base64.b64encode(encoded).decode()}"
+    return processed, len(data), len(encoded), original_size, image.size
+
+
+class PillowImagePreprocessor(ImagePreprocessor):
+    """Downscales and recompresses vision images in a pool of worker processes.
+
+    Images are capped to ``max_side`` on the long side and ``max_short_side``
+    on the short one, re-encoded to ``format`` and stripped of metadata. Decoding
+    and encoding are CPU-bound, so they run outside the event loop's process.
+    Results are kept in a small LRU keyed by the image hash, and identical
+    images in flight at the same time are processed once, so a conversation
+    that re-sends the same picture every turn pays for it only once.
+    """
+
+    def __init__(self, config: ImagePreprocessingConfig):
+        try:
+            import PIL  # noqa: F401
+        except ImportError:
+            raise ValueError("Pillow is required for image preprocessing (pip install Pillow)") from None
+        self._config = config
+        self._executor: ProcessPoolExecutor | None = None
+        self._single_flight = SingleFlight()
+        self._results: OrderedDict[str, PreprocessedImage] = OrderedDict()
+        self.images = 0
+        self.dedup_hits = 0
+        self.bytes_in = 0
+        self.bytes_out = 0
+        self.tokens_in = 0
+        self.tokens_out = 0
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            # Forking a process that already runs threads (HTTP pools, SQLite) can deadlock the child.
+            self._executor = ProcessPoolExecutor(
+                max_workers=self._config.workers,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        return self._executor
+
+    async def preprocess(self, image_base64: str) -> PreprocessedImage:
+        if not image_base64.startswith("data:"):
+            # Remote URLs are fetched by the provider; there is nothing to shrink here.
+            return PreprocessedImage(image_base64, original_bytes=0, bytes=0, original_tokens=0, tokens=0)
+        key = hashlib.sha256(image_base64.encode()).hexdigest()
+        result = self._results.get(key)
+        if result is not None:
+            self._results.move_to_end(key)
+            self.dedup_hits += 1
+        else:
+            result = await self._single_flight.do(key, lambda: self._run(key, image_base64))
+        self.images += 1
+        self.bytes_in += result.original_bytes
+        self.bytes_out += result.bytes
+        self.tokens_in += result.original_tokens
+        self.tokens_out += result.tokens
+        return result
+
+    async def _run(self, key: str, image_base64: str) -> PreprocessedImage:
+        config = self._config
+        processed, original_bytes, size, original_dims, dims = await asyncio.get_running_loop().run_in_executor(
+            self._get_executor(),
+            _preprocess,
+            image_base64,
+            config.max_side,
+            config.max_short_side,
+            config.format,
+            config.quality,
+        )
+        result = PreprocessedImage(
+            image_base64=processed,
+            original_bytes=original_bytes,
+            bytes=size,
+            original_tokens=estimate_image_tokens(*original_dims),
+            tokens=estimate_image_tokens(*dims),
+        )
+        self._results[key] = result
+        while len(self._results) > config.cache_entries:
+            self._results.popitem(last=False)
+        return result
+
+    def stats(self) -> dict:
+        return {
+            "images": self.images,
+            "dedup_hits": self.dedup_hits,
+            "bytes_in": self.bytes_in,
+            "bytes_out": self.bytes_out,
+            "bytes_saved": self.bytes_in - self.bytes_out,
+            "tokens_saved": self.tokens_in - self.tokens_out,
+        }
+
+    async def aclose(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+            self._executor = None
@@ -0,0 +1 @@
+"""Formatting, filtering and queueing of log records for the background log listener."""
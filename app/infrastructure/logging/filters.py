@@ -0,0 +1,27 @@
+import logging
+import zlib
+
+from app.application.services.request_context import current_request_id
+
+
+class RequestContextFilter(logging.Filter):
+    """Stamps records with the current request ID and samples per-request info logs.
+
+    Records logged outside a request get ``request_id = "-"`` and are always
+    kept, as are warnings and errors. Below ``WARNING``, a request's records
+    are kept for ``info_sample_rate`` of requests; the choice is made from a
+    hash of the request ID, so a request's log is either complete or absent.
+    Must run in the thread and task that logged the record.
+    """
+
+    def __init__(self, info_sample_rate: float = 1.0):
+        super().__init__()
+        self._threshold = int(info_sample_rate * 2**32)
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        request_id = current_request_id()
+        if request_id is None:
+            record.request_id = "-"
+            return True
+        record.request_id = request_id
+        return record.levelno >= logging.WARNING or zlib.crc32(request_id.encode()) < self._threshold
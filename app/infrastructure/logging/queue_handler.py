@@ -0,0 +1,34 @@
+import copy
+import logging
+from logging.handlers import QueueHandler
+
+
+class TruncatingQueueHandler(QueueHandler):
+    """Hands records to a ``QueueListener`` with their message rendered and capped.
+
+    The message is formatted here, in the logging thread, and cut to
+    ``max_message_chars`` (``0`` keeps it whole), so large payloads are neither
+    held in the queue nor written out in full. Tracebacks are rendered into
+    ``exc_text`` and never truncated; unlike ``QueueHandler`` they are kept
+    apart from the message, so the listener's formatter decides their layout.
+    """
+
+    def __init__(self, queue, max_message_chars: int = 0):
+        super().__init__(queue)
+        self._max_message_chars = max_message_chars
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        message = record.getMessage()
+        limit = self._max_message_chars
+        if limit and len(message) > limit:
+            message = f"{message[:limit]}... [truncated {len(message) - limit} chars]"
+        exc_text = record.exc_text
+        if record.exc_info and not exc_text:
+            exc_text = logging.Formatter().formatException(record.exc_info)
+
+        record = copy.copy(record)
+        record.msg = record.message = message
+        record.args = None
+        record.exc_info = None
+        record.exc_text = exc_text
+        return record
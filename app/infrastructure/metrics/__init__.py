@@ -0,0 +1 @@
+"""Metrics in the Prometheus text exposition format."""
@@ -0,0 +1,238 @@
+import math
+import time
+from bisect import bisect_left
+from collections.abc import Sequence
+
+from app.application.interfaces.metrics import UpstreamMetrics
+from app.domain.models import AIAssistant, Usage
+
+DEFAULT_LATENCY_BUCKETS = (0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0)
+
+
+def _format_value(value: float) -> str:
+    if isinstance(value, int):
+        return str(value)
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    return repr(value)
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+class _Value:
+    __slots__ = ("value",)
+
+    def __init__(self):
+        self.value = 0
+
+    def inc(self, amount: float = 1) -> None:
+        self.value += amount
+
+    def dec(self, amount: float = 1) -> None:
+        self.value -= amount
+
+
+class _HistogramValue:
+    __slots__ = ("bounds", "counts", "sum", "count")
+
+    def __init__(self, bounds: tuple[float, ...]):
+        self.bounds = bounds
+        self.counts = [0] * (len(bounds) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        # Buckets are stored individually and only made cumulative when rendered.
+        self.counts[bisect_left(self.bounds, value)] += 1
+        self.sum += value
+        self.count += 1
+
+
+class _Family:
+    """A named metric with one child per combination of label values."""
+
+    kind = "untyped"
+
+    def __init__(self, name: str, documentation: str, label_names: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.label_names = tuple(label_names)
+        self._children: dict[tuple[str, ...], object] = {}
+
+    def labels(self, *values: str):
+        child = self._children.get(values)
+        if child is None:
+            if len(values) != len(self.label_names):
+                raise ValueError(f"{self.name} expects labels {self.label_names}, got {values}")
+            child = self._children[values] = self._new_child()
+        return child
+
+    def _new_child(self):
+        return _Value()
+
+    def _label_text(self, values: tuple[str, ...], extra: str = "") -> str:
+        pairs = [f'{name}="{_escape(value)}"' for name, value in zip(self.label_names, values)]
+        if extra:
+            pairs.append(extra)
+        return "{" + ",".join(pairs) + "}" if pairs else ""
+
+    def render(self, lines: list[str]) -> None:
+        lines.append(f"# HELP {self.name} {self.documentation}")
+        lines.append(f"# TYPE {self.name} {self.kind}")
+        for values, child in self._children.items():
+            self._render_child(lines, values, child)
+
+    def _render_child(self, lines: list[str], values: tuple[str, ...], child) -> None:
+        lines.append(f"{self.name}{self._label_text(values)} {_format_value(child.value)}")
+
+
+class Counter(_Family):
+    kind = "counter"
+
+
+class Gauge(_Family):
+    kind = "gauge"
+
+
+class Histogram(_Family):
+    kind = "histogram"
+
+    def __init__(self, name: str, documentation: str, label_names: Sequence[str] = (), buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS):
+        super().__init__(name, documentation, label_names)
+        self.buckets = tuple(sorted(buckets))
+
+    def _new_child(self):
+        return _HistogramValue(self.buckets)
+
+    def _render_child(self, lines: list[str], values: tuple[str, ...], child: _HistogramValue) -> None:
+        cumulative = 0
+        for bound, count in zip((*self.buckets, math.inf), child.counts):
+            cumulative += count
+            labels = self._label_text(values, f'le="{_format_value(bound)}"')
+            lines.append(f"{self.name}_bucket{labels} {cumulative}")
+        labels = self._label_text(values)
+        lines.append(f"{self.name}_sum{labels} {_format_value(child.sum)}")
+        lines.append(f"{self.name}_count{labels} {child.count}")
+
+
+class _AssistantSeries:
+    """Children of the upstream families for one assistant, resolved once instead of on every call."""
+
+    __slots__ = ("ok", "failed", "cancelled", "duration", "first_token", "in_flight", "prompt_tokens", "completion_tokens")
+
+    def __init__(self, metrics: "PrometheusMetrics", assistant: str):
+        self.ok = metrics.upstream_requests.labels(assistant, "ok")
+        self.failed = metrics.upstream_requests.labels(assistant, "error")
+        self.cancelled = metrics.upstream_requests.labels(assistant, "cancelled")
+        self.duration = metrics.upstream_duration.labels(assistant)
+        self.first_token = metrics.upstream_first_token.labels(assistant)
+        self.in_flight = metrics.upstream_in_flight.labels(assistant)
+        self.prompt_tokens = metrics.prompt_tokens.labels(assistant)
+        self.completion_tokens = metrics.completion_tokens.labels(assistant)
+
+
+class PrometheusMetrics(UpstreamMetrics):
+    """Request and upstream metrics of this process, rendered for ``GET /metrics``.
+
+    Metrics are updated only from the event loop thread, so plain integer and
+    float fields suffice: no locks, and a recorded observation touches only
+    preallocated slots. Token throughput is exported as counters; rates are
+    left to the scraper (``rate(llmbox_completion_tokens_total[1m])``).
+    """
+
+    def __init__(self, latency_buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS):
+        self.http_requests = Counter(
+            "llmbox_http_requests_total", "HTTP requests by route template and status.", ("method", "route", "status")
+        )
+        self.http_duration = Histogram(
+            "llmbox_http_request_duration_seconds",
+            "Time to handle an HTTP request, streamed bodies included.",
+            ("route",),
+            latency_buckets,
+        )
+        self.http_in_flight = Gauge("llmbox_http_requests_in_flight", "HTTP requests being handled.")
+        self.upstream_requests = Counter(
+            "llmbox_upstream_requests_total", "Calls to model providers by outcome.", ("assistant", "outcome")
+        )
+        self.upstream_errors = Counter(
+            "llmbox_upstream_errors_total", "Failed calls to model providers by exception class.", ("assistant", "error")
+        )
+        self.upstream_duration = Histogram(
+            "llmbox_upstream_request_duration_seconds",
+            "Duration of calls to model providers, until the last chunk for streams.",
+            ("assistant",),
+            latency_buckets,
+        )
+        self.upstream_first_token = Histogram(
+            "llmbox_upstream_time_to_first_token_seconds",
+            "Time until a streaming call yields its first chunk.",
+            ("assistant",),
+            latency_buckets,
+        )
+        self.upstream_in_flight = Gauge("llmbox_upstream_requests_in_flight", "Calls to model providers in progress.", ("assistant",))
+        self.prompt_tokens = Counter("llmbox_prompt_tokens_total", "Prompt tokens reported by providers.", ("assistant",))
+        self.completion_tokens = Counter(
+            "llmbox_completion_tokens_total", "Completion tokens reported by providers.", ("assistant",)
+        )
+        self._families = [
+            self.http_requests,
+            self.http_duration,
+            self.http_in_flight,
+            self.upstream_requests,
+            self.upstream_errors,
+            self.upstream_duration,
+            self.upstream_first_token,
+            self.upstream_in_flight,
+            self.prompt_tokens,
+            self.completion_tokens,
+        ]
+        self._http_in_flight = self.http_in_flight.labels()
+        # Calls are always made to a concrete backend, never to auto itself.
+        self._assistants = {
+            assistant: _AssistantSeries(self, assistant.value) for assistant in AIAssistant if assistant != AIAssistant.AUTO
+        }
+
+    def request_started(self) -> float:
+        self._http_in_flight.inc()
+        return time.perf_counter()
+
+    def request_finished(self, method: str, route: str, status: int, started: float) -> None:
+        self._http_in_flight.dec()
+        self.http_requests.labels(method, route, str(status)).inc()
+        self.http_duration.labels(route).observe(time.perf_counter() - started)
+
+    def call_started(self, assistant: AIAssistant) -> float:
+        self._assistants[assistant].in_flight.inc()
+        return time.perf_counter()
+
+    def call_finished(self, assistant: AIAssistant, started: float, error: Exception | None = None) -> None:
+        series = self._assistants[assistant]
+        series.in_flight.dec()
+        series.duration.observe(time.perf_counter() - started)
+        if error is None:
+            series.ok.inc()
+        else:
+            series.failed.inc()
+            self.upstream_errors.labels(assistant.value, type(error).__name__).inc()
+
+    def call_cancelled(self, assistant: AIAssistant, started: float) -> None:
+        # Counted apart from errors, and kept out of the latency histogram: the call did not run to its end.
+        series = self._assistants[assistant]
+        series.in_flight.dec()
+        series.cancelled.inc()
+
+    def first_token(self, assistant: AIAssistant, started: float) -> None:
+        self._assistants[assistant].first_token.observe(time.perf_counter() - started)
+
+    def tokens(self, assistant: AIAssistant, usage: Usage) -> None:
+        series = self._assistants[assistant]
+        series.prompt_tokens.inc(usage.prompt_tokens)
+        series.completion_tokens.inc(usage.completion_tokens)
+
+    def render(self) -> str:
+        lines: list[str] = []
+        for family in self._families:
+            family.render(lines)
+        return "\n".join(lines) + "\n"
@@ -0,0 +1 @@
+"""Resilience primitives wrapped around upstream calls."""
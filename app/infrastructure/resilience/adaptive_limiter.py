@@ -0,0 +1,287 @@
+import asyncio
+import heapq
+import itertools
+import logging
+import math
+import time
+from collections import deque
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+
+import httpx
+import openai
+
+from app.application.services.request_context import current_identity
+from app.application.services.tracing import span
+from app.domain.exceptions import ProviderOverloadedException
+from app.domain.models import Priority
+from core.config import ConcurrencyConfig
+
+logger = logging.getLogger(__name__)
+
+_OVERLOAD_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+
+
+def is_overload_error(exc: BaseException) -> bool:
+    """Whether an upstream failure means the provider is overloaded (429/5xx or a timeout)."""
+    if getattr(exc, "status_code", None) in _OVERLOAD_STATUS_CODES:
+        return True
+    return isinstance(exc, (httpx.TimeoutException, openai.APITimeoutError))
+
+
+class FairQueue:
+    """Waiters of one priority class, ordered by start-time weighted fair queueing across tenants.
+
+    Each waiter gets a virtual start tag: the later of the queue's virtual time
+    and its tenant's previous finish tag. A tenant with weight ``w`` advances
+    its finish tag by ``1 / w`` per call, so under contention tenants are
+    served in proportion to their weights however many calls each has queued,
+    and a tenant that was idle cannot bank credit for later.
+    """
+
+    def __init__(self):
+        self._heap: list[tuple[float, int, asyncio.Future]] = []
+        self._finish: dict[str, float] = {}
+        self._virtual_time = 0.0
+        self._sequence = itertools.count()
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def push(self, tenant: str, weight: float, waiter: asyncio.Future) -> None:
+        start = max(self._virtual_time, self._finish.get(tenant, 0.0))
+        self._finish[tenant] = start + 1 / weight
+        heapq.heappush(self._heap, (start, next(self._sequence), waiter))
+        self._size += 1
+
+    def pop(self) -> asyncio.Future | None:
+        """Next live waiter; ones abandoned in the meantime are dropped on the way."""
+        while self._heap:
+            start, _, waiter = heapq.heappop(self._heap)
+            if waiter.done():
+                continue
+            self._virtual_time = start
+            self._on_removed()
+            return waiter
+        return None
+
+    def discard(self) -> None:
+        """An enqueued waiter was abandoned; it stays in the heap until ``pop`` skips it."""
+        self._on_removed()
+
+    def _on_removed(self) -> None:
+        self._size -= 1
+        if self._size == 0:
+            # Nobody is waiting, so no tenant is owed anything: start the next busy period afresh.
+            self._heap.clear()
+            self._finish.clear()
+            self._virtual_time = 0.0
+
+
+class QueueTimeStats:
+    """Queue time of the calls of one priority class, including those admitted without waiting."""
+
+    def __init__(self, window: int = 512):
+        self._recent: deque[float] = deque(maxlen=window)
+        self.calls = 0
+        self.waited = 0
+        self.timeouts = 0
+        self.rejected = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def record(self, seconds: float) -> None:
+        self._recent.append(seconds)
+        self.calls += 1
+        self.waited += seconds > 0
+        self.total += seconds
+        self.max = max(self.max, seconds)
+
+    def percentile(self, fraction: float) -> float:
+        if not self._recent:
+            return 0.0
+        ordered = sorted(self._recent)
+        return ordered[min(math.ceil(len(ordered) * fraction) - 1, len(ordered) - 1)]
+
+    def stats(self) -> dict:
+        return {
+            "calls": self.calls,
+            "waited": self.waited,
+            "timeouts": self.timeouts,
+            "rejected": self.rejected,
+            "mean": self.total / self.calls if self.calls else 0.0,
+            "p95": self.percentile(0.95),
+            "max": self.max,
+        }
+
+
+class AdaptiveLimiter:
+    """Bulkhead with an AIMD concurrency limit for a single provider.
+
+    The limit grows by roughly one slot per window of successful calls and is
+    multiplied by ``backoff`` when the provider answers 429/5xx, times out, or
+    when recent latency rises above ``latency_tolerance`` times the long-run
+    baseline. Only calls started after the previous decrease can trigger another
+    one, so a burst of failures from one window shrinks the limit once.
+
+    Calls over the limit wait in a queue per priority class of the current
+    ``RequestIdentity``: a free slot always goes to the most urgent class with
+    waiters, and within a class tenants share slots by ``tenant_weights`` (see
+    ``FairQueue``). Each class holds at most ``max_queue`` waiters, who give up
+    after the class's queue timeout with ``ProviderOverloadedException``.
+    """
+
+    _BASELINE_ALPHA = 0.02
+    _RECENT_ALPHA = 0.2
+
+    def __init__(self, name: str, config: ConcurrencyConfig):
+        if not 1 <= config.min_limit <= config.initial_limit <= config.max_limit:
+            raise ValueError("Concurrency limits must satisfy 1 <= min_limit <= initial_limit <= max_limit")
+        self.name = name
+        self._config = config
+        self._limit = float(config.initial_limit)
+        self._in_flight = 0
+        self._queues = {priority: FairQueue() for priority in Priority}
+        self._queue_times = {priority: QueueTimeStats() for priority in Priority}
+        self._baseline_latency: float | None = None
+        self._recent_latency: float | None = None
+        self._last_decrease = 0.0
+        self.rejected = 0
+        self.overloads = 0
+
+    @property
+    def limit(self) -> int:
+        return int(self._limit)
+
+    @property
+    def in_flight(self) -> int:
+        return self._in_flight
+
+    @property
+    def queue_depth(self) -> int:
+        return sum(len(queue) for queue in self._queues.values())
+
+    @asynccontextmanager
+    async def slot(self, record_latency: bool = True) -> AsyncIterator[None]:
+        """Hold one concurrency slot for the duration of the block and feed its outcome back into the limit."""
+        await self._acquire()
+        started = time.monotonic()
+        try:
+            yield
+        except Exception as exc:
+            self._release()
+            if is_overload_error(exc):
+                self.overloads += 1
+                self._decrease(started, f"overload: {exc.__class__.__name__}")
+            raise
+        except BaseException:
+            self._release()
+            raise
+        else:
+            self._release()
+            self._on_success(started, time.monotonic() - started if record_latency else None)
+
+    async def _acquire(self) -> None:
+        identity = current_identity()
+        priority = identity.priority
+        queue = self._queues[priority]
+        queue_times = self._queue_times[priority]
+        if self._in_flight < self.limit and not self.queue_depth:
+            self._in_flight += 1
+            queue_times.record(0.0)
+            return
+        if len(queue) >= self._config.max_queue:
+            self.rejected += 1
+            queue_times.rejected += 1
+            raise ProviderOverloadedException(f"{self.name}: {priority.value} concurrency queue is full")
+
+        timeout = self._config.queue_timeouts.get(priority.value, self._config.queue_timeout)
+        waiter = asyncio.get_running_loop().create_future()
+        queue.push(identity.tenant, self._config.tenant_weights.get(identity.tenant, 1.0), waiter)
+        started = time.monotonic()
+        try:
+            with span("queue", limiter=self.name):
+                await asyncio.wait_for(waiter, timeout)
+        except TimeoutError:
+            self.rejected += 1
+            queue_times.timeouts += 1
+            raise ProviderOverloadedException(f"{self.name}: no concurrency slot within {timeout:g}s") from None
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                # The slot was handed over just as the caller went away; pass it on.
+                self._release()
+            raise
+        else:
+            queue_times.record(time.monotonic() - started)
+        finally:
+            if waiter.cancelled():
+                queue.discard()
+
+    def _release(self) -> None:
+        self._in_flight -= 1
+        self._wake_waiters()
+
+    def _wake_waiters(self) -> None:
+        for queue in self._queues.values():
+            while self._in_flight < self.limit and (waiter := queue.pop()) is not None:
+                self._in_flight += 1
+                waiter.set_result(None)
+
+    def _on_success(self, started: float, latency: float | None) -> None:
+        if latency is not None:
+            if self._baseline_latency is None:
+                self._baseline_latency = self._recent_latency = latency
+            else:
+                self._baseline_latency += self._BASELINE_ALPHA * (latency - self._baseline_latency)
+                self._recent_latency += self._RECENT_ALPHA * (latency - self._recent_latency)
+            if self._recent_latency > self._config.latency_tolerance * self._baseline_latency:
+                self._decrease(started, "latency growth")
+                return
+
+        # Only grow while the limit is actually being used, otherwise it drifts up unbounded when idle.
+        if self._in_flight + 1 >= self._limit / 2:
+            self._limit = min(self._limit + 1 / self._limit, float(self._config.max_limit))
+            self._wake_waiters()
+
+    def _decrease(self, started: float, reason: str) -> None:
+        if started < self._last_decrease:
+            return
+        previous = self.limit
+        self._limit = max(self._limit * self._config.backoff, float(self._config.min_limit))
+        self._last_decrease = time.monotonic()
+        if self.limit != previous:
+            logger.warning("Concurrency limit for %s lowered %s -> %s (%s)", self.name, previous, self.limit, reason)
+
+    def stats(self) -> dict:
+        return {
+            "limit": self.limit,
+            "in_flight": self._in_flight,
+            "queue_depth": self.queue_depth,
+            "rejected": self.rejected,
+            "overloads": self.overloads,
+            "baseline_latency": self._baseline_latency,
+            "recent_latency": self._recent_latency,
+            "queues": {
+                priority.value: {"depth": len(self._queues[priority]), **self._queue_times[priority].stats()}
+                for priority in Priority
+            },
+        }
+
+
+class LimiterRegistry:
+    """Creates one ``AdaptiveLimiter`` per provider name and reports them together."""
+
+    def __init__(self, config: ConcurrencyConfig):
+        self._config = config
+        self._limiters: dict[str, AdaptiveLimiter] = {}
+
+    def get(self, name: str) -> AdaptiveLimiter:
+        limiter = self._limiters.get(name)
+        if limiter is None:
+            limiter = AdaptiveLimiter(name, self._config)
+            self._limiters[name] = limiter
+        return limiter
+
+    def stats(self) -> dict:
+        return {name: limiter.stats() for name, limiter in self._limiters.items()}
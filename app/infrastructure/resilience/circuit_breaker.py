@@ -0,0 +1,162 @@
+import logging
+import time
+from collections.abc import AsyncIterator
+from enum import Enum
+
+from app.domain.exceptions import CircuitOpenException, ProviderOverloadedException, is_client_error
+from app.domain.interfaces import TextModelClient, VisionModelClient
+from app.domain.models import AIMessage, AIResponse, AIResponseChunk, Message
+from core.config import CircuitBreakerConfig
+
+logger = logging.getLogger(__name__)
+
+
+class CircuitState(str, Enum):
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+def is_breaker_failure(exc: BaseException) -> bool:
+    """Whether a failure says something about the provider's health.
+
+    Client errors (4xx other than 408/429) are the caller's fault and local
+    queue rejections never reached the provider, so neither trips the breaker.
+    """
+    return not isinstance(exc, ProviderOverloadedException) and not is_client_error(exc)
+
+
+class CircuitBreaker:
+    """Closed/open/half-open circuit breaker for a single provider.
+
+    After ``failure_threshold`` consecutive failures the circuit opens and calls
+    fail immediately with ``CircuitOpenException``. Once ``reset_timeout`` has
+    passed, up to ``half_open_max_calls`` probe calls are let through: a
+    successful probe closes the circuit, a failed one opens it again.
+    """
+
+    def __init__(self, name: str, config: CircuitBreakerConfig):
+        self.name = name
+        self._config = config
+        self.state = CircuitState.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probes = 0
+        self.rejected = 0
+        self.opened = 0
+
+    def before_call(self) -> None:
+        if self.state == CircuitState.OPEN:
+            if time.monotonic() - self._opened_at < self._config.reset_timeout:
+                self.rejected += 1
+                raise CircuitOpenException(f"Circuit for {self.name} is open")
+            self._transition(CircuitState.HALF_OPEN)
+            self._probes = 0
+        if self.state == CircuitState.HALF_OPEN:
+            if self._probes >= self._config.half_open_max_calls:
+                self.rejected += 1
+                raise CircuitOpenException(f"Circuit for {self.name} is half-open, waiting for probe results")
+            self._probes += 1
+
+    def on_success(self) -> None:
+        self._failures = 0
+        if self.state != CircuitState.CLOSED:
+            self._transition(CircuitState.CLOSED)
+
+    def on_failure(self, exc: BaseException) -> None:
+        if not is_breaker_failure(exc):
+            # The provider answered, it just did not like the request.
+            self.on_success()
+            return
+        self._failures += 1
+        if self.state == CircuitState.HALF_OPEN or self._failures >= self._config.failure_threshold:
+            self._opened_at = time.monotonic()
+            self.opened += 1
+            self._transition(CircuitState.OPEN)
+
+    def on_abandoned(self) -> None:
+        """The call was cancelled before it finished; free its probe slot without judging the provider."""
+        if self.state == CircuitState.HALF_OPEN and self._probes > 0:
+            self._probes -= 1
+
+    def _transition(self, state: CircuitState) -> None:
+        if state != self.state:
+            log = logger.warning if state == CircuitState.OPEN else logger.info
+            log("Circuit for %s: %s -> %s", self.name, self.state.value, state.value)
+            self.state = state
+
+    def stats(self) -> dict:
+        return {
+            "state": self.state.value,
+            "consecutive_failures": self._failures,
+            "opened": self.opened,
+            "rejected": self.rejected,
+        }
+
+
+class CircuitBreakerClient(TextModelClient, VisionModelClient):
+    """Guards every call of the wrapped client with one shared ``CircuitBreaker``."""
+
+    def __init__(self, client, breaker: CircuitBreaker):
+        self._client = client
+        self.breaker = breaker
+
+    async def generate(self, messages: list[Message]) -> AIResponse:
+        self.breaker.before_call()
+        try:
+            response = await self._client.generate(messages)
+        except Exception as exc:
+            self.breaker.on_failure(exc)
+            raise
+        except BaseException:
+            self.breaker.on_abandoned()
+            raise
+        self.breaker.on_success()
+        return response
+
+    async def generate_vision(self, messages: list[AIMessage]) -> AIResponse:
+        self.breaker.before_call()
+        try:
+            response = await self._client.generate_vision(messages)
+        except Exception as exc:
+            self.breaker.on_failure(exc)
+            raise
+        except BaseException:
+            self.breaker.on_abandoned()
+            raise
+        self.breaker.on_success()
+        return response
+
+    def generate_stream(self, messages: list[Message]) -> AsyncIterator[AIResponseChunk]:
+        return self._guard_stream(lambda: self._client.generate_stream(messages))
+
+    def generate_vision_stream(self, messages: list[AIMessage]) -> AsyncIterator[AIResponseChunk]:
+        return self._guard_stream(lambda: self._client.generate_vision_stream(messages))
+
+    async def _guard_stream(self, open_stream) -> AsyncIterator[AIResponseChunk]:
+        self.breaker.before_call()
+        try:
+            async for chunk in open_stream():
+                yield chunk
+        except Exception as exc:
+            self.breaker.on_failure(exc)
+            raise
+        except BaseException:
+            self.breaker.on_abandoned()
+            raise
+        self.breaker.on_success()
+
+
+class CircuitBreakerRegistry:
+    """Creates one breaker per provider name and reports their states together."""
+
+    def __init__(self, config: CircuitBreakerConfig):
+        self._config = config
+        self._breakers: dict[str, CircuitBreaker] = {}
+
+    def wrap(self, name: str, client):
+        breaker = self._breakers.setdefault(name, CircuitBreaker(name, self._config))
+        return CircuitBreakerClient(client, breaker)
+
+    def stats(self) -> dict:
+        return {name: breaker.stats() for name, breaker in self._breakers.items()}
@@ -0,0 +1,153 @@
+import asyncio
+import logging
+import math
+import time
+from collections import deque
+from collections.abc import AsyncIterator
+from dataclasses import replace
+
+from app.domain.interfaces import TextModelClient
+from app.domain.models import AIAssistant, AIResponse, AIResponseChunk, Message
+from core.config import HedgingConfig
+
+logger = logging.getLogger(__name__)
+
+
+class _HedgeBudget:
+    """Token bucket that earns ``ratio`` of a hedge per request, capping hedges at that share of traffic."""
+
+    _BURST = 10.0
+
+    def __init__(self, ratio: float):
+        self._ratio = ratio
+        self._tokens = 0.0
+
+    def deposit(self) -> None:
+        self._tokens = min(self._tokens + self._ratio, self._BURST)
+
+    def withdraw(self) -> bool:
+        if self._tokens < 1.0:
+            return False
+        self._tokens -= 1.0
+        return True
+
+
+class HedgedTextClient(TextModelClient):
+    """Sends a second identical request when the first is slower than a percentile of recent latency.
+
+    The hedge goes to ``alternate`` if one is configured, otherwise to the same
+    client. Whichever answer arrives first wins and the other call is cancelled.
+    Hedges are paid for from a budget that grows by ``budget_ratio`` per request,
+    so they add at most that share of extra load. Streaming calls are passed
+    through unhedged: once tokens have been sent there is nothing to race.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        primary: TextModelClient,
+        config: HedgingConfig,
+        alternate: TextModelClient | None = None,
+        alternate_name: str | None = None,
+    ):
+        self.name = name
+        self._primary = primary
+        self._alternate = alternate or primary
+        self._alternate_name = alternate_name if alternate is not None else None
+        self._config = config
+        self._latencies: deque[float] = deque(maxlen=config.window)
+        self._budget = _HedgeBudget(config.budget_ratio)
+        self.requests = 0
+        self.hedges = 0
+        self.hedge_wins = 0
+        self.budget_exhausted = 0
+
+    def hedge_delay(self) -> float | None:
+        """Latency percentile after which a hedge is sent, or None until enough samples are collected."""
+        if len(self._latencies) < self._config.min_samples:
+            return None
+        ordered = sorted(self._latencies)
+        index = min(math.ceil(len(ordered) * self._config.percentile / 100) - 1, len(ordered) - 1)
+        return ordered[max(index, 0)]
+
+    async def generate(self, messages: list[Message]) -> AIResponse:
+        self.requests += 1
+        self._budget.deposit()
+        started = time.monotonic()
+        delay = self.hedge_delay()
+
+        primary = asyncio.ensure_future(self._primary.generate(messages))
+        hedge = None
+        try:
+            done, _ = await asyncio.wait({primary}, timeout=delay)
+            if not done:
+                if self._budget.withdraw():
+                    self.hedges += 1
+                    logger.info("Hedging %s request after %.2fs", self.name, delay)
+                    hedge = asyncio.ensure_future(self._alternate.generate(messages))
+                else:
+                    self.budget_exhausted += 1
+
+            winner = await self._first_success(primary, hedge)
+            response = winner.result()
+            if winner is hedge:
+                self.hedge_wins += 1
+                if self._alternate_name and response.served_by is None:
+                    response = replace(response, served_by=self._alternate_name)
+        finally:
+            for task in (primary, hedge):
+                if task is not None and not task.done():
+                    task.cancel()
+
+        self._latencies.append(time.monotonic() - started)
+        return response
+
+    @staticmethod
+    async def _first_success(primary: asyncio.Future, hedge: asyncio.Future | None) -> asyncio.Future:
+        """Wait for the first call that succeeds; if every call fails, re-raise the primary's error."""
+        pending = {primary} if hedge is None else {primary, hedge}
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in sorted(done, key=lambda task: task is not primary):
+                if task.exception() is None:
+                    return task
+        raise primary.exception()
+
+    def generate_stream(self, messages: list[Message]) -> AsyncIterator[AIResponseChunk]:
+        return self._primary.generate_stream(messages)
+
+    def stats(self) -> dict:
+        return {
+            "requests": self.requests,
+            "hedges": self.hedges,
+            "hedge_wins": self.hedge_wins,
+            "budget_exhausted": self.budget_exhausted,
+            "hedge_delay": self.hedge_delay(),
+        }
+
+
+class HedgingRegistry:
+    """Wraps the assistants listed in ``HedgingConfig.assistants`` and reports their hedging stats."""
+
+    def __init__(self, config: HedgingConfig):
+        self._config = config
+        self._clients: dict[str, HedgedTextClient] = {}
+
+    def wrap(self, clients: dict[AIAssistant, TextModelClient]) -> dict[AIAssistant, TextModelClient]:
+        wrapped = dict(clients)
+        for name in self._config.assistants:
+            assistant = AIAssistant(name)
+            alternate_name = self._config.alternates.get(name)
+            hedged = HedgedTextClient(
+                name,
+                clients[assistant],
+                self._config,
+                alternate=clients[AIAssistant(alternate_name)] if alternate_name else None,
+                alternate_name=alternate_name,
+            )
+            self._clients[name] = hedged
+            wrapped[assistant] = hedged
+        return wrapped
+
+    def stats(self) -> dict:
+        return {name: client.stats() for name, client in self._clients.items()}
@@ -0,0 +1 @@
+"""Conversation session storage."""
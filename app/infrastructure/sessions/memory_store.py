@@ -0,0 +1,73 @@
+import time
+from collections import OrderedDict
+
+from app.application.exceptions import ConflictException
+from app.application.interfaces.session_store import SessionStore
+from app.domain.models import Message, Session
+
+
+class InMemorySessionStore(SessionStore):
+    """Process-local sessions with LRU eviction above ``max_sessions`` and an idle TTL.
+
+    Histories are kept as domain objects and appended in place, so a turn
+    costs the same however long the conversation already is.
+    """
+
+    def __init__(self, max_sessions: int, ttl_seconds: float):
+        if max_sessions <= 0 or ttl_seconds <= 0:
+            raise ValueError("max_sessions and ttl_seconds must be positive")
+        self._max_sessions = max_sessions
+        self._ttl = ttl_seconds
+        self._sessions: OrderedDict[str, tuple[float, Session]] = OrderedDict()
+        self.evictions = 0
+        self.expirations = 0
+
+    async def create(self, session: Session) -> None:
+        self._sessions[session.id] = (time.monotonic() + self._ttl, session)
+        self._sessions.move_to_end(session.id)
+        while len(self._sessions) > self._max_sessions:
+            self._sessions.popitem(last=False)
+            self.evictions += 1
+
+    def _touch(self, session_id: str) -> Session | None:
+        entry = self._sessions.get(session_id)
+        if entry is None:
+            return None
+        expires_at, session = entry
+        if expires_at <= time.monotonic():
+            del self._sessions[session_id]
+            self.expirations += 1
+            return None
+        self._sessions[session_id] = (time.monotonic() + self._ttl, session)
+        self._sessions.move_to_end(session_id)
+        return session
+
+    async def get(self, session_id: str) -> Session | None:
+        return self._touch(session_id)
+
+    async def append(
+        self, session_id: str, messages: list[Message], updated_at: float, expected_length: int | None = None
+    ) -> bool:
+        session = self._touch(session_id)
+        if session is None:
+            return False
+        if expected_length is not None and len(session.messages) != expected_length:
+            raise ConflictException(f"Session {session_id} was changed by another request")
+        session.messages.extend(messages)
+        session.updated_at = updated_at
+        return True
+
+    async def delete(self, session_id: str) -> bool:
+        return self._sessions.pop(session_id, None) is not None
+
+    def stats(self) -> dict:
+        return {
+            "backend": "memory",
+            "sessions": len(self._sessions),
+            "max_sessions": self._max_sessions,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+        }
+
+    async def aclose(self) -> None:
+        self._sessions.clear()
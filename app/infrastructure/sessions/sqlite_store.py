@@ -0,0 +1,161 @@
+import asyncio
+import sqlite3
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from app.application.exceptions import ConflictException
+from app.application.interfaces.session_store import SessionStore
+from app.domain.models import AIAssistant, Message, Role, Session
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS sessions (
+    id TEXT PRIMARY KEY,
+    assistant TEXT NOT NULL,
+    created_at REAL NOT NULL,
+    updated_at REAL NOT NULL,
+    accessed_at REAL NOT NULL
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS sessions_accessed_at ON sessions (accessed_at);
+CREATE TABLE IF NOT EXISTS session_messages (
+    session_id TEXT NOT NULL REFERENCES sessions (id) ON DELETE CASCADE,
+    position INTEGER NOT NULL,
+    role TEXT NOT NULL,
+    content TEXT NOT NULL,
+    PRIMARY KEY (session_id, position)
+) WITHOUT ROWID;
+"""
+
+
+class SqliteSessionStore(SessionStore):
+    """Keeps sessions in a SQLite file, so they survive restarts and are shared by uvicorn workers.
+
+    A turn inserts only its new messages; the length check of a compare-and-set
+    append runs in the same ``BEGIN IMMEDIATE`` transaction, so two workers
+    cannot both extend the same history. Sessions idle longer than the TTL
+    and the least recently used ones above ``max_sessions`` are removed when
+    new sessions are created. All SQLite calls run on a dedicated thread.
+    """
+
+    def __init__(self, path: str, max_sessions: int, ttl_seconds: float):
+        if max_sessions <= 0 or ttl_seconds <= 0:
+            raise ValueError("max_sessions and ttl_seconds must be positive")
+        self._path = path
+        self._max_sessions = max_sessions
+        self._ttl = ttl_seconds
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="sessions")
+        self._connection: sqlite3.Connection | None = None
+        self.evictions = 0
+
+    async def _run(self, func, *args):
+        return await asyncio.get_running_loop().run_in_executor(self._executor, func, *args)
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._connection is None:
+            connection = sqlite3.connect(self._path, timeout=5.0, isolation_level=None)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA foreign_keys=ON")
+            connection.executescript(_SCHEMA)
+            self._connection = connection
+        return self._connection
+
+    async def create(self, session: Session) -> None:
+        await self._run(self._create, session)
+
+    def _create(self, session: Session) -> None:
+        connection = self._connect()
+        now = time.time()
+        with connection:
+            connection.execute("BEGIN IMMEDIATE")
+            expired = connection.execute("DELETE FROM sessions WHERE accessed_at < ?", (now - self._ttl,)).rowcount
+            connection.execute(
+                "INSERT INTO sessions (id, assistant, created_at, updated_at, accessed_at) VALUES (?, ?, ?, ?, ?)",
+                (session.id, session.assistant.value, session.created_at, session.updated_at, now),
+            )
+            self._insert_messages(connection, session.id, 0, session.messages)
+            overflow = connection.execute(
+                "DELETE FROM sessions WHERE id IN ("
+                " SELECT id FROM sessions ORDER BY accessed_at DESC LIMIT -1 OFFSET ?)",
+                (self._max_sessions,),
+            ).rowcount
+        self.evictions += expired + overflow
+
+    @staticmethod
+    def _insert_messages(connection: sqlite3.Connection, session_id: str, start: int, messages: list[Message]) -> None:
+        connection.executemany(
+            "INSERT INTO session_messages (session_id, position, role, content) VALUES (?, ?, ?, ?)",
+            [(session_id, start + index, message.role.value, message.content) for index, message in enumerate(messages)],
+        )
+
+    async def get(self, session_id: str) -> Session | None:
+        return await self._run(self._get, session_id)
+
+    def _get(self, session_id: str) -> Session | None:
+        connection = self._connect()
+        now = time.time()
+        row = connection.execute(
+            "UPDATE sessions SET accessed_at = ? WHERE id = ? AND accessed_at >= ?"
+            " RETURNING assistant, created_at, updated_at",
+            (now, session_id, now - self._ttl),
+        ).fetchone()
+        if row is None:
+            return None
+        assistant, created_at, updated_at = row
+        messages = [
+            Message(role=Role(role), content=content)
+            for role, content in connection.execute(
+                "SELECT role, content FROM session_messages WHERE session_id = ? ORDER BY position", (session_id,)
+            )
+        ]
+        return Session(
+            id=session_id,
+            assistant=AIAssistant(assistant),
+            messages=messages,
+            created_at=created_at,
+            updated_at=updated_at,
+        )
+
+    async def append(
+        self, session_id: str, messages: list[Message], updated_at: float, expected_length: int | None = None
+    ) -> bool:
+        return await self._run(self._append, session_id, messages, updated_at, expected_length)
+
+    def _append(self, session_id: str, messages: list[Message], updated_at: float, expected_length: int | None) -> bool:
+        connection = self._connect()
+        with connection:
+            connection.execute("BEGIN IMMEDIATE")
+            updated = connection.execute(
+                "UPDATE sessions SET updated_at = ?, accessed_at = ? WHERE id = ?",
+                (updated_at, time.time(), session_id),
+            ).rowcount
+            if not updated:
+                return False
+            (start,) = connection.execute(
+                "SELECT COALESCE(MAX(position) + 1, 0) FROM session_messages WHERE session_id = ?", (session_id,)
+            ).fetchone()
+            if expected_length is not None and start != expected_length:
+                raise ConflictException(f"Session {session_id} was changed by another request")
+            self._insert_messages(connection, session_id, start, messages)
+        return True
+
+    async def delete(self, session_id: str) -> bool:
+        return await self._run(self._delete, session_id)
+
+    def _delete(self, session_id: str) -> bool:
+        return self._connect().execute("DELETE FROM sessions WHERE id = ?", (session_id,)).rowcount > 0
+
+    def stats(self) -> dict:
+        return {
+            "backend": "sqlite",
+            "path": self._path,
+            "max_sessions": self._max_sessions,
+            "evictions": self.evictions,
+        }
+
+    async def aclose(self) -> None:
+        await self._run(self._close)
+        self._executor.shutdown(wait=True)
+
+    def _close(self) -> None:
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
@@ -0,0 +1 @@
+"""Local prompt token estimation."""
@@ -0,0 +1,111 @@
+import asyncio
+import logging
+import math
+from typing import Any
+
+from app.application.interfaces.token_estimator import TokenEstimate, TokenEstimator
+from app.application.services.single_flight import SingleFlight
+from app.domain.models import AIAssistant, Message
+from core.config import TokenBudgetConfig
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CONTEXT_WINDOWS = {
+    AIAssistant.CHAT_GPT: 128_000,
+    AIAssistant.YANDEX_GPT: 32_768,
+    AIAssistant.GPT_OSS_120B: 131_072,
+    AIAssistant.GPT_OSS_20B: 131_072,
+    AIAssistant.QWEN3_235B: 262_144,
+}
+
+# gpt-oss uses an o200k-based vocabulary. YandexGPT and Qwen tokenizers are not
+# available as tiktoken encodings, so they are estimated heuristically.
+_ENCODINGS = {
+    AIAssistant.GPT_OSS_120B: "o200k_base",
+    AIAssistant.GPT_OSS_20B: "o200k_base",
+}
+_FALLBACK_OPENAI_ENCODING = "o200k_base"
+
+# Chat formatting overhead per message and for priming the reply, as counted by OpenAI.
+_TOKENS_PER_MESSAGE = 4
+_TOKENS_PER_REPLY = 3
+# About four bytes of UTF-8 per token: right for English, but Cyrillic takes two bytes per character
+# and is overestimated up to twice, so heuristic estimates are marked inexact and never enforced.
+_BYTES_PER_TOKEN = 4
+# Prompts longer than this are encoded on a worker thread (tiktoken releases the GIL) instead of the event loop.
+_OFFLOAD_CHARS = 16_384
+
+
+def estimate_text_tokens(text: str) -> int:
+    return math.ceil(len(text.encode("utf-8")) / _BYTES_PER_TOKEN)
+
+
+class TiktokenTokenEstimator(TokenEstimator):
+    """Counts prompt tokens with tiktoken where the model's encoding is known, heuristically elsewhere.
+
+    tiktoken is optional and its encodings are loaded on first use, in a
+    thread, once per encoding: building one takes a noticeable fraction of a
+    second and may download the vocabulary (set ``TIKTOKEN_CACHE_DIR`` for
+    offline hosts). If tiktoken is missing or the encoding cannot be loaded,
+    counting falls back to the byte heuristic instead of failing requests.
+    """
+
+    def __init__(self, config: TokenBudgetConfig, openai_model: str | None = None):
+        self._openai_model = openai_model
+        self._context_windows = {
+            **DEFAULT_CONTEXT_WINDOWS,
+            **{AIAssistant(name): window for name, window in config.context_windows.items()},
+        }
+        self._encodings: dict[str, Any | None] = {}
+        self._loading = SingleFlight()
+
+    def context_window(self, assistant: AIAssistant) -> int | None:
+        return self._context_windows.get(assistant)
+
+    def _encoding_name(self, assistant: AIAssistant) -> str | None:
+        if assistant == AIAssistant.CHAT_GPT:
+            return f"model:{self._openai_model}" if self._openai_model else _FALLBACK_OPENAI_ENCODING
+        return _ENCODINGS.get(assistant)
+
+    async def _get_encoding(self, name: str) -> Any | None:
+        if name not in self._encodings:
+            await self._loading.do(name, lambda: self._load(name))
+        return self._encodings[name]
+
+    async def _load(self, name: str) -> None:
+        try:
+            self._encodings[name] = await asyncio.to_thread(_load_encoding, name)
+        except Exception as exc:
+            logger.warning("Token encoding %s is unavailable (%s), using the heuristic estimate", name, exc)
+            self._encodings[name] = None
+
+    async def count_messages(self, assistant: AIAssistant, messages: list[Message]) -> TokenEstimate:
+        name = self._encoding_name(assistant)
+        encoding = await self._get_encoding(name) if name is not None else None
+        texts = [message.content for message in messages]
+        if encoding is None:
+            counts = [estimate_text_tokens(text) for text in texts]
+            method, exact = "heuristic", False
+        else:
+            if sum(len(text) for text in texts) > _OFFLOAD_CHARS:
+                counts = await asyncio.to_thread(_encoded_lengths, encoding, texts)
+            else:
+                counts = _encoded_lengths(encoding, texts)
+            method, exact = f"tiktoken:{encoding.name}", True
+        message_tokens = [_TOKENS_PER_MESSAGE + count for count in counts]
+        return TokenEstimate(_TOKENS_PER_REPLY + sum(message_tokens), method, exact=exact, message_tokens=message_tokens)
+
+
+def _encoded_lengths(encoding: Any, texts: list[str]) -> list[int]:
+    return [len(encoding.encode(text, disallowed_special=())) for text in texts]
+
+
+def _load_encoding(name: str) -> Any:
+    import tiktoken
+
+    if name.startswith("model:"):
+        try:
+            return tiktoken.encoding_for_model(name.removeprefix("model:"))
+        except KeyError:
+            name = _FALLBACK_OPENAI_ENCODING
+    return tiktoken.get_encoding(name)
@@ -0,0 +1 @@
+"""Exporters for request traces."""
@@ -0,0 +1,89 @@
+import asyncio
+import json
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from typing import IO
+
+from app.application.interfaces.span_exporter import SpanExporter
+from app.application.services.tracing import Span, Trace
+
+logger = logging.getLogger(__name__)
+
+_SPAN_KIND_INTERNAL = 1
+_SPAN_KIND_SERVER = 2
+
+
+def _attribute_value(value) -> dict:
+    if isinstance(value, bool):
+        return {"boolValue": value}
+    if isinstance(value, int):
+        return {"intValue": str(value)}
+    if isinstance(value, float):
+        return {"doubleValue": value}
+    return {"stringValue": str(value)}
+
+
+def _attributes(attributes: dict | None) -> list[dict]:
+    return [{"key": key, "value": _attribute_value(value)} for key, value in (attributes or {}).items()]
+
+
+def to_otlp_json(trace: Trace, service_name: str) -> dict:
+    """A trace as an OTLP/JSON ``ExportTraceServiceRequest``."""
+
+    def encode(span: Span) -> dict:
+        encoded = {
+            "traceId": trace.trace_id,
+            "spanId": span.span_id,
+            "name": span.name,
+            "kind": _SPAN_KIND_SERVER if span is trace.root else _SPAN_KIND_INTERNAL,
+            "startTimeUnixNano": str(trace.timestamp_ns(span.start)),
+            "endTimeUnixNano": str(trace.timestamp_ns(span.end if span.end is not None else trace.root.end)),
+            "attributes": _attributes(span.attributes),
+        }
+        if span.parent_id is not None:
+            encoded["parentSpanId"] = span.parent_id
+        return encoded
+
+    return {
+        "resourceSpans": [{
+            "resource": {"attributes": _attributes({"service.name": service_name})},
+            "scopeSpans": [{"scope": {"name": "llmbox"}, "spans": [encode(span) for span in trace.spans]}],
+        }],
+    }
+
+
+class OtlpJsonFileExporter(SpanExporter):
+    """Appends each trace as one line of OTLP/JSON to a file.
+
+    The format is what the OpenTelemetry Collector's ``otlpjsonfile`` receiver
+    reads, so traces can be shipped to any OTLP backend later without adding
+    a network exporter to the service. Encoding and writing happen on a
+    dedicated thread.
+    """
+
+    def __init__(self, path: str, service_name: str = "llmbox"):
+        self._path = path
+        self._service_name = service_name
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="trace-export")
+        self._file: IO[str] | None = None
+
+    def export(self, trace: Trace) -> None:
+        self._executor.submit(self._write, trace)
+
+    def _write(self, trace: Trace) -> None:
+        try:
+            if self._file is None:
+                self._file = open(self._path, "a", encoding="utf-8")
+            self._file.write(json.dumps(to_otlp_json(trace, self._service_name), separators=(",", ":")) + "\n")
+            self._file.flush()
+        except OSError as exc:
+            logger.warning("Failed to export trace to %s: %s", self._path, exc)
+
+    def _close(self) -> None:
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    async def aclose(self) -> None:
+        await asyncio.get_running_loop().run_in_executor(self._executor, self._close)
+        self._executor.shutdown(wait=True)
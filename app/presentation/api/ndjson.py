@@ -0,0 +1,36 @@
+from collections.abc import AsyncIterator, Callable
+from typing import Any
+
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel
+
+from app.presentation.mappers.mappers import to_batch_item_result_schema
+
+
+async def _ndjson_lines(first: list, results: AsyncIterator, to_schema: Callable[[Any], BaseModel]) -> AsyncIterator[str]:
+    for result in first:
+        yield to_schema(result).model_dump_json() + "\n"
+    async for result in results:
+        yield to_schema(result).model_dump_json() + "\n"
+
+
+async def to_ndjson_response(
+    results: AsyncIterator,
+    to_schema: Callable[[Any], BaseModel] = to_batch_item_result_schema,
+) -> StreamingResponse:
+    """Emit one JSON line per result as soon as it is available.
+
+    The first result is awaited up front so that request-level errors still
+    surface as regular HTTP errors.
+    """
+    first = []
+    try:
+        first.append(await anext(results))
+    except StopAsyncIteration:
+        pass
+    return StreamingResponse(
+        _ndjson_lines(first, results, to_schema),
+        media_type="application/x-ndjson",
+        headers={"X-Accel-Buffering": "no"},
+    )
+
@@ -1,31 +1,252 @@
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, File, Form, Header, HTTPException, Response, UploadFile
+from fastapi.responses import PlainTextResponse, StreamingResponse
+from pydantic import ValidationError
 
-from app.application.services import AIService
-from app.presentation.api.schemas import AIResponseSchema, GenerateAIRequestSchema, GenerateVisionAIRequestSchema
+from app.application.exceptions import ValidationException
+from app.application.services import AIService, BatchJobService, ImageService, SessionService, StatsService
+from app.infrastructure.metrics.prometheus import PrometheusMetrics
+from app.presentation.api.ndjson import to_ndjson_response
+from app.presentation.api.schemas import (
+    AIResponseSchema,
+    BatchJobSchema,
+    CreateBatchJobRequestSchema,
+    CreateSessionRequestSchema,
+    GenerateAIBatchRequestSchema,
+    GenerateAIBatchResponseSchema,
+    GenerateAIRequestSchema,
+    GenerateVisionAIRequestSchema,
+    SessionSchema,
+    SessionTurnRequestSchema,
+    StoredImageSchema,
+    TokenCountSchema,
+)
+from app.presentation.api.sse import to_sse_response
 from app.presentation.decorators import handle_service_errors
-from app.presentation.dependencies import get_ai_service
-from app.presentation.mappers.mappers import to_generate_ai_request_dto, to_generate_vision_ai_request_dto, to_response_schema
+from app.presentation.dependencies import (
+    get_ai_service,
+    get_batch_job_service,
+    get_image_service,
+    get_metrics,
+    get_session_service,
+    get_stats_service,
+)
+from app.presentation.mappers.mappers import (
+    resolve_uploaded_image_ids,
+    to_batch_item_result_schema,
+    to_batch_job_result_schema,
+    to_batch_job_schema,
+    to_cache_policy,
+    to_create_batch_job_dto,
+    to_create_session_dto,
+    to_generate_ai_batch_request_dto,
+    to_generate_ai_request_dto,
+    to_generate_vision_ai_request_dto,
+    to_response_schema,
+    to_session_schema,
+    to_session_turn_dto,
+    to_stored_image_schema,
+    to_token_count_schema,
+)
 
 router = APIRouter()
 
 
-@handle_service_errors(endpoint_name="AI REQUEST")
 @router.post("/generate-ai-response", response_model=AIResponseSchema)
+@handle_service_errors(endpoint_name="AI REQUEST")
 async def generate_ai_response(
     body: GenerateAIRequestSchema,
     ai_service: AIService = Depends(get_ai_service),
+    cache_control: str | None = Header(default=None),
 ):
-    request_dto = to_generate_ai_request_dto(body)
+    request_dto = to_generate_ai_request_dto(body, cache_policy=to_cache_policy(cache_control))
     response_dto = await ai_service.generate_ai_response(request_dto)
     return to_response_schema(response_dto)
 
 
-@handle_service_errors(endpoint_name="VISION AI REQUEST")
+@router.post("/tokenize", response_model=TokenCountSchema)
+@handle_service_errors(endpoint_name="TOKENIZE")
+async def tokenize(body: GenerateAIRequestSchema, ai_service: AIService = Depends(get_ai_service)):
+    return to_token_count_schema(await ai_service.count_tokens(to_generate_ai_request_dto(body)))
+
+
+@router.post("/generate-ai-response/stream")
+@handle_service_errors(endpoint_name="AI STREAM REQUEST")
+async def generate_ai_response_stream(
+    body: GenerateAIRequestSchema,
+    ai_service: AIService = Depends(get_ai_service),
+):
+    request_dto = to_generate_ai_request_dto(body)
+    chunks = ai_service.generate_ai_response_stream(request_dto)
+    return await to_sse_response(chunks, endpoint_name="AI STREAM REQUEST")
+
+
+@router.post("/generate-ai-response/batch", response_model=GenerateAIBatchResponseSchema)
+@handle_service_errors(endpoint_name="AI BATCH REQUEST")
+async def generate_ai_response_batch(
+    body: GenerateAIBatchRequestSchema,
+    ai_service: AIService = Depends(get_ai_service),
+    cache_control: str | None = Header(default=None),
+):
+    request_dto = to_generate_ai_batch_request_dto(body, cache_policy=to_cache_policy(cache_control))
+    results = await ai_service.generate_ai_response_batch(request_dto)
+    return GenerateAIBatchResponseSchema(results=[to_batch_item_result_schema(result) for result in results])
+
+
+@router.post("/generate-ai-response/batch/stream")
+@handle_service_errors(endpoint_name="AI BATCH STREAM REQUEST")
+async def generate_ai_response_batch_stream(
+    body: GenerateAIBatchRequestSchema,
+    ai_service: AIService = Depends(get_ai_service),
+    cache_control: str | None = Header(default=None),
+) -> StreamingResponse:
+    request_dto = to_generate_ai_batch_request_dto(body, cache_policy=to_cache_policy(cache_control))
+    results = ai_service.generate_ai_response_batch_stream(request_dto)
+    return await to_ndjson_response(results)
+
+
 @router.post("/generate-ai-response-vision", response_model=AIResponseSchema)
+@handle_service_errors(endpoint_name="VISION AI REQUEST")
 async def generate_vision_ai_response(
     body: GenerateVisionAIRequestSchema,
     ai_service: AIService = Depends(get_ai_service),
+    cache_control: str | None = Header(default=None),
 ):
-    request_dto = to_generate_vision_ai_request_dto(body)
+    request_dto = to_generate_vision_ai_request_dto(body, cache_policy=to_cache_policy(cache_control))
+    response_dto = await ai_service.generate_ai_response_vision(request_dto)
+    return to_response_schema(response_dto)
+
+
+@router.post("/generate-ai-response-vision/multipart", response_model=AIResponseSchema)
+@handle_service_errors(endpoint_name="VISION AI MULTIPART REQUEST")
+async def generate_vision_ai_response_multipart(
+    request: str = Form(...),
+    images: list[UploadFile] = File(default=[]),
+    ai_service: AIService = Depends(get_ai_service),
+    image_service: ImageService = Depends(get_image_service),
+    cache_control: str | None = Header(default=None),
+):
+    try:
+        body = GenerateVisionAIRequestSchema.model_validate_json(request)
+    except ValidationError as exc:
+        raise ValidationException(f"Invalid request field: {exc}")
+    request_dto = to_generate_vision_ai_request_dto(body, cache_policy=to_cache_policy(cache_control))
+    image_ids = [(await image_service.upload_image(image.file)).image_id for image in images]
+    resolve_uploaded_image_ids(request_dto, image_ids)
     response_dto = await ai_service.generate_ai_response_vision(request_dto)
     return to_response_schema(response_dto)
+
+
+@router.post("/images", response_model=StoredImageSchema, status_code=201)
+@handle_service_errors(endpoint_name="IMAGE UPLOAD")
+async def upload_image(
+    file: UploadFile = File(...),
+    image_service: ImageService = Depends(get_image_service),
+):
+    return to_stored_image_schema(await image_service.upload_image(file.file))
+
+
+@router.post("/generate-ai-response-vision/stream")
+@handle_service_errors(endpoint_name="VISION AI STREAM REQUEST")
+async def generate_vision_ai_response_stream(
+    body: GenerateVisionAIRequestSchema,
+    ai_service: AIService = Depends(get_ai_service),
+):
+    request_dto = to_generate_vision_ai_request_dto(body)
+    chunks = ai_service.generate_ai_response_vision_stream(request_dto)
+    return await to_sse_response(chunks, endpoint_name="VISION AI STREAM REQUEST")
+
+
+@router.post("/batch-jobs", response_model=BatchJobSchema, status_code=202)
+@handle_service_errors(endpoint_name="BATCH JOB CREATE")
+async def create_batch_job(
+    body: CreateBatchJobRequestSchema,
+    batch_job_service: BatchJobService = Depends(get_batch_job_service),
+):
+    job_dto = await batch_job_service.create_job(to_create_batch_job_dto(body))
+    return to_batch_job_schema(job_dto)
+
+
+@router.get("/batch-jobs/{job_id}", response_model=BatchJobSchema)
+@handle_service_errors(endpoint_name="BATCH JOB STATUS")
+async def get_batch_job(job_id: str, batch_job_service: BatchJobService = Depends(get_batch_job_service)):
+    return to_batch_job_schema(await batch_job_service.get_job(job_id))
+
+
+@router.get("/batch-jobs/{job_id}/results")
+@handle_service_errors(endpoint_name="BATCH JOB RESULTS")
+async def get_batch_job_results(
+    job_id: str,
+    batch_job_service: BatchJobService = Depends(get_batch_job_service),
+) -> StreamingResponse:
+    results = await batch_job_service.get_job_results(job_id)
+    return await to_ndjson_response(results, to_batch_job_result_schema)
+
+
+@router.post("/batch-jobs/{job_id}/cancel", response_model=BatchJobSchema)
+@handle_service_errors(endpoint_name="BATCH JOB CANCEL")
+async def cancel_batch_job(job_id: str, batch_job_service: BatchJobService = Depends(get_batch_job_service)):
+    return to_batch_job_schema(await batch_job_service.cancel_job(job_id))
+
+
+@router.post("/sessions", response_model=SessionSchema, status_code=201)
+@handle_service_errors(endpoint_name="SESSION CREATE")
+async def create_session(
+    body: CreateSessionRequestSchema,
+    session_service: SessionService = Depends(get_session_service),
+):
+    return to_session_schema(await session_service.create_session(to_create_session_dto(body)))
+
+
+@router.get("/sessions/{session_id}", response_model=SessionSchema)
+@handle_service_errors(endpoint_name="SESSION GET")
+async def get_session(session_id: str, session_service: SessionService = Depends(get_session_service)):
+    return to_session_schema(await session_service.get_session(session_id))
+
+
+@router.delete("/sessions/{session_id}", status_code=204)
+@handle_service_errors(endpoint_name="SESSION DELETE")
+async def delete_session(session_id: str, session_service: SessionService = Depends(get_session_service)):
+    await session_service.delete_session(session_id)
+    return Response(status_code=204)
+
+
+@router.post("/sessions/{session_id}/messages", response_model=AIResponseSchema)
+@handle_service_errors(endpoint_name="SESSION MESSAGE")
+async def send_session_message(
+    session_id: str,
+    body: SessionTurnRequestSchema,
+    session_service: SessionService = Depends(get_session_service),
+    cache_control: str | None = Header(default=None),
+):
+    turn_dto = to_session_turn_dto(body, cache_policy=to_cache_policy(cache_control))
+    return to_response_schema(await session_service.send_message(session_id, turn_dto))
+
+
+@router.post("/sessions/{session_id}/messages/stream")
+@handle_service_errors(endpoint_name="SESSION STREAM MESSAGE")
+async def send_session_message_stream(
+    session_id: str,
+    body: SessionTurnRequestSchema,
+    session_service: SessionService = Depends(get_session_service),
+):
+    chunks = session_service.send_message_stream(session_id, to_session_turn_dto(body))
+    return await to_sse_response(chunks, endpoint_name="SESSION STREAM MESSAGE")
+
+
+@router.get("/health")
+async def health():
+    return {"status": "ok"}
+
+
+@router.get("/stats")
+async def get_stats(stats_service: StatsService | None = Depends(get_stats_service)):
+    if stats_service is None:
+        raise HTTPException(status_code=404, detail="Stats are disabled")
+    return stats_service.snapshot()
+
+
+@router.get("/metrics", response_class=PlainTextResponse)
+async def get_metrics_text(metrics: PrometheusMetrics | None = Depends(get_metrics)):
+    if metrics is None:
+        raise HTTPException(status_code=404, detail="Metrics are disabled")
+    return PlainTextResponse(metrics.render(), media_type="text/plain; version=0.0.4; charset=utf-8")
@@ -1,6 +1,6 @@
 from enum import Enum
 
-from pydantic import BaseModel
+from pydantic import BaseModel, Field, model_validator
 
 
 class RoleSchema(str, Enum):
@@ -20,6 +20,7 @@ class AIAssistantSchema(str, Enum):
     GPT_OSS_120B = "gpt_oss_120b"
     GPT_OSS_20B = "gpt_oss_20b"
     QWEN3_235B = "qwen3_235b"
+    AUTO = "auto"
 
 
 class MessageSchema(BaseModel):
@@ -33,9 +34,16 @@ class TextContentItemSchema(BaseModel):
 
 
 class ImageContentItemSchema(BaseModel):
-    image_base64: str
+    image_base64: str | None = None
+    image_id: str | None = None
     type: ContentTypeSchema = ContentTypeSchema.IMAGE_URL
 
+    @model_validator(mode="after")
+    def _check_source(self) -> "ImageContentItemSchema":
+        if (self.image_base64 is None) == (self.image_id is None):
+            raise ValueError("Exactly one of image_base64 and image_id must be set")
+        return self
+
 
 class AIMessageSchema(BaseModel):
     role: RoleSchema
@@ -51,11 +59,108 @@ class UsageSchema(BaseModel):
 class AIResponseSchema(BaseModel):
     assistant_message: str
     usage: UsageSchema
+    cached: bool = False
+    served_by: str | None = None
+
+
+class AIResponseChunkSchema(BaseModel):
+    delta: str
 
 
 class GenerateAIRequestSchema(BaseModel):
     messages: list[MessageSchema]
     assistant: AIAssistantSchema
+    truncate_history: bool = False
+
+
+class GenerateAIBatchRequestSchema(BaseModel):
+    items: list[GenerateAIRequestSchema] = Field(min_length=1)
+    max_concurrency: int | None = Field(default=None, ge=1)
+
+
+class BatchItemErrorSchema(BaseModel):
+    status_code: int
+    detail: str
+
+
+class BatchItemResultSchema(BaseModel):
+    index: int
+    response: AIResponseSchema | None = None
+    error: BatchItemErrorSchema | None = None
+
+
+class GenerateAIBatchResponseSchema(BaseModel):
+    results: list[BatchItemResultSchema]
+
+
+class BatchJobStatusSchema(str, Enum):
+    PENDING = "pending"
+    IN_PROGRESS = "in_progress"
+    COMPLETED = "completed"
+    FAILED = "failed"
+    CANCELLED = "cancelled"
+    EXPIRED = "expired"
+
+
+class BatchJobRequestSchema(BaseModel):
+    custom_id: str | None = Field(default=None, min_length=1)
+    messages: list[MessageSchema]
+
+
+class CreateBatchJobRequestSchema(BaseModel):
+    assistant: AIAssistantSchema
+    requests: list[BatchJobRequestSchema] = Field(min_length=1)
+
+
+class BatchJobSchema(BaseModel):
+    id: str
+    assistant: AIAssistantSchema
+    provider: str
+    status: BatchJobStatusSchema
+    request_count: int
+    completed_count: int
+    failed_count: int
+    created_at: float
+    updated_at: float
+    error: str | None = None
+
+
+class BatchJobResultSchema(BaseModel):
+    custom_id: str
+    response: AIResponseSchema | None = None
+    error: str | None = None
+
+
+class TokenCountSchema(BaseModel):
+    assistant: AIAssistantSchema
+    prompt_tokens: int
+    method: str
+    budget_tokens: int | None = None
+    fits: bool
+
+
+class CreateSessionRequestSchema(BaseModel):
+    assistant: AIAssistantSchema
+    messages: list[MessageSchema] = Field(default_factory=list)
+
+
+class SessionTurnRequestSchema(BaseModel):
+    messages: list[MessageSchema] = Field(min_length=1)
+    truncate_history: bool = False
+
+
+class SessionSchema(BaseModel):
+    id: str
+    assistant: AIAssistantSchema
+    messages: list[MessageSchema]
+    created_at: float
+    updated_at: float
+
+
+class StoredImageSchema(BaseModel):
+    image_id: str
+    size: int
+    mime_type: str
 
 
 class GenerateVisionAIRequestSchema(BaseModel):
@@ -0,0 +1,71 @@
+import json
+import logging
+from collections.abc import AsyncIterator
+
+from fastapi.responses import StreamingResponse
+
+from app.application.dto import AIResponseChunkDTO, UsageDTO
+from app.application.exceptions import ApplicationException
+from app.presentation.mappers.mappers import to_response_chunk_schema, to_usage_schema
+
+logger = logging.getLogger(__name__)
+
+
+def format_sse(data: str, event: str | None = None) -> str:
+    lines = [f"event: {event}"] if event else []
+    lines.extend(f"data: {line}" for line in data.splitlines() or [""])
+    return "\n".join(lines) + "\n\n"
+
+
+async def _sse_events(
+    first_chunk: AIResponseChunkDTO | None,
+    chunks: AsyncIterator[AIResponseChunkDTO],
+    endpoint_name: str,
+) -> AsyncIterator[str]:
+    usage: UsageDTO | None = None
+
+    def encode(chunk: AIResponseChunkDTO) -> str | None:
+        nonlocal usage
+        if chunk.usage is not None:
+            usage = chunk.usage
+        if chunk.delta:
+            return format_sse(to_response_chunk_schema(chunk).model_dump_json())
+        return None
+
+    if first_chunk is not None:
+        if event := encode(first_chunk):
+            yield event
+        try:
+            async for chunk in chunks:
+                if event := encode(chunk):
+                    yield event
+        except ApplicationException as exc:
+            logger.error("%s STREAM ERROR: %s", endpoint_name.upper(), exc)
+            yield format_sse(json.dumps({"detail": str(exc)}), event="error")
+            return
+        except Exception as exc:
+            logger.error("%s STREAM CRITICAL ERROR: error=%s", endpoint_name.upper(), exc, exc_info=True)
+            yield format_sse(json.dumps({"detail": f"Failed to process {endpoint_name} request"}), event="error")
+            return
+
+    usage_json = to_usage_schema(usage).model_dump_json() if usage is not None else "null"
+    yield format_sse(usage_json, event="usage")
+
+
+async def to_sse_response(chunks: AsyncIterator[AIResponseChunkDTO], endpoint_name: str) -> StreamingResponse:
+    """Relay response chunks as Server-Sent Events.
+
+    The first chunk is awaited before the response starts so that validation and
+    upstream errors still surface as regular HTTP errors; failures after that are
+    sent as an ``error`` event. The stream always ends with a ``usage`` event.
+    The backend that serves the stream is reported in the ``X-Served-By`` header.
+    """
+    first_chunk = await anext(chunks, None)
+    headers = {"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    if first_chunk is not None and first_chunk.served_by:
+        headers["X-Served-By"] = first_chunk.served_by
+    return StreamingResponse(
+        _sse_events(first_chunk, chunks, endpoint_name),
+        media_type="text/event-stream",
+        headers=headers,
+    )
@@ -7,9 +7,12 @@ from fastapi import HTTPException
 
 from app.application.exceptions import (
     ApplicationException,
+    NotFoundException,
     ServiceUnavailableException,
     ValidationException,
 )
+from app.application.services.tracing import span
+from app.presentation.mappers.mappers import to_error_status
 
 logger = logging.getLogger(__name__)
 
@@ -20,10 +23,14 @@ def handle_service_errors(endpoint_name: str = None):
         async def wrapper(*args: Any, **kwargs: Any) -> Any:
             name = endpoint_name or func.__name__
             try:
-                return await func(*args, **kwargs)
+                with span("route", endpoint=name):
+                    return await func(*args, **kwargs)
             except ValidationException as exc:
                 logger.error("%s VALIDATION ERROR: %s", name.upper(), exc)
-                raise HTTPException(status_code=400, detail=str(exc))
+                error = exc
+            except NotFoundException as exc:
+                logger.info("%s NOT FOUND: %s", name.upper(), exc)
+                error = exc
             except ServiceUnavailableException as exc:
                 logger.error(
                     "%s AI SERVICE ERROR: %s (original: %s)",
@@ -32,13 +39,15 @@ def handle_service_errors(endpoint_name: str = None):
                     exc.original_error if getattr(exc, "original_error", None) else "N/A",
                     exc_info=True
                 )
-                raise HTTPException(status_code=502, detail=f"AI service error: {str(exc)}")
+                error = exc
             except ApplicationException as exc:
                 logger.error("%s APPLICATION ERROR: %s", name.upper(), exc)
-                raise HTTPException(status_code=400, detail=str(exc))
+                error = exc
             except Exception as exc:
                 logger.error("%s CRITICAL ERROR: error=%s", name.upper(), exc, exc_info=True)
-                raise HTTPException(status_code=500, detail=f"Failed to process {name} request")
+                error = exc
+            status_code, detail = to_error_status(error, name)
+            raise HTTPException(status_code=status_code, detail=detail)
 
         return wrapper
 
@@ -1,11 +1,226 @@
 from functools import lru_cache
 
-from app.application.services import AIService
+from app.application.interfaces.image_preprocessor import ImagePreprocessor
+from app.application.interfaces.image_store import ImageStore
+from app.application.interfaces.response_cache import ResponseCache
+from app.application.interfaces.session_store import SessionStore
+from app.application.services import AIService, BatchJobService, ImageService, SessionService, StatsService
+from app.application.services.context_budget import ContextBudget
+from app.application.services.latency_router import LatencyRouter
+from app.application.services.single_flight import SingleFlight
+from app.application.services.tracing import Tracer
 from app.composition.config_bootstrap import load_config
-from app.composition.container import build_ai_service
+from app.composition.container import (
+    build_admission_controller,
+    build_ai_service,
+    build_batch_job_service,
+    build_batch_job_store,
+    build_batch_providers,
+    build_breaker_registry,
+    build_context_budget,
+    build_hedging_registry,
+    build_image_preprocessor,
+    build_image_service,
+    build_image_store,
+    build_latency_router,
+    build_limiter_registry,
+    build_metrics,
+    build_response_cache,
+    build_session_service,
+    build_session_store,
+    build_single_flight,
+    build_tracer,
+    build_upstream_registry,
+)
+from app.domain.interfaces import BatchProvider
+from app.domain.models import AIAssistant
+from app.infrastructure.batch.local_batch_provider import LocalBatchProvider
+from app.infrastructure.batch.sqlite_job_store import SqliteBatchJobStore
+from app.infrastructure.http.upstream_registry import UpstreamRegistry
+from app.infrastructure.metrics.prometheus import PrometheusMetrics
+from app.infrastructure.resilience.adaptive_limiter import LimiterRegistry
+from app.infrastructure.resilience.admission import AdmissionController
+from app.infrastructure.resilience.circuit_breaker import CircuitBreakerRegistry
+from app.infrastructure.resilience.hedging import HedgingRegistry
+
+
+@lru_cache
+def get_upstream_registry() -> UpstreamRegistry:
+    config = load_config()
+    return build_upstream_registry(config)
+
+
+@lru_cache
+def get_response_cache() -> ResponseCache | None:
+    config = load_config()
+    return build_response_cache(config.response_cache)
+
+
+@lru_cache
+def get_single_flight() -> SingleFlight | None:
+    config = load_config()
+    return build_single_flight(config)
+
+
+@lru_cache
+def get_limiter_registry() -> LimiterRegistry | None:
+    config = load_config()
+    return build_limiter_registry(config)
+
+
+@lru_cache
+def get_hedging_registry() -> HedgingRegistry | None:
+    config = load_config()
+    return build_hedging_registry(config)
+
+
+@lru_cache
+def get_breaker_registry() -> CircuitBreakerRegistry | None:
+    config = load_config()
+    return build_breaker_registry(config)
+
+
+@lru_cache
+def get_admission_controller() -> AdmissionController | None:
+    return build_admission_controller(load_config().admission)
+
+
+@lru_cache
+def get_metrics() -> PrometheusMetrics | None:
+    return build_metrics(load_config().metrics)
+
+
+@lru_cache
+def get_tracer() -> Tracer | None:
+    return build_tracer(load_config().tracing)
+
+
+@lru_cache
+def get_latency_router() -> LatencyRouter:
+    config = load_config()
+    return build_latency_router(config)
+
+
+@lru_cache
+def get_image_preprocessor() -> ImagePreprocessor | None:
+    config = load_config()
+    return build_image_preprocessor(config.image_preprocessing)
+
+
+@lru_cache
+def get_image_store() -> ImageStore:
+    config = load_config()
+    return build_image_store(config.image_store)
+
+
+@lru_cache
+def get_image_service() -> ImageService:
+    return build_image_service(get_image_store())
+
+
+@lru_cache
+def get_context_budget() -> ContextBudget | None:
+    return build_context_budget(load_config())
 
 
 @lru_cache
 def get_ai_service() -> AIService:
     config = load_config()
-    return build_ai_service(config)
+    return build_ai_service(
+        config,
+        get_upstream_registry(),
+        get_response_cache(),
+        get_single_flight(),
+        get_limiter_registry(),
+        get_hedging_registry(),
+        get_breaker_registry(),
+        get_latency_router(),
+        get_image_preprocessor(),
+        get_image_store(),
+        get_context_budget(),
+        get_metrics(),
+    )
+
+
+@lru_cache
+def get_batch_providers() -> dict[AIAssistant, BatchProvider]:
+    config = load_config()
+    return build_batch_providers(config, get_upstream_registry(), get_ai_service().text_use_case.text_clients)
+
+
+@lru_cache
+def get_batch_job_store() -> SqliteBatchJobStore:
+    config = load_config()
+    return build_batch_job_store(config)
+
+
+@lru_cache
+def get_batch_job_service() -> BatchJobService:
+    config = load_config()
+    return build_batch_job_service(config, get_batch_providers(), get_batch_job_store())
+
+
+@lru_cache
+def get_session_store() -> SessionStore:
+    return build_session_store(load_config().sessions)
+
+
+@lru_cache
+def get_session_service() -> SessionService:
+    return build_session_service(load_config().sessions, get_ai_service(), get_session_store())
+
+
+@lru_cache
+def get_stats_service() -> StatsService | None:
+    if not load_config().stats.enabled:
+        return None
+    stats_service = StatsService()
+    stats_service.register("upstreams", get_upstream_registry())
+    if (response_cache := get_response_cache()) is not None:
+        stats_service.register("response_cache", response_cache)
+    if (single_flight := get_single_flight()) is not None:
+        stats_service.register("coalescing", single_flight)
+    if (limiters := get_limiter_registry()) is not None:
+        stats_service.register("concurrency", limiters)
+    if (hedging := get_hedging_registry()) is not None:
+        stats_service.register("hedging", hedging)
+    if (breakers := get_breaker_registry()) is not None:
+        stats_service.register("circuit_breakers", breakers)
+    stats_service.register("auto_router", get_latency_router())
+    if (image_preprocessor := get_image_preprocessor()) is not None:
+        stats_service.register("image_preprocessing", image_preprocessor)
+    stats_service.register("image_store", get_image_store())
+    if (admission := get_admission_controller()) is not None:
+        stats_service.register("admission", admission)
+    if (context_budget := get_context_budget()) is not None:
+        stats_service.register("context_budget", context_budget)
+    stats_service.register("sessions", get_session_store())
+    if (tracer := get_tracer()) is not None:
+        stats_service.register("tracing", tracer)
+    return stats_service
+
+
+def open_resources() -> None:
+    get_ai_service()
+    get_batch_job_service()
+    get_session_service()
+    if (admission := get_admission_controller()) is not None:
+        admission.start()
+
+
+async def close_resources() -> None:
+    if (admission := get_admission_controller()) is not None:
+        await admission.aclose()
+    for provider in get_batch_providers().values():
+        if isinstance(provider, LocalBatchProvider):
+            await provider.aclose()
+    await get_batch_job_store().aclose()
+    await get_upstream_registry().aclose()
+    if (response_cache := get_response_cache()) is not None:
+        await response_cache.aclose()
+    if (image_preprocessor := get_image_preprocessor()) is not None:
+        await image_preprocessor.aclose()
+    await get_image_store().aclose()
+    await get_session_store().aclose()
+    if (tracer := get_tracer()) is not None:
+        await tracer.aclose()
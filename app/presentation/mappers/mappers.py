@@ -1,21 +1,58 @@
 from app.application.dto import (
     AIMessageDTO,
+    AIResponseChunkDTO,
     AIResponseDTO,
+    BatchItemResultDTO,
+    BatchJobDTO,
+    BatchJobRequestDTO,
+    BatchJobResultDTO,
+    CachePolicy,
+    CreateBatchJobDTO,
+    CreateSessionDTO,
+    GenerateAIBatchRequestDTO,
     GenerateAIRequestDTO,
     GenerateVisionAIRequestDTO,
     ImageContentItemDTO,
     MessageDTO,
+    SessionDTO,
+    SessionTurnDTO,
+    StoredImageDTO,
     TextContentItemDTO,
+    TokenCountDTO,
+    UsageDTO,
+)
+from app.application.exceptions import (
+    ApplicationException,
+    ConflictException,
+    NotFoundException,
+    ServiceUnavailableException,
+    ValidationException,
 )
 from app.domain.models import AIAssistant, ContentType, Role
 from app.presentation.api.schemas import (
+    AIAssistantSchema,
     AIMessageSchema,
+    AIResponseChunkSchema,
     AIResponseSchema,
+    BatchItemErrorSchema,
+    BatchItemResultSchema,
+    BatchJobRequestSchema,
+    BatchJobResultSchema,
+    BatchJobSchema,
+    BatchJobStatusSchema,
+    CreateBatchJobRequestSchema,
+    CreateSessionRequestSchema,
+    GenerateAIBatchRequestSchema,
     GenerateAIRequestSchema,
     GenerateVisionAIRequestSchema,
     ImageContentItemSchema,
     MessageSchema,
+    RoleSchema,
+    SessionSchema,
+    SessionTurnRequestSchema,
+    StoredImageSchema,
     TextContentItemSchema,
+    TokenCountSchema,
     UsageSchema,
 )
 
@@ -29,7 +66,11 @@ def to_text_content_item_dto(schema: TextContentItemSchema) -> TextContentItemDT
 
 
 def to_image_content_item_dto(schema: ImageContentItemSchema) -> ImageContentItemDTO:
-    return ImageContentItemDTO(image_base64=schema.image_base64, type=ContentType(schema.type.value))
+    return ImageContentItemDTO(
+        image_base64=schema.image_base64,
+        type=ContentType(schema.type.value),
+        image_id=schema.image_id,
+    )
 
 
 def to_ai_message_dto(schema: AIMessageSchema) -> AIMessageDTO:
@@ -43,21 +84,184 @@ def to_ai_message_dto(schema: AIMessageSchema) -> AIMessageDTO:
     return AIMessageDTO(role=Role(schema.role.value), content=content_items)
 
 
-def to_generate_ai_request_dto(schema: GenerateAIRequestSchema) -> GenerateAIRequestDTO:
+def to_cache_policy(cache_control: str | None) -> CachePolicy:
+    """Map a ``Cache-Control`` request header: ``no-store`` bypasses the cache, ``no-cache`` refreshes it."""
+    if not cache_control:
+        return CachePolicy.DEFAULT
+    directives = {directive.strip().lower() for directive in cache_control.split(",")}
+    if "no-store" in directives:
+        return CachePolicy.BYPASS
+    if "no-cache" in directives:
+        return CachePolicy.REFRESH
+    return CachePolicy.DEFAULT
+
+
+def to_generate_ai_request_dto(
+    schema: GenerateAIRequestSchema,
+    cache_policy: CachePolicy = CachePolicy.DEFAULT,
+) -> GenerateAIRequestDTO:
     messages = [to_message_dto(msg) for msg in schema.messages]
-    return GenerateAIRequestDTO(messages=messages, assistant=AIAssistant(schema.assistant.value))
+    return GenerateAIRequestDTO(
+        messages=messages,
+        assistant=AIAssistant(schema.assistant.value),
+        cache_policy=cache_policy,
+        truncate_history=schema.truncate_history,
+    )
 
 
-def to_generate_vision_ai_request_dto(schema: GenerateVisionAIRequestSchema) -> GenerateVisionAIRequestDTO:
+def to_generate_vision_ai_request_dto(
+    schema: GenerateVisionAIRequestSchema,
+    cache_policy: CachePolicy = CachePolicy.DEFAULT,
+) -> GenerateVisionAIRequestDTO:
     messages = [to_ai_message_dto(msg) for msg in schema.messages]
-    return GenerateVisionAIRequestDTO(messages=messages)
+    return GenerateVisionAIRequestDTO(messages=messages, cache_policy=cache_policy)
+
+
+def resolve_uploaded_image_ids(dto: GenerateVisionAIRequestDTO, image_ids: list[str]) -> None:
+    """Point ``upload:<n>`` image references at the n-th file of a multipart request."""
+    for message in dto.messages:
+        for item in message.content:
+            if isinstance(item, ImageContentItemDTO) and item.image_id and item.image_id.startswith("upload:"):
+                index = item.image_id.removeprefix("upload:")
+                if not index.isdigit() or int(index) >= len(image_ids):
+                    raise ValidationException(f"No uploaded file for image_id {item.image_id}")
+                item.image_id = image_ids[int(index)]
+
+
+def to_usage_schema(dto: UsageDTO) -> UsageSchema:
+    return UsageSchema(
+        prompt_tokens=dto.prompt_tokens,
+        completion_tokens=dto.completion_tokens,
+        total_tokens=dto.total_tokens,
+    )
 
 
 def to_response_schema(dto: AIResponseDTO) -> AIResponseSchema:
-    usage_schema = UsageSchema(
-        prompt_tokens=dto.usage.prompt_tokens,
-        completion_tokens=dto.usage.completion_tokens,
-        total_tokens=dto.usage.total_tokens,
+    return AIResponseSchema(
+        assistant_message=dto.assistant_message,
+        usage=to_usage_schema(dto.usage),
+        cached=dto.cached,
+        served_by=dto.served_by,
+    )
+
+
+def to_response_chunk_schema(dto: AIResponseChunkDTO) -> AIResponseChunkSchema:
+    return AIResponseChunkSchema(delta=dto.delta)
+
+
+def to_generate_ai_batch_request_dto(
+    schema: GenerateAIBatchRequestSchema,
+    cache_policy: CachePolicy = CachePolicy.DEFAULT,
+) -> GenerateAIBatchRequestDTO:
+    return GenerateAIBatchRequestDTO(
+        items=[to_generate_ai_request_dto(item, cache_policy=cache_policy) for item in schema.items],
+        max_concurrency=schema.max_concurrency,
+    )
+
+
+def to_error_status(exc: Exception, name: str) -> tuple[int, str]:
+    """Map an error raised while handling ``name`` to the HTTP status code and detail it is reported with."""
+    if isinstance(exc, ValidationException):
+        return 400, str(exc)
+    if isinstance(exc, NotFoundException):
+        return 404, str(exc)
+    if isinstance(exc, ConflictException):
+        return 409, str(exc)
+    if isinstance(exc, ServiceUnavailableException):
+        return 502, f"AI service error: {exc}"
+    if isinstance(exc, ApplicationException):
+        return 400, str(exc)
+    return 500, f"Failed to process {name} request"
+
+
+def to_batch_item_error_schema(exc: Exception) -> BatchItemErrorSchema:
+    """Report an item error with the status code the single-item endpoint would have returned."""
+    status_code, detail = to_error_status(exc, "batch item")
+    return BatchItemErrorSchema(status_code=status_code, detail=detail)
+
+
+def to_batch_item_result_schema(dto: BatchItemResultDTO) -> BatchItemResultSchema:
+    return BatchItemResultSchema(
+        index=dto.index,
+        response=to_response_schema(dto.response) if dto.response is not None else None,
+        error=to_batch_item_error_schema(dto.error) if dto.error is not None else None,
     )
 
-    return AIResponseSchema(assistant_message=dto.assistant_message, usage=usage_schema)
+
+def to_batch_job_request_dto(schema: BatchJobRequestSchema) -> BatchJobRequestDTO:
+    return BatchJobRequestDTO(
+        custom_id=schema.custom_id,
+        messages=[to_message_dto(message) for message in schema.messages],
+    )
+
+
+def to_create_batch_job_dto(schema: CreateBatchJobRequestSchema) -> CreateBatchJobDTO:
+    return CreateBatchJobDTO(
+        assistant=AIAssistant(schema.assistant.value),
+        requests=[to_batch_job_request_dto(request) for request in schema.requests],
+    )
+
+
+def to_batch_job_schema(dto: BatchJobDTO) -> BatchJobSchema:
+    return BatchJobSchema(
+        id=dto.id,
+        assistant=AIAssistantSchema(dto.assistant.value),
+        provider=dto.provider,
+        status=BatchJobStatusSchema(dto.status.value),
+        request_count=dto.request_count,
+        completed_count=dto.completed_count,
+        failed_count=dto.failed_count,
+        created_at=dto.created_at,
+        updated_at=dto.updated_at,
+        error=dto.error,
+    )
+
+
+def to_batch_job_result_schema(dto: BatchJobResultDTO) -> BatchJobResultSchema:
+    return BatchJobResultSchema(
+        custom_id=dto.custom_id,
+        response=to_response_schema(dto.response) if dto.response is not None else None,
+        error=dto.error,
+    )
+
+
+def to_token_count_schema(dto: TokenCountDTO) -> TokenCountSchema:
+    return TokenCountSchema(
+        assistant=AIAssistantSchema(dto.assistant.value),
+        prompt_tokens=dto.prompt_tokens,
+        method=dto.method,
+        budget_tokens=dto.budget_tokens,
+        fits=dto.fits,
+    )
+
+
+def to_stored_image_schema(dto: StoredImageDTO) -> StoredImageSchema:
+    return StoredImageSchema(image_id=dto.image_id, size=dto.size, mime_type=dto.mime_type)
+
+
+def to_create_session_dto(schema: CreateSessionRequestSchema) -> CreateSessionDTO:
+    return CreateSessionDTO(
+        assistant=AIAssistant(schema.assistant.value),
+        messages=[to_message_dto(message) for message in schema.messages],
+    )
+
+
+def to_session_turn_dto(
+    schema: SessionTurnRequestSchema,
+    cache_policy: CachePolicy = CachePolicy.DEFAULT,
+) -> SessionTurnDTO:
+    return SessionTurnDTO(
+        messages=[to_message_dto(message) for message in schema.messages],
+        cache_policy=cache_policy,
+        truncate_history=schema.truncate_history,
+    )
+
+
+def to_session_schema(dto: SessionDTO) -> SessionSchema:
+    return SessionSchema(
+        id=dto.id,
+        assistant=AIAssistantSchema(dto.assistant.value),
+        messages=[MessageSchema(role=RoleSchema(message.role.value), content=message.content) for message in dto.messages],
+        created_at=dto.created_at,
+        updated_at=dto.updated_at,
+    )
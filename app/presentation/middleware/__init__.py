@@ -0,0 +1 @@
+"""ASGI middleware wrapped around the API."""
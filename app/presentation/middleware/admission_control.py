@@ -0,0 +1,42 @@
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from app.infrastructure.resilience.admission import AdmissionController
+from app.presentation.middleware.body_size_limit import send_json_error
+from app.presentation.middleware.routing import route_template
+
+
+class AdmissionControlMiddleware:
+    """Sheds requests with 503 and ``Retry-After`` when the service is overloaded.
+
+    Requests are counted per route template (``/batch-jobs/{job_id}``, not the
+    concrete path) for as long as the app is handling them, streaming responses
+    included. Exempt paths such as ``/health`` and requests that match no route
+    are passed through without counting.
+    """
+
+    def __init__(self, app: ASGIApp, controller: AdmissionController):
+        self.app = app
+        self._controller = controller
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or self._controller.is_exempt(scope["path"]):
+            await self.app(scope, receive, send)
+            return
+        endpoint = route_template(scope)
+        if endpoint is None:
+            await self.app(scope, receive, send)
+            return
+
+        reason = self._controller.try_acquire(endpoint)
+        if reason is not None:
+            await send_json_error(
+                send,
+                503,
+                f"Service is overloaded ({reason}), retry later",
+                headers=[(b"retry-after", str(self._controller.retry_after).encode())],
+            )
+            return
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            self._controller.release(endpoint)
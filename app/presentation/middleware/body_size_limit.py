@@ -0,0 +1,88 @@
+import json
+
+from starlette.exceptions import HTTPException
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+
+async def send_json_error(
+    send: Send, status_code: int, detail: str, headers: list[tuple[bytes, bytes]] | None = None
+) -> None:
+    body = json.dumps({"detail": detail}).encode()
+    await send({
+        "type": "http.response.start",
+        "status": status_code,
+        "headers": [
+            (b"content-type", b"application/json"),
+            (b"content-length", str(len(body)).encode()),
+            *(headers or []),
+        ],
+    })
+    await send({"type": "http.response.body", "body": body})
+
+
+class BodySizeLimitMiddleware:
+    """Rejects request bodies above a per-path limit with 413 before they are buffered.
+
+    A declared ``Content-Length`` is checked up front, so an oversized upload is
+    refused without reading it. Bodies without one (chunked transfer) are counted
+    as they arrive: crossing the limit raises a 413 ``HTTPException`` from
+    ``receive``. Outer ``@app.middleware("http")`` layers may turn that into a
+    different error, so whatever the app answers after the overflow is replaced
+    with the 413 here. ``limits`` maps path prefixes to their own limit; the
+    longest matching prefix wins.
+    """
+
+    def __init__(self, app: ASGIApp, max_body_bytes: int, limits: dict[str, int] | None = None):
+        self.app = app
+        self._default = max_body_bytes
+        self._limits = sorted((limits or {}).items(), key=lambda item: len(item[0]), reverse=True)
+
+    def _limit_for(self, path: str) -> int:
+        for prefix, limit in self._limits:
+            if path.startswith(prefix):
+                return limit
+        return self._default
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        limit = self._limit_for(scope["path"])
+        for name, value in scope["headers"]:
+            if name == b"content-length":
+                if not value.isdigit() or int(value) > limit:
+                    await send_json_error(send, 413, f"Request body exceeds the limit of {limit} bytes")
+                    return
+                break
+
+        detail = f"Request body exceeds the limit of {limit} bytes"
+        received = 0
+        overflowed = False
+        response_started = False
+
+        async def limited_receive() -> Message:
+            nonlocal received, overflowed
+            message = await receive()
+            if message["type"] == "http.request":
+                received += len(message.get("body", b""))
+                if received > limit:
+                    overflowed = True
+                    raise HTTPException(status_code=413, detail=detail)
+            return message
+
+        async def guarded_send(message: Message) -> None:
+            nonlocal response_started
+            if overflowed:
+                return
+            if message["type"] == "http.response.start":
+                response_started = True
+            await send(message)
+
+        try:
+            await self.app(scope, limited_receive, guarded_send)
+        except Exception:
+            if not overflowed:
+                raise
+        if overflowed and not response_started:
+            await send_json_error(send, 413, detail)
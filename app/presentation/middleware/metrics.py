@@ -0,0 +1,37 @@
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.infrastructure.metrics.prometheus import PrometheusMetrics
+from app.presentation.middleware.routing import route_template
+
+
+class MetricsMiddleware:
+    """Counts HTTP requests and their latency per route template for ``GET /metrics``.
+
+    Requests that match no route share the ``unmatched`` label, so arbitrary
+    paths cannot blow up the number of series. Requests that fail before a
+    response is started are counted as 500.
+    """
+
+    def __init__(self, app: ASGIApp, metrics: PrometheusMetrics):
+        self.app = app
+        self._metrics = metrics
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        route = route_template(scope) or "unmatched"
+        status = 500
+
+        async def send_with_status(message: Message) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        started = self._metrics.request_started()
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            self._metrics.request_finished(scope["method"], route, status, started)
@@ -0,0 +1,61 @@
+import hashlib
+
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from app.application.services.request_context import request_identity
+from app.domain.models import Priority, RequestIdentity
+from app.presentation.middleware.body_size_limit import send_json_error
+from core.config import TenancyConfig
+
+
+class RequestIdentityMiddleware:
+    """Sets the tenant and priority class of each request for the upstream call scheduler.
+
+    The tenant is taken from the tenant header, else from the API key
+    (``X-API-Key`` or ``Authorization: Bearer``): a key listed in
+    ``api_key_tenants`` maps to its tenant, any other key to a tenant named by
+    a prefix of its hash, so keys are never logged or exported. Without either
+    the tenant is ``anonymous``. The priority header selects the class;
+    without it requests to ``bulk_paths`` are ``bulk`` and the rest
+    ``interactive``. The identity lives in a context variable, so background
+    work started by the request (batch jobs) keeps it.
+    """
+
+    def __init__(self, app: ASGIApp, config: TenancyConfig):
+        self.app = app
+        self._config = config
+        self._tenant_header = config.tenant_header.lower().encode()
+        self._priority_header = config.priority_header.lower().encode()
+
+    def _tenant(self, headers: dict[bytes, bytes]) -> str:
+        if tenant := headers.get(self._tenant_header, b"").decode("latin-1").strip():
+            return tenant
+        api_key = headers.get(b"x-api-key", b"").decode("latin-1").strip()
+        if not api_key:
+            scheme, _, credentials = headers.get(b"authorization", b"").decode("latin-1").partition(" ")
+            api_key = credentials.strip() if scheme.lower() == "bearer" else ""
+        if not api_key:
+            return "anonymous"
+        return self._config.api_key_tenants.get(api_key) or f"key-{hashlib.sha256(api_key.encode()).hexdigest()[:12]}"
+
+    def _default_priority(self, path: str) -> Priority:
+        if any(path.startswith(prefix) for prefix in self._config.bulk_paths):
+            return Priority.BULK
+        return Priority.INTERACTIVE
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        headers = dict(scope["headers"])
+        priority_value = headers.get(self._priority_header, b"").decode("latin-1").strip().lower()
+        try:
+            priority = Priority(priority_value) if priority_value else self._default_priority(scope["path"])
+        except ValueError:
+            classes = ", ".join(priority.value for priority in Priority)
+            await send_json_error(send, 400, f"{self._config.priority_header} must be one of: {classes}")
+            return
+
+        with request_identity(RequestIdentity(tenant=self._tenant(headers), priority=priority)):
+            await self.app(scope, receive, send)
@@ -0,0 +1,78 @@
+import logging
+import re
+import time
+import uuid
+
+from starlette.datastructures import URL
+from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.application.services.request_context import request_id_context
+
+logger = logging.getLogger(__name__)
+
+_REQUEST_ID = re.compile(rb"[A-Za-z0-9._:-]{1,128}")
+
+
+class RequestLoggingMiddleware:
+    """Assigns each request an ID, times it into ``X-Process-Time`` and turns unhandled errors into a JSON 500.
+
+    The ID is taken from a well-formed ``X-Request-ID`` header, else
+    generated; it is returned in the same header and set for log records
+    while the request is handled. ``X-Process-Time`` carries the seconds
+    until the response started, measured with ``perf_counter_ns``. Response
+    messages are forwarded as they come, so streamed bodies are not buffered.
+    An error raised after the response has started cannot be answered any
+    more and propagates to the server, which aborts the connection.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    @staticmethod
+    def _request_id(scope: Scope) -> str:
+        for name, value in scope["headers"]:
+            if name == b"x-request-id":
+                if _REQUEST_ID.fullmatch(value):
+                    return value.decode()
+                break
+        return uuid.uuid4().hex
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        started = time.perf_counter_ns()
+        request_id = self._request_id(scope)
+        response_started = False
+
+        async def timed_send(message: Message) -> None:
+            nonlocal response_started
+            if message["type"] == "http.response.start":
+                response_started = True
+                process_time = (time.perf_counter_ns() - started) / 1e9
+                message["headers"] = [
+                    *message.get("headers", ()),
+                    (b"x-process-time", str(process_time).encode()),
+                    (b"x-request-id", request_id.encode()),
+                ]
+            await send(message)
+
+        with request_id_context(request_id):
+            try:
+                await self.app(scope, receive, timed_send)
+            except Exception as e:
+                if response_started:
+                    raise
+                process_time = (time.perf_counter_ns() - started) / 1e9
+                logger.error(
+                    f"REQUEST ERROR: {scope['method']} {URL(scope=scope)} - Error: {str(e)} - Time: {process_time:.2f}s",
+                    exc_info=True,
+                )
+                response = JSONResponse(
+                    status_code=500,
+                    content={"detail": "Internal server error", "error": str(e)},
+                    headers={"X-Process-Time": str(process_time), "X-Request-ID": request_id},
+                )
+                await response(scope, receive, send)
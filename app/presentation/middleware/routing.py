@@ -0,0 +1,24 @@
+from starlette.routing import Match
+from starlette.types import Scope
+
+_SCOPE_KEY = "llmbox.route_template"
+
+
+def route_template(scope: Scope) -> str | None:
+    """Path template of the route that will handle the request, e.g. ``/batch-jobs/{job_id}``.
+
+    Routes are read from the application in the scope at request time, so
+    routers included after the middleware was added are seen too. The result
+    is kept in the scope, so several middlewares resolve a request against
+    the route table only once. ``None`` when no route matches fully.
+    """
+    if _SCOPE_KEY in scope:
+        return scope[_SCOPE_KEY]
+    template = None
+    for route in scope["app"].router.routes:
+        match, _ = route.matches(scope)
+        if match == Match.FULL:
+            template = getattr(route, "path", None)
+            break
+    scope[_SCOPE_KEY] = template
+    return template
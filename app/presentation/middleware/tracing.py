@@ -0,0 +1,49 @@
+import time
+
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.application.services.tracing import Tracer
+from app.presentation.middleware.routing import route_template
+
+
+class TracingMiddleware:
+    """Traces each request and reports where its time went in a ``Server-Timing`` header.
+
+    The header is written when the response starts, so for streaming
+    responses it covers the work up to the first byte; the exported trace
+    covers the whole request. ``serialize`` is the time between the route
+    handler returning and the response starting, i.e. response model
+    validation and JSON encoding.
+    """
+
+    def __init__(self, app: ASGIApp, tracer: Tracer):
+        self.app = app
+        self._tracer = tracer
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        route = route_template(scope) or "unmatched"
+        started = self._tracer.start(f"{scope['method']} {route}", {"http.method": scope["method"], "http.route": route})
+        if started is None:
+            await self.app(scope, receive, send)
+            return
+        trace, token = started
+
+        async def send_with_timing(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                now = time.perf_counter()
+                handler = next((span for span in trace.spans if span.name == "route" and span.end is not None), None)
+                if handler is not None:
+                    trace.add("serialize", handler.end, now)
+                trace.root.attributes["http.status_code"] = message["status"]
+                if self._tracer.server_timing:
+                    MutableHeaders(scope=message).append("Server-Timing", trace.server_timing())
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            self._tracer.finish(trace, token)
@@ -0,0 +1,259 @@
+import base64
+import binascii
+import logging
+import re
+import tempfile
+from collections.abc import Callable
+
+from starlette.exceptions import HTTPException
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.application.interfaces.image_store import ImageStore
+from app.domain.exceptions import InvalidImageException
+from app.presentation.middleware.body_size_limit import send_json_error
+
+logger = logging.getLogger(__name__)
+
+_STRING_SPECIAL = re.compile(rb'["\\]')
+_IMAGE_KEY = re.compile(rb'"image_base64"\s*:\s*$')
+_DATA_URL_HEADER = re.compile(rb"data:[\w.+-]+/[\w.+-]+;base64,")
+_MAX_HEADER = 128
+_HEX4 = re.compile(rb"[0-9a-fA-F]{4}")
+# Decoded images stay in memory up to this size and spill to a temporary file beyond it.
+_SPOOL_SIZE = 1 << 20
+
+
+class _ImageSink:
+    """Decodes one base64 data URL as it streams in."""
+
+    def __init__(self, key_start: int, max_image_bytes: int):
+        self.key_start = key_start
+        self._max_image_bytes = max_image_bytes
+        self.header = bytearray()
+        self.decoding = False
+        self._pending = b""
+        self._size = 0
+        self.file = tempfile.SpooledTemporaryFile(max_size=_SPOOL_SIZE)
+
+    def write(self, data: bytes) -> bool:
+        """Feed string content; returns False once it is clear this is not a base64 data URL."""
+        if not self.decoding:
+            self.header += data
+            match = _DATA_URL_HEADER.match(self.header)
+            if match is None:
+                # Keep waiting only while the prefix can still grow into a data URL header.
+                return (
+                    len(self.header) < _MAX_HEADER
+                    and b"data:".startswith(bytes(self.header[:5]))
+                    and b"," not in self.header
+                )
+            data = bytes(self.header[match.end():])
+            self.decoding = True
+        data = self._pending + data.replace(b"\n", b"").replace(b"\r", b"")
+        usable = len(data) - len(data) % 4
+        self._pending = data[usable:]
+        self._decode(data[:usable])
+        return True
+
+    def _decode(self, data: bytes) -> None:
+        try:
+            decoded = base64.b64decode(data, validate=True)
+        except binascii.Error:
+            raise InvalidImageException("Image is not valid base64") from None
+        self._size += len(decoded)
+        if self._size > self._max_image_bytes:
+            raise InvalidImageException(f"Image exceeds the limit of {self._max_image_bytes} bytes")
+        self.file.write(decoded)
+
+    def finish(self) -> None:
+        if not self.decoding:
+            raise InvalidImageException("Image must be a base64 data URL")
+        self._decode(self._pending)
+        self.file.seek(0)
+
+
+class _ImageExtractor:
+    """Rewrites a JSON body on the fly, moving ``image_base64`` payloads into the image store.
+
+    Everything outside image strings is copied to a skeleton body; each
+    ``"image_base64": "data:...;base64,..."`` member is decoded chunk by chunk
+    into the store and replaced with ``"image_id": "<sha256>"``. Values that
+    are not base64 data URLs (remote URLs) are left in place.
+    """
+
+    def __init__(self, store: ImageStore, max_image_bytes: int):
+        self._store = store
+        self._max_image_bytes = max_image_bytes
+        self.body = bytearray()
+        self.images = 0
+        self._in_string = False
+        self._escape = False
+        self._unicode: bytearray | None = None  # hex digits of a \uXXXX escape seen so far
+        self._sink: _ImageSink | None = None
+
+    async def feed(self, chunk: bytes) -> None:
+        position = 0
+        while position < len(chunk):
+            if self._unicode is not None:
+                position = self._on_unicode_escape(chunk, position)
+            elif self._escape:
+                position = await self._on_escape(chunk[position:position + 1], position)
+            elif self._in_string:
+                position = await self._scan_string(chunk, position)
+            else:
+                end = chunk.find(b'"', position)
+                if end < 0:
+                    self.body += chunk[position:]
+                    return
+                self.body += chunk[position:end]
+                tail = _IMAGE_KEY.search(self.body, max(0, len(self.body) - 64))
+                if tail is not None:
+                    self._sink = _ImageSink(tail.start(), self._max_image_bytes)
+                else:
+                    self.body += b'"'
+                self._in_string = True
+                position = end + 1
+
+    async def _scan_string(self, chunk: bytes, position: int) -> int:
+        match = _STRING_SPECIAL.search(chunk, position)
+        end = match.start() if match is not None else len(chunk)
+        self._write_string(chunk[position:end])
+        if match is None:
+            return end
+        if match.group() == b"\\":
+            self._escape = True
+        else:
+            await self._close_string()
+        return end + 1
+
+    async def _on_escape(self, char: bytes, position: int) -> int:
+        self._escape = False
+        if self._sink is not None and char == b"/":
+            # Some encoders escape the slashes in "image/png" and in base64.
+            self._write_string(b"/")
+            return position + 1
+        if self._sink is not None and char == b"u":
+            self._unicode = bytearray()
+            return position + 1
+        if self._sink is not None and self._sink.decoding:
+            if char not in (b"n", b"r"):
+                raise InvalidImageException("Image is not valid base64")
+            return position + 1
+        self._write_string(b"\\" + char)
+        return position + 1
+
+    def _on_unicode_escape(self, chunk: bytes, position: int) -> int:
+        end = min(len(chunk), position + 4 - len(self._unicode))
+        self._unicode += chunk[position:end]
+        if len(self._unicode) < 4:
+            return end
+        digits = bytes(self._unicode)
+        self._unicode = None
+        code = int(digits, 16) if _HEX4.fullmatch(digits) else None
+        if code is not None and 0x20 <= code < 0x7F and code not in b'"\\':
+            # Encoders that escape all punctuation write the "/" and "+" of a data URL as \u002f and \u002b.
+            self._write_string(bytes([code]))
+        else:
+            # Nothing a data URL can contain: keep the escape as it came, so a value put back stays valid JSON.
+            self._write_string(b"\\u" + digits)
+        return end
+
+    def _write_string(self, data: bytes) -> None:
+        if not data:
+            return
+        if self._sink is None:
+            self.body += data
+        elif not self._sink.write(data):
+            # Not a data URL after all: put the member back as it came.
+            self.body += b'"' + bytes(self._sink.header)
+            self._sink.file.close()
+            self._sink = None
+
+    async def _close_string(self) -> None:
+        self._in_string = False
+        sink = self._sink
+        if sink is None:
+            self.body += b'"'
+            return
+        self._sink = None
+        try:
+            sink.finish()
+            image = await self._store.put(sink.file)
+        finally:
+            sink.file.close()
+        del self.body[sink.key_start:]
+        self.body += f'"image_id":"{image.image_id}"'.encode()
+        self.images += 1
+
+
+class VisionImageExtractionMiddleware:
+    """Streams JSON vision requests and stores their images instead of buffering them in the body.
+
+    By default a request with a few base64 images is held several times over:
+    as raw body bytes, as parsed JSON strings, and as validated models. Here
+    each image is decoded into the image store while the body is still being
+    received, and the endpoint gets a small body that references the images by
+    ``image_id``; they are read back from disk only when the upstream request
+    is built. ``image_store`` is a factory so the store is created lazily.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        image_store: Callable[[], ImageStore],
+        max_image_bytes: int,
+        path_prefix: str = "/generate-ai-response-vision",
+    ):
+        self.app = app
+        self._image_store = image_store
+        self._max_image_bytes = max_image_bytes
+        self._path_prefix = path_prefix
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if (
+            scope["type"] != "http"
+            or scope["method"] != "POST"
+            or not scope["path"].startswith(self._path_prefix)
+            or not self._is_json(scope)
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        extractor = _ImageExtractor(self._image_store(), self._max_image_bytes)
+        try:
+            while True:
+                message = await receive()
+                if message["type"] == "http.disconnect":
+                    return
+                await extractor.feed(message.get("body", b""))
+                if not message.get("more_body", False):
+                    break
+        except HTTPException as exc:
+            await send_json_error(send, exc.status_code, exc.detail)
+            return
+        except InvalidImageException as exc:
+            await send_json_error(send, 400, str(exc))
+            return
+
+        body = bytes(extractor.body)
+        if extractor.images:
+            logger.debug("Extracted %s images from %s, %s bytes left in body", extractor.images, scope["path"], len(body))
+        headers = [(name, value) for name, value in scope["headers"] if name != b"content-length"]
+        headers.append((b"content-length", str(len(body)).encode()))
+        body_sent = False
+
+        async def replay() -> Message:
+            nonlocal body_sent
+            if not body_sent:
+                body_sent = True
+                return {"type": "http.request", "body": body, "more_body": False}
+            return await receive()
+
+        await self.app({**scope, "headers": headers}, replay, send)
+
+    @staticmethod
+    def _is_json(scope: Scope) -> bool:
+        for name, value in scope["headers"]:
+            if name == b"content-type":
+                return value.split(b";")[0].strip().lower() == b"application/json"
+        return False
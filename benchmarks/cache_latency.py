@@ -0,0 +1,107 @@
+"""Get/put latency of the response cache backends under concurrent access.
+
+Each worker process opens its own cache instance against the same SQLite
+file (as uvicorn workers would) and runs a mixed read/write workload with
+several concurrent coroutines. Per-operation latencies are aggregated across
+processes. The in-memory backend is measured in a single process for scale.
+
+    python -m benchmarks.cache_latency --processes 4 --ops 2000 --read-ratio 0.9
+"""
+import argparse
+import asyncio
+import multiprocessing
+import os
+import random
+import statistics
+import tempfile
+import time
+
+from app.infrastructure.cache.memory_cache import InMemoryResponseCache
+from app.infrastructure.cache.sqlite_cache import SqliteResponseCache
+
+MAX_BYTES = 256 * 1024 * 1024
+
+
+def build_cache(backend: str, path: str):
+    if backend == "sqlite":
+        return SqliteResponseCache(path, max_bytes=MAX_BYTES, ttl_seconds=3600)
+    return InMemoryResponseCache(max_bytes=MAX_BYTES, ttl_seconds=3600)
+
+
+async def workload(backend: str, path: str, ops: int, concurrency: int, keys: int, value_size: int, read_ratio: float, seed: int):
+    cache = build_cache(backend, path)
+    rng = random.Random(seed)
+    value = os.urandom(value_size)
+    gets: list[float] = []
+    puts: list[float] = []
+
+    async def worker(count: int) -> None:
+        for _ in range(count):
+            key = f"key-{rng.randrange(keys)}"
+            started = time.perf_counter()
+            if rng.random() < read_ratio:
+                await cache.get(key)
+                gets.append(time.perf_counter() - started)
+            else:
+                await cache.set(key, value)
+                puts.append(time.perf_counter() - started)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker(ops // concurrency) for _ in range(concurrency)))
+    elapsed = time.perf_counter() - started
+    hits = cache.stats()["hits"]
+    await cache.aclose()
+    return gets, puts, hits, elapsed
+
+
+def run_process(args: tuple) -> tuple[list[float], list[float], int, float]:
+    return asyncio.run(workload(*args))
+
+
+def percentile(samples: list[float], fraction: float) -> float:
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * fraction))]
+
+
+def report(label: str, samples: list[float]) -> None:
+    if not samples:
+        return
+    print(
+        f"  {label}: n={len(samples):6d} "
+        f"p50={statistics.median(samples) * 1e6:8.1f} us "
+        f"p99={percentile(samples, 0.99) * 1e6:8.1f} us "
+        f"max={max(samples) * 1e6:8.1f} us"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--processes", type=int, default=4)
+    parser.add_argument("--ops", type=int, default=2000, help="operations per process")
+    parser.add_argument("--concurrency", type=int, default=8, help="coroutines per process")
+    parser.add_argument("--keys", type=int, default=500)
+    parser.add_argument("--value-size", type=int, default=2048)
+    parser.add_argument("--read-ratio", type=float, default=0.9)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "bench.sqlite3")
+        for backend, processes in (("memory", 1), ("sqlite", 1), ("sqlite", args.processes)):
+            jobs = [
+                (backend, path, args.ops, args.concurrency, args.keys, args.value_size, args.read_ratio, seed)
+                for seed in range(processes)
+            ]
+            with multiprocessing.get_context("spawn").Pool(processes) as pool:
+                results = pool.map(run_process, jobs)
+            gets = [sample for result in results for sample in result[0]]
+            puts = [sample for result in results for sample in result[1]]
+            hits = sum(result[2] for result in results)
+            wall = max(result[3] for result in results)
+            total = len(gets) + len(puts)
+            print(f"{backend} x{processes} processes: {total} ops in {wall:.2f}s ({total / wall:.0f} ops/s), hits={hits}")
+            report("get", gets)
+            report("put", puts)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,128 @@
+"""Contention benchmark for YandexAuth.get_iam_key.
+
+Starts a stub IAM server on localhost, fires N concurrent callers at a cold
+YandexAuth and reports how many IAM exchanges were made, caller latency and
+the longest event-loop stall observed while tokens were being issued.
+
+    python -m benchmarks.iam_contention --callers 500 --iam-latency-ms 80
+"""
+import argparse
+import asyncio
+import json
+import statistics
+import time
+
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import rsa
+
+from app.infrastructure.clients.yandex_auth import YandexAuth
+from app.infrastructure.http.transport import HttpTransport
+from core.config import HttpConfig
+
+
+class StubIAMServer:
+    def __init__(self, latency: float):
+        self._latency = latency
+        self.requests = 0
+        self._server: asyncio.Server | None = None
+
+    async def start(self) -> str:
+        self._server = await asyncio.start_server(self._handle, "127.0.0.1", 0)
+        port = self._server.sockets[0].getsockname()[1]
+        return f"http://127.0.0.1:{port}/iam/v1/tokens"
+
+    async def stop(self) -> None:
+        self._server.close()
+        await self._server.wait_closed()
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            while True:
+                head = await reader.readuntil(b"\r\n\r\n")
+                length = 0
+                for line in head.split(b"\r\n"):
+                    if line.lower().startswith(b"content-length:"):
+                        length = int(line.split(b":", 1)[1])
+                await reader.readexactly(length)
+                self.requests += 1
+                await asyncio.sleep(self._latency)
+                body = json.dumps({"iamToken": f"t1.stub-{self.requests}"}).encode()
+                writer.write(
+                    b"HTTP/1.1 200 OK\r\nContent-Type: application/json\r\n"
+                    + f"Content-Length: {len(body)}\r\n\r\n".encode()
+                    + body
+                )
+                await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionResetError):
+            pass
+        finally:
+            writer.close()
+
+
+async def measure_loop_stall(stop: asyncio.Event, interval: float = 0.001) -> float:
+    worst = 0.0
+    while not stop.is_set():
+        started = time.perf_counter()
+        await asyncio.sleep(interval)
+        worst = max(worst, time.perf_counter() - started - interval)
+    return worst
+
+
+async def run_round(auth: YandexAuth, callers: int) -> tuple[list[float], float, float]:
+    async def caller() -> float:
+        started = time.perf_counter()
+        await auth.get_iam_key()
+        return time.perf_counter() - started
+
+    stop = asyncio.Event()
+    stall_task = asyncio.create_task(measure_loop_stall(stop))
+    await asyncio.sleep(0.01)
+    started = time.perf_counter()
+    latencies = sorted(await asyncio.gather(*(caller() for _ in range(callers))))
+    wall = time.perf_counter() - started
+    stop.set()
+    return latencies, wall, await stall_task
+
+
+async def run(callers: int, iam_latency: float, rounds: int) -> None:
+    private_key = rsa.generate_private_key(public_exponent=65537, key_size=2048).private_bytes(
+        serialization.Encoding.PEM, serialization.PrivateFormat.PKCS8, serialization.NoEncryption()
+    ).decode()
+    server = StubIAMServer(iam_latency)
+    iam_url = await server.start()
+    transport = HttpTransport(HttpConfig())
+    transport.open()
+    auth = YandexAuth("kid", "sa", private_key, http_transport=transport, iam_url=iam_url)
+
+    print(f"callers per round: {callers}, stub IAM latency: {iam_latency * 1000:.0f} ms")
+    for round_no in range(1, rounds + 1):
+        requests_before = server.requests
+        latencies, wall, worst_stall = await run_round(auth, callers)
+        print(
+            f"round {round_no}: IAM requests={server.requests - requests_before} "
+            f"wall={wall * 1000:.1f} ms "
+            f"p50={statistics.median(latencies) * 1000:.1f} ms "
+            f"p99={latencies[int(len(latencies) * 0.99) - 1] * 1000:.1f} ms "
+            f"worst loop stall={worst_stall * 1000:.2f} ms"
+        )
+        # Expire both tokens so the next round refreshes again with a warm signing key.
+        auth.iam_key = None
+        auth.jwt_token = None
+
+    if auth._iam_token_task is not None:
+        auth._iam_token_task.cancel()
+    await transport.aclose()
+    await server.stop()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--callers", type=int, default=200)
+    parser.add_argument("--iam-latency-ms", type=float, default=50.0)
+    parser.add_argument("--rounds", type=int, default=3)
+    args = parser.parse_args()
+    asyncio.run(run(args.callers, args.iam_latency_ms / 1000, args.rounds))
+
+
+if __name__ == "__main__":
+    main()
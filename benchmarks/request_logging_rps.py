@@ -0,0 +1,125 @@
+"""Requests per second on stub routes with and without request logging middleware.
+
+Three variants are compared: no middleware, the old ``@app.middleware("http")``
+layer (Starlette's ``BaseHTTPMiddleware``) and ``RequestLoggingMiddleware``.
+Requests are driven straight through the ASGI interface (no sockets, no HTTP
+parsing), so the numbers show what the middleware itself costs per request.
+Each variant gets a warm-up pass and the best of several rounds is reported.
+
+    python -m benchmarks.request_logging_rps --requests 20000 --concurrency 32
+"""
+import argparse
+import asyncio
+import logging
+import time
+
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse, StreamingResponse
+
+from app.presentation.middleware.request_logging import RequestLoggingMiddleware
+
+logger = logging.getLogger(__name__)
+
+SCOPE = {
+    "type": "http",
+    "asgi": {"version": "3.0"},
+    "http_version": "1.1",
+    "method": "GET",
+    "scheme": "http",
+    "root_path": "",
+    "query_string": b"",
+    "headers": [(b"host", b"bench")],
+    "server": ("bench", 80),
+    "client": ("127.0.0.1", 50000),
+}
+
+
+def build_app(variant: str) -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/stub")
+    async def stub():
+        return {"ok": True}
+
+    @app.get("/stream")
+    async def stream():
+        async def body():
+            for _ in range(16):
+                yield b"data: chunk\n\n"
+
+        return StreamingResponse(body(), media_type="text/event-stream")
+
+    if variant == "base_http":
+        # The layer that main.py used before RequestLoggingMiddleware.
+        @app.middleware("http")
+        async def log_requests(request: Request, call_next):
+            start_time = time.time()
+            try:
+                response = await call_next(request)
+                response.headers["X-Process-Time"] = str(time.time() - start_time)
+                return response
+            except Exception as e:
+                logger.error(f"REQUEST ERROR: {request.method} {request.url} - Error: {str(e)}", exc_info=True)
+                return JSONResponse(status_code=500, content={"detail": "Internal server error", "error": str(e)})
+    elif variant == "asgi":
+        app.add_middleware(RequestLoggingMiddleware)
+    return app
+
+
+async def call(app: FastAPI, path: str) -> None:
+    scope = {**SCOPE, "path": path, "raw_path": path.encode()}
+    request_sent = False
+    status = 0
+
+    async def receive():
+        nonlocal request_sent
+        if not request_sent:
+            request_sent = True
+            return {"type": "http.request", "body": b"", "more_body": False}
+        await asyncio.Event().wait()
+
+    async def send(message):
+        nonlocal status
+        if message["type"] == "http.response.start":
+            status = message["status"]
+
+    await app(scope, receive, send)
+    assert status == 200, status
+
+
+async def run(app: FastAPI, path: str, requests: int, concurrency: int) -> float:
+    per_worker = requests // concurrency
+
+    async def worker() -> None:
+        for _ in range(per_worker):
+            await call(app, path)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return per_worker * concurrency / (time.perf_counter() - started)
+
+
+async def main_async(args) -> None:
+    variants = ("none", "base_http", "asgi")
+    print(f"{'route':<8} {'middleware':<10} {'rps':>10} {'vs none':>8}")
+    for path in ("/stub", "/stream"):
+        results = {}
+        for variant in variants:
+            app = build_app(variant)
+            await run(app, path, min(args.requests, 1000), args.concurrency)
+            results[variant] = max([await run(app, path, args.requests, args.concurrency) for _ in range(args.rounds)])
+        for variant in variants:
+            ratio = results[variant] / results["none"]
+            print(f"{path:<8} {variant:<10} {results[variant]:>10.0f} {ratio:>7.0%}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=20000)
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--rounds", type=int, default=3)
+    asyncio.run(main_async(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
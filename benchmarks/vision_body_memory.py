@@ -0,0 +1,111 @@
+"""Peak RSS of one large vision request, with and without streaming image extraction.
+
+Each variant runs in a fresh process: the API is built with a stub vision
+client (no network, preprocessing off) and a single request carrying several
+base64 images is streamed to it in 64 KiB chunks, so the client side never
+holds the whole body. The growth of peak RSS over the idle baseline is what
+the server spent on the request.
+
+    python -m benchmarks.vision_body_memory --images 4 --image-mb 8
+"""
+import argparse
+import asyncio
+import base64
+import multiprocessing
+import os
+import resource
+import tempfile
+import time
+
+CHUNK = 48 * 1024  # raw bytes per chunk; a multiple of 3, so chunks encode independently
+
+
+def _peak_rss_mb() -> float:
+    # ru_maxrss is in kilobytes on Linux.
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+async def _body(images: int, image_bytes: int):
+    yield b'{"messages":[{"role":"user","content":[{"type":"text","text":"Describe the images"}'
+    block = os.urandom(CHUNK)
+    for index in range(images):
+        yield b',{"type":"image_url","image_base64":"data:image/jpeg;base64,'
+        for offset in range(0, image_bytes, CHUNK):
+            chunk = block[:min(CHUNK, image_bytes - offset)]
+            if offset == 0:
+                # A JPEG signature for the store, then the image number so images do not deduplicate.
+                chunk = b"\xff\xd8\xff" + index.to_bytes(3, "big") + chunk[6:]
+            yield base64.b64encode(chunk)
+        yield b'"}'
+    yield b"]}]}"
+
+
+async def _run(streaming: bool, images: int, image_bytes: int) -> tuple[float, float, int]:
+    import httpx
+    from fastapi import FastAPI
+
+    from app.application.services import AIService
+    from app.application.use_cases.generate_text_ai_use_case import GenerateTextAIUseCase
+    from app.application.use_cases.generate_text_batch_use_case import GenerateTextBatchUseCase
+    from app.application.use_cases.generate_vision_ai_use_case import GenerateVisionAIUseCase
+    from app.domain.models import AIResponse, Usage
+    from app.infrastructure.images.disk_image_store import DiskImageStore
+    from app.presentation.api.routes import router
+    from app.presentation.dependencies import get_ai_service
+    from app.presentation.middleware.vision_images import VisionImageExtractionMiddleware
+
+    class StubVisionClient:
+        async def generate_vision(self, messages):
+            return AIResponse(assistant_message="ok", usage=Usage(prompt_tokens=1, completion_tokens=1, total_tokens=2))
+
+    with tempfile.TemporaryDirectory() as tmp:
+        store = DiskImageStore(tmp, max_bytes=images * image_bytes * 2, max_image_bytes=image_bytes * 2)
+        text_use_case = GenerateTextAIUseCase({})
+        ai_service = AIService(
+            generate_text_use_case=text_use_case,
+            generate_vision_use_case=GenerateVisionAIUseCase(StubVisionClient(), image_store=store),
+            generate_batch_use_case=GenerateTextBatchUseCase(text_use_case),
+        )
+        app = FastAPI()
+        app.include_router(router)
+        app.dependency_overrides[get_ai_service] = lambda: ai_service
+        if streaming:
+            app.add_middleware(VisionImageExtractionMiddleware, image_store=lambda: store, max_image_bytes=image_bytes * 2)
+
+        async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://bench") as client:
+            # Warm up imports and lazily created objects before taking the baseline.
+            await client.post("/generate-ai-response-vision", json={"messages": [{"role": "user", "content": "hi"}]})
+            baseline = _peak_rss_mb()
+            started = time.perf_counter()
+            response = await client.post(
+                "/generate-ai-response-vision",
+                content=_body(images, image_bytes),
+                headers={"content-type": "application/json"},
+            )
+            elapsed = time.perf_counter() - started
+        await store.aclose()
+    return _peak_rss_mb() - baseline, elapsed, response.status_code
+
+
+def run_variant(args: tuple) -> tuple[float, float, int]:
+    return asyncio.run(_run(*args))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--images", type=int, default=4)
+    parser.add_argument("--image-mb", type=float, default=8, help="decoded size of each image")
+    args = parser.parse_args()
+
+    image_bytes = int(args.image_mb * 1024 * 1024)
+    body_mb = args.images * image_bytes * 4 / 3 / 1024 / 1024
+    print(f"{args.images} images x {args.image_mb:g} MiB, request body ~{body_mb:.1f} MiB")
+    context = multiprocessing.get_context("spawn")
+    for label, streaming in (("buffered", False), ("streaming", True)):
+        with context.Pool(1) as pool:
+            growth, elapsed, status = pool.apply(run_variant, ((streaming, args.images, image_bytes),))
+        print(f"  {label:9s}: status={status} peak RSS +{growth:7.1f} MiB ({growth / body_mb:.1f}x body) in {elapsed:.2f}s")
+
+
+if __name__ == "__main__":
+    main()
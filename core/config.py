@@ -1,4 +1,4 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 
 @dataclass
@@ -26,6 +26,169 @@ class YandexConfig:
     qwen_235b_model_name: str | None
     open_ai_api_key: str | None
     open_ai_base_url: str | None
+    iam_refresh_fraction: float = 0.5
+    iam_token_cache_path: str | None = None
+
+
+UPSTREAM_NAMES = ("openai", "yandex_gpt", "yandex_open_ai", "yandex_iam")
+
+
+@dataclass
+class HttpConfig:
+    max_connections: int = 100
+    max_keepalive_connections: int = 20
+    keepalive_expiry: float = 30.0
+    http2: bool = False
+    timeout: float = 30.0
+    connect_timeout: float = 5.0
+    dns_cache_ttl: float = 300.0
+
+
+@dataclass
+class ResponseCacheConfig:
+    enabled: bool = False
+    backend: str = "memory"
+    path: str = "llmbox_cache.sqlite3"
+    max_bytes: int = 64 * 1024 * 1024
+    ttl_seconds: float = 3600.0
+    compact_interval: float = 60.0
+
+
+@dataclass
+class ConcurrencyConfig:
+    enabled: bool = True
+    initial_limit: int = 16
+    min_limit: int = 1
+    max_limit: int = 128
+    max_queue: int = 256
+    queue_timeout: float = 10.0
+    latency_tolerance: float = 2.0
+    backoff: float = 0.5
+    queue_timeouts: dict[str, float] = field(default_factory=dict)
+    tenant_weights: dict[str, float] = field(default_factory=dict)
+
+
+@dataclass
+class CircuitBreakerConfig:
+    enabled: bool = True
+    failure_threshold: int = 5
+    reset_timeout: float = 30.0
+    half_open_max_calls: int = 1
+
+
+@dataclass
+class AutoRoutingConfig:
+    pool: list[str] = field(default_factory=list)
+    exploration: float = 0.05
+    stale_after: float = 60.0
+
+
+@dataclass
+class HedgingConfig:
+    assistants: list[str] = field(default_factory=list)
+    alternates: dict[str, str] = field(default_factory=dict)
+    percentile: float = 95.0
+    budget_ratio: float = 0.05
+    min_samples: int = 20
+    window: int = 256
+
+
+@dataclass
+class BatchConfig:
+    max_items: int = 1000
+    max_concurrency: int = 16
+
+
+@dataclass
+class BatchJobsConfig:
+    provider: str = "openai"
+    store_path: str = "llmbox_batch_jobs.sqlite3"
+    max_requests: int = 50000
+    local_concurrency: int = 4
+    local_result_ttl: float = 3600.0
+
+
+@dataclass
+class ImagePreprocessingConfig:
+    enabled: bool = False
+    max_side: int = 2048
+    max_short_side: int = 768
+    format: str = "jpeg"
+    quality: int = 85
+    workers: int = 2
+    cache_entries: int = 256
+
+
+@dataclass
+class ImageStoreConfig:
+    path: str = "llmbox_images"
+    max_bytes: int = 1024 * 1024 * 1024
+    max_image_bytes: int = 20 * 1024 * 1024
+
+
+@dataclass
+class RequestLimitsConfig:
+    max_body_bytes: int = 1024 * 1024
+    max_vision_body_bytes: int = 64 * 1024 * 1024
+    max_batch_body_bytes: int = 32 * 1024 * 1024
+
+
+@dataclass
+class AdmissionConfig:
+    enabled: bool = True
+    max_in_flight: int = 512
+    endpoint_max_in_flight: int = 256
+    endpoint_limits: dict[str, int] = field(default_factory=dict)
+    max_loop_lag: float = 0.25
+    lag_interval: float = 0.05
+    retry_after: int = 1
+    exempt_paths: list[str] = field(default_factory=lambda: ["/health", "/stats", "/metrics", "/docs", "/redoc", "/openapi.json"])
+
+
+@dataclass
+class TenancyConfig:
+    tenant_header: str = "X-Tenant-Id"
+    priority_header: str = "X-Priority"
+    api_key_tenants: dict[str, str] = field(default_factory=dict)
+    bulk_paths: list[str] = field(default_factory=lambda: ["/generate-ai-response/batch", "/batch-jobs"])
+
+
+@dataclass
+class TokenBudgetConfig:
+    enabled: bool = True
+    context_windows: dict[str, int] = field(default_factory=dict)
+    reserve_tokens: int = 2000
+
+
+@dataclass
+class SessionsConfig:
+    backend: str = "memory"
+    path: str = "llmbox_sessions.sqlite3"
+    max_sessions: int = 10000
+    max_messages: int = 1000
+    ttl_seconds: float = 24 * 3600
+
+
+@dataclass
+class MetricsConfig:
+    enabled: bool = False
+    latency_buckets: list[float] = field(
+        default_factory=lambda: [0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0]
+    )
+
+
+@dataclass
+class StatsConfig:
+    enabled: bool = False
+
+
+@dataclass
+class TracingConfig:
+    enabled: bool = False
+    exporter: str = "none"
+    path: str = "llmbox_traces.jsonl"
+    sample_rate: float = 1.0
+    server_timing: bool = True
 
 
 @dataclass
@@ -33,6 +196,9 @@ class LoggingConfig:
     level: str
     file: str
     format: str
+    json_format: bool = False
+    info_sample_rate: float = 1.0
+    max_message_chars: int = 8192
 
 
 @dataclass
@@ -41,3 +207,24 @@ class Config:
     open_ai: OpenAIConfig
     yandex: YandexConfig
     logging: LoggingConfig
+    http: HttpConfig = field(default_factory=HttpConfig)
+    upstream_http: dict[str, HttpConfig] = field(default_factory=dict)
+    response_cache: ResponseCacheConfig = field(default_factory=ResponseCacheConfig)
+    request_coalescing: bool = True
+    concurrency: ConcurrencyConfig = field(default_factory=ConcurrencyConfig)
+    hedging: HedgingConfig = field(default_factory=HedgingConfig)
+    circuit_breaker: CircuitBreakerConfig = field(default_factory=CircuitBreakerConfig)
+    fallbacks: dict[str, list[str]] = field(default_factory=dict)
+    auto_routing: AutoRoutingConfig = field(default_factory=AutoRoutingConfig)
+    batch: BatchConfig = field(default_factory=BatchConfig)
+    batch_jobs: BatchJobsConfig = field(default_factory=BatchJobsConfig)
+    image_preprocessing: ImagePreprocessingConfig = field(default_factory=ImagePreprocessingConfig)
+    image_store: ImageStoreConfig = field(default_factory=ImageStoreConfig)
+    request_limits: RequestLimitsConfig = field(default_factory=RequestLimitsConfig)
+    admission: AdmissionConfig = field(default_factory=AdmissionConfig)
+    tenancy: TenancyConfig = field(default_factory=TenancyConfig)
+    token_budget: TokenBudgetConfig = field(default_factory=TokenBudgetConfig)
+    sessions: SessionsConfig = field(default_factory=SessionsConfig)
+    metrics: MetricsConfig = field(default_factory=MetricsConfig)
+    stats: StatsConfig = field(default_factory=StatsConfig)
+    tracing: TracingConfig = field(default_factory=TracingConfig)
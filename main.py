@@ -1,5 +1,5 @@
 import logging
-import time
+from contextlib import asynccontextmanager
 
 import uvicorn
 from dotenv import load_dotenv
@@ -9,51 +9,97 @@ from fastapi.responses import JSONResponse
 from app.composition.config_bootstrap import load_config
 from app.composition.logging_bootstrap import setup_logging
 from app.presentation.api import routes as ai_routes
-
-load_dotenv()
-config = load_config()
-setup_logging(config.logging)
-
-logger = logging.getLogger(__name__)
-
-app = FastAPI(
-    title="LLMBox",
-    description="API для работы с LLM",
-    version="1.0.0",
-    docs_url="/docs",
-    openapi_url="/docs/openapi.json"
+from app.presentation.dependencies import (
+    close_resources,
+    get_admission_controller,
+    get_image_store,
+    get_metrics,
+    get_tracer,
+    open_resources,
 )
+from app.presentation.middleware.admission_control import AdmissionControlMiddleware
+from app.presentation.middleware.body_size_limit import BodySizeLimitMiddleware
+from app.presentation.middleware.metrics import MetricsMiddleware
+from app.presentation.middleware.request_identity import RequestIdentityMiddleware
+from app.presentation.middleware.request_logging import RequestLoggingMiddleware
+from app.presentation.middleware.tracing import TracingMiddleware
+from app.presentation.middleware.vision_images import VisionImageExtractionMiddleware
 
+logger = logging.getLogger(__name__)
 
-@app.middleware("http")
-async def log_requests(request: Request, call_next):
-    start_time = time.time()
-    method = request.method
-    url = str(request.url)
-
-    try:
-        response = await call_next(request)
-        process_time = time.time() - start_time
-        response.headers["X-Process-Time"] = str(process_time)
-        return response
 
-    except Exception as e:
-        process_time = time.time() - start_time
-        logger.error(f"REQUEST ERROR: {method} {url} - Error: {str(e)} - Time: {process_time:.2f}s", exc_info=True)
-        return JSONResponse(status_code=500, content={"detail": "Internal server error", "error": str(e)})
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    open_resources()
+    yield
+    await close_resources()
 
 
-@app.exception_handler(Exception)
 async def global_exception_handler(request: Request, exc: Exception):
     logger.error(f"GLOBAL EXCEPTION: {request.method} {request.url} - {str(exc)}", exc_info=True)
     return JSONResponse(status_code=500, content={"detail": "Internal server error", "error": str(exc)})
 
 
-app.include_router(ai_routes.router)
+def create_app() -> FastAPI:
+    """Builds the application; importing this module has no side effects.
+
+    Image preprocessing workers are spawned processes that re-import the main
+    module, so configuration, logging and the app are only set up here.
+    """
+    load_dotenv()
+    config = load_config()
+    setup_logging(config.logging)
+
+    app = FastAPI(
+        title="LLMBox",
+        description="API для работы с LLM",
+        version="1.0.0",
+        docs_url="/docs",
+        openapi_url="/docs/openapi.json",
+        lifespan=lifespan,
+    )
+
+    app.add_exception_handler(Exception, global_exception_handler)
+
+    app.add_middleware(
+        VisionImageExtractionMiddleware,
+        image_store=get_image_store,
+        max_image_bytes=config.image_store.max_image_bytes,
+    )
+    app.add_middleware(
+        BodySizeLimitMiddleware,
+        max_body_bytes=config.request_limits.max_body_bytes,
+        limits={
+            "/generate-ai-response-vision": config.request_limits.max_vision_body_bytes,
+            "/images": config.request_limits.max_vision_body_bytes,
+            "/generate-ai-response/batch": config.request_limits.max_batch_body_bytes,
+            "/batch-jobs": config.request_limits.max_batch_body_bytes,
+        },
+    )
+
+    app.add_middleware(RequestIdentityMiddleware, config=config.tenancy)
+    if (tracer := get_tracer()) is not None:
+        app.add_middleware(TracingMiddleware, tracer=tracer)
+    if (admission_controller := get_admission_controller()) is not None:
+        # Wraps the body-size and vision middlewares, so a shed request costs no body reading or parsing;
+        # metrics and request logging wrap it in turn, so shed requests are still counted and logged.
+        app.add_middleware(AdmissionControlMiddleware, controller=admission_controller)
+    if (metrics := get_metrics()) is not None:
+        # Outside admission control, so shed requests show up as 503s.
+        app.add_middleware(MetricsMiddleware, metrics=metrics)
+    # Outermost, so log records from every layer carry the request ID.
+    app.add_middleware(RequestLoggingMiddleware)
+
+    app.include_router(ai_routes.router)
+
+    logger.info("FastAPI application started successfully")
+    return app
 
-logger.info("FastAPI application started successfully")
 
 if __name__ == "__main__":
+    load_dotenv()
+    config = load_config()
+    setup_logging(config.logging)
     host = config.application.host
     port = config.application.port
 
@@ -62,4 +108,4 @@ if __name__ == "__main__":
     logger.info(f"Health check: http://{host}:{port}/health")
     logger.info(f"Логи сохраняются в файл: {config.logging.file}")
 
-    uvicorn.run("main:app", host=host, port=port, reload=False, log_level="info")
+    uvicorn.run("main:create_app", factory=True, host=host, port=port, reload=False, log_level="info")
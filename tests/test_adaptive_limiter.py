@@ -0,0 +1,154 @@
+import asyncio
+import unittest
+
+from app.domain.exceptions import ProviderOverloadedException, ProviderStatusException
+from app.infrastructure.resilience.adaptive_limiter import AdaptiveLimiter, LimiterRegistry, is_overload_error
+from core.config import ConcurrencyConfig
+
+
+def _limiter(**overrides) -> AdaptiveLimiter:
+    params = {"initial_limit": 2, "min_limit": 1, "max_limit": 8, "max_queue": 2, "queue_timeout": 1.0}
+    params.update(overrides)
+    return AdaptiveLimiter("test", ConcurrencyConfig(**params))
+
+
+class AdaptiveLimiterTests(unittest.IsolatedAsyncioTestCase):
+    async def test_calls_over_limit_wait_for_a_free_slot(self):
+        limiter = _limiter()
+        release = asyncio.Event()
+        order = []
+
+        async def call(index):
+            async with limiter.slot():
+                order.append(index)
+                await release.wait()
+
+        tasks = [asyncio.create_task(call(index)) for index in range(3)]
+        await asyncio.sleep(0)
+        self.assertEqual(limiter.in_flight, 2)
+        self.assertEqual(limiter.queue_depth, 1)
+
+        release.set()
+        await asyncio.gather(*tasks)
+        self.assertEqual(order, [0, 1, 2])
+        self.assertEqual(limiter.in_flight, 0)
+
+    async def test_full_queue_rejects_immediately(self):
+        limiter = _limiter(initial_limit=1, max_queue=1)
+        release = asyncio.Event()
+
+        async def call():
+            async with limiter.slot():
+                await release.wait()
+
+        tasks = [asyncio.create_task(call()) for _ in range(2)]
+        await asyncio.sleep(0)
+
+        with self.assertRaises(ProviderOverloadedException):
+            async with limiter.slot():
+                pass
+        self.assertEqual(limiter.rejected, 1)
+        release.set()
+        await asyncio.gather(*tasks)
+
+    async def test_queue_wait_is_bounded(self):
+        limiter = _limiter(initial_limit=1, queue_timeout=0.01)
+        release = asyncio.Event()
+
+        async def call():
+            async with limiter.slot():
+                await release.wait()
+
+        task = asyncio.create_task(call())
+        await asyncio.sleep(0)
+
+        with self.assertRaises(ProviderOverloadedException):
+            async with limiter.slot():
+                pass
+        self.assertEqual(limiter.queue_depth, 0)
+        release.set()
+        await task
+
+    async def test_overload_shrinks_limit_once_per_window(self):
+        limiter = _limiter(initial_limit=8)
+        release = asyncio.Event()
+
+        async def failing_call():
+            async with limiter.slot():
+                await release.wait()
+                raise ProviderStatusException(429, "rate limited")
+
+        tasks = [asyncio.create_task(failing_call()) for _ in range(4)]
+        await asyncio.sleep(0)
+        release.set()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+        self.assertEqual(limiter.limit, 4)
+        self.assertEqual(limiter.overloads, 4)
+
+    async def test_client_errors_do_not_shrink_limit(self):
+        limiter = _limiter(initial_limit=4)
+
+        with self.assertRaises(ProviderStatusException):
+            async with limiter.slot():
+                raise ProviderStatusException(400, "bad request")
+
+        self.assertEqual(limiter.limit, 4)
+
+    async def test_successful_calls_grow_busy_limit(self):
+        limiter = _limiter(initial_limit=2)
+
+        async def call():
+            async with limiter.slot():
+                await asyncio.sleep(0)
+
+        for _ in range(5):
+            await asyncio.gather(call(), call())
+
+        self.assertGreater(limiter.limit, 2)
+
+    async def test_idle_limit_does_not_grow(self):
+        limiter = _limiter(initial_limit=4)
+
+        for _ in range(10):
+            async with limiter.slot():
+                pass
+
+        self.assertEqual(limiter.limit, 4)
+
+    async def test_cancelled_waiter_does_not_leak_slot(self):
+        limiter = _limiter(initial_limit=1)
+        release = asyncio.Event()
+
+        async def call():
+            async with limiter.slot():
+                await release.wait()
+
+        holder = asyncio.create_task(call())
+        await asyncio.sleep(0)
+        waiter = asyncio.create_task(call())
+        await asyncio.sleep(0)
+        waiter.cancel()
+        await asyncio.gather(waiter, return_exceptions=True)
+        release.set()
+        await holder
+
+        self.assertEqual(limiter.in_flight, 0)
+        self.assertEqual(limiter.queue_depth, 0)
+
+
+class OverloadClassificationTests(unittest.TestCase):
+    def test_rate_limits_and_server_errors_are_overloads(self):
+        self.assertTrue(is_overload_error(ProviderStatusException(429, "")))
+        self.assertTrue(is_overload_error(ProviderStatusException(503, "")))
+        self.assertFalse(is_overload_error(ProviderStatusException(400, "")))
+        self.assertFalse(is_overload_error(ValueError()))
+
+    def test_registry_reports_limiters_by_name(self):
+        registry = LimiterRegistry(ConcurrencyConfig())
+        self.assertIs(registry.get("chat_gpt"), registry.get("chat_gpt"))
+        self.assertEqual(set(registry.stats()), {"chat_gpt"})
+
+
+if __name__ == "__main__":
+    unittest.main()
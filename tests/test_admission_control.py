@@ -0,0 +1,112 @@
+import asyncio
+import time
+import unittest
+
+import httpx
+from fastapi import APIRouter, FastAPI
+
+from app.infrastructure.resilience.admission import AdmissionController, LoopLagMonitor
+from app.presentation.middleware.admission_control import AdmissionControlMiddleware
+from core.config import AdmissionConfig
+
+
+class LoopLagMonitorTests(unittest.IsolatedAsyncioTestCase):
+    async def test_blocking_the_loop_shows_up_as_lag(self):
+        monitor = LoopLagMonitor(interval=0.01)
+        monitor.start()
+        try:
+            await asyncio.sleep(0.03)
+            time.sleep(0.2)
+            await asyncio.sleep(0.02)
+        finally:
+            await monitor.aclose()
+
+        self.assertGreater(monitor.max_lag, 0.1)
+
+    def test_lag_rises_at_once_and_decays_gradually(self):
+        monitor = LoopLagMonitor(interval=0.01)
+
+        monitor.record(0.4)
+        monitor.record(0.0)
+
+        self.assertEqual(monitor.lag, 0.2)
+        self.assertEqual(monitor.max_lag, 0.4)
+
+
+class AdmissionControlTests(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.controller = AdmissionController(AdmissionConfig(
+            max_in_flight=3, endpoint_max_in_flight=2, endpoint_limits={"/slow/{item}": 1}, max_loop_lag=0.5, retry_after=7,
+        ))
+        self.release = asyncio.Event()
+        app = FastAPI()
+
+        @app.get("/slow/{item}")
+        async def slow(item: str):
+            await self.release.wait()
+            return {"item": item}
+
+        @app.get("/health")
+        async def health():
+            return {"status": "ok"}
+
+        app.add_middleware(AdmissionControlMiddleware, controller=self.controller)
+        # Included after the middleware was added, as in main.py.
+        late = APIRouter()
+
+        @late.get("/fast")
+        async def fast():
+            return {}
+
+        app.include_router(late)
+        self.client = httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test")
+
+    async def asyncTearDown(self):
+        self.release.set()
+        await self.client.aclose()
+
+    async def _wait_in_flight(self, count: int):
+        for _ in range(100):
+            if self.controller.stats()["in_flight"] == count:
+                return
+            await asyncio.sleep(0.01)
+        self.fail("requests did not start")
+
+    async def test_endpoint_limit_sheds_with_retry_after(self):
+        first = asyncio.create_task(self.client.get("/slow/a"))
+        await self._wait_in_flight(1)
+
+        shed = await self.client.get("/slow/b")
+        other_endpoint = await self.client.get("/fast")
+        self.release.set()
+        admitted = await first
+
+        self.assertEqual(shed.status_code, 503)
+        self.assertEqual(shed.headers["retry-after"], "7")
+        self.assertEqual(other_endpoint.status_code, 200)
+        self.assertEqual(admitted.json(), {"item": "a"})
+        self.assertEqual(self.controller.stats()["shed"], {"/slow/{item}": {"endpoint_in_flight": 1}})
+        self.assertEqual(self.controller.stats()["in_flight"], 0)
+
+    async def test_loop_lag_sheds_everything_but_exempt_paths(self):
+        self.controller.lag_monitor.record(1.0)
+
+        shed = await self.client.get("/fast")
+        exempt = [await self.client.get(path) for path in ("/health", "/openapi.json", "/docs", "/redoc")]
+
+        self.assertEqual(shed.status_code, 503)
+        self.assertEqual([response.status_code for response in exempt], [200, 200, 200, 200])
+        self.assertEqual(self.controller.stats()["shed_total"], 1)
+
+    def test_global_limit_applies_across_endpoints(self):
+        self.assertIsNone(self.controller.try_acquire("/a"))
+        self.assertIsNone(self.controller.try_acquire("/b"))
+        self.assertIsNone(self.controller.try_acquire("/c"))
+
+        self.assertEqual(self.controller.try_acquire("/d"), "in_flight")
+        self.controller.release("/a")
+        self.assertIsNone(self.controller.try_acquire("/d"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,145 @@
+import asyncio
+import json
+import unittest
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.application.dto import GenerateAIBatchRequestDTO, GenerateAIRequestDTO, MessageDTO
+from app.application.exceptions import NotFoundException, ServiceUnavailableException, ValidationException
+from app.application.services import AIService
+from app.application.use_cases.generate_text_ai_use_case import GenerateTextAIUseCase
+from app.application.use_cases.generate_text_batch_use_case import GenerateTextBatchUseCase
+from app.application.use_cases.generate_vision_ai_use_case import GenerateVisionAIUseCase
+from app.domain.exceptions import AIServiceException
+from app.domain.models import AIAssistant, AIResponse, Role, Usage
+from app.presentation.api.routes import router
+from app.presentation.dependencies import get_ai_service
+from app.presentation.mappers.mappers import to_batch_item_error_schema
+
+USAGE = Usage(prompt_tokens=1, completion_tokens=1, total_tokens=2)
+
+
+class EchoClient:
+    """Answers with the prompt after a delay encoded in it; prompts starting with "fail" raise."""
+
+    def __init__(self):
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def generate(self, messages):
+        prompt = messages[-1].content
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(float(prompt.split(":")[1]) if ":" in prompt else 0)
+        finally:
+            self.in_flight -= 1
+        if prompt.startswith("fail"):
+            raise AIServiceException("upstream failed")
+        return AIResponse(assistant_message=prompt, usage=USAGE)
+
+
+def _item(prompt: str) -> GenerateAIRequestDTO:
+    return GenerateAIRequestDTO(messages=[MessageDTO(role=Role.USER, content=prompt)], assistant=AIAssistant.CHAT_GPT)
+
+
+class GenerateTextBatchUseCaseTests(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.client = EchoClient()
+        self.use_case = GenerateTextBatchUseCase(
+            GenerateTextAIUseCase({AIAssistant.CHAT_GPT: self.client}),
+            max_items=10,
+            max_concurrency=3,
+        )
+
+    async def test_results_are_returned_in_request_order(self):
+        prompts = ["a:0.03", "b:0.01", "fail:0", "c:0"]
+
+        results = await self.use_case.execute(GenerateAIBatchRequestDTO(items=[_item(prompt) for prompt in prompts]))
+
+        self.assertEqual([result.index for result in results], [0, 1, 2, 3])
+        self.assertEqual(results[0].response.assistant_message, "a:0.03")
+        self.assertIsInstance(results[2].error, ServiceUnavailableException)
+
+    async def test_stream_yields_in_completion_order(self):
+        prompts = ["slow:0.05", "fast:0"]
+
+        results = [result async for result in self.use_case.execute_stream(GenerateAIBatchRequestDTO(items=[_item(p) for p in prompts]))]
+
+        self.assertEqual([result.index for result in results], [1, 0])
+
+    async def test_concurrency_is_capped(self):
+        items = [_item("x:0.01") for _ in range(8)]
+
+        await self.use_case.execute(GenerateAIBatchRequestDTO(items=items, max_concurrency=2))
+
+        self.assertEqual(self.client.max_in_flight, 2)
+
+    async def test_concurrency_cannot_exceed_server_limit(self):
+        items = [_item("x:0.01") for _ in range(8)]
+
+        await self.use_case.execute(GenerateAIBatchRequestDTO(items=items, max_concurrency=100))
+
+        self.assertEqual(self.client.max_in_flight, 3)
+
+    async def test_oversized_batch_is_rejected(self):
+        with self.assertRaises(ValidationException):
+            await self.use_case.execute(GenerateAIBatchRequestDTO(items=[_item("x")] * 11))
+
+
+class BatchRouteTests(unittest.TestCase):
+    def setUp(self):
+        text_use_case = GenerateTextAIUseCase({AIAssistant.CHAT_GPT: EchoClient()})
+        ai_service = AIService(
+            generate_text_use_case=text_use_case,
+            generate_vision_use_case=GenerateVisionAIUseCase(vision_client=None),
+            generate_batch_use_case=GenerateTextBatchUseCase(text_use_case, max_items=2),
+        )
+        app = FastAPI()
+        app.include_router(router)
+        app.dependency_overrides[get_ai_service] = lambda: ai_service
+        self.client = TestClient(app)
+
+    @staticmethod
+    def _body(*prompts: str, assistant: str = "chat_gpt") -> dict:
+        return {"items": [{"assistant": assistant, "messages": [{"role": "user", "content": p}]} for p in prompts]}
+
+    def test_batch_reports_per_item_errors(self):
+        response = self.client.post("/generate-ai-response/batch", json=self._body("ok", "fail"))
+
+        self.assertEqual(response.status_code, 200)
+        results = response.json()["results"]
+        self.assertEqual(results[0]["response"]["assistant_message"], "ok")
+        self.assertEqual(results[1]["error"]["status_code"], 502)
+
+    def test_unknown_assistant_is_an_item_error(self):
+        response = self.client.post("/generate-ai-response/batch", json=self._body("ok", assistant="qwen3_235b"))
+
+        self.assertEqual(response.json()["results"][0]["error"]["status_code"], 400)
+
+    def test_oversized_batch_is_a_request_error(self):
+        response = self.client.post("/generate-ai-response/batch", json=self._body("a", "b", "c"))
+
+        self.assertEqual(response.status_code, 400)
+
+    def test_stream_emits_ndjson(self):
+        response = self.client.post("/generate-ai-response/batch/stream", json=self._body("a", "b"))
+
+        self.assertEqual(response.headers["content-type"], "application/x-ndjson")
+        lines = [json.loads(line) for line in response.text.splitlines()]
+        self.assertEqual(sorted(line["index"] for line in lines), [0, 1])
+
+
+class BatchItemErrorTests(unittest.TestCase):
+    def test_item_errors_use_the_single_request_status_codes(self):
+        errors = [ValidationException("bad"), NotFoundException("gone"), ServiceUnavailableException("down"), RuntimeError("boom")]
+
+        schemas = [to_batch_item_error_schema(error) for error in errors]
+
+        self.assertEqual([schema.status_code for schema in schemas], [400, 404, 502, 500])
+        self.assertEqual(schemas[3].detail, "Failed to process batch item request")
+
+
+if __name__ == "__main__":
+    unittest.main()
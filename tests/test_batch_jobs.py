@@ -0,0 +1,268 @@
+import asyncio
+import json
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+import httpx
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from openai import AsyncOpenAI
+
+from app.application.dto import BatchJobRequestDTO, CreateBatchJobDTO, MessageDTO
+from app.application.exceptions import NotFoundException, ValidationException
+from app.application.services import BatchJobService
+from app.application.use_cases.batch_jobs_use_case import BatchJobsUseCase
+from app.composition.container import build_batch_providers
+from app.domain.models import AIAssistant, AIResponse, BatchJobStatus, BatchRequest, Message, Role, Usage
+from app.infrastructure.batch.local_batch_provider import LocalBatchProvider
+from app.infrastructure.batch.openai_batch_provider import OpenAIBatchProvider
+from app.infrastructure.batch.sqlite_job_store import SqliteBatchJobStore
+from app.presentation.api.routes import router
+from app.presentation.dependencies import get_batch_job_service
+
+USAGE = Usage(prompt_tokens=1, completion_tokens=1, total_tokens=2)
+
+
+class EchoClient:
+    """Echoes the prompt; prompts starting with "fail" raise, and ``gate`` holds every call until set."""
+
+    def __init__(self):
+        self.gate = asyncio.Event()
+        self.gate.set()
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def generate(self, messages):
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await self.gate.wait()
+            await asyncio.sleep(0)
+        finally:
+            self.in_flight -= 1
+        prompt = messages[-1].content
+        if prompt.startswith("fail"):
+            raise RuntimeError("upstream failed")
+        return AIResponse(assistant_message=prompt, usage=USAGE)
+
+
+def _request(prompt: str, custom_id: str | None = None) -> BatchJobRequestDTO:
+    return BatchJobRequestDTO(custom_id=custom_id, messages=[MessageDTO(role=Role.USER, content=prompt)])
+
+
+class BatchJobsUseCaseTests(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.store = SqliteBatchJobStore(os.path.join(self.tmp.name, "jobs.sqlite3"))
+        self.client = EchoClient()
+        self.provider = LocalBatchProvider(self.client, concurrency=2)
+        self.use_case = BatchJobsUseCase({AIAssistant.CHAT_GPT: self.provider}, self.store, max_requests=5)
+
+    async def asyncTearDown(self):
+        await self.provider.aclose()
+        await self.store.aclose()
+        self.tmp.cleanup()
+
+    async def _wait_terminal(self, job_id: str):
+        for _ in range(100):
+            job = await self.use_case.get(job_id)
+            if job.status.is_terminal:
+                return job
+            await asyncio.sleep(0.01)
+        self.fail("batch job did not finish")
+
+    async def test_job_runs_to_completion_and_returns_results(self):
+        job = await self.use_case.create(
+            CreateBatchJobDTO(assistant=AIAssistant.CHAT_GPT, requests=[_request("a", "first"), _request("fail"), _request("c")])
+        )
+        self.assertEqual(job.request_count, 3)
+
+        job = await self._wait_terminal(job.id)
+        results = [result async for result in await self.use_case.results(job.id)]
+
+        self.assertEqual(job.status, BatchJobStatus.COMPLETED)
+        self.assertEqual((job.completed_count, job.failed_count), (2, 1))
+        self.assertEqual([result.custom_id for result in results], ["first", "1", "2"])
+        self.assertEqual(results[0].response.assistant_message, "a")
+        self.assertIn("upstream failed", results[1].error)
+
+    async def test_job_survives_a_new_store_instance(self):
+        job = await self.use_case.create(CreateBatchJobDTO(assistant=AIAssistant.CHAT_GPT, requests=[_request("a")]))
+        await self._wait_terminal(job.id)
+
+        reopened = SqliteBatchJobStore(self.store._path)
+        try:
+            stored = await reopened.get(job.id)
+        finally:
+            await reopened.aclose()
+
+        self.assertEqual(stored.status, BatchJobStatus.COMPLETED)
+        self.assertTrue(stored.provider_batch_id.startswith("local_batch_"))
+
+    async def test_running_local_job_expires_after_a_restart(self):
+        self.client.gate.clear()
+        job = await self.use_case.create(CreateBatchJobDTO(assistant=AIAssistant.CHAT_GPT, requests=[_request("a")]))
+        restarted = BatchJobsUseCase({AIAssistant.CHAT_GPT: LocalBatchProvider(EchoClient())}, self.store)
+
+        expired = await restarted.get(job.id)
+        results = [result async for result in await restarted.results(job.id)]
+
+        self.assertEqual(expired.status, BatchJobStatus.EXPIRED)
+        self.assertIn("restarted", expired.error)
+        self.assertEqual(results, [])
+        self.client.gate.set()
+
+    async def test_local_results_are_dropped_after_their_ttl(self):
+        provider = LocalBatchProvider(self.client, concurrency=2, result_ttl=0)
+        requests = [BatchRequest(custom_id=str(index), messages=[Message(role=Role.USER, content="a")]) for index in range(5)]
+        batch_id = await provider.submit(requests)
+        await provider._batches[batch_id].task
+
+        state = await provider.get_state(batch_id)
+
+        self.assertEqual(state.status, BatchJobStatus.EXPIRED)
+        self.assertEqual([result async for result in provider.get_results(batch_id)], [])
+        self.assertEqual(provider._batches, {})
+        self.assertEqual(self.client.max_in_flight, 2)
+
+    async def test_local_providers_use_the_configured_text_clients(self):
+        config = mock.Mock()
+        config.batch_jobs.provider = "local"
+        config.batch_jobs.local_concurrency = 2
+        config.batch_jobs.local_result_ttl = 60.0
+        clients = {AIAssistant.CHAT_GPT: self.client, AIAssistant.YANDEX_GPT: EchoClient()}
+
+        providers = build_batch_providers(config, upstreams=None, text_clients=clients)
+
+        self.assertEqual(set(providers), set(clients))
+        self.assertIs(providers[AIAssistant.YANDEX_GPT]._client, clients[AIAssistant.YANDEX_GPT])
+
+    async def test_results_of_unfinished_job_are_rejected(self):
+        self.client.gate.clear()
+        job = await self.use_case.create(CreateBatchJobDTO(assistant=AIAssistant.CHAT_GPT, requests=[_request("a")]))
+
+        with self.assertRaises(ValidationException):
+            await self.use_case.results(job.id)
+
+        cancelled = await self.use_case.cancel(job.id)
+        self.assertEqual(cancelled.status, BatchJobStatus.CANCELLED)
+
+    async def test_invalid_jobs_are_rejected(self):
+        with self.assertRaises(ValidationException):
+            await self.use_case.create(CreateBatchJobDTO(assistant=AIAssistant.YANDEX_GPT, requests=[_request("a")]))
+        with self.assertRaises(ValidationException):
+            await self.use_case.create(
+                CreateBatchJobDTO(assistant=AIAssistant.CHAT_GPT, requests=[_request("a", "x"), _request("b", "x")])
+            )
+        with self.assertRaises(ValidationException):
+            await self.use_case.create(CreateBatchJobDTO(assistant=AIAssistant.CHAT_GPT, requests=[_request("a")] * 6))
+        with self.assertRaises(NotFoundException):
+            await self.use_case.get("job_missing")
+
+
+class OpenAIBatchProviderTests(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.uploaded = None
+        output = [
+            {"custom_id": "a", "response": {"status_code": 200, "body": {
+                "choices": [{"message": {"content": "hello"}}],
+                "usage": {"prompt_tokens": 3, "completion_tokens": 2, "total_tokens": 5},
+            }}},
+            {"custom_id": "b", "response": {"status_code": 400, "body": {"error": {"message": "bad request"}}}},
+        ]
+        batch = {
+            "id": "batch_1",
+            "object": "batch",
+            "endpoint": "/v1/chat/completions",
+            "input_file_id": "file_in",
+            "completion_window": "24h",
+            "created_at": 0,
+            "status": "completed",
+            "output_file_id": "file_out",
+            "request_counts": {"total": 2, "completed": 1, "failed": 1},
+        }
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            if request.url.path == "/v1/files":
+                self.uploaded = request.content
+                return httpx.Response(200, json={
+                    "id": "file_in", "object": "file", "bytes": 1, "created_at": 0,
+                    "filename": "batch.jsonl", "purpose": "batch", "status": "processed",
+                })
+            if request.url.path == "/v1/batches":
+                self.batch_request = json.loads(request.content)
+                return httpx.Response(200, json={**batch, "status": "validating"})
+            if request.url.path == "/v1/batches/batch_1":
+                return httpx.Response(200, json=batch)
+            if request.url.path == "/v1/files/file_out/content":
+                return httpx.Response(200, content="\n".join(json.dumps(line) for line in output).encode())
+            return httpx.Response(404, json={"error": {"message": "not found"}})
+
+        self.http = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        client = AsyncOpenAI(api_key="test", base_url="https://api.openai.test/v1", http_client=self.http)
+        self.provider = OpenAIBatchProvider(client, model="gpt-test")
+
+    async def asyncTearDown(self):
+        await self.http.aclose()
+
+    async def test_submit_uploads_jsonl_and_creates_batch(self):
+        batch_id = await self.provider.submit([BatchRequest(custom_id="a", messages=[Message(role=Role.USER, content="hi")])])
+
+        self.assertEqual(batch_id, "batch_1")
+        self.assertEqual(self.batch_request["input_file_id"], "file_in")
+        self.assertEqual(self.batch_request["endpoint"], "/v1/chat/completions")
+        self.assertIn(b'"custom_id": "a"', self.uploaded)
+        self.assertIn(b'"model": "gpt-test"', self.uploaded)
+
+    async def test_state_and_results_are_mapped(self):
+        state = await self.provider.get_state("batch_1")
+        results = [result async for result in self.provider.get_results("batch_1")]
+
+        self.assertEqual((state.status, state.completed, state.failed), (BatchJobStatus.COMPLETED, 1, 1))
+        self.assertEqual(results[0].response.assistant_message, "hello")
+        self.assertEqual(results[0].response.usage.total_tokens, 5)
+        self.assertEqual(results[1].error, "bad request")
+
+
+class BatchJobRoutesTests(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.store = SqliteBatchJobStore(os.path.join(self.tmp.name, "jobs.sqlite3"))
+        self.provider = LocalBatchProvider(EchoClient())
+        service = BatchJobService(BatchJobsUseCase({AIAssistant.CHAT_GPT: self.provider}, self.store))
+        app = FastAPI()
+        app.include_router(router)
+        app.dependency_overrides[get_batch_job_service] = lambda: service
+        self.client = TestClient(app)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_job_lifecycle(self):
+        with self.client:
+            response = self.client.post("/batch-jobs", json={
+                "assistant": "chat_gpt",
+                "requests": [{"custom_id": "x", "messages": [{"role": "user", "content": "hi"}]}],
+            })
+            self.assertEqual(response.status_code, 202)
+            job_id = response.json()["id"]
+
+            for _ in range(100):
+                job = self.client.get(f"/batch-jobs/{job_id}").json()
+                if job["status"] == "completed":
+                    break
+            self.assertEqual(job["status"], "completed")
+
+            results = self.client.get(f"/batch-jobs/{job_id}/results")
+            lines = [json.loads(line) for line in results.text.splitlines()]
+
+            self.assertEqual(results.headers["content-type"], "application/x-ndjson")
+            self.assertEqual(lines[0]["custom_id"], "x")
+            self.assertEqual(lines[0]["response"]["assistant_message"], "hi")
+            self.assertEqual(self.client.get("/batch-jobs/job_missing").status_code, 404)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,129 @@
+import asyncio
+import json
+import os
+import tempfile
+import unittest
+
+from app.application.dto import AIResponseDTO, UsageDTO
+from app.application.exceptions import ServiceUnavailableException
+from app.batch.checkpoint import Checkpoint
+from app.batch.runner import BatchRunner
+
+
+class FakeAIService:
+    def __init__(self, hang_on: set[str] = frozenset()):
+        self.hang_on = hang_on
+        self.calls: list[str] = []
+
+    async def generate_ai_response(self, request):
+        prompt = request.messages[-1].content
+        self.calls.append(prompt)
+        if prompt in self.hang_on:
+            await asyncio.Event().wait()
+        if prompt == "fail":
+            raise ServiceUnavailableException("upstream down")
+        await asyncio.sleep(0)
+        return AIResponseDTO(assistant_message=prompt.upper(), usage=UsageDTO(1, 2, 3), served_by="chat_gpt")
+
+
+def _line(prompt: str, **extra) -> str:
+    return json.dumps({"assistant": "chat_gpt", "messages": [{"role": "user", "content": prompt}], **extra})
+
+
+class BatchRunnerTests(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self._dir = tempfile.TemporaryDirectory()
+        self.input_path = os.path.join(self._dir.name, "in.jsonl")
+        self.output_path = os.path.join(self._dir.name, "out.jsonl")
+
+    def tearDown(self):
+        self._dir.cleanup()
+
+    def _write_input(self, lines: list[str]) -> None:
+        with open(self.input_path, "w", encoding="utf-8") as file:
+            file.write("\n".join(lines) + "\n")
+
+    def _read_output(self) -> list[dict]:
+        with open(self.output_path, encoding="utf-8") as file:
+            return [json.loads(line) for line in file]
+
+    @staticmethod
+    def _runner(service, **kwargs) -> BatchRunner:
+        return BatchRunner(service, report=lambda message: None, **kwargs)
+
+    async def test_writes_one_result_per_line(self):
+        self._write_input([_line("a", id="first"), "not json", _line("fail"), "", _line("b")])
+
+        progress = await self._runner(FakeAIService(), concurrency=2).run(self.input_path, self.output_path)
+
+        results = {result["line"]: result for result in self._read_output()}
+        self.assertEqual(sorted(results), [0, 1, 2, 4])
+        self.assertEqual(results[0]["id"], "first")
+        self.assertEqual(results[0]["response"]["assistant_message"], "A")
+        self.assertEqual(results[1]["error"]["status_code"], 400)
+        self.assertEqual(results[2]["error"]["status_code"], 502)
+        self.assertEqual((progress.done, progress.failed, progress.tokens), (5, 2, 6))
+        self.assertFalse(os.path.exists(f"{self.output_path}.checkpoint"))
+
+    async def test_resumes_after_interruption_without_duplicates(self):
+        prompts = [f"p{index}" for index in range(20)]
+        self._write_input([_line(prompt) for prompt in prompts])
+
+        stuck = FakeAIService(hang_on={"p3"})
+        run = asyncio.create_task(
+            self._runner(stuck, concurrency=4, window=8, checkpoint_interval=0).run(self.input_path, self.output_path)
+        )
+        checkpoint_path = f"{self.output_path}.checkpoint"
+        # Wait for the window to fill: p3 hangs, so lines 4 to 2 + 8 finish and nothing past them starts.
+        for _ in range(500):
+            checkpoint = Checkpoint.load(checkpoint_path)
+            if checkpoint is not None and len(checkpoint.completed) == 7:
+                break
+            await asyncio.sleep(0.01)
+        run.cancel()
+        with self.assertRaises(asyncio.CancelledError):
+            await run
+
+        checkpoint = Checkpoint.load(checkpoint_path)
+        self.assertEqual(checkpoint.watermark, 2)
+        self.assertLessEqual(max(checkpoint.completed), 2 + 8)
+
+        resumed = FakeAIService()
+        await self._runner(resumed, concurrency=4).run(self.input_path, self.output_path)
+
+        lines = sorted(result["line"] for result in self._read_output())
+        self.assertEqual(lines, list(range(20)))
+        self.assertNotIn("p0", resumed.calls)
+        self.assertIn("p3", resumed.calls)
+
+    async def test_counts_a_last_line_without_trailing_newline(self):
+        with open(self.input_path, "w", encoding="utf-8") as file:
+            file.write(_line("a") + "\n" + _line("b"))
+
+        progress = await self._runner(FakeAIService()).run(self.input_path, self.output_path)
+
+        self.assertEqual((progress.total, progress.done), (2, 2))
+        self.assertEqual(sorted(result["line"] for result in self._read_output()), [0, 1])
+
+    async def test_per_assistant_limit(self):
+        self._write_input([_line(f"p{index}") for index in range(10)])
+        in_flight = max_in_flight = 0
+
+        class CountingService(FakeAIService):
+            async def generate_ai_response(self, request):
+                nonlocal in_flight, max_in_flight
+                in_flight += 1
+                max_in_flight = max(max_in_flight, in_flight)
+                try:
+                    await asyncio.sleep(0.001)
+                    return await super().generate_ai_response(request)
+                finally:
+                    in_flight -= 1
+
+        await self._runner(CountingService(), concurrency=8, assistant_limits={"chat_gpt": 2}).run(self.input_path, self.output_path)
+
+        self.assertEqual(max_in_flight, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
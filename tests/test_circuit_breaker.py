@@ -0,0 +1,133 @@
+import unittest
+from unittest.mock import patch
+
+from app.domain.exceptions import CircuitOpenException, ProviderOverloadedException, ProviderStatusException
+from app.domain.models import AIResponse, AIResponseChunk, Usage
+from app.infrastructure.resilience.circuit_breaker import (
+    CircuitBreaker,
+    CircuitBreakerClient,
+    CircuitBreakerRegistry,
+    CircuitState,
+)
+from core.config import CircuitBreakerConfig
+
+RESPONSE = AIResponse(assistant_message="ok", usage=Usage(prompt_tokens=1, completion_tokens=1, total_tokens=2))
+
+
+class FlakyClient:
+    def __init__(self):
+        self.error: Exception | None = None
+        self.calls = 0
+
+    async def generate(self, messages):
+        self.calls += 1
+        if self.error is not None:
+            raise self.error
+        return RESPONSE
+
+    async def generate_stream(self, messages):
+        self.calls += 1
+        if self.error is not None:
+            raise self.error
+        yield AIResponseChunk(delta="ok")
+
+
+def _breaker(**overrides) -> CircuitBreaker:
+    params = {"failure_threshold": 2, "reset_timeout": 10.0, "half_open_max_calls": 1}
+    params.update(overrides)
+    return CircuitBreaker("test", CircuitBreakerConfig(**params))
+
+
+class CircuitBreakerTests(unittest.IsolatedAsyncioTestCase):
+    async def test_opens_after_consecutive_failures_and_fails_fast(self):
+        upstream = FlakyClient()
+        upstream.error = ProviderStatusException(503, "unavailable")
+        client = CircuitBreakerClient(upstream, _breaker())
+
+        for _ in range(2):
+            with self.assertRaises(ProviderStatusException):
+                await client.generate([])
+        with self.assertRaises(CircuitOpenException):
+            await client.generate([])
+
+        self.assertEqual(client.breaker.state, CircuitState.OPEN)
+        self.assertEqual(upstream.calls, 2)
+
+    async def test_client_errors_and_local_rejections_do_not_trip(self):
+        upstream = FlakyClient()
+        client = CircuitBreakerClient(upstream, _breaker())
+
+        for error in (ProviderStatusException(400, "bad"), ProviderOverloadedException("queue full"), ProviderStatusException(422, "bad")):
+            upstream.error = error
+            with self.assertRaises(type(error)):
+                await client.generate([])
+
+        self.assertEqual(client.breaker.state, CircuitState.CLOSED)
+
+    async def test_successful_probe_closes_circuit(self):
+        upstream = FlakyClient()
+        upstream.error = TimeoutError()
+        client = CircuitBreakerClient(upstream, _breaker())
+        with patch("app.infrastructure.resilience.circuit_breaker.time.monotonic", return_value=100.0):
+            for _ in range(2):
+                with self.assertRaises(TimeoutError):
+                    await client.generate([])
+
+        upstream.error = None
+        with patch("app.infrastructure.resilience.circuit_breaker.time.monotonic", return_value=111.0):
+            self.assertEqual(await client.generate([]), RESPONSE)
+
+        self.assertEqual(client.breaker.state, CircuitState.CLOSED)
+
+    async def test_failed_probe_reopens_circuit(self):
+        upstream = FlakyClient()
+        upstream.error = TimeoutError()
+        client = CircuitBreakerClient(upstream, _breaker())
+        with patch("app.infrastructure.resilience.circuit_breaker.time.monotonic", return_value=100.0):
+            for _ in range(2):
+                with self.assertRaises(TimeoutError):
+                    await client.generate([])
+
+        with patch("app.infrastructure.resilience.circuit_breaker.time.monotonic", return_value=111.0):
+            with self.assertRaises(TimeoutError):
+                await client.generate([])
+            with self.assertRaises(CircuitOpenException):
+                await client.generate([])
+
+        self.assertEqual(client.breaker.opened, 2)
+
+    async def test_half_open_admits_limited_probes(self):
+        breaker = _breaker(failure_threshold=1)
+        breaker.on_failure(TimeoutError())
+        breaker._opened_at -= 20
+
+        breaker.before_call()
+        self.assertEqual(breaker.state, CircuitState.HALF_OPEN)
+        with self.assertRaises(CircuitOpenException):
+            breaker.before_call()
+
+        breaker.on_abandoned()
+        breaker.before_call()
+
+    async def test_stream_failures_count(self):
+        upstream = FlakyClient()
+        upstream.error = ProviderStatusException(500, "boom")
+        client = CircuitBreakerClient(upstream, _breaker(failure_threshold=1))
+
+        with self.assertRaises(ProviderStatusException):
+            async for _ in client.generate_stream([]):
+                pass
+
+        self.assertEqual(client.breaker.state, CircuitState.OPEN)
+
+    def test_registry_shares_breaker_per_name(self):
+        registry = CircuitBreakerRegistry(CircuitBreakerConfig())
+        first = registry.wrap("chat_gpt", FlakyClient())
+        second = registry.wrap("chat_gpt", FlakyClient())
+
+        self.assertIs(first.breaker, second.breaker)
+        self.assertEqual(registry.stats()["chat_gpt"]["state"], "closed")
+
+
+if __name__ == "__main__":
+    unittest.main()
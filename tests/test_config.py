@@ -43,6 +43,9 @@ class EnvConfigProviderTests(unittest.TestCase):
         self.assertEqual(config.application.port, 9000)
         self.assertEqual(config.open_ai.model, "gpt-4")
         self.assertEqual(config.logging.level, "INFO")
+        self.assertFalse(config.stats.enabled)
+        self.assertFalse(config.metrics.enabled)
+        self.assertFalse(config.image_preprocessing.enabled)
 
     def test_validator_raises_on_missing_required_keys(self) -> None:
         env = {**FULL_ENV}
@@ -52,6 +55,33 @@ class EnvConfigProviderTests(unittest.TestCase):
         with self.assertRaises(ConfigurationException):
             provider.get_config()
 
+    def test_hedging_alternates_are_parsed_and_checked(self) -> None:
+        env = {**FULL_ENV, "HEDGING_ALTERNATES": " qwen3_235b = gpt_oss_120b "}
+        config = EnvConfigProvider(FakeConfigSource(env), AppConfigValidator()).get_config()
+
+        self.assertEqual(config.hedging.alternates, {"qwen3_235b": "gpt_oss_120b"})
+        for value in ("qwen3_235b", "qwen3_235b=gpt5", "auto=chat_gpt"):
+            provider = EnvConfigProvider(FakeConfigSource({**FULL_ENV, "HEDGING_ALTERNATES": value}), AppConfigValidator())
+            with self.assertRaisesRegex(ConfigurationException, f"HEDGING_ALTERNATES: invalid item '{value}'"):
+                provider.get_config()
+
+
+    def test_malformed_pairs_name_the_variable(self) -> None:
+        env = {**FULL_ENV, "TENANT_WEIGHTS": "ui=4, enrichment=1", "TENANT_API_KEYS": "a2V5==ui"}
+        config = EnvConfigProvider(FakeConfigSource(env), AppConfigValidator()).get_config()
+
+        self.assertEqual(config.concurrency.tenant_weights, {"ui": 4.0, "enrichment": 1.0})
+        self.assertEqual(config.tenancy.api_key_tenants, {"a2V5=": "ui"})
+        cases = [
+            ("TENANT_WEIGHTS", "ui", "TENANT_WEIGHTS: invalid item 'ui'"),
+            ("TENANT_WEIGHTS", "ui=heavy", "TENANT_WEIGHTS: invalid value 'heavy' for 'ui', expected float"),
+            ("CONTEXT_WINDOWS", "chat_gpt=1.5", "CONTEXT_WINDOWS: invalid value '1.5' for 'chat_gpt', expected int"),
+        ]
+        for key, value, message in cases:
+            provider = EnvConfigProvider(FakeConfigSource({**FULL_ENV, key: value}), AppConfigValidator())
+            with self.assertRaisesRegex(ConfigurationException, message):
+                provider.get_config()
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,124 @@
+import asyncio
+import unittest
+
+from app.domain.models import AIAssistant, AIResponse, Usage
+from app.infrastructure.resilience.hedging import HedgedTextClient, HedgingRegistry
+from core.config import HedgingConfig
+
+USAGE = Usage(prompt_tokens=1, completion_tokens=1, total_tokens=2)
+
+
+class ScriptedClient:
+    """Answers each call after the next scripted delay, or raises if the script entry is an exception."""
+
+    def __init__(self, name: str, script: list):
+        self.name = name
+        self._script = list(script)
+        self.calls = 0
+        self.cancelled = 0
+
+    async def generate(self, messages):
+        self.calls += 1
+        step = self._script.pop(0) if self._script else 0
+        try:
+            if isinstance(step, Exception):
+                raise step
+            await asyncio.sleep(step)
+        except asyncio.CancelledError:
+            self.cancelled += 1
+            raise
+        return AIResponse(assistant_message=self.name, usage=USAGE)
+
+    async def generate_stream(self, messages):
+        yield
+
+
+def _config(**overrides) -> HedgingConfig:
+    params = {"assistants": ["qwen3_235b"], "percentile": 50.0, "budget_ratio": 1.0, "min_samples": 3}
+    params.update(overrides)
+    return HedgingConfig(**params)
+
+
+async def _warm_up(client: HedgedTextClient, count: int) -> None:
+    for _ in range(count):
+        await client.generate([])
+
+
+class HedgedTextClientTests(unittest.IsolatedAsyncioTestCase):
+    async def test_no_hedge_until_enough_samples(self):
+        primary = ScriptedClient("primary", [0.01, 0.01])
+        client = HedgedTextClient("qwen3_235b", primary, _config())
+
+        await _warm_up(client, 2)
+
+        self.assertIsNone(client.hedge_delay())
+        self.assertEqual(client.hedges, 0)
+
+    async def test_slow_primary_is_hedged_and_loser_cancelled(self):
+        primary = ScriptedClient("primary", [0, 0, 0, 1.0])
+        alternate = ScriptedClient("alternate", [0])
+        client = HedgedTextClient("qwen3_235b", primary, _config(), alternate=alternate)
+        await _warm_up(client, 3)
+
+        response = await client.generate([])
+
+        self.assertEqual(response.assistant_message, "alternate")
+        self.assertEqual((client.hedges, client.hedge_wins), (1, 1))
+        await asyncio.sleep(0)
+        self.assertEqual(primary.cancelled, 1)
+
+    async def test_primary_can_still_win_after_hedge(self):
+        primary = ScriptedClient("primary", [0, 0, 0, 0.05])
+        alternate = ScriptedClient("alternate", [1.0])
+        client = HedgedTextClient("qwen3_235b", primary, _config(), alternate=alternate)
+        await _warm_up(client, 3)
+
+        response = await client.generate([])
+
+        self.assertEqual(response.assistant_message, "primary")
+        self.assertEqual((client.hedges, client.hedge_wins), (1, 0))
+
+    async def test_failed_primary_falls_back_to_hedge(self):
+        primary = ScriptedClient("primary", [0, 0, 0, 0.05])
+        alternate = ScriptedClient("alternate", [RuntimeError("down")])
+        client = HedgedTextClient("qwen3_235b", primary, _config(), alternate=alternate)
+        await _warm_up(client, 3)
+
+        response = await client.generate([])
+
+        self.assertEqual(response.assistant_message, "primary")
+
+    async def test_primary_error_is_raised_when_both_fail(self):
+        primary = ScriptedClient("primary", [0, 0, 0, RuntimeError("primary")])
+        client = HedgedTextClient("qwen3_235b", primary, _config())
+        await _warm_up(client, 3)
+
+        with self.assertRaisesRegex(RuntimeError, "primary"):
+            await client.generate([])
+
+    async def test_budget_caps_extra_requests(self):
+        primary = ScriptedClient("primary", [0] * 9 + [0.05] * 5)
+        client = HedgedTextClient("qwen3_235b", primary, _config(budget_ratio=0.1))
+        await _warm_up(client, 9)
+
+        await _warm_up(client, 4)
+
+        self.assertEqual(client.hedges, 1)
+        self.assertEqual(client.budget_exhausted, 3)
+
+
+class HedgingRegistryTests(unittest.TestCase):
+    def test_wraps_only_configured_assistants(self):
+        qwen = ScriptedClient("qwen", [])
+        oss = ScriptedClient("oss", [])
+        registry = HedgingRegistry(_config(alternates={"qwen3_235b": "gpt_oss_120b"}))
+
+        clients = registry.wrap({AIAssistant.QWEN3_235B: qwen, AIAssistant.GPT_OSS_120B: oss})
+
+        self.assertIsInstance(clients[AIAssistant.QWEN3_235B], HedgedTextClient)
+        self.assertIs(clients[AIAssistant.GPT_OSS_120B], oss)
+        self.assertEqual(set(registry.stats()), {"qwen3_235b"})
+
+
+if __name__ == "__main__":
+    unittest.main()
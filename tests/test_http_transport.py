@@ -0,0 +1,100 @@
+import asyncio
+import socket
+import unittest
+from unittest import mock
+
+import httpx
+
+from app.infrastructure.http.transport import CachingDNSBackend, HttpTransport, PooledHTTPTransport
+from app.infrastructure.http.upstream_registry import UpstreamRegistry
+from core.config import HttpConfig
+
+
+class RecordingBackend:
+    def __init__(self) -> None:
+        self.connected_to: list[str] = []
+
+    async def connect_tcp(self, host, port, timeout=None, local_address=None, socket_options=None):
+        self.connected_to.append(host)
+        return object()
+
+
+class CachingDNSBackendTests(unittest.IsolatedAsyncioTestCase):
+    async def test_resolves_host_once_within_ttl(self) -> None:
+        inner = RecordingBackend()
+        backend = CachingDNSBackend(ttl=60, backend=inner)
+        lookups = []
+
+        async def fake_getaddrinfo(host, port, **kwargs):
+            lookups.append(host)
+            return [(socket.AF_INET, socket.SOCK_STREAM, 6, "", ("10.0.0.1", port))]
+
+        with mock.patch.object(asyncio.get_running_loop(), "getaddrinfo", fake_getaddrinfo):
+            await backend.connect_tcp("api.example.com", 443)
+            await backend.connect_tcp("api.example.com", 443)
+
+        self.assertEqual(lookups, ["api.example.com"])
+        self.assertEqual(inner.connected_to, ["10.0.0.1", "10.0.0.1"])
+
+    async def test_ip_literal_is_not_resolved(self) -> None:
+        inner = RecordingBackend()
+        backend = CachingDNSBackend(ttl=60, backend=inner)
+
+        await backend.connect_tcp("127.0.0.1", 80)
+
+        self.assertEqual(inner.connected_to, ["127.0.0.1"])
+        self.assertEqual(backend._cache, {})
+
+
+class HttpTransportTests(unittest.IsolatedAsyncioTestCase):
+    async def test_client_is_shared_until_closed(self) -> None:
+        transport = HttpTransport(HttpConfig())
+
+        first = transport.client
+        second = transport.client
+        await transport.aclose()
+
+        self.assertIs(first, second)
+        self.assertTrue(first.is_closed)
+        self.assertIsNot(transport.client, first)
+        await transport.aclose()
+
+    async def test_pooled_transport_swaps_in_a_dns_caching_pool(self) -> None:
+        limits = httpx.Limits(max_connections=7, max_keepalive_connections=3)
+
+        cached = PooledHTTPTransport(limits=limits, http2=False, dns_cache_ttl=60)
+        uncached = PooledHTTPTransport(limits=limits, http2=False, dns_cache_ttl=0)
+
+        self.assertIsInstance(cached._pool._network_backend, CachingDNSBackend)
+        self.assertNotIsInstance(uncached._pool._network_backend, CachingDNSBackend)
+        self.assertEqual(cached.pool_stats(), {"connections": 0, "active": 0, "idle": 0})
+        for transport in (cached, uncached):
+            self.assertEqual(transport._pool._max_connections, 7)
+            await transport.aclose()
+
+
+class UpstreamRegistryTests(unittest.IsolatedAsyncioTestCase):
+    async def test_clients_for_same_upstream_share_one_pool(self) -> None:
+        registry = UpstreamRegistry(HttpConfig())
+
+        first = registry.openai_client("yandex_open_ai", api_key="key", base_url="https://llm.example/v1")
+        second = registry.openai_client("yandex_open_ai", api_key="key", base_url="https://llm.example/v1/")
+        other = registry.openai_client("yandex_open_ai", api_key="other", base_url="https://llm.example/v1")
+
+        self.assertIs(first, second)
+        self.assertIsNot(first, other)
+        self.assertEqual(len(registry.stats()), 2)
+        await registry.aclose()
+
+    async def test_uses_per_upstream_config(self) -> None:
+        registry = UpstreamRegistry(HttpConfig(), {"yandex_gpt": HttpConfig(max_connections=7)})
+
+        transport = registry.http_transport("yandex_gpt", "https://llm.example/foundationModels/v1")
+
+        self.assertEqual(transport.config.max_connections, 7)
+        self.assertEqual(registry.stats()["yandex_gpt"]["max_connections"], 7)
+        await registry.aclose()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,171 @@
+import asyncio
+import base64
+import io
+import os
+import runpy
+import unittest
+from unittest import mock
+
+from PIL import Image
+
+from app.application.dto import AIMessageDTO, GenerateVisionAIRequestDTO, ImageContentItemDTO, TextContentItemDTO
+from app.application.exceptions import ValidationException
+from app.application.interfaces.image_preprocessor import PreprocessedImage
+from app.application.use_cases.generate_vision_ai_use_case import GenerateVisionAIUseCase
+from app.domain.exceptions import InvalidImageException
+from app.domain.models import AIResponse, Role, Usage
+from app.infrastructure.images.pillow_preprocessor import PillowImagePreprocessor, estimate_image_tokens
+from core.config import ImagePreprocessingConfig
+
+
+def _data_url(image: Image.Image, image_format: str = "JPEG", **params) -> str:
+    buffer = io.BytesIO()
+    image.save(buffer, format=image_format, **params)
+    return f"data:image/{image_format.lower()};base64,{base64.b64encode(buffer.getvalue()).decode()}"
+
+
+def _decode(data_url: str) -> Image.Image:
+    return Image.open(io.BytesIO(base64.b64decode(data_url.partition(",")[2])))
+
+
+def _photo(width: int, height: int) -> Image.Image:
+    # A gradient compresses like a photo rather than like a flat fill.
+    return Image.linear_gradient("L").resize((width, height)).convert("RGB")
+
+
+class EstimateImageTokensTests(unittest.TestCase):
+    def test_matches_provider_pricing_examples(self):
+        self.assertEqual(estimate_image_tokens(1024, 1024), 765)
+        self.assertEqual(estimate_image_tokens(2048, 4096), 1105)
+        self.assertEqual(estimate_image_tokens(4000, 3000), estimate_image_tokens(1024, 768))
+
+
+class PillowImagePreprocessorTests(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.preprocessor = PillowImagePreprocessor(ImagePreprocessingConfig(max_side=1024, max_short_side=512, workers=1))
+
+    async def asyncTearDown(self):
+        await self.preprocessor.aclose()
+
+    async def test_large_image_is_downscaled_and_stripped(self):
+        exif = Image.Exif()
+        exif[0x0112] = 6  # rotated 90 degrees: stored landscape, displayed portrait
+        exif[0x010F] = "Camera maker"
+        original = _data_url(_photo(3000, 2000), quality=95, exif=exif)
+
+        result = await self.preprocessor.preprocess(original)
+        image = _decode(result.image_base64)
+
+        self.assertEqual(image.size, (512, 768))
+        self.assertEqual(len(image.getexif()), 0)
+        self.assertTrue(result.image_base64.startswith("data:image/jpeg;base64,"))
+        self.assertLess(result.bytes, result.original_bytes)
+        self.assertLess(result.tokens, result.original_tokens)
+        self.assertEqual(self.preprocessor.stats()["bytes_saved"], result.original_bytes - result.bytes)
+
+    async def test_small_image_is_kept_when_reencoding_does_not_help(self):
+        original = _data_url(Image.effect_noise((64, 64), 64).convert("RGB"), quality=10)
+
+        result = await self.preprocessor.preprocess(original)
+
+        self.assertEqual(result.image_base64, original)
+        self.assertEqual(result.bytes, result.original_bytes)
+
+    async def test_small_image_with_metadata_is_stripped_even_if_larger(self):
+        exif = Image.Exif()
+        exif[0x010F] = "Camera maker"
+        exif[0x8825] = {1: "N", 2: (55.0, 45.0, 0.0)}  # GPS position
+        original = _data_url(Image.effect_noise((64, 64), 64).convert("RGB"), quality=10, exif=exif)
+
+        result = await self.preprocessor.preprocess(original)
+        image = _decode(result.image_base64)
+
+        self.assertNotEqual(result.image_base64, original)
+        self.assertEqual(image.size, (64, 64))
+        self.assertEqual(len(image.getexif()), 0)
+        self.assertNotIn("exif", image.info)
+
+    async def test_identical_images_are_processed_once(self):
+        original = _data_url(_photo(2000, 2000))
+
+        first, second = await asyncio.gather(self.preprocessor.preprocess(original), self.preprocessor.preprocess(original))
+        third = await self.preprocessor.preprocess(original)
+
+        self.assertEqual(first.image_base64, second.image_base64)
+        self.assertIs(third, first)
+        self.assertEqual(self.preprocessor.stats()["images"], 3)
+        self.assertEqual(self.preprocessor.stats()["dedup_hits"], 1)
+
+    async def test_remote_urls_pass_through(self):
+        result = await self.preprocessor.preprocess("https://example.com/cat.png")
+
+        self.assertEqual(result.image_base64, "https://example.com/cat.png")
+
+    async def test_invalid_image_is_rejected(self):
+        with self.assertRaises(InvalidImageException):
+            await self.preprocessor.preprocess("data:image/png;base64,bm90IGFuIGltYWdl")
+
+
+class RecordingVisionClient:
+    def __init__(self):
+        self.messages = None
+
+    async def generate_vision(self, messages):
+        self.messages = messages
+        return AIResponse(assistant_message="ok", usage=Usage(prompt_tokens=1, completion_tokens=1, total_tokens=2))
+
+
+class StubPreprocessor:
+    def __init__(self, error: Exception | None = None):
+        self.error = error
+
+    async def preprocess(self, image_base64):
+        if self.error is not None:
+            raise self.error
+        return PreprocessedImage("data:image/jpeg;base64,c21hbGw=", original_bytes=100, bytes=5, original_tokens=765, tokens=255)
+
+
+def _vision_request() -> GenerateVisionAIRequestDTO:
+    return GenerateVisionAIRequestDTO(messages=[
+        AIMessageDTO(role=Role.USER, content=[
+            TextContentItemDTO(text="What is this?"),
+            ImageContentItemDTO(image_base64="data:image/png;base64,YmlnIGltYWdl"),
+        ]),
+    ])
+
+
+class VisionPreprocessingUseCaseTests(unittest.IsolatedAsyncioTestCase):
+    async def test_images_are_replaced_before_the_upstream_call(self):
+        client = RecordingVisionClient()
+        use_case = GenerateVisionAIUseCase(client, image_preprocessor=StubPreprocessor())
+
+        await use_case.execute(_vision_request())
+
+        self.assertEqual(client.messages[0].content[1].image_base64, "data:image/jpeg;base64,c21hbGw=")
+        self.assertEqual(client.messages[0].content[0].text, "What is this?")
+
+    async def test_undecodable_image_is_a_validation_error(self):
+        use_case = GenerateVisionAIUseCase(
+            RecordingVisionClient(),
+            image_preprocessor=StubPreprocessor(InvalidImageException("Cannot decode image")),
+        )
+
+        with self.assertRaises(ValidationException):
+            await use_case.execute(_vision_request())
+
+
+class WorkerStartupTests(unittest.TestCase):
+    def test_reimporting_main_in_a_worker_has_no_side_effects(self):
+        main_path = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "main.py")
+
+        # Spawned workers run the parent's main module under this name.
+        with mock.patch("app.composition.logging_bootstrap.setup_logging") as setup_logging:
+            namespace = runpy.run_path(main_path, run_name="__mp_main__")
+
+        setup_logging.assert_not_called()
+        self.assertNotIn("app", namespace)
+        self.assertIn("create_app", namespace)
+
+
+if __name__ == "__main__":
+    unittest.main()
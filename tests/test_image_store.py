@@ -0,0 +1,173 @@
+import base64
+import io
+import json
+import os
+import tempfile
+import unittest
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.application.dto import AIMessageDTO, GenerateVisionAIRequestDTO, ImageContentItemDTO
+from app.application.exceptions import ServiceUnavailableException
+from app.application.services import AIService, ImageService
+from app.application.use_cases.generate_text_ai_use_case import GenerateTextAIUseCase
+from app.application.use_cases.generate_text_batch_use_case import GenerateTextBatchUseCase
+from app.application.use_cases.generate_vision_ai_use_case import GenerateVisionAIUseCase
+from app.domain.exceptions import InvalidImageException
+from app.domain.models import AIResponse, Role, Usage
+from app.infrastructure.images.disk_image_store import DiskImageStore
+from app.presentation.api.routes import router
+from app.presentation.dependencies import get_ai_service, get_image_service
+
+PNG = b"\x89PNG\r\n\x1a\n" + b"\x00" * 200
+JPEG = b"\xff\xd8\xff\xe0" + b"\x01" * 200
+
+
+class DiskImageStoreTests(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.store = DiskImageStore(self.tmp.name, max_bytes=500, max_image_bytes=300)
+
+    async def asyncTearDown(self):
+        await self.store.aclose()
+        self.tmp.cleanup()
+
+    async def test_images_are_content_addressed_and_read_back_as_data_urls(self):
+        first = await self.store.put(io.BytesIO(PNG))
+        second = await self.store.put(io.BytesIO(PNG))
+
+        data_url = await self.store.get_data_url(first.image_id)
+
+        self.assertEqual(first, second)
+        self.assertEqual(first.mime_type, "image/png")
+        self.assertEqual(data_url, "data:image/png;base64," + base64.b64encode(PNG).decode())
+        self.assertEqual(self.store.stats()["images"], 1)
+        self.assertEqual(self.store.stats()["duplicates"], 1)
+
+    async def test_least_recently_used_images_are_evicted(self):
+        old = await self.store.put(io.BytesIO(PNG))
+        recent = await self.store.put(io.BytesIO(JPEG))
+        await self.store.get_data_url(old.image_id)
+
+        newest = await self.store.put(io.BytesIO(PNG + b"\x01"))
+
+        self.assertIsNone(await self.store.get_data_url(recent.image_id))
+        self.assertIsNotNone(await self.store.get_data_url(old.image_id))
+        self.assertIsNotNone(await self.store.get_data_url(newest.image_id))
+        self.assertEqual(len([name for name in os.listdir(self.tmp.name) if not name.endswith(".tmp")]), 2)
+
+    async def test_index_is_rebuilt_from_disk(self):
+        image = await self.store.put(io.BytesIO(JPEG))
+
+        reopened = DiskImageStore(self.tmp.name, max_bytes=500, max_image_bytes=300)
+        try:
+            data_url = await reopened.get_data_url(image.image_id)
+        finally:
+            await reopened.aclose()
+
+        self.assertTrue(data_url.startswith("data:image/jpeg;base64,"))
+
+    async def test_invalid_uploads_are_rejected_and_not_kept(self):
+        with self.assertRaises(InvalidImageException):
+            await self.store.put(io.BytesIO(b"not an image"))
+        with self.assertRaises(InvalidImageException):
+            await self.store.put(io.BytesIO(PNG * 2))
+
+        self.assertEqual(os.listdir(self.tmp.name), [])
+        self.assertIsNone(await self.store.get_data_url("../../etc/passwd"))
+
+
+class RecordingVisionClient:
+    def __init__(self):
+        self.messages = None
+
+    async def generate_vision(self, messages):
+        self.messages = messages
+        return AIResponse(assistant_message="ok", usage=Usage(prompt_tokens=1, completion_tokens=1, total_tokens=2))
+
+
+class UnreadableImageStore:
+    async def get_data_url(self, image_id):
+        raise PermissionError("denied")
+
+
+class ImageReferenceTests(unittest.IsolatedAsyncioTestCase):
+    async def test_store_read_errors_are_reported_as_unavailable(self):
+        use_case = GenerateVisionAIUseCase(RecordingVisionClient(), image_store=UnreadableImageStore())
+        request = GenerateVisionAIRequestDTO(messages=[AIMessageDTO(role=Role.USER, content=[ImageContentItemDTO(image_id="0" * 64)])])
+
+        with self.assertLogs("app.application.use_cases.generate_vision_ai_use_case", "ERROR"):
+            with self.assertRaisesRegex(ServiceUnavailableException, "Failed to read uploaded image"):
+                await use_case.execute(request)
+
+
+class ImageUploadRoutesTests(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        store = DiskImageStore(self.tmp.name, max_bytes=10_000, max_image_bytes=1_000)
+        self.vision_client = RecordingVisionClient()
+        text_use_case = GenerateTextAIUseCase({})
+        ai_service = AIService(
+            generate_text_use_case=text_use_case,
+            generate_vision_use_case=GenerateVisionAIUseCase(self.vision_client, image_store=store),
+            generate_batch_use_case=GenerateTextBatchUseCase(text_use_case),
+        )
+        app = FastAPI()
+        app.include_router(router)
+        app.dependency_overrides[get_ai_service] = lambda: ai_service
+        app.dependency_overrides[get_image_service] = lambda: ImageService(store)
+        self.client = TestClient(app)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def _sent_image(self) -> str:
+        return self.vision_client.messages[0].content[1].image_base64
+
+    def test_uploaded_image_can_be_referenced_by_id(self):
+        upload = self.client.post("/images", files={"file": ("cat.png", PNG, "image/png")})
+        self.assertEqual(upload.status_code, 201)
+
+        response = self.client.post("/generate-ai-response-vision", json={"messages": [{
+            "role": "user",
+            "content": [{"type": "text", "text": "What is it?"}, {"type": "image_url", "image_id": upload.json()["image_id"]}],
+        }]})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(self._sent_image(), "data:image/png;base64," + base64.b64encode(PNG).decode())
+
+    def test_multipart_request_carries_raw_image_bytes(self):
+        request = {"messages": [{
+            "role": "user",
+            "content": [{"type": "text", "text": "What is it?"}, {"type": "image_url", "image_id": "upload:0"}],
+        }]}
+
+        response = self.client.post(
+            "/generate-ai-response-vision/multipart",
+            data={"request": json.dumps(request)},
+            files=[("images", ("cat.jpg", JPEG, "image/jpeg"))],
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(self._sent_image(), "data:image/jpeg;base64," + base64.b64encode(JPEG).decode())
+
+    def test_bad_references_are_rejected(self):
+        unknown = self.client.post("/generate-ai-response-vision", json={"messages": [{
+            "role": "user", "content": [{"type": "image_url", "image_id": "0" * 64}],
+        }]})
+        missing_upload = self.client.post(
+            "/generate-ai-response-vision/multipart",
+            data={"request": json.dumps({"messages": [{
+                "role": "user", "content": [{"type": "image_url", "image_id": "upload:1"}],
+            }]})},
+        )
+        not_an_image = self.client.post("/images", files={"file": ("a.txt", b"hello", "text/plain")})
+
+        self.assertEqual(unknown.status_code, 404)
+        self.assertEqual(missing_upload.status_code, 400)
+        self.assertEqual(not_an_image.status_code, 400)
+
+
+if __name__ == "__main__":
+    unittest.main()
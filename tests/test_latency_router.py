@@ -0,0 +1,123 @@
+import random
+import unittest
+from unittest.mock import patch
+
+from app.application.dto import GenerateAIRequestDTO, MessageDTO
+from app.application.exceptions import ServiceUnavailableException, ValidationException
+from app.application.services.latency_router import LatencyRouter
+from app.application.use_cases.generate_text_ai_use_case import GenerateTextAIUseCase
+from app.domain.exceptions import AIServiceException
+from app.domain.models import AIAssistant, AIResponse, Role, Usage
+
+FAST, SLOW = AIAssistant.GPT_OSS_20B, AIAssistant.QWEN3_235B
+CLOCK = "app.application.services.latency_router.time.monotonic"
+
+
+def _observe(router: LatencyRouter, assistant: AIAssistant, started: float, finished: float, error: bool = False) -> None:
+    with patch(CLOCK, side_effect=[started, finished, finished]):
+        try:
+            with router.track(assistant):
+                if error:
+                    raise RuntimeError("failed")
+        except RuntimeError:
+            pass
+
+
+class LatencyRouterTests(unittest.TestCase):
+    def _warm_router(self, **kwargs) -> LatencyRouter:
+        router = LatencyRouter([SLOW, FAST], rng=random.Random(0), **kwargs)
+        _observe(router, SLOW, 0.0, 3.0)
+        _observe(router, FAST, 0.0, 1.0)
+        return router
+
+    def test_unmeasured_backends_are_probed_first(self):
+        router = LatencyRouter([SLOW, FAST], exploration=0.0)
+        _observe(router, SLOW, 0.0, 3.0)
+
+        self.assertEqual(router.rank()[0], FAST)
+
+    def test_prefers_lowest_latency(self):
+        router = self._warm_router(exploration=0.0)
+
+        with patch(CLOCK, return_value=5.0):
+            self.assertEqual(router.rank(), [FAST, SLOW])
+
+    def test_errors_push_backend_down(self):
+        router = self._warm_router(exploration=0.0)
+        for _ in range(5):
+            _observe(router, FAST, 1.0, 1.0, error=True)
+
+        with patch(CLOCK, return_value=5.0):
+            self.assertEqual(router.rank()[0], SLOW)
+
+    def test_in_flight_load_is_taken_into_account(self):
+        router = self._warm_router(exploration=0.0)
+
+        with patch(CLOCK, return_value=5.0), router.track(FAST), router.track(FAST), router.track(FAST):
+            self.assertEqual(router.rank()[0], SLOW)
+
+    def test_stale_estimates_are_refreshed(self):
+        router = self._warm_router(exploration=0.0, stale_after=10.0)
+        _observe(router, FAST, 20.0, 21.0)
+
+        with patch(CLOCK, return_value=25.0):
+            self.assertEqual(router.rank()[0], SLOW)
+
+    def test_exploration_occasionally_tries_other_backends(self):
+        router = self._warm_router(exploration=0.5)
+
+        with patch(CLOCK, return_value=5.0):
+            firsts = {router.rank()[0] for _ in range(50)}
+
+        self.assertEqual(firsts, {FAST, SLOW})
+        self.assertGreater(router.explorations, 0)
+
+
+class DummyTextClient:
+    def __init__(self, response):
+        self._response = response
+        self.calls = 0
+
+    async def generate(self, messages):
+        self.calls += 1
+        if isinstance(self._response, Exception):
+            raise self._response
+        return self._response
+
+
+class AutoAssistantTests(unittest.IsolatedAsyncioTestCase):
+    @staticmethod
+    def _request() -> GenerateAIRequestDTO:
+        return GenerateAIRequestDTO(messages=[MessageDTO(role=Role.USER, content="hi")], assistant=AIAssistant.AUTO)
+
+    async def test_auto_requires_router(self):
+        use_case = GenerateTextAIUseCase({FAST: DummyTextClient(None)})
+
+        with self.assertRaises(ValidationException):
+            await use_case.execute(self._request())
+
+    async def test_auto_reports_chosen_backend_and_fails_over(self):
+        usage = Usage(prompt_tokens=1, completion_tokens=1, total_tokens=2)
+        router = LatencyRouter([FAST, SLOW], exploration=0.0)
+        use_case = GenerateTextAIUseCase(
+            {FAST: DummyTextClient(AIServiceException("down")), SLOW: DummyTextClient(AIResponse("ok", usage))},
+            router=router,
+        )
+
+        dto = await use_case.execute(self._request())
+
+        self.assertEqual(dto.served_by, SLOW.value)
+        self.assertEqual(router.stats()["backends"][FAST.value]["errors"], 1)
+
+    async def test_auto_without_configured_backends_is_unavailable(self):
+        use_case = GenerateTextAIUseCase({FAST: DummyTextClient(None)}, router=LatencyRouter([SLOW], exploration=0.0))
+
+        with self.assertRaisesRegex(ServiceUnavailableException, "No configured backend"):
+            await use_case.execute(self._request())
+        with self.assertRaisesRegex(ServiceUnavailableException, "No configured backend"):
+            async for _ in use_case.execute_stream(self._request()):
+                pass
+
+
+if __name__ == "__main__":
+    unittest.main()
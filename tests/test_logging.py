@@ -0,0 +1,113 @@
+import json
+import logging
+import os
+import queue
+import tempfile
+import unittest
+
+import httpx
+from fastapi import FastAPI
+
+from app.application.services.request_context import current_request_id, request_id_context
+from app.composition.logging_bootstrap import setup_logging, shutdown_logging
+from app.infrastructure.logging.filters import RequestContextFilter
+from app.infrastructure.logging.json_formatter import JsonFormatter
+from app.infrastructure.logging.queue_handler import TruncatingQueueHandler
+from app.presentation.middleware.request_logging import RequestLoggingMiddleware
+from core.config import LoggingConfig
+
+
+def _record(message: str, *args, level: int = logging.INFO, exc_info=None) -> logging.LogRecord:
+    return logging.LogRecord("test", level, __file__, 1, message, args, exc_info)
+
+
+class QueuePipelineTests(unittest.TestCase):
+    def test_large_messages_are_truncated_and_tracebacks_kept_apart(self):
+        records = queue.SimpleQueue()
+        handler = TruncatingQueueHandler(records, max_message_chars=10)
+        try:
+            raise ValueError("bad")
+        except ValueError as exc:
+            exc_info = (type(exc), exc, exc.__traceback__)
+            handler.handle(_record("payload: %s", "x" * 100, level=logging.ERROR, exc_info=exc_info))
+
+        record = records.get_nowait()
+        self.assertEqual(record.getMessage(), "payload: x... [truncated 99 chars]")
+        self.assertIsNone(record.exc_info)
+        self.assertIn("ValueError: bad", record.exc_text)
+        self.assertNotIn("ValueError", record.getMessage())
+
+    def test_info_logs_are_sampled_per_request(self):
+        sampler = RequestContextFilter(info_sample_rate=0.0)
+
+        with request_id_context("abc"):
+            info, warning = _record("info"), _record("warning", level=logging.WARNING)
+            self.assertFalse(sampler.filter(info))
+            self.assertTrue(sampler.filter(warning))
+        outside = _record("startup")
+        self.assertTrue(sampler.filter(outside))
+
+        self.assertEqual((warning.request_id, outside.request_id), ("abc", "-"))
+        self.assertTrue(RequestContextFilter(info_sample_rate=1.0).filter(info))
+
+    def test_json_lines_carry_the_request_id(self):
+        record = _record("привет %s", "мир")
+        record.request_id = "abc"
+
+        entry = json.loads(JsonFormatter().format(record))
+
+        self.assertEqual(entry["message"], "привет мир")
+        self.assertEqual(entry["request_id"], "abc")
+        self.assertEqual((entry["level"], entry["logger"]), ("INFO", "test"))
+        self.assertTrue(entry["timestamp"].endswith("+00:00"))
+
+
+class SetupLoggingTests(unittest.TestCase):
+    def setUp(self):
+        root = logging.getLogger()
+        self.saved = root.level, root.handlers[:]
+        self.directory = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        shutdown_logging()
+        root = logging.getLogger()
+        root.setLevel(self.saved[0])
+        root.handlers[:] = self.saved[1]
+        self.directory.cleanup()
+
+    def test_records_are_written_by_the_background_listener(self):
+        path = os.path.join(self.directory.name, "app.log")
+        setup_logging(LoggingConfig(level="INFO", file=path, format="%(message)s", json_format=True))
+
+        with request_id_context("req-1"):
+            logging.getLogger("test").info("handled")
+        logging.getLogger("test").debug("dropped by level")
+        shutdown_logging()
+
+        with open(path, encoding="utf-8") as file:
+            entries = [json.loads(line) for line in file]
+        self.assertEqual([(entry["message"], entry.get("request_id")) for entry in entries], [("handled", "req-1")])
+
+
+class RequestIdTests(unittest.IsolatedAsyncioTestCase):
+    async def test_request_id_is_propagated_or_generated(self):
+        app = FastAPI()
+
+        @app.get("/id")
+        async def handler():
+            return {"request_id": current_request_id()}
+
+        app.add_middleware(RequestLoggingMiddleware)
+        async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
+            given = await client.get("/id", headers={"X-Request-ID": "trace-42"})
+            malformed = await client.get("/id", headers={"X-Request-ID": "bad id\twith spaces"})
+
+        self.assertEqual(given.json(), {"request_id": "trace-42"})
+        self.assertEqual(given.headers["x-request-id"], "trace-42")
+        self.assertEqual(len(malformed.json()["request_id"]), 32)
+        self.assertEqual(malformed.headers["x-request-id"], malformed.json()["request_id"])
+        self.assertIsNone(current_request_id())
+
+
+if __name__ == "__main__":
+    unittest.main()
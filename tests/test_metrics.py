@@ -0,0 +1,181 @@
+import asyncio
+import unittest
+
+import httpx
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.application.dto import GenerateAIRequestDTO, MessageDTO
+from app.application.services import StatsService
+from app.application.use_cases.generate_text_ai_use_case import GenerateTextAIUseCase
+from app.domain.exceptions import ProviderStatusException
+from app.domain.models import AIAssistant, AIResponse, AIResponseChunk, Role, Usage
+from app.infrastructure.metrics.prometheus import Counter, Histogram, PrometheusMetrics
+from app.presentation.api.routes import router
+from app.presentation.dependencies import get_metrics, get_stats_service
+from app.presentation.middleware.metrics import MetricsMiddleware
+
+
+def _sample(text: str, name: str) -> float:
+    for line in text.splitlines():
+        if line.startswith(name + " "):
+            return float(line.rsplit(" ", 1)[1])
+    raise AssertionError(f"{name} not found in:\n{text}")
+
+
+class ExpositionTests(unittest.TestCase):
+    def test_histogram_buckets_are_cumulative(self):
+        histogram = Histogram("latency_seconds", "Latency.", ("route",), buckets=(0.1, 1.0))
+        for value in (0.05, 0.1, 0.5, 3.0):
+            histogram.labels("/a").observe(value)
+        lines = []
+        histogram.render(lines)
+
+        self.assertEqual(lines, [
+            "# HELP latency_seconds Latency.",
+            "# TYPE latency_seconds histogram",
+            'latency_seconds_bucket{route="/a",le="0.1"} 2',
+            'latency_seconds_bucket{route="/a",le="1.0"} 3',
+            'latency_seconds_bucket{route="/a",le="+Inf"} 4',
+            'latency_seconds_sum{route="/a"} 3.65',
+            'latency_seconds_count{route="/a"} 4',
+        ])
+
+    def test_label_values_are_escaped_and_checked(self):
+        counter = Counter("errors_total", "Errors.", ("error",))
+        counter.labels('say "hi"\n').inc()
+        lines = []
+        counter.render(lines)
+
+        self.assertEqual(lines[-1], 'errors_total{error="say \\"hi\\"\\n"} 1')
+        with self.assertRaises(ValueError):
+            counter.labels("a", "b")
+
+
+class FlakyClient:
+    def __init__(self, fail: bool):
+        self.fail = fail
+
+    async def generate(self, messages):
+        if self.fail:
+            raise ProviderStatusException(503, "upstream failed")
+        return AIResponse(assistant_message="ok", usage=Usage(prompt_tokens=7, completion_tokens=3, total_tokens=10))
+
+    async def generate_stream(self, messages):
+        yield AIResponseChunk(delta="o")
+        yield AIResponseChunk(delta="k", usage=Usage(prompt_tokens=5, completion_tokens=2, total_tokens=7))
+
+
+class HangingClient:
+    def __init__(self):
+        self.called = asyncio.Event()
+
+    async def generate(self, messages):
+        self.called.set()
+        await asyncio.Event().wait()
+
+
+class UpstreamMetricsTests(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.metrics = PrometheusMetrics()
+        self.use_case = GenerateTextAIUseCase(
+            {AIAssistant.YANDEX_GPT: FlakyClient(fail=True), AIAssistant.CHAT_GPT: FlakyClient(fail=False)},
+            fallbacks={AIAssistant.YANDEX_GPT: [AIAssistant.CHAT_GPT]},
+            metrics=self.metrics,
+        )
+
+    def _request(self, assistant: AIAssistant) -> GenerateAIRequestDTO:
+        return GenerateAIRequestDTO(messages=[MessageDTO(role=Role.USER, content="hi")], assistant=assistant)
+
+    async def test_calls_are_recorded_for_the_backend_that_served_them(self):
+        await self.use_case.execute(self._request(AIAssistant.YANDEX_GPT))
+        text = self.metrics.render()
+
+        self.assertEqual(_sample(text, 'llmbox_upstream_requests_total{assistant="yandex_gpt",outcome="error"}'), 1)
+        self.assertEqual(
+            _sample(text, 'llmbox_upstream_errors_total{assistant="yandex_gpt",error="ProviderStatusException"}'), 1
+        )
+        self.assertEqual(_sample(text, 'llmbox_upstream_requests_total{assistant="chat_gpt",outcome="ok"}'), 1)
+        self.assertEqual(_sample(text, 'llmbox_prompt_tokens_total{assistant="chat_gpt"}'), 7)
+        self.assertEqual(_sample(text, 'llmbox_completion_tokens_total{assistant="chat_gpt"}'), 3)
+        self.assertEqual(_sample(text, 'llmbox_upstream_request_duration_seconds_count{assistant="chat_gpt"}'), 1)
+        self.assertEqual(_sample(text, 'llmbox_upstream_requests_in_flight{assistant="yandex_gpt"}'), 0)
+
+    async def test_streams_record_time_to_first_token_and_final_usage(self):
+        chunks = [chunk async for chunk in self.use_case.execute_stream(self._request(AIAssistant.CHAT_GPT))]
+        text = self.metrics.render()
+
+        self.assertEqual(len(chunks), 2)
+        self.assertEqual(_sample(text, 'llmbox_upstream_time_to_first_token_seconds_count{assistant="chat_gpt"}'), 1)
+        self.assertEqual(_sample(text, 'llmbox_completion_tokens_total{assistant="chat_gpt"}'), 2)
+        self.assertEqual(_sample(text, 'llmbox_upstream_requests_in_flight{assistant="chat_gpt"}'), 0)
+
+    async def test_abandoned_streams_and_cancelled_calls_are_not_errors(self):
+        stream = self.use_case.execute_stream(self._request(AIAssistant.CHAT_GPT))
+        await anext(stream)
+        await stream.aclose()
+        hanging = self.use_case._text_clients[AIAssistant.CHAT_GPT] = HangingClient()
+        call = asyncio.create_task(self.use_case.execute(self._request(AIAssistant.CHAT_GPT)))
+        await hanging.called.wait()
+        call.cancel()
+        with self.assertRaises(asyncio.CancelledError):
+            await call
+        text = self.metrics.render()
+
+        self.assertEqual(_sample(text, 'llmbox_upstream_requests_total{assistant="chat_gpt",outcome="cancelled"}'), 2)
+        self.assertEqual(_sample(text, 'llmbox_upstream_requests_total{assistant="chat_gpt",outcome="error"}'), 0)
+        self.assertNotIn('llmbox_upstream_errors_total{assistant="chat_gpt"', text)
+        self.assertEqual(_sample(text, 'llmbox_upstream_requests_in_flight{assistant="chat_gpt"}'), 0)
+
+
+class StaticStats:
+    def stats(self) -> dict:
+        return {"hits": 1}
+
+
+class MetricsEndpointTests(unittest.IsolatedAsyncioTestCase):
+    async def test_requests_are_counted_per_route_template(self):
+        metrics = PrometheusMetrics()
+        app = FastAPI()
+        app.include_router(router)
+        app.dependency_overrides[get_metrics] = lambda: metrics
+        app.add_middleware(MetricsMiddleware, metrics=metrics)
+
+        async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
+            await client.get("/health")
+            await client.get("/no-such-path")
+            response = await client.get("/metrics")
+
+        self.assertTrue(response.headers["content-type"].startswith("text/plain; version=0.0.4"))
+        text = response.text
+        self.assertEqual(_sample(text, 'llmbox_http_requests_total{method="GET",route="/health",status="200"}'), 1)
+        self.assertEqual(_sample(text, 'llmbox_http_requests_total{method="GET",route="unmatched",status="404"}'), 1)
+        self.assertEqual(_sample(text, 'llmbox_http_request_duration_seconds_count{route="/health"}'), 1)
+        # The scrape itself is still in flight while the body is rendered.
+        self.assertEqual(_sample(text, "llmbox_http_requests_in_flight"), 1)
+
+    def test_disabled_metrics_return_404(self):
+        app = FastAPI()
+        app.include_router(router)
+        app.dependency_overrides[get_metrics] = lambda: None
+
+        self.assertEqual(TestClient(app).get("/metrics").status_code, 404)
+
+    def test_stats_are_served_only_when_enabled(self):
+        app = FastAPI()
+        app.include_router(router)
+        client = TestClient(app)
+
+        app.dependency_overrides[get_stats_service] = lambda: None
+        disabled = client.get("/stats")
+        stats_service = StatsService()
+        stats_service.register("response_cache", StaticStats())
+        app.dependency_overrides[get_stats_service] = lambda: stats_service
+        enabled = client.get("/stats")
+
+        self.assertEqual(disabled.status_code, 404)
+        self.assertEqual(enabled.json(), {"response_cache": {"hits": 1}})
+
+
+if __name__ == "__main__":
+    unittest.main()
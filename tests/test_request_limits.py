@@ -0,0 +1,141 @@
+import base64
+import json
+import tempfile
+import unittest
+
+from fastapi import FastAPI, Request
+from fastapi.testclient import TestClient
+
+from app.application.services import AIService
+from app.application.use_cases.generate_text_ai_use_case import GenerateTextAIUseCase
+from app.application.use_cases.generate_text_batch_use_case import GenerateTextBatchUseCase
+from app.application.use_cases.generate_vision_ai_use_case import GenerateVisionAIUseCase
+from app.domain.models import AIResponse, Usage
+from app.infrastructure.images.disk_image_store import DiskImageStore
+from app.presentation.api.routes import router
+from app.presentation.dependencies import get_ai_service
+from app.presentation.middleware.body_size_limit import BodySizeLimitMiddleware
+from app.presentation.middleware.vision_images import VisionImageExtractionMiddleware
+
+PNG = b"\x89PNG\r\n\x1a\n" + bytes(range(256)) * 4
+PNG_URL = "data:image/png;base64," + base64.b64encode(PNG).decode()
+
+
+def _chunks(data: bytes, size: int):
+    for offset in range(0, len(data), size):
+        yield data[offset:offset + size]
+
+
+def _vision_body(*images: str) -> dict:
+    content = [{"type": "text", "text": 'Say "hi"\\n'}]
+    content += [{"type": "image_url", "image_base64": image} for image in images]
+    return {"messages": [{"role": "user", "content": content}]}
+
+
+class BodySizeLimitTests(unittest.TestCase):
+    def setUp(self):
+        app = FastAPI()
+
+        @app.middleware("http")
+        async def passthrough(request: Request, call_next):
+            return await call_next(request)
+
+        @app.post("/small")
+        async def small(payload: dict):
+            return {"keys": len(payload)}
+
+        @app.post("/large")
+        async def large(payload: dict):
+            return {"keys": len(payload)}
+
+        app.add_middleware(BodySizeLimitMiddleware, max_body_bytes=100, limits={"/large": 1000})
+        self.client = TestClient(app)
+
+    def test_declared_length_is_checked_before_reading(self):
+        body = json.dumps({"text": "x" * 200})
+
+        self.assertEqual(self.client.post("/small", content=body).status_code, 413)
+        self.assertEqual(self.client.post("/large", content=body).status_code, 200)
+
+    def test_chunked_body_is_cut_off_at_the_limit(self):
+        body = json.dumps({"text": "x" * 200}).encode()
+
+        response = self.client.post("/small", content=_chunks(body, 32), headers={"content-type": "application/json"})
+        allowed = self.client.post("/large", content=_chunks(body, 32), headers={"content-type": "application/json"})
+
+        self.assertEqual(response.status_code, 413)
+        self.assertIn("100 bytes", response.json()["detail"])
+        self.assertEqual(allowed.status_code, 200)
+
+
+class RecordingVisionClient:
+    def __init__(self):
+        self.messages = None
+
+    async def generate_vision(self, messages):
+        self.messages = messages
+        return AIResponse(assistant_message="ok", usage=Usage(prompt_tokens=1, completion_tokens=1, total_tokens=2))
+
+
+class VisionImageExtractionTests(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.store = DiskImageStore(self.tmp.name, max_bytes=100_000, max_image_bytes=2_000)
+        self.vision_client = RecordingVisionClient()
+        text_use_case = GenerateTextAIUseCase({})
+        ai_service = AIService(
+            generate_text_use_case=text_use_case,
+            generate_vision_use_case=GenerateVisionAIUseCase(self.vision_client, image_store=self.store),
+            generate_batch_use_case=GenerateTextBatchUseCase(text_use_case),
+        )
+        app = FastAPI()
+        app.include_router(router)
+        app.dependency_overrides[get_ai_service] = lambda: ai_service
+        app.add_middleware(VisionImageExtractionMiddleware, image_store=lambda: self.store, max_image_bytes=2_000)
+        self.client = TestClient(app)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def _post(self, body: dict, chunk_size: int = 7, escapes: dict[str, str] | None = None):
+        # Small chunks split image headers, escapes and keys across messages.
+        data = json.dumps(body)
+        for char, escape in (escapes or {"/": "\\/"}).items():
+            data = data.replace(char, escape)
+        return self.client.post(
+            "/generate-ai-response-vision",
+            content=_chunks(data.encode(), chunk_size),
+            headers={"content-type": "application/json"},
+        )
+
+    def test_images_are_moved_to_the_store_while_streaming(self):
+        response = self._post(_vision_body(PNG_URL, "https://example.com/cat.png"))
+
+        content = self.vision_client.messages[0].content
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(content[0].text, 'Say "hi"\\n')
+        self.assertEqual(content[1].image_base64, PNG_URL)
+        self.assertEqual(content[2].image_base64, "https://example.com/cat.png")
+        self.assertEqual(self.store.stats()["uploads"], 1)
+
+    def test_unicode_escapes_are_decoded_in_images_and_kept_elsewhere(self):
+        remote = "https://example.com/caf\u00e9.png"
+        response = self._post(_vision_body(PNG_URL, remote), 3, escapes={"/": "\\u002F", "+": "\\u002b"})
+
+        content = self.vision_client.messages[0].content
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(content[1].image_base64, PNG_URL)
+        self.assertEqual(content[2].image_base64, remote)
+        self.assertEqual(self.store.stats()["uploads"], 1)
+
+    def test_invalid_or_oversized_images_are_rejected(self):
+        invalid = self._post(_vision_body("data:image/png;base64,not*base64"))
+        oversized = self._post(_vision_body("data:image/png;base64," + base64.b64encode(PNG * 3).decode()), 4096)
+
+        self.assertEqual(invalid.status_code, 400)
+        self.assertEqual(oversized.status_code, 400)
+        self.assertIsNone(self.vision_client.messages)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,82 @@
+import asyncio
+import unittest
+
+import httpx
+from fastapi import FastAPI
+from fastapi.responses import StreamingResponse
+
+from app.presentation.middleware.request_logging import RequestLoggingMiddleware
+
+
+class RequestLoggingMiddlewareTests(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.release = asyncio.Event()
+        app = FastAPI()
+
+        @app.get("/ok")
+        async def ok():
+            return {"ok": True}
+
+        @app.get("/boom")
+        async def boom():
+            raise RuntimeError("boom")
+
+        @app.get("/stream")
+        async def stream():
+            async def body():
+                yield b"first\n"
+                await self.release.wait()
+                yield b"second\n"
+
+            return StreamingResponse(body(), media_type="text/plain")
+
+        app.add_middleware(RequestLoggingMiddleware)
+        self.app = app
+        self.client = httpx.AsyncClient(transport=httpx.ASGITransport(app=app, raise_app_exceptions=False), base_url="http://test")
+
+    async def asyncTearDown(self):
+        await self.client.aclose()
+
+    async def test_process_time_header_is_added(self):
+        response = await self.client.get("/ok")
+
+        self.assertEqual(response.json(), {"ok": True})
+        self.assertGreaterEqual(float(response.headers["x-process-time"]), 0.0)
+
+    async def test_unhandled_error_becomes_json_500(self):
+        with self.assertLogs("app.presentation.middleware.request_logging", "ERROR") as logs:
+            response = await self.client.get("/boom?x=1")
+
+        self.assertEqual(response.status_code, 500)
+        self.assertEqual(response.json(), {"detail": "Internal server error", "error": "boom"})
+        self.assertIn("x-process-time", response.headers)
+        self.assertIn("REQUEST ERROR: GET http://test/boom?x=1 - Error: boom", logs.output[0])
+
+    async def test_streamed_chunks_are_forwarded_as_they_are_sent(self):
+        sent = []
+        first_chunk = asyncio.Event()
+
+        async def send(message):
+            sent.append(message)
+            if message.get("body") == b"first\n":
+                first_chunk.set()
+
+        async def receive():
+            await asyncio.Event().wait()
+
+        scope = {
+            "type": "http", "asgi": {"version": "3.0"}, "http_version": "1.1", "method": "GET", "scheme": "http",
+            "path": "/stream", "raw_path": b"/stream", "query_string": b"", "headers": [], "server": ("test", 80),
+        }
+        task = asyncio.create_task(self.app(scope, receive, send))
+        await asyncio.wait_for(first_chunk.wait(), timeout=1)
+
+        self.assertFalse(task.done())
+        self.assertIn(b"x-process-time", dict(sent[0]["headers"]))
+        self.release.set()
+        await task
+        self.assertEqual([message.get("body") for message in sent[1:]], [b"first\n", b"second\n", b""])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,150 @@
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from app.application.dto import CachePolicy, GenerateAIRequestDTO, MessageDTO
+from app.application.services.request_fingerprint import text_request_key, vision_request_key
+from app.application.use_cases.generate_text_ai_use_case import GenerateTextAIUseCase
+from app.domain.models import AIAssistant, AIMessage, AIResponse, ImageContentItem, Message, Role, TextContentItem, Usage
+from app.infrastructure.cache.memory_cache import InMemoryResponseCache
+from app.infrastructure.cache.sqlite_cache import SqliteResponseCache
+
+
+class CountingTextClient:
+    def __init__(self) -> None:
+        self.calls = 0
+
+    async def generate(self, messages):
+        self.calls += 1
+        return AIResponse(assistant_message=f"answer {self.calls}", usage=Usage(1, 1, 2))
+
+
+class RequestFingerprintTests(unittest.TestCase):
+    def test_text_key_is_stable_and_field_sensitive(self) -> None:
+        messages = [Message(role=Role.USER, content="ab")]
+
+        key = text_request_key(AIAssistant.CHAT_GPT, messages)
+
+        self.assertEqual(key, text_request_key(AIAssistant.CHAT_GPT, [Message(role=Role.USER, content="ab")]))
+        self.assertNotEqual(key, text_request_key(AIAssistant.YANDEX_GPT, messages))
+        self.assertNotEqual(key, text_request_key(AIAssistant.CHAT_GPT, messages, params={"temperature": 1}))
+        self.assertNotEqual(
+            text_request_key(AIAssistant.CHAT_GPT, [Message(role=Role.USER, content="a"), Message(role=Role.USER, content="b")]),
+            key,
+        )
+
+    def test_vision_key_hashes_large_images_in_slices(self) -> None:
+        image = "data:image/png;base64," + "A" * 3_000_000
+        messages = [AIMessage(role=Role.USER, content=[TextContentItem(text="what?"), ImageContentItem(image_base64=image)])]
+
+        with mock.patch("app.application.services.request_fingerprint._CHUNK_CHARS", 1000):
+            sliced = vision_request_key(messages)
+
+        self.assertEqual(sliced, vision_request_key(messages))
+        self.assertNotEqual(sliced, vision_request_key([AIMessage(role=Role.USER, content=[TextContentItem(text="what?")])]))
+
+
+class InMemoryResponseCacheTests(unittest.IsolatedAsyncioTestCase):
+    async def test_evicts_least_recently_used_when_over_size(self) -> None:
+        cache = InMemoryResponseCache(max_bytes=25, ttl_seconds=60)
+        await cache.set("a", b"x" * 9)
+        await cache.set("b", b"x" * 9)
+        await cache.get("a")
+
+        await cache.set("c", b"x" * 9)
+
+        self.assertIsNotNone(await cache.get("a"))
+        self.assertIsNone(await cache.get("b"))
+        self.assertEqual(cache.stats()["evictions"], 1)
+
+    async def test_expires_entries_after_ttl(self) -> None:
+        cache = InMemoryResponseCache(max_bytes=100, ttl_seconds=10)
+        with mock.patch("app.infrastructure.cache.memory_cache.time.monotonic", return_value=100.0):
+            await cache.set("a", b"value")
+        with mock.patch("app.infrastructure.cache.memory_cache.time.monotonic", return_value=111.0):
+            self.assertIsNone(await cache.get("a"))
+        self.assertEqual(cache.stats()["entries"], 0)
+
+
+class CachedTextUseCaseTests(unittest.IsolatedAsyncioTestCase):
+    def make_request(self, policy: CachePolicy = CachePolicy.DEFAULT) -> GenerateAIRequestDTO:
+        return GenerateAIRequestDTO(
+            messages=[MessageDTO(role=Role.USER, content="classify this")],
+            assistant=AIAssistant.CHAT_GPT,
+            cache_policy=policy,
+        )
+
+    async def test_second_identical_request_is_served_from_cache(self) -> None:
+        client = CountingTextClient()
+        use_case = GenerateTextAIUseCase({AIAssistant.CHAT_GPT: client}, InMemoryResponseCache(1024, 60))
+
+        first = await use_case.execute(self.make_request())
+        second = await use_case.execute(self.make_request())
+
+        self.assertEqual(client.calls, 1)
+        self.assertFalse(first.cached)
+        self.assertTrue(second.cached)
+        self.assertEqual(second.assistant_message, "answer 1")
+
+    async def test_refresh_and_bypass_policies(self) -> None:
+        client = CountingTextClient()
+        cache = InMemoryResponseCache(1024, 60)
+        use_case = GenerateTextAIUseCase({AIAssistant.CHAT_GPT: client}, cache)
+        await use_case.execute(self.make_request())
+
+        refreshed = await use_case.execute(self.make_request(CachePolicy.REFRESH))
+        bypassed = await use_case.execute(self.make_request(CachePolicy.BYPASS))
+        cached = await use_case.execute(self.make_request())
+
+        self.assertEqual(refreshed.assistant_message, "answer 2")
+        self.assertEqual(bypassed.assistant_message, "answer 3")
+        self.assertEqual(cached.assistant_message, "answer 2")
+        self.assertTrue(cached.cached)
+
+
+class SqliteResponseCacheTests(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self._tmp.name, "cache.sqlite3")
+
+    async def asyncTearDown(self) -> None:
+        self._tmp.cleanup()
+
+    async def test_entries_survive_reopen(self) -> None:
+        cache = SqliteResponseCache(self.path, max_bytes=1024, ttl_seconds=60)
+        await cache.set("key", b"value")
+        await cache.aclose()
+
+        reopened = SqliteResponseCache(self.path, max_bytes=1024, ttl_seconds=60)
+        value = await reopened.get("key")
+        await reopened.aclose()
+
+        self.assertEqual(value, b"value")
+        self.assertEqual(reopened.stats()["entries"], 1)
+
+    async def test_compaction_trims_to_max_bytes_by_access_time(self) -> None:
+        cache = SqliteResponseCache(self.path, max_bytes=25, ttl_seconds=60, compact_interval=3600)
+        clock = [100.0]
+        with mock.patch("app.infrastructure.cache.sqlite_cache.time.time", side_effect=lambda: clock[0]):
+            for key in ("a", "b", "c"):
+                clock[0] += 1
+                await cache.set(key, b"x" * 9)
+
+            self.assertIsNone(await cache.get("a"))
+            self.assertEqual(await cache.get("c"), b"x" * 9)
+        self.assertEqual(cache.stats()["evictions"], 1)
+        await cache.aclose()
+
+    async def test_expired_entries_are_misses(self) -> None:
+        cache = SqliteResponseCache(self.path, max_bytes=1024, ttl_seconds=10)
+        with mock.patch("app.infrastructure.cache.sqlite_cache.time.time", return_value=100.0):
+            await cache.set("a", b"value")
+        with mock.patch("app.infrastructure.cache.sqlite_cache.time.time", return_value=111.0):
+            self.assertIsNone(await cache.get("a"))
+        self.assertEqual(cache.stats()["misses"], 1)
+        await cache.aclose()
+
+
+if __name__ == "__main__":
+    unittest.main()
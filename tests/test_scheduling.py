@@ -0,0 +1,128 @@
+import asyncio
+import unittest
+
+import httpx
+from fastapi import FastAPI
+
+from app.application.services.request_context import current_identity, request_identity
+from app.domain.exceptions import ProviderOverloadedException
+from app.domain.models import Priority, RequestIdentity
+from app.infrastructure.resilience.adaptive_limiter import AdaptiveLimiter
+from app.presentation.middleware.request_identity import RequestIdentityMiddleware
+from core.config import ConcurrencyConfig, TenancyConfig
+
+
+class SchedulingTests(unittest.IsolatedAsyncioTestCase):
+    def _limiter(self, **overrides) -> AdaptiveLimiter:
+        params = {"initial_limit": 1, "min_limit": 1, "max_limit": 1, "max_queue": 100, "queue_timeout": 1.0}
+        params.update(overrides)
+        return AdaptiveLimiter("test", ConcurrencyConfig(**params))
+
+    async def _run_queued(self, limiter: AdaptiveLimiter, calls: list[tuple[str, Priority]]) -> list[str]:
+        """Holds the only slot until every call is queued, then records the order they are served in."""
+        order = []
+        release = asyncio.Event()
+
+        async def holder():
+            async with limiter.slot():
+                await release.wait()
+
+        async def call(tenant: str, priority: Priority):
+            with request_identity(RequestIdentity(tenant=tenant, priority=priority)):
+                async with limiter.slot():
+                    order.append(f"{tenant}:{priority.value}")
+
+        holding = asyncio.create_task(holder())
+        await asyncio.sleep(0)
+        tasks = [asyncio.create_task(call(tenant, priority)) for tenant, priority in calls]
+        await asyncio.sleep(0)
+        self.assertEqual(limiter.queue_depth, len(calls))
+        release.set()
+        await asyncio.gather(holding, *tasks)
+        return order
+
+    async def test_priority_classes_are_served_strictly(self):
+        limiter = self._limiter()
+
+        order = await self._run_queued(limiter, [
+            ("jobs", Priority.BULK), ("ui", Priority.DEFAULT), ("ui", Priority.INTERACTIVE), ("jobs", Priority.BULK),
+        ])
+
+        self.assertEqual(order, ["ui:interactive", "ui:default", "jobs:bulk", "jobs:bulk"])
+
+    async def test_tenants_share_slots_by_weight(self):
+        limiter = self._limiter(tenant_weights={"ui": 2})
+
+        order = await self._run_queued(limiter, [("jobs", Priority.BULK)] * 6 + [("ui", Priority.BULK)] * 4)
+
+        # The tenant that queued first does not get to finish first: ui gets two slots per one of jobs.
+        self.assertEqual([entry.split(":")[0] for entry in order[:6]], ["jobs", "ui", "ui", "jobs", "ui", "ui"])
+        stats = limiter.stats()["queues"]["bulk"]
+        self.assertEqual((stats["calls"], stats["waited"], stats["depth"]), (10, 10, 0))
+        self.assertGreater(stats["max"], 0)
+
+    async def test_queue_timeout_is_per_class(self):
+        limiter = self._limiter(queue_timeouts={"interactive": 0.01})
+        release = asyncio.Event()
+
+        async def holder():
+            async with limiter.slot():
+                await release.wait()
+
+        async def bulk_call():
+            with request_identity(RequestIdentity(priority=Priority.BULK)):
+                async with limiter.slot():
+                    pass
+
+        holding = asyncio.create_task(holder())
+        await asyncio.sleep(0)
+        bulk = asyncio.create_task(bulk_call())
+        with request_identity(RequestIdentity(priority=Priority.INTERACTIVE)):
+            with self.assertRaises(ProviderOverloadedException):
+                async with limiter.slot():
+                    pass
+        release.set()
+        await asyncio.gather(holding, bulk)
+
+        self.assertEqual(limiter.stats()["queues"]["interactive"]["timeouts"], 1)
+        self.assertEqual(limiter.stats()["queues"]["bulk"]["calls"], 1)
+        self.assertEqual(limiter.queue_depth, 0)
+
+
+class RequestIdentityMiddlewareTests(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        app = FastAPI()
+
+        @app.post("/generate-ai-response")
+        @app.post("/batch-jobs")
+        async def identity():
+            current = current_identity()
+            return {"tenant": current.tenant, "priority": current.priority.value}
+
+        app.add_middleware(RequestIdentityMiddleware, config=TenancyConfig(api_key_tenants={"secret": "ui"}))
+        self.client = httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test")
+
+    async def asyncTearDown(self):
+        await self.client.aclose()
+
+    async def test_identity_comes_from_headers_and_api_keys(self):
+        explicit = await self.client.post("/generate-ai-response", headers={"X-Tenant-Id": "crm", "X-Priority": "bulk"})
+        mapped_key = await self.client.post("/generate-ai-response", headers={"Authorization": "Bearer secret"})
+        other_key = await self.client.post("/batch-jobs", headers={"X-API-Key": "another"})
+        anonymous = await self.client.post("/generate-ai-response")
+
+        self.assertEqual(explicit.json(), {"tenant": "crm", "priority": "bulk"})
+        self.assertEqual(mapped_key.json(), {"tenant": "ui", "priority": "interactive"})
+        self.assertTrue(other_key.json()["tenant"].startswith("key-"))
+        self.assertNotIn("another", other_key.json()["tenant"])
+        self.assertEqual(other_key.json()["priority"], "bulk")
+        self.assertEqual(anonymous.json(), {"tenant": "anonymous", "priority": "interactive"})
+
+    async def test_unknown_priority_is_rejected(self):
+        response = await self.client.post("/generate-ai-response", headers={"X-Priority": "urgent"})
+
+        self.assertEqual(response.status_code, 400)
+
+
+if __name__ == "__main__":
+    unittest.main()
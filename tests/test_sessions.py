@@ -0,0 +1,245 @@
+import asyncio
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.application.dto import CreateSessionDTO, MessageDTO, SessionTurnDTO
+from app.application.exceptions import ConflictException, NotFoundException, ServiceUnavailableException, ValidationException
+from app.application.services import SessionService
+from app.application.use_cases.generate_text_ai_use_case import GenerateTextAIUseCase
+from app.application.use_cases.sessions_use_case import SessionsUseCase
+from app.domain.exceptions import AIServiceException
+from app.domain.models import AIAssistant, AIResponse, AIResponseChunk, Message, Role, Session, Usage
+from app.infrastructure.sessions.memory_store import InMemorySessionStore
+from app.infrastructure.sessions.sqlite_store import SqliteSessionStore
+from app.presentation.api.routes import router
+from app.presentation.dependencies import get_session_service
+
+
+def _session(session_id: str, *contents: str) -> Session:
+    return Session(
+        id=session_id,
+        assistant=AIAssistant.CHAT_GPT,
+        messages=[Message(role=Role.USER, content=content) for content in contents],
+        created_at=1.0,
+        updated_at=1.0,
+    )
+
+
+class InMemorySessionStoreTests(unittest.IsolatedAsyncioTestCase):
+    async def test_least_recently_used_session_is_evicted(self):
+        store = InMemorySessionStore(max_sessions=2, ttl_seconds=60)
+        await store.create(_session("a"))
+        await store.create(_session("b"))
+        await store.get("a")
+        await store.create(_session("c"))
+
+        self.assertIsNotNone(await store.get("a"))
+        self.assertIsNone(await store.get("b"))
+        self.assertEqual(store.stats()["evictions"], 1)
+
+    async def test_idle_sessions_expire(self):
+        store = InMemorySessionStore(max_sessions=10, ttl_seconds=60)
+        with mock.patch("app.infrastructure.sessions.memory_store.time.monotonic", return_value=100.0):
+            await store.create(_session("a"))
+        with mock.patch("app.infrastructure.sessions.memory_store.time.monotonic", return_value=161.0):
+            self.assertIsNone(await store.get("a"))
+            self.assertFalse(await store.append("a", [Message(role=Role.USER, content="x")], 2.0))
+
+        self.assertEqual(store.stats()["expirations"], 1)
+
+
+class SqliteSessionStoreTests(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "sessions.sqlite3")
+
+    async def asyncTearDown(self):
+        self.directory.cleanup()
+
+    async def test_appended_turns_survive_reopening(self):
+        store = SqliteSessionStore(self.path, max_sessions=10, ttl_seconds=60)
+        await store.create(_session("a", "hi"))
+        self.assertTrue(await store.append("a", [Message(role=Role.ASSISTANT, content="hello")], 5.0))
+        await store.aclose()
+
+        reopened = SqliteSessionStore(self.path, max_sessions=10, ttl_seconds=60)
+        session = await reopened.get("a")
+        missing = await reopened.append("missing", [Message(role=Role.USER, content="x")], 5.0)
+        deleted = await reopened.delete("a")
+        after_delete = await reopened.get("a")
+        await reopened.aclose()
+
+        self.assertEqual([(message.role, message.content) for message in session.messages], [
+            (Role.USER, "hi"), (Role.ASSISTANT, "hello"),
+        ])
+        self.assertEqual(session.updated_at, 5.0)
+        self.assertFalse(missing)
+        self.assertTrue(deleted)
+        self.assertIsNone(after_delete)
+
+    async def test_creating_over_the_limit_evicts_least_recently_used(self):
+        store = SqliteSessionStore(self.path, max_sessions=2, ttl_seconds=60)
+        with mock.patch("app.infrastructure.sessions.sqlite_store.time.time", side_effect=[1.0, 2.0, 3.0, 4.0, 5.0, 6.0]):
+            await store.create(_session("a"))
+            await store.create(_session("b"))
+            await store.get("a")
+            await store.create(_session("c"))
+            b, a = await store.get("b"), await store.get("a")
+        await store.aclose()
+
+        self.assertIsNone(b)
+        self.assertIsNotNone(a)
+        self.assertEqual(store.stats()["evictions"], 1)
+
+    async def test_turns_from_two_workers_on_the_same_history_conflict(self):
+        workers = [SqliteSessionStore(self.path, max_sessions=10, ttl_seconds=60) for _ in range(2)]
+        await workers[0].create(_session("a", "hi"))
+        first, second = [await worker.get("a") for worker in workers]
+
+        saved = await workers[0].append("a", [Message(role=Role.USER, content="one")], 2.0, len(first.messages))
+        with self.assertRaises(ConflictException):
+            await workers[1].append("a", [Message(role=Role.USER, content="two")], 3.0, len(second.messages))
+        history = await workers[1].get("a")
+        for worker in workers:
+            await worker.aclose()
+
+        self.assertTrue(saved)
+        self.assertEqual([message.content for message in history.messages], ["hi", "one"])
+
+
+class EchoTextClient:
+    """Replies with the number of messages it was sent."""
+
+    def __init__(self, fail: bool = False):
+        self.fail = fail
+        self.received = []
+
+    async def generate(self, messages):
+        self.received.append([message.content for message in messages])
+        if self.fail:
+            raise AIServiceException("upstream failed")
+        return AIResponse(
+            assistant_message=f"seen {len(messages)}",
+            usage=Usage(prompt_tokens=1, completion_tokens=1, total_tokens=2),
+        )
+
+    async def generate_stream(self, messages):
+        self.received.append([message.content for message in messages])
+        yield AIResponseChunk(delta="seen ")
+        yield AIResponseChunk(delta=str(len(messages)))
+
+
+def _turn(content: str) -> SessionTurnDTO:
+    return SessionTurnDTO(messages=[MessageDTO(role=Role.USER, content=content)])
+
+
+class SessionsUseCaseTests(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.client = EchoTextClient()
+        self.use_case = SessionsUseCase(
+            InMemorySessionStore(max_sessions=10, ttl_seconds=60),
+            GenerateTextAIUseCase({AIAssistant.CHAT_GPT: self.client}),
+            max_messages=6,
+        )
+        self.session = await self.use_case.create(CreateSessionDTO(
+            assistant=AIAssistant.CHAT_GPT, messages=[MessageDTO(role=Role.SYSTEM, content="be brief")],
+        ))
+
+    async def test_turns_extend_the_stored_history(self):
+        first = await self.use_case.send(self.session.id, _turn("one"))
+        second = await self.use_case.send(self.session.id, _turn("two"))
+
+        self.assertEqual((first.assistant_message, second.assistant_message), ("seen 2", "seen 4"))
+        self.assertEqual(self.client.received[-1], ["be brief", "one", "seen 2", "two"])
+        stored = await self.use_case.get(self.session.id)
+        self.assertEqual([message.role for message in stored.messages], [
+            Role.SYSTEM, Role.USER, Role.ASSISTANT, Role.USER, Role.ASSISTANT,
+        ])
+
+    async def test_failed_turn_leaves_history_unchanged(self):
+        self.client.fail = True
+
+        with self.assertRaises(ServiceUnavailableException):
+            await self.use_case.send(self.session.id, _turn("one"))
+
+        self.assertEqual(len((await self.use_case.get(self.session.id)).messages), 1)
+
+    async def test_streamed_reply_is_saved_after_the_stream_ends(self):
+        deltas = [chunk.delta async for chunk in self.use_case.send_stream(self.session.id, _turn("one"))]
+
+        self.assertEqual("".join(deltas), "seen 2")
+        stored = await self.use_case.get(self.session.id)
+        self.assertEqual(stored.messages[-1], MessageDTO(role=Role.ASSISTANT, content="seen 2"))
+
+    async def test_concurrent_turns_are_serialized(self):
+        await asyncio.gather(
+            self.use_case.send(self.session.id, _turn("one")),
+            self.use_case.send(self.session.id, _turn("two")),
+        )
+
+        self.assertEqual([len(received) for received in self.client.received], [2, 4])
+
+    async def test_stalled_stream_does_not_block_other_turns_and_loses_the_race(self):
+        stream = self.use_case.send_stream(self.session.id, _turn("streamed"))
+        await anext(stream)
+
+        reply = await asyncio.wait_for(self.use_case.send(self.session.id, _turn("regular")), 1)
+        with self.assertRaises(ConflictException):
+            async for _ in stream:
+                pass
+
+        self.assertEqual(reply.assistant_message, "seen 2")
+        stored = await self.use_case.get(self.session.id)
+        self.assertEqual([message.content for message in stored.messages], ["be brief", "regular", "seen 2"])
+
+    async def test_unknown_session_and_message_limit(self):
+        with self.assertRaises(NotFoundException):
+            await self.use_case.send("missing", _turn("one"))
+        await self.use_case.send(self.session.id, _turn("one"))
+        await self.use_case.send(self.session.id, _turn("two"))
+
+        with self.assertRaisesRegex(ValidationException, "limit of 6 messages"):
+            await self.use_case.send(self.session.id, _turn("three"))
+
+
+class SessionRoutesTests(unittest.TestCase):
+    def setUp(self):
+        use_case = SessionsUseCase(
+            InMemorySessionStore(max_sessions=10, ttl_seconds=60),
+            GenerateTextAIUseCase({AIAssistant.CHAT_GPT: EchoTextClient()}),
+        )
+        app = FastAPI()
+        app.include_router(router)
+        app.dependency_overrides[get_session_service] = lambda: SessionService(use_case)
+        self.client = TestClient(app)
+
+    def test_session_lifecycle(self):
+        created = self.client.post("/sessions", json={"assistant": "chat_gpt"})
+        session_id = created.json()["id"]
+        reply = self.client.post(f"/sessions/{session_id}/messages", json={
+            "messages": [{"role": "user", "content": "hi"}],
+        })
+        stream = self.client.post(f"/sessions/{session_id}/messages/stream", json={
+            "messages": [{"role": "user", "content": "again"}],
+        })
+        fetched = self.client.get(f"/sessions/{session_id}")
+        deleted = self.client.delete(f"/sessions/{session_id}")
+        missing = self.client.post(f"/sessions/{session_id}/messages", json={
+            "messages": [{"role": "user", "content": "hi"}],
+        })
+
+        self.assertEqual(created.status_code, 201)
+        self.assertEqual(reply.json()["assistant_message"], "seen 1")
+        self.assertIn('data: {"delta":"3"}', stream.text)
+        self.assertEqual([message["content"] for message in fetched.json()["messages"]], ["hi", "seen 1", "again", "seen 3"])
+        self.assertEqual(deleted.status_code, 204)
+        self.assertEqual(missing.status_code, 404)
+
+
+if __name__ == "__main__":
+    unittest.main()
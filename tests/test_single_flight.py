@@ -0,0 +1,160 @@
+import asyncio
+import unittest
+
+from app.application.dto import GenerateAIRequestDTO, MessageDTO
+from app.application.exceptions import ServiceUnavailableException
+from app.application.services.single_flight import SingleFlight
+from app.application.use_cases.generate_text_ai_use_case import GenerateTextAIUseCase
+from app.domain.exceptions import AIServiceException
+from app.domain.models import AIAssistant, AIResponse, Role, Usage
+
+
+class SlowTextClient:
+    def __init__(self, response: AIResponse | Exception):
+        self._response = response
+        self.release = asyncio.Event()
+        self.calls = 0
+
+    async def generate(self, messages):
+        self.calls += 1
+        await self.release.wait()
+        if isinstance(self._response, Exception):
+            raise self._response
+        return self._response
+
+
+def _request(content: str = "hi") -> GenerateAIRequestDTO:
+    return GenerateAIRequestDTO(messages=[MessageDTO(role=Role.USER, content=content)], assistant=AIAssistant.CHAT_GPT)
+
+
+class SingleFlightTests(unittest.IsolatedAsyncioTestCase):
+    async def test_concurrent_calls_share_one_execution(self):
+        single_flight = SingleFlight()
+        calls = 0
+        release = asyncio.Event()
+
+        async def work():
+            nonlocal calls
+            calls += 1
+            await release.wait()
+            return "result"
+
+        waiters = [asyncio.create_task(single_flight.do("key", work)) for _ in range(5)]
+        await asyncio.sleep(0)
+        release.set()
+
+        self.assertEqual(await asyncio.gather(*waiters), ["result"] * 5)
+        self.assertEqual(calls, 1)
+        self.assertEqual(single_flight.stats(), {"leaders": 1, "coalesced": 4, "in_flight": 0})
+
+    async def test_exception_is_delivered_to_every_waiter(self):
+        single_flight = SingleFlight()
+        release = asyncio.Event()
+
+        async def work():
+            await release.wait()
+            raise RuntimeError("boom")
+
+        waiters = [asyncio.create_task(single_flight.do("key", work)) for _ in range(3)]
+        await asyncio.sleep(0)
+        release.set()
+
+        results = await asyncio.gather(*waiters, return_exceptions=True)
+        self.assertTrue(all(isinstance(result, RuntimeError) for result in results))
+
+    async def test_cancelled_waiter_does_not_cancel_shared_call(self):
+        single_flight = SingleFlight()
+        release = asyncio.Event()
+
+        async def work():
+            await release.wait()
+            return "result"
+
+        first = asyncio.create_task(single_flight.do("key", work))
+        second = asyncio.create_task(single_flight.do("key", work))
+        await asyncio.sleep(0)
+        first.cancel()
+        await asyncio.sleep(0)
+        release.set()
+
+        self.assertEqual(await second, "result")
+        self.assertTrue(first.cancelled())
+
+    async def test_shared_call_is_cancelled_when_all_waiters_leave(self):
+        single_flight = SingleFlight()
+        cancelled = asyncio.Event()
+
+        async def work():
+            try:
+                await asyncio.Event().wait()
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+
+        waiters = [asyncio.create_task(single_flight.do("key", work)) for _ in range(2)]
+        await asyncio.sleep(0)
+        for waiter in waiters:
+            waiter.cancel()
+        await asyncio.gather(*waiters, return_exceptions=True)
+        await asyncio.wait_for(cancelled.wait(), 1)
+
+        self.assertEqual(single_flight.stats()["in_flight"], 0)
+
+    async def test_caller_arriving_while_the_shared_call_cancels_starts_a_new_one(self):
+        single_flight = SingleFlight()
+        release = asyncio.Event()
+
+        async def slow_to_cancel():
+            try:
+                await asyncio.Event().wait()
+            except asyncio.CancelledError:
+                await release.wait()
+                raise
+
+        async def fresh():
+            return "fresh"
+
+        waiter = asyncio.create_task(single_flight.do("key", slow_to_cancel))
+        await asyncio.sleep(0)
+        waiter.cancel()
+        await asyncio.gather(waiter, return_exceptions=True)
+        result = await asyncio.wait_for(single_flight.do("key", fresh), 1)
+        release.set()
+        await asyncio.sleep(0)
+
+        self.assertEqual(result, "fresh")
+        self.assertEqual(single_flight.stats(), {"leaders": 2, "coalesced": 0, "in_flight": 0})
+
+
+class GenerateTextCoalescingTests(unittest.IsolatedAsyncioTestCase):
+    async def test_identical_requests_share_one_upstream_call(self):
+        usage = Usage(prompt_tokens=1, completion_tokens=1, total_tokens=2)
+        client = SlowTextClient(AIResponse(assistant_message="ok", usage=usage))
+        single_flight = SingleFlight()
+        use_case = GenerateTextAIUseCase({AIAssistant.CHAT_GPT: client}, single_flight=single_flight)
+
+        requests = [asyncio.create_task(use_case.execute(_request())) for _ in range(4)]
+        other = asyncio.create_task(use_case.execute(_request("other")))
+        await asyncio.sleep(0)
+        client.release.set()
+
+        responses = await asyncio.gather(*requests, other)
+        self.assertEqual([response.assistant_message for response in responses], ["ok"] * 5)
+        self.assertEqual(client.calls, 2)
+        self.assertEqual(single_flight.coalesced, 3)
+
+    async def test_upstream_error_is_mapped_for_every_waiter(self):
+        client = SlowTextClient(AIServiceException("down"))
+        use_case = GenerateTextAIUseCase({AIAssistant.CHAT_GPT: client}, single_flight=SingleFlight())
+
+        requests = [asyncio.create_task(use_case.execute(_request())) for _ in range(3)]
+        await asyncio.sleep(0)
+        client.release.set()
+
+        results = await asyncio.gather(*requests, return_exceptions=True)
+        self.assertTrue(all(isinstance(result, ServiceUnavailableException) for result in results))
+        self.assertEqual(client.calls, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,112 @@
+import json
+import unittest
+
+import httpx
+from openai import AsyncOpenAI
+
+from app.application.dto import AIResponseChunkDTO, UsageDTO
+from app.application.exceptions import ServiceUnavailableException
+from app.domain.models import Message, Role
+from app.infrastructure.clients.openai_client import OpenAIClient
+from app.infrastructure.clients.yandex_gpt_client import YandexGPTClient
+from app.infrastructure.http.transport import HttpTransport
+from app.presentation.api.sse import _sse_events, format_sse
+from core.config import HttpConfig
+
+
+class StubAuth:
+    async def get_iam_key(self) -> str:
+        return "iam"
+
+
+class MockHttpTransport(HttpTransport):
+    def __init__(self, handler) -> None:
+        super().__init__(HttpConfig())
+        self._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+
+def yandex_line(text: str, usage: dict | None = None) -> str:
+    result = {"alternatives": [{"message": {"role": "assistant", "text": text}}]}
+    if usage:
+        result["usage"] = usage
+    return json.dumps({"result": result})
+
+
+class YandexGPTClientStreamTests(unittest.IsolatedAsyncioTestCase):
+    async def test_converts_cumulative_text_to_deltas(self) -> None:
+        usage = {"inputTextTokens": "3", "completionTokens": "2", "totalTokens": "5"}
+        body = "\n".join([yandex_line("Hel"), yandex_line("Hello"), yandex_line("Hello!", usage)]) + "\n"
+        requests = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(json.loads(request.content))
+            return httpx.Response(200, text=body)
+
+        client = YandexGPTClient("https://api", "gpt://folder/", "yandexgpt", StubAuth(), MockHttpTransport(handler))
+
+        chunks = [chunk async for chunk in client.generate_stream([Message(role=Role.USER, content="hi")])]
+
+        self.assertTrue(requests[0]["completionOptions"]["stream"])
+        self.assertEqual([chunk.delta for chunk in chunks], ["Hel", "lo", "!", ""])
+        self.assertEqual(chunks[-1].usage.total_tokens, 5)
+
+    async def test_raises_on_error_status(self) -> None:
+        client = YandexGPTClient(
+            "https://api", "gpt://folder/", "yandexgpt", StubAuth(),
+            MockHttpTransport(lambda request: httpx.Response(429, text="slow down")),
+        )
+
+        with self.assertRaises(Exception):
+            async for _ in client.generate_stream([Message(role=Role.USER, content="hi")]):
+                pass
+
+
+class OpenAIClientStreamTests(unittest.IsolatedAsyncioTestCase):
+    async def test_yields_deltas_and_final_usage(self) -> None:
+        events = [
+            {"id": "1", "object": "chat.completion.chunk", "created": 0, "model": "m",
+             "choices": [{"index": 0, "delta": {"content": "Hi"}, "finish_reason": None}]},
+            {"id": "1", "object": "chat.completion.chunk", "created": 0, "model": "m",
+             "choices": [{"index": 0, "delta": {"content": " there"}, "finish_reason": "stop"}]},
+            {"id": "1", "object": "chat.completion.chunk", "created": 0, "model": "m", "choices": [],
+             "usage": {"prompt_tokens": 4, "completion_tokens": 2, "total_tokens": 6}},
+        ]
+        body = "".join(f"data: {json.dumps(event)}\n\n" for event in events) + "data: [DONE]\n\n"
+        http_client = httpx.AsyncClient(
+            transport=httpx.MockTransport(
+                lambda request: httpx.Response(200, text=body, headers={"content-type": "text/event-stream"})
+            )
+        )
+        client = OpenAIClient("m", "key", client=AsyncOpenAI(api_key="key", http_client=http_client))
+
+        chunks = [chunk async for chunk in client.generate_stream([Message(role=Role.USER, content="hi")])]
+
+        self.assertEqual("".join(chunk.delta for chunk in chunks), "Hi there")
+        self.assertEqual(chunks[-1].usage.total_tokens, 6)
+
+
+class SSETests(unittest.IsolatedAsyncioTestCase):
+    async def test_emits_deltas_then_usage_event(self) -> None:
+        async def chunks():
+            yield AIResponseChunkDTO(delta="b")
+            yield AIResponseChunkDTO(delta="", usage=UsageDTO(prompt_tokens=1, completion_tokens=2, total_tokens=3))
+
+        events = [event async for event in _sse_events(AIResponseChunkDTO(delta="a"), chunks(), "test")]
+
+        self.assertEqual(events[0], 'data: {"delta":"a"}\n\n')
+        self.assertEqual(events[1], 'data: {"delta":"b"}\n\n')
+        self.assertTrue(events[2].startswith("event: usage\ndata: "))
+        self.assertEqual(json.loads(events[2].split("data: ", 1)[1])["total_tokens"], 3)
+
+    async def test_mid_stream_error_is_sent_as_error_event(self) -> None:
+        async def chunks():
+            raise ServiceUnavailableException("upstream closed")
+            yield
+
+        events = [event async for event in _sse_events(AIResponseChunkDTO(delta="a"), chunks(), "test")]
+
+        self.assertEqual(events[-1], format_sse(json.dumps({"detail": "upstream closed"}), event="error"))
+
+
+if __name__ == "__main__":
+    unittest.main()
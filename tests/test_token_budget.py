@@ -0,0 +1,190 @@
+import asyncio
+import unittest
+from unittest.mock import patch
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.application.dto import GenerateAIRequestDTO, MessageDTO
+from app.application.exceptions import ValidationException
+from app.application.interfaces.token_estimator import TokenEstimate
+from app.application.services import AIService
+from app.application.services.context_budget import ContextBudget
+from app.application.use_cases.count_tokens_use_case import CountTokensUseCase
+from app.application.use_cases.generate_text_ai_use_case import GenerateTextAIUseCase
+from app.application.use_cases.generate_text_batch_use_case import GenerateTextBatchUseCase
+from app.application.use_cases.generate_vision_ai_use_case import GenerateVisionAIUseCase
+from app.domain.models import AIAssistant, AIResponse, Message, Role, Usage
+from app.infrastructure.tokens.tiktoken_estimator import TiktokenTokenEstimator
+from app.presentation.api.routes import router
+from app.presentation.dependencies import get_ai_service
+from core.config import TokenBudgetConfig
+
+
+class FakeEncoding:
+    name = "fake"
+
+    def __init__(self):
+        self.encoded = []
+
+    def encode(self, text, disallowed_special=()):
+        self.encoded.append(text)
+        return text.split()
+
+
+class TiktokenTokenEstimatorTests(unittest.IsolatedAsyncioTestCase):
+    async def test_models_without_a_known_encoding_use_the_byte_heuristic(self):
+        estimator = TiktokenTokenEstimator(TokenBudgetConfig(context_windows={"yandex_gpt": 8000}))
+
+        estimate = await estimator.count_messages(AIAssistant.YANDEX_GPT, [Message(role=Role.USER, content="x" * 400)])
+
+        self.assertEqual(estimate.method, "heuristic")
+        self.assertEqual(estimate.tokens, 3 + 4 + 100)
+        self.assertEqual(estimator.context_window(AIAssistant.YANDEX_GPT), 8000)
+        self.assertIsNone(estimator.context_window(AIAssistant.AUTO))
+
+    async def test_encodings_are_loaded_once_on_first_use(self):
+        estimator = TiktokenTokenEstimator(TokenBudgetConfig(), openai_model="gpt-test")
+        loads = []
+
+        async def load(name):
+            loads.append(name)
+            estimator._encodings[name] = FakeEncoding()
+
+        estimator._load = load
+        self.assertEqual(estimator._encodings, {})
+
+        messages = [Message(role=Role.USER, content="one two three")]
+        first = await estimator.count_messages(AIAssistant.CHAT_GPT, messages)
+        second = await estimator.count_messages(AIAssistant.CHAT_GPT, messages)
+
+        self.assertEqual(loads, ["model:gpt-test"])
+        self.assertEqual((first.tokens, first.method), (3 + 4 + 3, "tiktoken:fake"))
+        self.assertEqual(second, first)
+
+    async def test_truncation_subtracts_counts_instead_of_re_encoding(self):
+        estimator = TiktokenTokenEstimator(TokenBudgetConfig(context_windows={"chat_gpt": 30}), openai_model="gpt-test")
+        encoding = estimator._encodings["model:gpt-test"] = FakeEncoding()
+        budget = ContextBudget(estimator, reserve_tokens=5)
+        contents = ["be brief", "a b c d e", "f g h i j", "k l"]
+        roles = [Role.SYSTEM, Role.USER, Role.ASSISTANT, Role.USER]
+        messages = [Message(role=role, content=content) for role, content in zip(roles, contents)]
+
+        fitted = await budget.fit(AIAssistant.CHAT_GPT, messages, truncate=True)
+
+        self.assertEqual([message.content for message in fitted], ["be brief", "f g h i j", "k l"])
+        self.assertEqual(encoding.encoded, contents)
+
+    async def test_large_prompts_are_encoded_off_the_event_loop(self):
+        estimator = TiktokenTokenEstimator(TokenBudgetConfig(), openai_model="gpt-test")
+        estimator._encodings["model:gpt-test"] = FakeEncoding()
+        short = [Message(role=Role.USER, content="word " * 10)]
+        long = [Message(role=Role.USER, content="word " * 10_000)]
+
+        with patch("asyncio.to_thread", wraps=asyncio.to_thread) as to_thread:
+            await estimator.count_messages(AIAssistant.CHAT_GPT, short)
+            self.assertFalse(to_thread.called)
+            estimate = await estimator.count_messages(AIAssistant.CHAT_GPT, long)
+
+        to_thread.assert_called_once()
+        self.assertEqual(estimate.tokens, 3 + 4 + 10_000)
+
+
+class StubEstimator:
+    """One token per character plus one per message, in a 20-token window."""
+
+    async def count_messages(self, assistant, messages):
+        return TokenEstimate(sum(len(message.content) + 1 for message in messages), "stub")
+
+    def context_window(self, assistant):
+        return None if assistant == AIAssistant.AUTO else 20
+
+
+class RecordingTextClient:
+    def __init__(self):
+        self.messages = None
+
+    async def generate(self, messages):
+        self.messages = messages
+        return AIResponse(assistant_message="ok", usage=Usage(prompt_tokens=1, completion_tokens=1, total_tokens=2))
+
+
+def _request(*contents: str, truncate: bool = False) -> GenerateAIRequestDTO:
+    roles = [Role.SYSTEM] + [Role.USER, Role.ASSISTANT] * len(contents)
+    return GenerateAIRequestDTO(
+        messages=[MessageDTO(role=role, content=content) for role, content in zip(roles, contents)],
+        assistant=AIAssistant.CHAT_GPT,
+        truncate_history=truncate,
+    )
+
+
+class ContextBudgetUseCaseTests(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.client = RecordingTextClient()
+        self.budget = ContextBudget(StubEstimator(), reserve_tokens=5)
+        self.use_case = GenerateTextAIUseCase({AIAssistant.CHAT_GPT: self.client}, context_budget=self.budget)
+
+    async def test_oversized_prompt_is_rejected_before_dispatch(self):
+        with self.assertRaises(ValidationException):
+            await self.use_case.execute(_request("sys", "aaaa", "bbbb", "cccc"))
+
+        self.assertIsNone(self.client.messages)
+        self.assertEqual(self.budget.stats()["rejected"], 1)
+
+    async def test_truncation_drops_oldest_non_system_messages(self):
+        await self.use_case.execute(_request("sys", "aaaa", "bbbb", "cccc", truncate=True))
+
+        self.assertEqual([message.content for message in self.client.messages], ["sys", "bbbb", "cccc"])
+        self.assertEqual(self.budget.stats()["truncated"], 1)
+
+    async def test_last_message_alone_over_budget_is_rejected_even_with_truncation(self):
+        with self.assertRaises(ValidationException):
+            await self.use_case.execute(_request("sys", "a" * 30, truncate=True))
+
+    async def test_heuristic_estimate_over_budget_is_not_enforced(self):
+        # 200 mostly Cyrillic characters are 375 bytes: the byte heuristic says 101 tokens for a 90-token
+        # budget, while a real tokenizer needs well under 90.
+        estimator = TiktokenTokenEstimator(TokenBudgetConfig(context_windows={"yandex_gpt": 100}))
+        budget = ContextBudget(estimator, reserve_tokens=10)
+        use_case = GenerateTextAIUseCase({AIAssistant.YANDEX_GPT: self.client}, context_budget=budget)
+        request = GenerateAIRequestDTO(
+            messages=[MessageDTO(role=Role.USER, content="привет " * 25 + "п" * 25)],
+            assistant=AIAssistant.YANDEX_GPT,
+        )
+
+        with self.assertLogs("app.application.services.context_budget", "WARNING"):
+            await use_case.execute(request)
+
+        self.assertEqual(len(self.client.messages), 1)
+        self.assertEqual(budget.stats(), {"rejected": 0, "truncated": 0, "unverified": 1})
+
+
+class TokenizeRouteTests(unittest.TestCase):
+    def test_tokenize_returns_estimate_without_calling_provider(self):
+        client = RecordingTextClient()
+        budget = ContextBudget(StubEstimator(), reserve_tokens=5)
+        text_use_case = GenerateTextAIUseCase({AIAssistant.CHAT_GPT: client}, context_budget=budget)
+        ai_service = AIService(
+            generate_text_use_case=text_use_case,
+            generate_vision_use_case=GenerateVisionAIUseCase(client),
+            generate_batch_use_case=GenerateTextBatchUseCase(text_use_case),
+            count_tokens_use_case=CountTokensUseCase(budget),
+        )
+        app = FastAPI()
+        app.include_router(router)
+        app.dependency_overrides[get_ai_service] = lambda: ai_service
+
+        response = TestClient(app).post("/tokenize", json={
+            "assistant": "chat_gpt",
+            "messages": [{"role": "user", "content": "hello"}],
+        })
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json(), {
+            "assistant": "chat_gpt", "prompt_tokens": 6, "method": "stub", "budget_tokens": 15, "fits": True,
+        })
+        self.assertIsNone(client.messages)
+
+
+if __name__ == "__main__":
+    unittest.main()
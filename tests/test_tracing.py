@@ -0,0 +1,133 @@
+import json
+import os
+import tempfile
+import unittest
+
+import httpx
+from fastapi import FastAPI
+
+from app.application.services.tracing import Trace, Tracer, record_span, span, tracing_active
+from app.infrastructure.http.tracing_hooks import _make_trace_callback
+from app.infrastructure.tracing.otlp_file_exporter import OtlpJsonFileExporter
+from app.presentation.decorators import handle_service_errors
+from app.presentation.middleware.tracing import TracingMiddleware
+
+
+class RecordingExporter:
+    def __init__(self):
+        self.traces: list[Trace] = []
+
+    def export(self, trace):
+        self.traces.append(trace)
+
+    async def aclose(self):
+        pass
+
+
+class SpanTests(unittest.IsolatedAsyncioTestCase):
+    def test_spans_outside_a_trace_are_a_shared_no_op(self):
+        self.assertFalse(tracing_active())
+        self.assertIs(span("a"), span("b", key="value"))
+        with span("a") as current:
+            self.assertIsNone(current)
+        record_span("a", 0.0)
+
+    async def test_nested_spans_and_upstream_events_form_a_tree(self):
+        exporter = RecordingExporter()
+        tracer = Tracer(exporter)
+        trace, token = tracer.start("POST /x")
+        with span("use_case") as use_case:
+            with span("upstream", provider="openai"):
+                on_event = _make_trace_callback("api.example.com")
+                await on_event("connection.connect_tcp.started", {})
+                await on_event("connection.connect_tcp.complete", {})
+                await on_event("http11.receive_response_headers.started", {})
+                await on_event("http11.receive_response_headers.complete", {})
+        tracer.finish(trace, token)
+
+        spans = {recorded.name: recorded for recorded in exporter.traces[0].spans}
+        self.assertEqual(list(spans), ["POST /x", "use_case", "upstream", "upstream.connect", "upstream.ttfb"])
+        self.assertEqual(spans["use_case"].parent_id, trace.root.span_id)
+        self.assertEqual(spans["upstream"].parent_id, use_case.span_id)
+        self.assertEqual(spans["upstream.ttfb"].parent_id, spans["upstream"].span_id)
+        self.assertEqual(spans["upstream.connect"].attributes, {"host": "api.example.com"})
+        self.assertFalse(tracing_active())
+
+    def test_spans_after_the_request_finished_are_dropped(self):
+        tracer = Tracer()
+        trace, token = tracer.start("GET /x")
+        tracer.finish(trace, token)
+
+        trace.add("late", 0.0, 1.0)
+
+        self.assertEqual(len(trace.spans), 1)
+
+
+class TracingMiddlewareTests(unittest.IsolatedAsyncioTestCase):
+    async def test_server_timing_breaks_down_the_request(self):
+        exporter = RecordingExporter()
+        app = FastAPI()
+
+        @app.get("/items/{item_id}")
+        @handle_service_errors(endpoint_name="ITEM")
+        async def get_item(item_id: str):
+            with span("use_case"):
+                pass
+            return {"item": item_id}
+
+        app.add_middleware(TracingMiddleware, tracer=Tracer(exporter))
+        async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
+            response = await client.get("/items/1")
+
+        names = [entry.split(";")[0] for entry in response.headers["server-timing"].split(", ")]
+        self.assertEqual(names, ["route", "use_case", "serialize", "total"])
+        root = exporter.traces[0].root
+        self.assertEqual(root.name, "GET /items/{item_id}")
+        self.assertEqual(root.attributes["http.status_code"], 200)
+
+    async def test_unsampled_requests_are_not_traced(self):
+        app = FastAPI()
+
+        @app.get("/x")
+        async def handler():
+            return {"traced": tracing_active()}
+
+        app.add_middleware(TracingMiddleware, tracer=Tracer(sample_rate=0.0))
+        async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
+            response = await client.get("/x")
+
+        self.assertEqual(response.json(), {"traced": False})
+        self.assertNotIn("server-timing", response.headers)
+
+
+class OtlpJsonFileExporterTests(unittest.IsolatedAsyncioTestCase):
+    async def test_each_trace_is_one_otlp_json_line(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "traces.jsonl")
+            exporter = OtlpJsonFileExporter(path)
+            tracer = Tracer(exporter)
+            for _ in range(2):
+                trace, token = tracer.start("GET /x", {"http.status_code": 200})
+                with span("use_case", cached=True):
+                    pass
+                tracer.finish(trace, token)
+            await exporter.aclose()
+
+            with open(path, encoding="utf-8") as file:
+                lines = [json.loads(line) for line in file]
+
+        self.assertEqual(len(lines), 2)
+        resource_spans = lines[0]["resourceSpans"][0]
+        self.assertEqual(resource_spans["resource"]["attributes"][0]["value"], {"stringValue": "llmbox"})
+        root, child = resource_spans["scopeSpans"][0]["spans"]
+        self.assertEqual(len(root["traceId"]), 32)
+        self.assertNotIn("parentSpanId", root)
+        self.assertEqual(child["parentSpanId"], root["spanId"])
+        self.assertEqual(root["attributes"], [{"key": "http.status_code", "value": {"intValue": "200"}}])
+        self.assertEqual(child["attributes"], [{"key": "cached", "value": {"boolValue": True}}])
+        self.assertLessEqual(int(root["startTimeUnixNano"]), int(child["startTimeUnixNano"]))
+        self.assertLessEqual(int(child["endTimeUnixNano"]), int(root["endTimeUnixNano"]))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -14,8 +14,14 @@ from app.application.exceptions import (
 )
 from app.application.use_cases.generate_text_ai_use_case import GenerateTextAIUseCase
 from app.application.use_cases.generate_vision_ai_use_case import GenerateVisionAIUseCase
-from app.domain.exceptions import AIServiceException, DomainException, UnknownAIAssistantException
-from app.domain.models import AIAssistant, AIResponse, Role, Usage
+from app.domain.exceptions import (
+    AIServiceException,
+    CircuitOpenException,
+    DomainException,
+    ProviderStatusException,
+    UnknownAIAssistantException,
+)
+from app.domain.models import AIAssistant, AIResponse, AIResponseChunk, Role, Usage
 
 
 class DummyTextClient:
@@ -29,6 +35,14 @@ class DummyTextClient:
             raise self._response
         return self._response
 
+    async def generate_stream(self, messages):
+        self.received_messages = messages
+        if isinstance(self._response, Exception):
+            raise self._response
+        for word in self._response.assistant_message.split():
+            yield AIResponseChunk(delta=word)
+        yield AIResponseChunk(delta="", usage=self._response.usage)
+
 
 class DummyVisionClient:
     def __init__(self, response: AIResponse | Exception):
@@ -114,6 +128,86 @@ class GenerateTextAIUseCaseTests(unittest.IsolatedAsyncioTestCase):
         with self.assertRaises(ServiceUnavailableException):
             await use_case.execute(request)
 
+    async def test_execute_stream_yields_chunks(self):
+        usage = Usage(prompt_tokens=1, completion_tokens=2, total_tokens=3)
+        client = DummyTextClient(AIResponse(assistant_message="hello world", usage=usage))
+        use_case = GenerateTextAIUseCase({AIAssistant.CHAT_GPT: client})
+        request = GenerateAIRequestDTO(
+            messages=[MessageDTO(role=Role.USER, content="hi")],
+            assistant=AIAssistant.CHAT_GPT,
+        )
+
+        chunks = [chunk async for chunk in use_case.execute_stream(request)]
+
+        self.assertEqual([chunk.delta for chunk in chunks], ["hello", "world", ""])
+        self.assertEqual(chunks[-1].usage.total_tokens, 3)
+
+    async def test_execute_stream_maps_ai_service_exception_to_service_unavailable(self):
+        client = DummyTextClient(AIServiceException("boom"))
+        use_case = GenerateTextAIUseCase({AIAssistant.CHAT_GPT: client})
+        request = GenerateAIRequestDTO(
+            messages=[MessageDTO(role=Role.USER, content="hi")],
+            assistant=AIAssistant.CHAT_GPT,
+        )
+
+        with self.assertRaises(ServiceUnavailableException):
+            async for _ in use_case.execute_stream(request):
+                pass
+
+
+class GenerateTextFallbackTests(unittest.IsolatedAsyncioTestCase):
+    def _use_case(self, primary_response, fallback_response) -> GenerateTextAIUseCase:
+        return GenerateTextAIUseCase(
+            {
+                AIAssistant.GPT_OSS_120B: DummyTextClient(primary_response),
+                AIAssistant.QWEN3_235B: DummyTextClient(fallback_response),
+            },
+            fallbacks={AIAssistant.GPT_OSS_120B: [AIAssistant.QWEN3_235B]},
+        )
+
+    @staticmethod
+    def _request() -> GenerateAIRequestDTO:
+        return GenerateAIRequestDTO(messages=[MessageDTO(role=Role.USER, content="hi")], assistant=AIAssistant.GPT_OSS_120B)
+
+    async def test_primary_reports_served_by(self):
+        usage = Usage(prompt_tokens=1, completion_tokens=1, total_tokens=2)
+        use_case = self._use_case(AIResponse(assistant_message="primary", usage=usage), AIServiceException("unused"))
+
+        dto = await use_case.execute(self._request())
+
+        self.assertEqual(dto.served_by, "gpt_oss_120b")
+
+    async def test_fails_over_to_next_assistant(self):
+        usage = Usage(prompt_tokens=1, completion_tokens=1, total_tokens=2)
+        use_case = self._use_case(CircuitOpenException("open"), AIResponse(assistant_message="fallback", usage=usage))
+
+        dto = await use_case.execute(self._request())
+
+        self.assertEqual(dto.assistant_message, "fallback")
+        self.assertEqual(dto.served_by, "qwen3_235b")
+
+    async def test_client_errors_do_not_fail_over(self):
+        usage = Usage(prompt_tokens=1, completion_tokens=1, total_tokens=2)
+        use_case = self._use_case(ProviderStatusException(400, "bad"), AIResponse(assistant_message="fallback", usage=usage))
+
+        with self.assertRaises(ServiceUnavailableException):
+            await use_case.execute(self._request())
+
+    async def test_last_error_is_raised_when_chain_is_exhausted(self):
+        use_case = self._use_case(AIServiceException("primary"), AIServiceException("fallback"))
+
+        with self.assertRaisesRegex(ServiceUnavailableException, "fallback"):
+            await use_case.execute(self._request())
+
+    async def test_stream_fails_over_before_first_chunk(self):
+        usage = Usage(prompt_tokens=1, completion_tokens=1, total_tokens=2)
+        use_case = self._use_case(AIServiceException("down"), AIResponse(assistant_message="hello world", usage=usage))
+
+        chunks = [chunk async for chunk in use_case.execute_stream(self._request())]
+
+        self.assertEqual(chunks[0].served_by, "qwen3_235b")
+        self.assertEqual("".join(chunk.delta for chunk in chunks), "helloworld")
+
 
 class GenerateVisionAIUseCaseTests(unittest.IsolatedAsyncioTestCase):
     async def test_execute_happy_path(self):
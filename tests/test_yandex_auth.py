@@ -0,0 +1,70 @@
+import asyncio
+import os
+import tempfile
+import time
+import unittest
+
+from app.infrastructure.clients.yandex_auth import YandexAuth
+from app.infrastructure.http.transport import HttpTransport
+from core.config import HttpConfig
+
+
+class StubYandexAuth(YandexAuth):
+    def __init__(self, **kwargs) -> None:
+        super().__init__(
+            key_id="kid",
+            service_account_id="sa",
+            private_key="private",
+            http_transport=HttpTransport(HttpConfig()),
+            **kwargs,
+        )
+        self.jwt_calls = 0
+        self.iam_calls = 0
+
+    def create_jwt_token(self) -> str:
+        self.jwt_calls += 1
+        self.jwt_expires_at = time.time() + 3600
+        return "jwt"
+
+    async def create_iam_token(self, jwt_token: str) -> tuple[str, float]:
+        self.iam_calls += 1
+        await asyncio.sleep(0.01)
+        return f"iam-{self.iam_calls}", time.time() + 3600
+
+
+class YandexAuthTests(unittest.IsolatedAsyncioTestCase):
+    async def asyncTearDown(self) -> None:
+        for task in asyncio.all_tasks() - {asyncio.current_task()}:
+            task.cancel()
+
+    async def test_concurrent_callers_share_one_refresh(self) -> None:
+        auth = StubYandexAuth()
+
+        tokens = await asyncio.gather(*(auth.get_iam_key() for _ in range(50)))
+
+        self.assertEqual(set(tokens), {"iam-1"})
+        self.assertEqual(auth.jwt_calls, 1)
+        self.assertEqual(auth.iam_calls, 1)
+
+    async def test_refresh_is_scheduled_at_fraction_of_ttl(self) -> None:
+        auth = StubYandexAuth(refresh_fraction=0.25)
+
+        await auth.get_iam_key()
+
+        self.assertAlmostEqual(auth._refresh_at - time.time(), 900, delta=5)
+
+    async def test_token_cache_is_reused_across_instances(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "iam.json")
+            first = StubYandexAuth(token_cache_path=path)
+            second = StubYandexAuth(token_cache_path=path)
+
+            first_token = await first.get_iam_key()
+            second_token = await second.get_iam_key()
+
+            self.assertEqual(first_token, second_token)
+            self.assertEqual(second.iam_calls, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()